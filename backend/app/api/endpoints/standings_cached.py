@@ -2,6 +2,7 @@ from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
 from typing import Optional, List, Dict, Any
 
 from app.services.standings_calculator import standings_calculator
+from app.services.clinch_solver import clinch_solver
 from app.core.image_mappings import get_driver_image, get_team_logo
 
 router = APIRouter()
@@ -12,18 +13,16 @@ async def get_cached_driver_standings(
 ):
     """Get driver standings from cached data (updated daily)"""
     try:
-        data = await standings_calculator.update_year_if_needed(year)
+        standings = await standings_calculator.get_standings_section(year, "driver_standings")
         
-        if not data:
+        if standings is None:
             raise HTTPException(status_code=404, detail=f"No standings data available for {year}")
         
-        standings = data.get("driver_standings", [])
-        
-        # 각 드라이버에 이미지 URL 추가
-        for standing in standings:
-            standing["headshot_url"] = get_driver_image(standing.get("driver_name", ""))
-        
-        return standings
+        # 각 드라이버에 이미지 URL 추가 (저장소가 메모리에 캐시한 dict 는 수정하지 않도록 복사본에)
+        return [
+            {**standing, "headshot_url": get_driver_image(standing.get("driver_name", ""))}
+            for standing in standings
+        ]
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -34,18 +33,16 @@ async def get_cached_constructor_standings(
 ):
     """Get constructor standings from cached data (updated daily)"""
     try:
-        data = await standings_calculator.update_year_if_needed(year)
+        standings = await standings_calculator.get_standings_section(year, "constructor_standings")
         
-        if not data:
+        if standings is None:
             raise HTTPException(status_code=404, detail=f"No standings data available for {year}")
         
-        standings = data.get("constructor_standings", [])
-        
-        # 각 팀에 로고 URL 추가
-        for standing in standings:
-            standing["logo_url"] = get_team_logo(standing.get("team_name", ""))
-        
-        return standings
+        # 각 팀에 로고 URL 추가 (저장소가 메모리에 캐시한 dict 는 수정하지 않도록 복사본에)
+        return [
+            {**standing, "logo_url": get_team_logo(standing.get("team_name", ""))}
+            for standing in standings
+        ]
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -74,15 +71,22 @@ async def get_cached_standings_analysis(
         if len(constructor_standings) >= 2:
             constructor_gap = constructor_standings[0]["points"] - constructor_standings[1]["points"]
         
-        # Estimate races remaining (rough calculation)
-        total_races = data.get("total_races", 0)
-        estimated_season_races = 24  # Typical F1 season
-        races_remaining = max(0, estimated_season_races - total_races)
+        # Remaining grands prix and sprints from the calendar, after the last race in the standings
+        race_results = data.get("race_results", [])
+        last_race_date = max((race.get("date", "") for race in race_results), default="")
+        events = await standings_calculator.get_remaining_events(year, last_race_date)
+        calendar_source = "openf1"
+        if events is None:
+            # Calendar unavailable: fall back to a typical 24 race season without sprints
+            calendar_source = "estimate"
+            events = [{"type": "race"}] * max(0, 24 - data.get("total_races", 0))
+        
+        scenarios = clinch_solver.analyze(year, data, events)
         
         return {
             "timestamp": data.get("last_updated"),
             "year": year,
-            "total_races_completed": total_races,
+            "total_races_completed": data.get("total_races", 0),
             "driver_standings": driver_standings[:10],  # Top 10
             "constructor_standings": constructor_standings[:10],  # Top 10
             "championship_analysis": {
@@ -90,8 +94,17 @@ async def get_cached_standings_analysis(
                 "driver_championship_gap": driver_gap,
                 "constructor_championship_leader": constructor_standings[0]["team_name"] if constructor_standings else None,
                 "constructor_championship_gap": constructor_gap,
-                "races_remaining": races_remaining,
-                "points_available": races_remaining * 25  # Max points per race
+                "races_remaining": scenarios["remaining_races"],
+                "sprints_remaining": scenarios["remaining_sprints"],
+                "points_available": scenarios["driver_points_available"],
+                "constructor_points_available": scenarios["constructor_points_available"],
+                "calendar_source": calendar_source
+            },
+            "clinch_scenarios": {
+                "drivers": scenarios["drivers"],
+                "constructors": scenarios["constructors"],
+                "remaining_events": scenarios["remaining_events"],
+                "points_rules": scenarios["points_rules"]
             },
             "metadata": data.get("metadata", {}),
             "cache_info": {
@@ -113,13 +126,11 @@ async def get_cached_race_results(
 ):
     """Get all race results for a year from cached data"""
     try:
-        data = await standings_calculator.update_year_if_needed(year)
+        race_results = await standings_calculator.get_standings_section(year, "race_results")
         
-        if not data:
+        if race_results is None:
             raise HTTPException(status_code=404, detail=f"No race results available for {year}")
         
-        race_results = data.get("race_results", [])
-        
         if limit:
             race_results = race_results[:limit]
         
@@ -170,7 +181,8 @@ async def refresh_all_standings_data(
         background_tasks.add_task(
             standings_calculator.batch_update_all_years,
             years=year_list,
-            force=force
+            force=force,
+            parallel=True
         )
         
         return {
@@ -191,16 +203,18 @@ async def get_cache_status():
         years = [2021, 2022, 2023, 2024, 2025]
         
         for year in years:
-            data = standings_calculator.load_standings_data(year)
-            if data:
+            # Header only - no standings sections are decoded here
+            manifest = standings_calculator.store.manifest(year)
+            if manifest:
+                counts = manifest.get("counts", {})
                 status[year] = {
                     "cached": True,
-                    "last_updated": data.get("last_updated"),
-                    "total_races": data.get("total_races", 0),
+                    "last_updated": manifest.get("last_updated"),
+                    "total_races": manifest.get("total_races", 0),
                     "is_stale": standings_calculator.is_data_stale(year),
-                    "drivers": len(data.get("driver_standings", [])),
-                    "teams": len(data.get("constructor_standings", [])),
-                    "sessions_processed": len(data.get("sessions_processed", []))
+                    "drivers": counts.get("drivers", 0),
+                    "teams": counts.get("teams", 0),
+                    "sessions_processed": counts.get("sessions_processed", 0)
                 }
             else:
                 status[year] = {
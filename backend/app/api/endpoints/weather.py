@@ -61,7 +61,7 @@ async def get_weather_analysis(
     """Analyze weather trends and impact on race conditions"""
     try:
         # Use the weather service for comprehensive analysis
-        analysis = await weather_service.get_comprehensive_analysis(session_key)
+        analysis = await weather_service.get_comprehensive_analysis(session_key, hours)
         
         if "error" in analysis:
             raise HTTPException(status_code=404, detail=analysis["error"])
@@ -90,8 +90,12 @@ async def get_tire_strategy_analysis(
         if not current_weather:
             raise HTTPException(status_code=404, detail="No weather data found")
         
-        # Get tire recommendation
-        tire_recommendation = weather_service.get_tire_recommendation(current_weather)
+        # Get tire recommendation (smoothed by the session's weather statistics)
+        series = weather_service.cache.get(session_key)
+        tire_recommendation = weather_service.get_tire_recommendation(
+            current_weather,
+            series.stats if series else None
+        )
         
         return {
             "session_key": session_key,
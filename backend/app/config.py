@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Optional, Dict
 import os
 
 class Settings(BaseSettings):
@@ -10,6 +10,15 @@ class Settings(BaseSettings):
     # F1 Data Source Configuration
     use_livef1: bool = True  # Use LiveF1 as primary data source
     fallback_to_openf1: bool = True  # Fallback to OpenF1 if LiveF1 fails
+    # How the fallback is used: "sequential" (after LiveF1 fails), "hedged" (also
+    # once LiveF1 is slower than its hedge_percentile latency) or "race" (both at once)
+    data_source_policy: str = "hedged"
+    # Per-method overrides, e.g. DATA_SOURCE_METHOD_POLICIES='{"get_positions": "race"}'
+    data_source_method_policies: Dict[str, str] = {}
+    hedge_percentile: float = 0.9
+    hedge_default_delay: float = 1.0  # seconds, used until enough latency samples exist
+    circuit_failure_threshold: int = 5
+    circuit_recovery_timeout: float = 30.0
     
     # LiveF1 Settings
     livef1_session_key: Optional[str] = None
@@ -18,6 +27,21 @@ class Settings(BaseSettings):
     # OpenF1 API (fallback)
     openf1_api_base_url: str = "https://api.openf1.org/v1"
     openf1_api_key: Optional[str] = None
+    openf1_timeout: float = 10.0  # per attempt, also capped by the request deadline
+    openf1_retry_attempts: int = 3  # GET only
+    openf1_retry_base_delay: float = 0.25
+    openf1_retry_max_delay: float = 2.0
+    openf1_stale_ttl: int = 86400  # last good responses served while an endpoint's circuit is open
+    
+    # Thread pools for blocking livef1 calls, "workers/queue" per pool (live, bulk, analytics);
+    # calls beyond the queue fail fast, e.g. EXECUTOR_POOLS='{"bulk": "2/16"}'
+    executor_pools: Dict[str, str] = {}
+    
+    # Time budget for one incoming API request; clients may lower it with X-Request-Timeout
+    request_deadline: float = 20.0
+    
+    # X-Reload-Token for POST /admin/reload-datasets (read by main.py); unset = loopback clients only
+    reload_token: Optional[str] = None
     
     # Database
     database_url: str = "sqlite+aiosqlite:///./openf1_dashboard.db"
@@ -33,7 +57,15 @@ class Settings(BaseSettings):
     
     # Rate limiting
     rate_limit_per_minute: int = 60
-    rate_limit_burst: int = 10
+    # Requests allowed back to back before the per-minute pacing applies (None = one full period)
+    rate_limit_burst: Optional[int] = None
+    rate_limit_backend: str = "memory"  # "memory" (per process) or "redis" (shared across workers)
+    # Per-route overrides by path prefix, "limit/period[:burst]",
+    # e.g. RATE_LIMIT_ROUTES='{"/api/v1/standings/refresh": "5/60"}'
+    rate_limit_routes: Dict[str, str] = {}
+    
+    # Metrics
+    metrics_flush_interval: int = 60  # seconds between batched writes to the metrics tables
     
     # WebSocket
     websocket_ping_interval: int = 25
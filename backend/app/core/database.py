@@ -76,7 +76,8 @@ class APIMetricsDB(Base):
     endpoint = Column(String(200), index=True, nullable=False)
     method = Column(String(10), nullable=False)
     status_code = Column(Integer, index=True)
-    response_time = Column(Float)  # in seconds
+    response_time = Column(Float)  # in seconds (mean over request_count requests)
+    request_count = Column(Integer, default=1)  # requests aggregated into this row
     user_id = Column(String(100), index=True)
     ip_address = Column(String(45))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -100,8 +101,16 @@ async def init_database():
     """Initialize database tables"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
     print("✅ Database tables created successfully")
 
+def _add_missing_columns(sync_conn):
+    """create_all doesn't alter existing tables; add columns introduced later"""
+    from sqlalchemy import inspect, text
+    columns = {column["name"] for column in inspect(sync_conn).get_columns("api_metrics")}
+    if "request_count" not in columns:
+        sync_conn.execute(text("ALTER TABLE api_metrics ADD COLUMN request_count INTEGER DEFAULT 1"))
+
 async def close_database():
     """Close database connection"""
     await engine.dispose()
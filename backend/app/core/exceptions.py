@@ -14,4 +14,14 @@ class RateLimitException(Exception):
 class WebSocketException(Exception):
     def __init__(self, message: str):
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class CircuitOpenException(OpenF1APIException):
+    def __init__(self, source: str, retry_after: float = 0.0):
+        self.source = source
+        self.retry_after = retry_after
+        super().__init__(f"{source} is unavailable (circuit open, retry in {retry_after:.0f}s)", status_code=503)
+
+class DeadlineExceededException(OpenF1APIException):
+    def __init__(self, message: str = "Request deadline exceeded"):
+        super().__init__(message, status_code=504)
\ No newline at end of file
@@ -0,0 +1,174 @@
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Standard library only so the live API (services/) and app/ share the same pools.
+#
+# Blocking library calls are split by how long they take and how urgent they are,
+# so a burst of historical/season loads can never delay the 1 Hz live timing polls:
+#   live      - livetiming endpoints polled while a session runs (short, latency sensitive)
+#   bulk      - season loads and other historical fetches (slow, can wait)
+#   analytics - CPU bound number crunching
+# name -> (max_workers, max_queue)
+DEFAULT_POOLS: Dict[str, Tuple[int, int]] = {
+    "live": (4, 8),
+    "bulk": (4, 32),
+    "analytics": (max(2, min(4, os.cpu_count() or 2)), 16),
+}
+
+
+class ExecutorBusyError(RuntimeError):
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        super().__init__(f"Executor '{name}' is full ({limit} tasks running or queued)")
+
+
+def parse_pool_spec(spec: str) -> Tuple[int, int]:
+    """'4/8' -> (4 workers, 8 queued)"""
+    workers, _, queue = str(spec).partition("/")
+    return max(1, int(workers)), max(0, int(queue or 0))
+
+
+class BoundedExecutor:
+    """Thread pool with a hard cap on queued work and utilization counters.
+
+    Up to max_workers calls run at once and up to max_queue more may wait;
+    anything beyond that is rejected immediately with ExecutorBusyError
+    instead of piling up behind work that is already late.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-pool")
+        self._created_at = time.monotonic()
+        self._lock = threading.Lock()  # guards the counters worker threads update
+        self.pending = 0  # running + queued
+        self.running = 0
+        self.stats = {
+            "submitted": 0, "rejected": 0, "completed": 0, "failed": 0,
+            "busy_time": 0.0, "queue_time": 0.0, "max_pending": 0
+        }
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run func in this pool; raises ExecutorBusyError when the queue is full"""
+        with self._lock:
+            if self.pending >= self.capacity:
+                self.stats["rejected"] += 1
+                raise ExecutorBusyError(self.name, self.capacity)
+            self.pending += 1
+            self.stats["submitted"] += 1
+            self.stats["max_pending"] = max(self.stats["max_pending"], self.pending)
+        submitted = time.monotonic()
+
+        def call():
+            started = time.monotonic()
+            with self._lock:
+                self.stats["queue_time"] += started - submitted
+                self.running += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.stats["busy_time"] += time.monotonic() - started
+
+        def done(future):
+            # Runs when the work itself ends, even if the awaiting caller was cancelled
+            with self._lock:
+                self.pending -= 1
+                if future.cancelled():
+                    return
+                self.stats["failed" if future.exception() is not None else "completed"] += 1
+
+        try:
+            future = self._pool.submit(call)
+        except BaseException:
+            # e.g. the pool was shut down; done() will never run for this slot
+            with self._lock:
+                self.pending -= 1
+                self.stats["submitted"] -= 1
+            raise
+        future.add_done_callback(done)
+        return await asyncio.wrap_future(future)
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = max(time.monotonic() - self._created_at, 1e-9)
+        started = self.stats["completed"] + self.stats["failed"]
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queued": max(0, self.pending - self.running),
+            "utilization": round(self.stats["busy_time"] / (elapsed * self.max_workers), 4),
+            "avg_queue_time": round(self.stats["queue_time"] / started, 4) if started else 0.0,
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in self.stats.items()}
+        }
+
+    def shutdown(self, wait: bool = False):
+        self._pool.shutdown(wait=wait)
+
+
+class ExecutorRegistry:
+    """Named BoundedExecutors, created on first use.
+
+    Sizes come from DEFAULT_POOLS, overridden by the EXECUTOR_POOLS environment
+    variable or configure(), both as {"name": "workers/queue"}.
+    """
+
+    def __init__(self, pools: Optional[Dict[str, Tuple[int, int]]] = None):
+        self._specs: Dict[str, Tuple[int, int]] = dict(pools or DEFAULT_POOLS)
+        self._executors: Dict[str, BoundedExecutor] = {}
+
+    def configure(self, overrides: Optional[Dict[str, str]]):
+        """Apply {"name": "workers/queue"} overrides; already created pools are replaced"""
+        for name, spec in (overrides or {}).items():
+            try:
+                self._specs[name] = parse_pool_spec(spec)
+            except ValueError:
+                logger.warning(f"Ignoring invalid executor spec {name}={spec!r}, expected 'workers/queue'")
+                continue
+            old = self._executors.pop(name, None)
+            if old is not None:
+                old.shutdown(wait=False)
+
+    def get(self, name: str) -> BoundedExecutor:
+        executor = self._executors.get(name)
+        if executor is None:
+            if name not in self._specs:
+                raise KeyError(f"Unknown executor '{name}'")
+            executor = self._executors[name] = BoundedExecutor(name, *self._specs[name])
+        return executor
+
+    __getitem__ = get
+
+    async def run(self, name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        return await self.get(name).run(func, *args, **kwargs)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: executor.snapshot() for name, executor in self._executors.items()}
+
+    def shutdown(self):
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        self._executors.clear()
+
+
+executors = ExecutorRegistry()
+try:
+    executors.configure(json.loads(os.getenv("EXECUTOR_POOLS") or "{}"))
+except ValueError:
+    logger.warning("EXECUTOR_POOLS is not valid JSON, using default executor sizes")
@@ -0,0 +1,149 @@
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+# Only depends on the standard library so the live API (services/) can use it
+# without pulling in the app settings.
+
+
+@dataclass
+class CachedResponse:
+    """Parsed body of a 200 response plus what is needed to revalidate it.
+
+    The body is handed out as-is on every hit, so callers must not mutate it.
+    """
+    body: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fresh_until: float = 0.0
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.fresh_until
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """'public, max-age=60' -> {'public': None, 'max-age': '60'}"""
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _freshness(headers) -> Optional[float]:
+    """Seconds the response may be reused without asking, None if it must not be stored"""
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    max_age = directives.get("s-maxage") or directives.get("max-age")
+    try:
+        lifetime = float(max_age) if max_age is not None else 0.0
+        lifetime -= float(headers.get("age") or 0)
+    except ValueError:
+        lifetime = 0.0
+    return max(0.0, lifetime)
+
+
+class HttpCache:
+    """In-memory HTTP cache for JSON GETs (ETag/Last-Modified revalidation, Cache-Control freshness).
+
+    While fresh (max-age) the stored body is returned without a request; after
+    that the request carries If-None-Match/If-Modified-Since and a 304 reuses the
+    stored, already-parsed body instead of downloading and decoding it again.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.stats = {"fresh_hits": 0, "revalidated": 0, "downloads": 0}
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        return f"{url}?{urlencode(sorted(params.items()))}" if params else url
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def fresh_body(self, key: str) -> Tuple[bool, Any]:
+        """(True, body) when a stored response can be used without any request"""
+        entry = self.lookup(key)
+        if entry is not None and entry.is_fresh:
+            self.stats["fresh_hits"] += 1
+            return True, entry.body
+        return False, None
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        entry = self.lookup(key)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified(self, key: str, headers) -> Any:
+        """Handle a 304: extend freshness and return the stored body"""
+        entry = self._entries[key]
+        freshness = _freshness(headers)
+        entry.fresh_until = time.monotonic() + (freshness or 0.0)
+        entry.etag = headers.get("etag") or entry.etag
+        self.stats["revalidated"] += 1
+        return entry.body
+
+    def store(self, key: str, headers, body: Any) -> Any:
+        """Remember a 200 response if it is cacheable and revalidatable; returns body"""
+        self.stats["downloads"] += 1
+        freshness = _freshness(headers)
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if freshness is None or not (freshness or etag or last_modified):
+            # Nothing to reuse it with
+            self._entries.pop(key, None)
+            return body
+        self._entries[key] = CachedResponse(
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            fresh_until=time.monotonic() + freshness
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return body
+
+    def fetch_json(self, session, url: str, params: Optional[Dict[str, Any]] = None, timeout: float = 10) -> Optional[Any]:
+        """Blocking GET through a requests.Session; parsed JSON, or None on a non-200 status.
+
+        Network errors propagate like a plain session.get would.
+        """
+        key = self.key(url, params)
+        fresh, body = self.fresh_body(key)
+        if fresh:
+            return body
+        response = session.get(url, params=params, headers=self.conditional_headers(key), timeout=timeout)
+        if response.status_code == 304 and key in self._entries:
+            return self.not_modified(key, response.headers)
+        if response.status_code != 200:
+            return None
+        return self.store(key, response.headers, response.json())
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), **self.stats}
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.executors import executors
+
+logger = logging.getLogger(__name__)
+
+# Latency histogram bucket upper bounds in seconds (Prometheus-style, +Inf implied)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RouteStats:
+    """Latency histogram and counters for one (method, route template, status)"""
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def observe(self, duration: float):
+        self.count += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    last_hit: Optional[datetime] = None
+
+
+class MetricsCollector:
+    """In-process request and cache metrics.
+
+    Recording a request or cache lookup only touches a couple of dict
+    entries. Totals since startup back the /metrics endpoint; a second set
+    of counters accumulates since the last flush and is written to the
+    metrics tables in one batch by a background task.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.requests: Dict[Tuple[str, str, int], RouteStats] = defaultdict(RouteStats)
+        self.cache: Dict[str, CacheStats] = defaultdict(CacheStats)
+        self._pending_requests: Dict[Tuple[str, str, int], RouteStats] = defaultdict(RouteStats)
+        self._pending_cache: Dict[str, CacheStats] = defaultdict(CacheStats)
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def record_request(self, method: str, route: str, status_code: int, duration: float):
+        key = (method, route, status_code)
+        self.requests[key].observe(duration)
+        self._pending_requests[key].observe(duration)
+
+    def record_cache(self, namespace: str, hit: bool):
+        for stats in (self.cache[namespace], self._pending_cache[namespace]):
+            if hit:
+                stats.hits += 1
+                stats.last_hit = datetime.utcnow()
+            else:
+                stats.misses += 1
+
+    def snapshot(self) -> Dict[str, List[Dict]]:
+        """Totals since startup, hottest routes first"""
+        routes = [
+            {
+                "method": method,
+                "route": route,
+                "status_code": status_code,
+                "count": stats.count,
+                "avg_time": stats.total_time / stats.count if stats.count else 0.0,
+                "max_time": stats.max_time,
+                "total_time": stats.total_time
+            }
+            for (method, route, status_code), stats in self.requests.items()
+        ]
+        routes.sort(key=lambda r: r["total_time"], reverse=True)
+        cache = [
+            {"namespace": namespace, "hits": stats.hits, "misses": stats.misses}
+            for namespace, stats in self.cache.items()
+        ]
+        return {"routes": routes, "cache": cache}
+
+    def render_prometheus(self) -> str:
+        """Render totals in the Prometheus text exposition format"""
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route template",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        requests_total = []
+        for (method, route, status_code), stats in sorted(self.requests.items()):
+            labels = f'method="{method}",route="{_escape(route)}",status="{status_code}"'
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += bucket_count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {stats.total_time:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {stats.count}")
+            requests_total.append(f"http_requests_total{{{labels}}} {stats.count}")
+
+        lines.append("# HELP http_requests_total Requests by route template and status")
+        lines.append("# TYPE http_requests_total counter")
+        lines.extend(requests_total)
+
+        lines.append("# HELP cache_requests_total Cache lookups by namespace and result")
+        lines.append("# TYPE cache_requests_total counter")
+        for namespace, stats in sorted(self.cache.items()):
+            lines.append(f'cache_requests_total{{namespace="{_escape(namespace)}",result="hit"}} {stats.hits}')
+            lines.append(f'cache_requests_total{{namespace="{_escape(namespace)}",result="miss"}} {stats.misses}')
+
+        executor_stats = sorted(executors.snapshot().items())
+        lines.append("# HELP executor_tasks_total Blocking calls by executor and outcome")
+        lines.append("# TYPE executor_tasks_total counter")
+        for name, stats in executor_stats:
+            for result in ("completed", "failed", "rejected"):
+                lines.append(f'executor_tasks_total{{executor="{name}",result="{result}"}} {stats[result]}')
+        for metric, key, help_text in (
+            ("executor_running", "running", "Calls currently running"),
+            ("executor_queued", "queued", "Calls waiting for a worker"),
+            ("executor_utilization", "utilization", "Share of worker time spent busy since startup"),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for name, stats in executor_stats:
+                lines.append(f'{metric}{{executor="{name}"}} {stats[key]}')
+
+        lines.append("# HELP process_uptime_seconds Seconds since the metrics collector started")
+        lines.append("# TYPE process_uptime_seconds gauge")
+        lines.append(f"process_uptime_seconds {time.time() - self.started_at:.0f}")
+        return "\n".join(lines) + "\n"
+
+    async def flush(self) -> int:
+        """Write counters accumulated since the last flush as aggregated rows"""
+        if not self._pending_requests and not self._pending_cache:
+            return 0
+
+        pending_requests, self._pending_requests = self._pending_requests, defaultdict(RouteStats)
+        pending_cache, self._pending_cache = self._pending_cache, defaultdict(CacheStats)
+
+        from sqlalchemy import select
+        from app.core.database import get_db, APIMetricsDB, CacheMetricsDB
+
+        try:
+            async with get_db() as db:
+                db.add_all([
+                    APIMetricsDB(
+                        endpoint=route[:200],
+                        method=method,
+                        status_code=status_code,
+                        response_time=stats.total_time / stats.count,
+                        request_count=stats.count
+                    )
+                    for (method, route, status_code), stats in pending_requests.items()
+                ])
+
+                # One running row per cache namespace
+                if pending_cache:
+                    result = await db.execute(
+                        select(CacheMetricsDB).where(
+                            CacheMetricsDB.namespace.in_(list(pending_cache.keys())),
+                            CacheMetricsDB.cache_key == "*"
+                        )
+                    )
+                    existing = {row.namespace: row for row in result.scalars()}
+                    for namespace, stats in pending_cache.items():
+                        row = existing.get(namespace)
+                        if row is None:
+                            row = CacheMetricsDB(namespace=namespace, cache_key="*", hit_count=0, miss_count=0)
+                            db.add(row)
+                        row.hit_count = (row.hit_count or 0) + stats.hits
+                        row.miss_count = (row.miss_count or 0) + stats.misses
+                        if stats.last_hit:
+                            row.last_hit = stats.last_hit
+        except Exception as e:
+            logger.error(f"Failed to flush metrics: {e}")
+            return 0
+
+        return len(pending_requests) + len(pending_cache)
+
+    async def _flush_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+
+    def start(self, interval: float = 60.0):
+        """Start the periodic background flush"""
+        if not self._flush_task or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop(interval))
+
+    async def stop(self):
+        """Stop the background flush and write whatever is still pending"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Global instance
+metrics_collector = MetricsCollector()
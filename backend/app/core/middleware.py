@@ -1,145 +1,241 @@
-from fastapi import Request, HTTPException
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import math
 import time
 import logging
-from typing import Dict
-import asyncio
+from typing import Dict, Optional
 
-from app.core.exceptions import OpenF1APIException, RateLimitException
+from app.core.exceptions import CircuitOpenException, OpenF1APIException, RateLimitException
+from app.core.resilience import request_deadline, set_deadline
+from app.core.rate_limit import RateLimitRule, RouteRateLimits, create_rate_limiter, rate_limit_headers
+from app.core.metrics import metrics_collector
 
 logger = logging.getLogger(__name__)
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+# These are plain ASGI middleware rather than BaseHTTPMiddleware subclasses:
+# they wrap `send` instead of buffering the response through an extra task
+# and memory stream, so streaming responses pass straight through.
+
+class ErrorHandlingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
-        except OpenF1APIException as e:
-            logger.error(f"OpenF1 API error: {e.message}")
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            if response_started:
+                # Headers are already on the wire; nothing sensible to replace them with
+                raise
+            response = self._error_response(e)
+            await response(scope, receive, send)
+
+    def _error_response(self, exc: Exception) -> JSONResponse:
+        if isinstance(exc, OpenF1APIException):
+            logger.error(f"OpenF1 API error: {exc.message}")
+            headers = None
+            if isinstance(exc, CircuitOpenException):
+                headers = {"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
             return JSONResponse(
-                status_code=e.status_code or 500,
+                status_code=exc.status_code or 500,
                 content={
                     "error": "OpenF1 API Error",
-                    "message": e.message,
-                    "status_code": e.status_code
-                }
+                    "message": exc.message,
+                    "status_code": exc.status_code
+                },
+                headers=headers
             )
-        except RateLimitException as e:
-            logger.warning(f"Rate limit exceeded: {e.message}")
+        if isinstance(exc, RateLimitException):
+            logger.warning(f"Rate limit exceeded: {exc.message}")
             return JSONResponse(
                 status_code=429,
                 content={
                     "error": "Rate Limit Exceeded",
-                    "message": e.message
+                    "message": exc.message
                 }
             )
-        except HTTPException as e:
+        if isinstance(exc, HTTPException):
             return JSONResponse(
-                status_code=e.status_code,
+                status_code=exc.status_code,
                 content={
                     "error": "HTTP Exception",
-                    "message": e.detail
-                }
-            )
-        except Exception as e:
-            logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": "Internal Server Error",
-                    "message": "An unexpected error occurred"
+                    "message": exc.detail
                 }
             )
+        logger.error(f"Unhandled exception: {str(exc)}", exc_info=exc)
+        return JSONResponse(
+            status_code=500,
+            content={
+                "error": "Internal Server Error",
+                "message": "An unexpected error occurred"
+            }
+        )
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, calls: int = 60, period: int = 60):
-        super().__init__(app)
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        calls: int = 60,
+        period: int = 60,
+        burst: Optional[int] = None,
+        routes: Optional[Dict[str, str]] = None,
+        backend: str = "memory"
+    ):
+        self.app = app
         self.calls = calls
         self.period = period
-        self.clients: Dict[str, list] = {}
-        self._cleanup_task = None
-    
-    async def dispatch(self, request: Request, call_next):
+        self.limits = RouteRateLimits(
+            default=RateLimitRule(limit=calls, period=period, burst=burst),
+            routes={prefix: RateLimitRule.parse(spec) for prefix, spec in (routes or {}).items()}
+        )
+        self.limiter = create_rate_limiter(backend)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get client IP
-        client_ip = request.client.host
-        
-        # Initialize or get client's request timestamps
-        now = time.time()
-        if client_ip not in self.clients:
-            self.clients[client_ip] = []
-        
-        # Remove old timestamps
-        self.clients[client_ip] = [
-            timestamp for timestamp in self.clients[client_ip]
-            if now - timestamp < self.period
-        ]
-        
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+
+        # One bucket per client and route group
+        bucket, rule = self.limits.resolve(scope["path"])
+        result = await self.limiter.check(f"{client_ip}:{bucket}", rule)
+        headers = rate_limit_headers(result)
+
         # Check rate limit
-        if len(self.clients[client_ip]) >= self.calls:
-            return JSONResponse(
+        if not result.allowed:
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "Rate limit exceeded",
-                    "retry_after": self.period
+                    "retry_after": int(headers["Retry-After"])
                 },
-                headers={
-                    "Retry-After": str(self.period),
-                    "X-RateLimit-Limit": str(self.calls),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(now + self.period))
-                }
+                headers=headers
             )
-        
-        # Record this request
-        self.clients[client_ip].append(now)
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(self.calls)
-        response.headers["X-RateLimit-Remaining"] = str(
-            self.calls - len(self.clients[client_ip])
-        )
-        response.headers["X-RateLimit-Reset"] = str(int(now + self.period))
-        
-        # Start cleanup task if not running
-        if not self._cleanup_task or self._cleanup_task.done():
-            self._cleanup_task = asyncio.create_task(self._cleanup_old_clients())
-        
-        return response
-    
-    async def _cleanup_old_clients(self):
-        while True:
-            await asyncio.sleep(self.period)
-            now = time.time()
-            # Remove clients with no recent requests
-            self.clients = {
-                ip: timestamps
-                for ip, timestamps in self.clients.items()
-                if any(now - ts < self.period for ts in timestamps)
-            }
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message):
+            # Add rate limit headers
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+class DeadlineMiddleware:
+    """Gives each request a time budget that upstream calls (OpenF1 retries) must fit in.
+
+    Defaults to `default` seconds; a client may ask for less with X-Request-Timeout.
+    """
+
+    def __init__(self, app: ASGIApp, default: float = 20.0):
+        self.app = app
+        self.default = default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = self.default
+        for name, value in scope.get("headers", []):
+            if name == b"x-request-timeout":
+                try:
+                    budget = min(budget, max(0.1, float(value)))
+                except ValueError:
+                    pass
+                break
+
+        token = set_deadline(budget)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_deadline.reset(token)
+
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
         start_time = time.time()
-        
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
+
         # Log request
-        logger.info(f"Request: {request.method} {request.url.path}")
-        
-        response = await call_next(request)
-        
-        # Calculate request duration
-        duration = time.time() - start_time
-        
-        # Log response
-        logger.info(
-            f"Response: {request.method} {request.url.path} "
-            f"- Status: {response.status_code} - Duration: {duration:.3f}s"
-        )
-        
-        # Add timing header
-        response.headers["X-Process-Time"] = str(duration)
-        
-        return response
\ No newline at end of file
+        logger.info(f"Request: {method} {path}")
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add timing header (time until the response headers are ready)
+                MutableHeaders(scope=message)["X-Process-Time"] = str(time.time() - start_time)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Calculate request duration
+            duration = time.time() - start_time
+
+            # Log response
+            logger.info(
+                f"Response: {method} {path} "
+                f"- Status: {status_code} - Duration: {duration:.3f}s"
+            )
+
+class MetricsMiddleware:
+    """Records latency and status per route template (e.g. /api/v1/drivers/{driver_number})"""
+
+    def __init__(self, app: ASGIApp, collector=None):
+        self.app = app
+        self.collector = collector or metrics_collector
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the scope; unmatched paths share
+            # one label so arbitrary URLs can't blow up the number of series
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "__unmatched__"
+            self.collector.record_request(
+                scope["method"], route_path, status_code, time.perf_counter() - start_time
+            )
@@ -0,0 +1,193 @@
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Mapping, Optional, Tuple
+
+# Standard library only: shared by the live API (services/) and app/services.
+# Every push is O(1) (amortized for the sliding window), so statistics over a
+# whole session never rescan its history.
+
+
+class RunningStats:
+    """Count, mean, variance (Welford), min and max of every value pushed"""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def push(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Sample variance, None with fewer than two values"""
+        if self.count < 2:
+            return None
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self) -> Optional[float]:
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count else None,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max
+        }
+
+
+class Ewma:
+    """Exponentially weighted moving average; alpha is the weight of the newest value"""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, alpha: float = 0.2):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.value: Optional[float] = None
+
+    def push(self, x: float):
+        self.value = x if self.value is None else self.value + self.alpha * (x - self.value)
+
+
+class SlidingWindow:
+    """Values of the last `span` time units: mean, min, max and least-squares slope.
+
+    Keeps running sums for the regression and monotonic deques for min/max,
+    so both push and eviction are amortized O(1). Times must not decrease.
+    """
+
+    def __init__(self, span: float):
+        self.span = span
+        self.samples: Deque[Tuple[float, float]] = deque()
+        self._origin: Optional[float] = None  # keeps the time sums small
+        self._sum_t = self._sum_x = self._sum_tt = self._sum_tx = 0.0
+        self._mins: Deque[Tuple[float, float]] = deque()
+        self._maxs: Deque[Tuple[float, float]] = deque()
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def push(self, t: float, x: float):
+        if self._origin is None:
+            self._origin = t
+        self.samples.append((t, x))
+        u = t - self._origin
+        self._sum_t += u
+        self._sum_x += x
+        self._sum_tt += u * u
+        self._sum_tx += u * x
+        while self._mins and self._mins[-1][1] >= x:
+            self._mins.pop()
+        self._mins.append((t, x))
+        while self._maxs and self._maxs[-1][1] <= x:
+            self._maxs.pop()
+        self._maxs.append((t, x))
+        self._evict(t - self.span)
+
+    def _evict(self, cutoff: float):
+        while self.samples and self.samples[0][0] < cutoff:
+            t, x = self.samples.popleft()
+            u = t - self._origin
+            self._sum_t -= u
+            self._sum_x -= x
+            self._sum_tt -= u * u
+            self._sum_tx -= u * x
+            if self._mins[0][0] <= t:
+                self._mins.popleft()
+            if self._maxs[0][0] <= t:
+                self._maxs.popleft()
+        if not self.samples:
+            self._origin = None
+            self._sum_t = self._sum_x = self._sum_tt = self._sum_tx = 0.0
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._sum_x / len(self.samples) if self.samples else None
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._mins[0][1] if self._mins else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._maxs[0][1] if self._maxs else None
+
+    @property
+    def slope(self) -> Optional[float]:
+        """Change of the value per time unit, None until two distinct times are in the window"""
+        n = len(self.samples)
+        if n < 2:
+            return None
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 1e-12 * max(1.0, n * self._sum_tt):
+            return None
+        return (n * self._sum_tx - self._sum_t * self._sum_x) / denominator
+
+
+class StreamStats:
+    """Running, EWMA and sliding-window statistics of one series"""
+
+    def __init__(self, window: float, alpha: float = 0.2):
+        self.running = RunningStats()
+        self.ewma = Ewma(alpha)
+        self.window = SlidingWindow(window)
+        self.last: Optional[float] = None
+        self.last_time: Optional[float] = None
+
+    def push(self, t: float, x: Optional[float]):
+        """Add a value observed at time t (None and NaN are skipped)"""
+        if x is None or x != x:
+            return
+        self.running.push(x)
+        self.ewma.push(x)
+        self.window.push(t, x)
+        self.last = x
+        self.last_time = t
+
+    def snapshot(self, slope_unit: float = 1.0) -> Dict[str, Any]:
+        """slope_unit scales the slope, e.g. 1800 for change per 30 minutes with times in seconds"""
+        slope = self.window.slope
+        return {
+            **self.running.snapshot(),
+            "current": self.last,
+            "ewma": self.ewma.value,
+            "window_samples": len(self.window),
+            "window_mean": self.window.mean,
+            "window_min": self.window.min,
+            "window_max": self.window.max,
+            "slope": slope * slope_unit if slope is not None else None
+        }
+
+
+class StatsGroup:
+    """StreamStats for a fixed set of fields of the same samples"""
+
+    def __init__(self, fields: Iterable[str], window: float, alpha: float = 0.2):
+        self.fields: Dict[str, StreamStats] = {name: StreamStats(window, alpha) for name in fields}
+
+    def __getitem__(self, name: str) -> StreamStats:
+        return self.fields[name]
+
+    def push(self, t: float, sample: Mapping[str, Any]):
+        for name, stats in self.fields.items():
+            stats.push(t, sample.get(name))
+
+    def snapshot(self, slope_unit: float = 1.0) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.snapshot(slope_unit) for name, stats in self.fields.items()}
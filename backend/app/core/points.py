@@ -0,0 +1,26 @@
+from typing import Any, Dict, Tuple
+
+# Standard library only: the single source of the F1 points tables for the
+# live API (services/), app/services and the compute worker kernels.
+
+RACE_POINTS: Tuple[int, ...] = (25, 18, 15, 12, 10, 8, 6, 4, 2, 1)
+SPRINT_POINTS: Tuple[int, ...] = (8, 7, 6, 5, 4, 3, 2, 1)
+SPRINT_POINTS_2021: Tuple[int, ...] = (3, 2, 1)
+
+
+def points_rules(year: int) -> Dict[str, Any]:
+    """Points for one race / sprint in a given season.
+
+    The fastest lap point (top-10 finishers only) existed from 2019 to 2024;
+    sprints scored top-3 in 2021 and top-8 from 2022.
+    """
+    return {
+        "race": RACE_POINTS,
+        "sprint": SPRINT_POINTS_2021 if year <= 2021 else SPRINT_POINTS,
+        "fastest_lap": 1 if 2019 <= year <= 2024 else 0
+    }
+
+
+def position_points(table: Tuple[int, ...] = RACE_POINTS) -> Dict[int, int]:
+    """{finishing position: points} for a points table"""
+    return {position: points for position, points in enumerate(table, 1)}
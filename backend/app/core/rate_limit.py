@@ -0,0 +1,235 @@
+import math
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """`limit` requests per `period` seconds, with up to `burst` requests back to back.
+
+    When burst is None the bucket holds a full period's worth of requests,
+    which matches the previous fixed-window behavior.
+    """
+    limit: int
+    period: float
+    burst: Optional[int] = None
+
+    @property
+    def emission_interval(self) -> float:
+        return self.period / self.limit
+
+    @property
+    def capacity(self) -> int:
+        return self.burst or self.limit
+
+    @property
+    def burst_offset(self) -> float:
+        return self.emission_interval * self.capacity
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimitRule":
+        """Parse "limit/period" or "limit/period:burst", e.g. "120/60:20" """
+        rate, _, burst = spec.partition(":")
+        limit, _, period = rate.partition("/")
+        return cls(
+            limit=int(limit),
+            period=float(period or 60),
+            burst=int(burst) if burst else None
+        )
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # seconds until the bucket is full again
+    retry_after: float  # seconds until the next request is allowed (0 if allowed)
+
+
+def _gcra(tat: float, now: float, rule: RateLimitRule) -> Tuple[Optional[float], RateLimitResult]:
+    """Generic cell rate algorithm. Returns the new theoretical arrival time (None if denied)."""
+    interval = rule.emission_interval
+    tat = max(tat, now)
+    new_tat = tat + interval
+    allow_at = new_tat - rule.burst_offset
+
+    if now < allow_at:
+        return None, RateLimitResult(
+            allowed=False,
+            limit=rule.limit,
+            remaining=0,
+            reset_after=tat - now,
+            retry_after=allow_at - now
+        )
+
+    remaining = int((now - allow_at) / interval + 1e-9)
+    return new_tat, RateLimitResult(
+        allowed=True,
+        limit=rule.limit,
+        remaining=remaining,
+        reset_after=new_tat - now,
+        retry_after=0.0
+    )
+
+
+class MemoryRateLimiter:
+    """Per-process GCRA limiter: a single float (theoretical arrival time) per key.
+
+    Keys are kept in least-recently-used order, so expired entries are pruned
+    a few at a time from the front on each check instead of by a periodic
+    sweep over every client.
+    """
+
+    def __init__(self, prune_batch: int = 8):
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self.prune_batch = prune_batch
+
+    def _prune(self, now: float):
+        for _ in range(self.prune_batch):
+            if not self._tats:
+                return
+            key, tat = next(iter(self._tats.items()))
+            if tat > now:
+                return
+            del self._tats[key]
+
+    async def check(self, key: str, rule: RateLimitRule) -> RateLimitResult:
+        now = time.monotonic()
+        self._prune(now)
+
+        new_tat, result = _gcra(self._tats.get(key, now), now, rule)
+        if new_tat is not None:
+            self._tats[key] = new_tat
+            self._tats.move_to_end(key)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+# KEYS[1] = bucket key
+# ARGV = emission interval (ms), burst offset (ms)
+# Returns {allowed, remaining, reset_after_ms, retry_after_ms}
+GCRA_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local interval = tonumber(ARGV[1])
+local burst_offset = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+  tat = now
+end
+
+local new_tat = tat + interval
+local allow_at = new_tat - burst_offset
+
+if now < allow_at then
+  return {0, 0, tat - now, allow_at - now}
+end
+
+local ttl = math.ceil(new_tat - now)
+redis.call('SET', KEYS[1], new_tat, 'PX', ttl)
+return {1, math.floor((now - allow_at) / interval), ttl, 0}
+"""
+
+
+class RedisRateLimiter:
+    """GCRA limiter with state in Redis, shared by every worker process.
+
+    Each check is a single EVALSHA round trip. If Redis is unavailable the
+    limiter falls back to per-process limiting, like cache_service does.
+    """
+
+    def __init__(self, redis_client=None, key_prefix: str = "ratelimit"):
+        self._redis_client = redis_client
+        self.key_prefix = key_prefix
+        self._script = None
+        self._script_client = None
+        self._fallback = MemoryRateLimiter()
+
+    @property
+    def redis_client(self):
+        if self._redis_client is not None:
+            return self._redis_client
+        # Share the connection pool set up by cache_service at startup
+        from app.services.cache_service import cache_service
+        return cache_service.redis_client
+
+    async def check(self, key: str, rule: RateLimitRule) -> RateLimitResult:
+        client = self.redis_client
+        if client is None:
+            return await self._fallback.check(key, rule)
+
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(GCRA_LUA)
+            self._script_client = client
+
+        try:
+            allowed, remaining, reset_after_ms, retry_after_ms = await self._script(
+                keys=[f"{self.key_prefix}:{key}"],
+                args=[rule.emission_interval * 1000, rule.burst_offset * 1000]
+            )
+        except Exception as e:
+            logger.warning(f"Redis rate limit check failed, using in-memory limiter: {e}")
+            return await self._fallback.check(key, rule)
+
+        return RateLimitResult(
+            allowed=bool(int(allowed)),
+            limit=rule.limit,
+            remaining=int(remaining),
+            reset_after=float(reset_after_ms) / 1000,
+            retry_after=float(retry_after_ms) / 1000
+        )
+
+
+class RouteRateLimits:
+    """Resolves the rule for a request path by longest matching prefix"""
+
+    def __init__(self, default: RateLimitRule, routes: Optional[Dict[str, RateLimitRule]] = None):
+        self.default = default
+        # Longest prefix first so the first match is the most specific one
+        self._routes: List[Tuple[str, RateLimitRule]] = sorted(
+            (routes or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._resolved: Dict[str, Tuple[str, RateLimitRule]] = {}
+
+    def resolve(self, path: str) -> Tuple[str, RateLimitRule]:
+        """Return (bucket name, rule) for a path; results are memoized per path"""
+        cached = self._resolved.get(path)
+        if cached is not None:
+            return cached
+
+        match = ("*", self.default)
+        for prefix, rule in self._routes:
+            if path.startswith(prefix):
+                match = (prefix, rule)
+                break
+
+        if len(self._resolved) < 10000:
+            self._resolved[path] = match
+        return match
+
+
+def create_rate_limiter(backend: str = "memory"):
+    if backend == "redis":
+        return RedisRateLimiter()
+    return MemoryRateLimiter()
+
+
+def rate_limit_headers(result: RateLimitResult) -> Dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(max(0, result.remaining)),
+        "X-RateLimit-Reset": str(int(time.time() + result.reset_after)),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(1, math.ceil(result.retry_after)))
+    return headers
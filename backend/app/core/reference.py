@@ -0,0 +1,256 @@
+import json
+import sys
+import logging
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Standard library only, like http_cache, so scrapers and the live API can share it
+DATA_FILE = Path(__file__).with_name("reference_data.json")
+
+
+def normalize_name(name: str) -> str:
+    """'Nico Hülkenberg ' -> 'nico hulkenberg' (accents, case and spacing ignored)"""
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True)
+class TeamRef:
+    team_id: str  # Ergast constructorId
+    name: str  # Ergast name, e.g. "RB F1 Team"
+    display_name: str  # Name used by the standings pages, e.g. "RB"
+    color: str
+    slug: Optional[str] = None  # motorsportstats.com
+    aliases: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class DriverRef:
+    driver_id: str  # Ergast driverId
+    given_name: str
+    family_name: str
+    code: str
+    permanent_number: Optional[int]
+    nationality: str
+    country_code: str
+    date_of_birth: str = ""
+    place_of_birth: str = ""
+    slug: Optional[str] = None  # motorsportstats.com
+    aliases: Tuple[str, ...] = ()
+    career: Dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.given_name} {self.family_name}"
+
+
+@dataclass(frozen=True)
+class Seat:
+    """A driver's race number and team for (part of) a season"""
+    season: int
+    driver: DriverRef
+    team: TeamRef
+    number: int
+    first_round: int = 1
+    last_round: Optional[int] = None  # None = until the end of the season
+
+    def covers(self, round_number: int) -> bool:
+        return self.first_round <= round_number and (self.last_round is None or round_number <= self.last_round)
+
+
+class ReferenceRegistry:
+    """Drivers, teams and season line-ups, indexed once for O(1) lookups.
+
+    Season lookups take an optional round for mid-season swaps; without one
+    the latest seat of that season is returned.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.countries: Dict[str, str] = {
+            _intern(code): _intern(nationality) for code, nationality in data.get("countries", {}).items()
+        }
+
+        self.teams: Dict[str, TeamRef] = {}
+        self._teams_by_name: Dict[str, TeamRef] = {}
+        self._teams_by_slug: Dict[str, TeamRef] = {}
+        for team_id, info in data.get("teams", {}).items():
+            team = TeamRef(
+                team_id=_intern(team_id),
+                name=_intern(info["name"]),
+                display_name=_intern(info.get("display_name") or info["name"]),
+                color=_intern(info.get("color", "#666666")),
+                slug=_intern(info.get("slug")),
+                aliases=tuple(_intern(alias) for alias in info.get("aliases", []))
+            )
+            self.teams[team.team_id] = team
+            for name in (team.name, team.display_name, *team.aliases):
+                self._teams_by_name.setdefault(normalize_name(name), team)
+            if team.slug:
+                self._teams_by_slug[team.slug] = team
+
+        self.drivers: Dict[str, DriverRef] = {}
+        self._drivers_by_code: Dict[str, DriverRef] = {}
+        self._drivers_by_slug: Dict[str, DriverRef] = {}
+        self._drivers_by_name: Dict[str, DriverRef] = {}
+        self._drivers_by_number: Dict[int, DriverRef] = {}
+        for driver_id, info in data.get("drivers", {}).items():
+            driver = DriverRef(
+                driver_id=_intern(driver_id),
+                given_name=_intern(info["given_name"]),
+                family_name=_intern(info["family_name"]),
+                code=_intern(info.get("code", "")),
+                permanent_number=info.get("permanent_number"),
+                nationality=_intern(info.get("nationality", "")),
+                country_code=_intern(info.get("country_code", "")),
+                date_of_birth=info.get("date_of_birth", ""),
+                place_of_birth=info.get("place_of_birth", ""),
+                slug=_intern(info.get("slug")),
+                aliases=tuple(_intern(alias) for alias in info.get("aliases", [])),
+                career=info.get("career", {})
+            )
+            self.drivers[driver.driver_id] = driver
+            self._drivers_by_code.setdefault(driver.code, driver)
+            if driver.slug:
+                self._drivers_by_slug[driver.slug] = driver
+            for name in (driver.full_name, *driver.aliases):
+                self._drivers_by_name[normalize_name(name)] = driver
+            if driver.permanent_number is not None:
+                self._drivers_by_number[driver.permanent_number] = driver
+
+        # (season, number) / (season, driver_id) -> seats in round order
+        self._seats_by_number: Dict[Tuple[int, int], List[Seat]] = {}
+        self._seats_by_driver: Dict[Tuple[int, str], List[Seat]] = {}
+        self._seasons: Dict[int, List[Seat]] = {}
+        for season_key, entries in data.get("seasons", {}).items():
+            season = int(season_key)
+            for entry in entries:
+                first_round, last_round = entry.get("rounds") or (1, None)
+                seat = Seat(
+                    season=season,
+                    driver=self.drivers[entry["driver"]],
+                    team=self.teams[entry["team"]],
+                    number=entry["number"],
+                    first_round=first_round,
+                    last_round=last_round
+                )
+                self._seasons.setdefault(season, []).append(seat)
+                self._seats_by_number.setdefault((season, seat.number), []).append(seat)
+                self._seats_by_driver.setdefault((season, seat.driver.driver_id), []).append(seat)
+        for seats in (*self._seats_by_number.values(), *self._seats_by_driver.values()):
+            seats.sort(key=lambda seat: seat.first_round)
+
+    @classmethod
+    def load(cls, path: Path = DATA_FILE) -> "ReferenceRegistry":
+        with open(path, "r", encoding="utf-8") as f:
+            registry = cls(json.load(f))
+        logger.info(
+            f"Loaded reference data: {len(registry.drivers)} drivers, {len(registry.teams)} teams, "
+            f"seasons {sorted(registry._seasons)}"
+        )
+        return registry
+
+    # ---- seasons ----
+
+    @property
+    def seasons(self) -> List[int]:
+        return sorted(self._seasons)
+
+    def season_seats(self, season: int) -> List[Seat]:
+        return list(self._seasons.get(season, []))
+
+    def season_drivers(self, season: int) -> List[DriverRef]:
+        """Everyone who raced in the season, in line-up order"""
+        return list({seat.driver.driver_id: seat.driver for seat in self._seasons.get(season, [])}.values())
+
+    @staticmethod
+    def _pick(seats: Optional[List[Seat]], round_number: Optional[int]) -> Optional[Seat]:
+        if not seats:
+            return None
+        if round_number is None:
+            return seats[-1]
+        return next((seat for seat in seats if seat.covers(round_number)), None)
+
+    def seat_for_number(self, season: int, number: int, round_number: Optional[int] = None) -> Optional[Seat]:
+        return self._pick(self._seats_by_number.get((season, number)), round_number)
+
+    def seat_for_driver(self, season: int, driver_id: str, round_number: Optional[int] = None) -> Optional[Seat]:
+        return self._pick(self._seats_by_driver.get((season, driver_id)), round_number)
+
+    # ---- drivers ----
+
+    def driver_by_id(self, driver_id: str) -> Optional[DriverRef]:
+        return self.drivers.get(driver_id)
+
+    def driver_by_code(self, code: str) -> Optional[DriverRef]:
+        return self._drivers_by_code.get((code or "").upper())
+
+    def driver_by_slug(self, slug: str) -> Optional[DriverRef]:
+        return self._drivers_by_slug.get(slug)
+
+    def driver_by_name(self, name: str) -> Optional[DriverRef]:
+        return self._drivers_by_name.get(normalize_name(name))
+
+    def driver_by_number(
+        self,
+        number: int,
+        season: Optional[int] = None,
+        round_number: Optional[int] = None
+    ) -> Optional[DriverRef]:
+        """Race number in the given season, falling back to permanent numbers"""
+        if season is not None:
+            seat = self.seat_for_number(season, number, round_number)
+            if seat:
+                return seat.driver
+        return self._drivers_by_number.get(number)
+
+    def describe_number(
+        self,
+        number: int,
+        season: Optional[int] = None,
+        round_number: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Name/team/color for a race number as shown on the standings pages.
+
+        "active" is False when the number only matched a driver's permanent
+        number and not that season's line-up; None for unknown numbers.
+        """
+        seat = self.seat_for_number(season, number, round_number) if season is not None else None
+        if seat is None:
+            driver = self._drivers_by_number.get(number)
+            if driver is None:
+                return None
+            seat = self.seat_for_driver(self.seasons[-1], driver.driver_id) if self._seasons else None
+            if seat is None:
+                return {"name": driver.full_name, "team": "Unknown Team", "color": "#666666", "active": False}
+            return {"name": driver.full_name, "team": seat.team.display_name, "color": seat.team.color, "active": False}
+        return {"name": seat.driver.full_name, "team": seat.team.display_name, "color": seat.team.color, "active": True}
+
+    # ---- teams / countries ----
+
+    def team_by_id(self, team_id: str) -> Optional[TeamRef]:
+        return self.teams.get(team_id)
+
+    def team_by_name(self, name: str) -> Optional[TeamRef]:
+        return self._teams_by_name.get(normalize_name(name))
+
+    def team_by_slug(self, slug: str) -> Optional[TeamRef]:
+        return self._teams_by_slug.get(slug)
+
+    def team_color(self, name: str, default: str = "#666666") -> str:
+        team = self.team_by_name(name)
+        return team.color if team else default
+
+    def nationality(self, country_code: str, default: str = "Unknown") -> str:
+        return self.countries.get((country_code or "").upper(), default)
+
+
+reference = ReferenceRegistry.load()
@@ -0,0 +1,169 @@
+import math
+import time
+import random
+import logging
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Deque, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyStats:
+    """Rolling latency and outcome samples for one upstream (last `window` calls)"""
+
+    def __init__(self, window: int = 200):
+        self.samples: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self.total_calls = 0
+        self.total_failures = 0
+
+    def record(self, duration: float, ok: bool):
+        self.samples.append((duration, ok))
+        self.total_calls += 1
+        if not ok:
+            self.total_failures += 1
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Latency percentile (0 < p <= 1) of successful calls, None without samples"""
+        durations = sorted(duration for duration, ok in self.samples if ok)
+        if not durations:
+            return None
+        index = min(len(durations) - 1, max(0, math.ceil(p * len(durations)) - 1))
+        return durations[index]
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        if not self.samples:
+            return None
+        return sum(1 for _, ok in self.samples if ok) / len(self.samples)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self.samples),
+            "success_rate": self.success_rate,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "total_calls": self.total_calls,
+            "total_failures": self.total_failures
+        }
+
+
+class CircuitBreaker:
+    """Closed -> open after `failure_threshold` consecutive failures.
+
+    While open, calls are rejected without touching the upstream. After
+    `recovery_timeout` seconds the breaker is half-open and lets a single
+    trial call through: success closes it, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.recovery_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until a trial call is allowed (0 unless open)"""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+
+    def available(self) -> bool:
+        """Whether a call would currently be let through (no side effects)"""
+        state = self.state
+        return state == self.CLOSED or (state == self.HALF_OPEN and not self._trial_in_flight)
+
+    def allow_request(self) -> bool:
+        """Reserve a call. In half-open state only one trial call is let through."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        if self.opened_at is not None:
+            logger.info(f"Circuit {self.name} closed")
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self._trial_in_flight or (
+            self.opened_at is None and self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.opened_at is None:
+                self.times_opened += 1
+                logger.warning(f"Circuit {self.name} opened after {self.consecutive_failures} failures")
+            self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release(self):
+        """Give back a reserved call that ended without an outcome (e.g. cancelled)"""
+        self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after": round(self.retry_after, 1),
+            "times_opened": self.times_opened
+        }
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Up to `attempts` tries with exponential backoff and full jitter between them"""
+    attempts: int = 3
+    base_delay: float = 0.25
+    max_delay: float = 2.0
+
+    def backoff(self, attempt: int) -> float:
+        """Sleep before retry number `attempt` (1 = first retry)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+# Absolute time.monotonic() deadline of the request being served, if any
+request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(seconds: float):
+    """Set the deadline `seconds` from now, keeping an earlier one if already set.
+    Returns the token for request_deadline.reset()."""
+    deadline = time.monotonic() + seconds
+    current = request_deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    return request_deadline.set(deadline)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline (None without a deadline)"""
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
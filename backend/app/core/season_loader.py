@@ -0,0 +1,152 @@
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from app.core.executors import executors
+
+logger = logging.getLogger(__name__)
+
+# No third-party imports: the loader function (livef1.get_season) is passed in
+# and blocking loads run on the shared "bulk" pool from app.core.executors, so
+# both the live API (services/) and app/services can share it.
+
+
+@dataclass
+class SeasonEntry:
+    season: Any
+    loaded_at: float
+    sessions: Dict[Any, Any] = field(default_factory=dict)  # session_key -> session
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+
+def index_sessions(season: Any) -> Dict[Any, Any]:
+    """session_key -> session for every session of every meeting"""
+    index = {}
+    for meeting in getattr(season, "meetings", None) or []:
+        for session in getattr(meeting, "sessions", None) or []:
+            session_key = getattr(session, "session_key", None)
+            if session_key is not None:
+                index[session_key] = session
+    return index
+
+
+class SeasonLoader:
+    """Loads season objects off the event loop and keeps the last few years.
+
+    - get_season runs in the bulk executor, never on the event loop or next
+      to the live timing polls
+    - concurrent requests for the same year wait on one load (single flight)
+    - the current season is refreshed in the background once older than
+      refresh_after; callers keep getting the cached object meanwhile
+    - past seasons do not change and are only evicted by the LRU
+    """
+
+    def __init__(
+        self,
+        load: Callable[[int], Any],
+        max_seasons: int = 4,
+        refresh_after: float = 900.0,
+        executor: str = "bulk"
+    ):
+        self._load = load
+        self.max_seasons = max_seasons
+        self.refresh_after = refresh_after
+        # Looked up by name on every load so executors.configure() can replace the pool
+        self.executor = executor
+        self._entries: "OrderedDict[int, SeasonEntry]" = OrderedDict()
+        self._inflight: Dict[int, asyncio.Future] = {}
+        self.stats = {"hits": 0, "loads": 0, "joined": 0, "refreshes": 0, "failures": 0}
+
+    def _is_stale(self, year: int, entry: SeasonEntry) -> bool:
+        return year >= datetime.now().year and entry.age > self.refresh_after
+
+    async def get(self, year: int) -> Any:
+        entry = self._entries.get(year)
+        if entry is not None:
+            self._entries.move_to_end(year)
+            self.stats["hits"] += 1
+            if self._is_stale(year, entry) and year not in self._inflight:
+                self.stats["refreshes"] += 1
+                self._start_load(year).add_done_callback(self._log_refresh_failure)
+            return entry.season
+        return (await self._join(year)).season
+
+    async def _join(self, year: int) -> SeasonEntry:
+        future = self._inflight.get(year)
+        if future is None:
+            future = self._start_load(year)
+        else:
+            self.stats["joined"] += 1
+        # shield: one cancelled caller must not cancel the load for everyone else
+        return await asyncio.shield(future)
+
+    def _start_load(self, year: int) -> asyncio.Future:
+        future = asyncio.ensure_future(self._run_load(year))
+        self._inflight[year] = future
+        future.add_done_callback(lambda _: self._inflight.pop(year, None))
+        return future
+
+    async def _run_load(self, year: int) -> SeasonEntry:
+        self.stats["loads"] += 1
+        started = time.monotonic()
+        try:
+            season = await executors.run(self.executor, self._load, year)
+            # Index in the worker as well, so large seasons never block the loop
+            sessions = await executors.run(self.executor, index_sessions, season)
+        except Exception:
+            self.stats["failures"] += 1
+            raise
+        entry = SeasonEntry(season=season, loaded_at=time.monotonic(), sessions=sessions)
+        self._entries[year] = entry
+        self._entries.move_to_end(year)
+        while len(self._entries) > self.max_seasons:
+            self._entries.popitem(last=False)
+        logger.info(f"Loaded season {year} ({len(sessions)} sessions) in {time.monotonic() - started:.2f}s")
+        return entry
+
+    @staticmethod
+    def _log_refresh_failure(future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Background season refresh failed, keeping cached season: {future.exception()}")
+
+    def cached_session(self, session_key: Any) -> Optional[Any]:
+        """Session from any cached season, without loading anything"""
+        for entry in reversed(self._entries.values()):
+            session = entry.sessions.get(session_key)
+            if session is not None:
+                return session
+        return None
+
+    async def get_session(self, session_key: Any, year: Optional[int] = None) -> Optional[Any]:
+        """Session by key: cached seasons first, then the given (default current) season"""
+        session = self.cached_session(session_key)
+        if session is not None:
+            return session
+        year = year or datetime.now().year
+        if year in self._entries:
+            return None
+        await self.get(year)
+        return self._entries[year].sessions.get(session_key) if year in self._entries else None
+
+    def invalidate(self, year: Optional[int] = None):
+        if year is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(year, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "seasons": {
+                year: {"age_seconds": round(entry.age, 1), "sessions": len(entry.sessions)}
+                for year, entry in self._entries.items()
+            },
+            "inflight": sorted(self._inflight),
+            **self.stats
+        }
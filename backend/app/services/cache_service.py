@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.models.user_models import CacheEntry
+from app.core.metrics import metrics_collector
 
 class CacheService:
     def __init__(self):
@@ -64,6 +65,7 @@ class CacheService:
                 if cached_data:
                     # Increment hit count
                     await self.redis_client.hincrby(f"{cache_key}:meta", "hit_count", 1)
+                    metrics_collector.record_cache(namespace, hit=True)
                     return json.loads(cached_data)
             except Exception as e:
                 print(f"Redis get error: {e}")
@@ -72,10 +74,12 @@ class CacheService:
             cache_entry = self._memory_cache.get(cache_key)
             if cache_entry and not cache_entry.is_expired:
                 cache_entry.hit_count += 1
+                metrics_collector.record_cache(namespace, hit=True)
                 return cache_entry.data
             elif cache_entry and cache_entry.is_expired:
                 del self._memory_cache[cache_key]
         
+        metrics_collector.record_cache(namespace, hit=False)
         return None
     
     async def set(
@@ -0,0 +1,223 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.points import points_rules
+
+# Positions considered when searching for the result a driver needs
+GRID_SIZE = 20
+
+
+def event_tables(events: Sequence[str], rules: Dict[str, Any], grid: int = GRID_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """(events x grid) points by finishing position and the fastest lap bonus per event"""
+    tables = np.zeros((len(events), grid), dtype=np.int64)
+    bonus = np.zeros(len(events), dtype=np.int64)
+    for e, event in enumerate(events):
+        points = rules[event][:grid]
+        tables[e, :len(points)] = points
+        if event == "race":
+            bonus[e] = rules["fastest_lap"]
+    return tables, bonus
+
+
+def _finish_totals(tables: np.ndarray, bonus: np.ndarray, cars: int) -> Dict[str, np.ndarray]:
+    """Points over the given events if a competitor finishes f-th (f = 1..grid) in every one.
+
+    With cars=2 the team takes positions f and f+1. "own" is what the
+    finish guarantees, "own_best" adds the fastest lap point when it can be
+    scored, and "rival" is the most any single other competitor can take
+    from the places that are left.
+    """
+    grid = tables.shape[1]
+    finishes = grid - cars + 1
+    own = np.zeros(finishes, dtype=np.int64)
+    rival = np.zeros(finishes, dtype=np.int64)
+    own_best = np.zeros(finishes, dtype=np.int64)
+    taken = np.arange(cars)
+    for f in range(finishes):
+        slots = f + taken
+        free = np.setdiff1d(np.arange(grid), slots)[:cars]
+        own[f] = tables[:, slots].sum()
+        rival[f] = tables[:, free].sum() + bonus.sum()
+        # The fastest lap point only counts in events where the car finishes in the points
+        own_best[f] = own[f] + bonus[tables[:, slots[0]] > 0].sum()
+    return {"own": own, "own_best": own_best, "rival": rival}
+
+
+def _worst_finish(mask: np.ndarray) -> List[Optional[int]]:
+    """Per row, the last (worst) 1-based finish where mask holds, None if it never does.
+
+    Totals fall as the finish gets worse, so each row of mask is True up to
+    some finish and False after it.
+    """
+    if mask.shape[1] == 0:
+        return [None] * mask.shape[0]
+    worst = mask.shape[1] - np.argmax(mask[:, ::-1], axis=1)
+    return [int(w) if ok else None for w, ok in zip(worst, mask.any(axis=1))]
+
+
+def solve(points: Sequence[int], events: Sequence[str], rules: Dict[str, Any], cars: int = 1) -> Dict[str, Any]:
+    """Clinch / elimination state of every competitor after the given remaining events.
+
+    Works on the full (competitor x competitor) gap matrix:
+    i is guaranteed to finish ahead of j when its lead is larger than the
+    most j can still score, and j can still catch i when that lead is no
+    more than j's maximum. Equal points count as "can catch" because the
+    countback decides. The bounds are pairwise: they do not model that two
+    rivals cannot both win the same race.
+    """
+    points = np.asarray(points, dtype=np.int64)
+    n = len(points)
+    tables, bonus = event_tables(events, rules)
+    per_event_max = tables[:, :cars].sum(axis=1) + bonus
+    available = int(per_event_max.sum())
+
+    gap = points[:, np.newaxis] - points[np.newaxis, :]  # gap[i, j] = lead of i over j
+    ahead = gap > available  # i stays ahead of j whatever happens
+    catchable = gap <= available  # j can still reach i (j scores everything, i nothing)
+    np.fill_diagonal(ahead, False)
+    np.fill_diagonal(catchable, False)
+    best_position = 1 + ahead.sum(axis=0)
+    worst_position = 1 + catchable.sum(axis=1)
+
+    # Strongest other competitor for each i: the leader, or second place for the leader
+    order = np.argsort(-points, kind="stable")
+    top = points[order[0]] if n else 0
+    second = points[order[1]] if n > 1 else 0
+    best_rival = np.where(np.arange(n) == (order[0] if n else -1), second, top)
+
+    clinched = worst_position == 1
+    eliminated = points + available < best_rival
+
+    totals = _finish_totals(tables, bonus, cars)
+    # Every remaining event at finish f, rivals scoring nothing
+    contention = points[:, np.newaxis] + totals["own_best"][np.newaxis, :] >= best_rival[:, np.newaxis]
+    # Every remaining event at finish f, the strongest rival taking the best places left
+    control = points[:, np.newaxis] + totals["own"][np.newaxis, :] > best_rival[:, np.newaxis] + totals["rival"][np.newaxis, :]
+
+    # The next event alone, with everything after it still to play for
+    if len(events):
+        later = available - int(per_event_max[0])
+        next_totals = _finish_totals(tables[:1], bonus[:1], cars)
+        clinch_next = (
+            points[:, np.newaxis] + next_totals["own"][np.newaxis, :]
+            > best_rival[:, np.newaxis] + next_totals["rival"][np.newaxis, :] + later
+        )
+    else:
+        clinch_next = np.zeros((n, 0), dtype=bool)
+
+    return {
+        "available": available,
+        "per_event_max": per_event_max.tolist(),
+        "best_position": best_position.tolist(),
+        "worst_position": worst_position.tolist(),
+        "clinched": clinched.tolist(),
+        "eliminated": eliminated.tolist(),
+        "max_points": (points + available).tolist(),
+        "finish_to_stay_in_contention": _worst_finish(contention),
+        "finish_to_clinch": _worst_finish(control),
+        "finish_to_clinch_next_event": _worst_finish(clinch_next)
+    }
+
+
+class ClinchSolver:
+    """Championship math for the cached standings, memoized per standings version.
+
+    A version is the (year, last_updated, total_races) of a standings file
+    plus the remaining calendar, so repeated analysis requests between
+    standings rebuilds are a dictionary lookup.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._memo: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"hits": 0, "solves": 0}
+
+    @staticmethod
+    def version_key(year: int, data: Dict[str, Any], events: Sequence[Dict[str, Any]]) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((year, data.get("last_updated"), data.get("total_races"))).encode())
+        for event in events:
+            digest.update(f"|{event['type']}|{event.get('session_key')}".encode())
+        return digest.hexdigest()
+
+    def analyze(self, year: int, data: Dict[str, Any], events: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        key = self.version_key(year, data, events)
+        cached = self._memo.get(key)
+        if cached is not None:
+            self._memo.move_to_end(key)
+            self.stats["hits"] += 1
+            return cached
+
+        rules = points_rules(year)
+        kinds = [event["type"] for event in events]
+        drivers = data.get("driver_standings", [])
+        teams = data.get("constructor_standings", [])
+        result = {
+            "remaining_races": kinds.count("race"),
+            "remaining_sprints": kinds.count("sprint"),
+            "remaining_events": [
+                {"type": event["type"], "location": event.get("location"), "date": event.get("date")}
+                for event in events
+            ],
+            "points_rules": {
+                "race": list(rules["race"]),
+                "sprint": list(rules["sprint"]),
+                "fastest_lap": rules["fastest_lap"]
+            },
+            "drivers": self._rows(drivers, "driver_name", kinds, rules, cars=1),
+            "constructors": self._rows(teams, "team_name", kinds, rules, cars=2)
+        }
+        result["driver_points_available"] = result["drivers"][0]["points_available"] if drivers else 0
+        result["constructor_points_available"] = result["constructors"][0]["points_available"] if teams else 0
+
+        self.stats["solves"] += 1
+        self._memo[key] = result
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _rows(
+        standings: List[Dict[str, Any]],
+        name_key: str,
+        events: Sequence[str],
+        rules: Dict[str, Any],
+        cars: int
+    ) -> List[Dict[str, Any]]:
+        if not standings:
+            return []
+        points = [standing["points"] for standing in standings]
+        solved = solve(points, events, rules, cars=cars)
+        leader = max(points)
+        rows = []
+        for k, standing in enumerate(standings):
+            if solved["clinched"][k]:
+                status = "champion" if not events else "clinched"
+            elif solved["eliminated"][k]:
+                status = "eliminated"
+            else:
+                status = "contender"
+            rows.append({
+                "name": standing[name_key],
+                "position": standing.get("position", k + 1),
+                "points": standing["points"],
+                "points_behind_leader": leader - standing["points"],
+                "points_available": solved["available"],
+                "max_points": solved["max_points"][k],
+                "status": status,
+                "best_possible_position": solved["best_position"][k],
+                "worst_possible_position": solved["worst_position"][k],
+                "finish_to_stay_in_contention": solved["finish_to_stay_in_contention"][k],
+                "finish_to_clinch": solved["finish_to_clinch"][k],
+                "finish_to_clinch_next_event": solved["finish_to_clinch_next_event"][k]
+            })
+        return rows
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"entries": len(self._memo), **self.stats}
+
+
+clinch_solver = ClinchSolver()
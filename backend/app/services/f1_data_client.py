@@ -1,18 +1,32 @@
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from app.config import settings
-from app.core.exceptions import OpenF1APIException
+from app.core.exceptions import CircuitOpenException, OpenF1APIException
+from app.core.executors import executors
+from app.core.resilience import CircuitBreaker, LatencyStats
 from app.services.openf1_client import openf1_client
 from app.services.livef1_client import livef1_client
 
 logger = logging.getLogger(__name__)
 
+POLICIES = ("sequential", "hedged", "race")
+# Latency samples needed before the hedge delay follows the measured percentile
+MIN_HEDGE_SAMPLES = 10
+
 class F1DataClient:
     """
     하이브리드 F1 데이터 클라이언트
-    LiveF1을 우선 사용하고, 실패 시 OpenF1으로 fallback
+    LiveF1을 우선 사용하고, 실패(또는 빈 결과) 시 OpenF1으로 fallback
+
+    메서드별 정책:
+    - sequential: LiveF1 이 끝난 뒤에만 OpenF1 호출
+    - hedged: LiveF1 이 평소 지연(percentile)보다 늦어지면 OpenF1 도 호출, 먼저 온 유효 결과 사용
+    - race: 두 소스를 동시에 호출, 먼저 온 유효 결과 사용
+    소스별로 최근 지연/성공률을 기록하고, 서킷 브레이커가 열린 소스는 건너뜀
     """
     
     def __init__(self):
@@ -20,33 +34,135 @@ class F1DataClient:
         self.fallback_to_openf1 = settings.fallback_to_openf1
         self.livef1_client = livef1_client
         self.openf1_client = openf1_client
+        self.default_policy = settings.data_source_policy
+        self.method_policies = dict(settings.data_source_method_policies)
+        self.latency = {name: LatencyStats() for name in ("livef1", "openf1")}
+        self.breakers = {
+            name: CircuitBreaker(
+                name,
+                failure_threshold=settings.circuit_failure_threshold,
+                recovery_timeout=settings.circuit_recovery_timeout
+            )
+            for name in ("livef1", "openf1")
+        }
+        # method -> {"last": source, "wins": {source: count}}
+        self.selection: Dict[str, Dict[str, Any]] = {}
+    
+    def _sources(self) -> List[str]:
+        """Enabled sources in preference order"""
+        sources = []
+        if self.use_livef1:
+            sources.append("livef1")
+        if self.fallback_to_openf1:
+            sources.append("openf1")
+        return sources
+    
+    def _policy(self, method_name: str) -> str:
+        policy = self.method_policies.get(method_name, self.default_policy)
+        return policy if policy in POLICIES else "sequential"
+    
+    def _hedge_delay(self, source: str) -> float:
+        stats = self.latency[source]
+        if len(stats) < MIN_HEDGE_SAMPLES:
+            return settings.hedge_default_delay
+        return max(0.05, stats.percentile(settings.hedge_percentile) or settings.hedge_default_delay)
+    
+    async def _call_source(self, source: str, method_name: str, args, kwargs) -> Any:
+        breaker = self.breakers[source]
+        if not breaker.allow_request():
+            raise CircuitOpenException(source, breaker.retry_after)
+        
+        client = self.livef1_client if source == "livef1" else self.openf1_client
+        started = time.perf_counter()
+        try:
+            result = await getattr(client, method_name)(*args, **kwargs)
+        except asyncio.CancelledError:
+            # Lost the race; not the upstream's fault
+            breaker.release()
+            raise
+        except Exception:
+            self.latency[source].record(time.perf_counter() - started, ok=False)
+            breaker.record_failure()
+            raise
+        self.latency[source].record(time.perf_counter() - started, ok=True)
+        breaker.record_success()
+        return result
+    
+    def _record_selection(self, method_name: str, source: str):
+        entry = self.selection.setdefault(method_name, {"last": None, "wins": {}})
+        entry["last"] = source
+        entry["wins"][source] = entry["wins"].get(source, 0) + 1
     
     async def _try_both_clients(self, method_name: str, *args, **kwargs) -> Any:
         """
-        LiveF1을 먼저 시도하고 실패하면 OpenF1으로 fallback
+        정책에 따라 소스 호출, 먼저 도착한 유효(비어있지 않은) 결과 반환.
+        모든 소스가 빈 결과면 빈 결과를, 모두 실패하면 마지막 예외를 전달
         """
-        if self.use_livef1:
-            try:
-                livef1_method = getattr(self.livef1_client, method_name)
-                result = await livef1_method(*args, **kwargs)
-                if result:  # 결과가 있으면 LiveF1 결과 반환
-                    logger.debug(f"{method_name}: Using LiveF1 data")
-                    return result
-            except Exception as e:
-                logger.warning(f"{method_name}: LiveF1 failed: {e}")
+        enabled = self._sources()
+        sources = [source for source in enabled if self.breakers[source].available()]
+        if not sources:
+            if enabled:
+                source = enabled[-1]
+                raise CircuitOpenException(source, self.breakers[source].retry_after)
+            logger.error(f"{method_name}: No data source available")
+            raise OpenF1APIException(f"Failed to get data from {method_name}")
         
-        if self.fallback_to_openf1:
-            try:
-                openf1_method = getattr(self.openf1_client, method_name)
-                result = await openf1_method(*args, **kwargs)
-                logger.debug(f"{method_name}: Using OpenF1 fallback data")
-                return result
-            except Exception as e:
-                logger.error(f"{method_name}: OpenF1 fallback also failed: {e}")
-                raise e
+        policy = self._policy(method_name)
+        pending: Dict[asyncio.Task, str] = {}
+        launched = 0
+        empty_result: Optional[Tuple[str, Any]] = None
+        last_error: Optional[Exception] = None
+        
+        def launch_next():
+            nonlocal launched
+            source = sources[launched]
+            launched += 1
+            task = asyncio.create_task(self._call_source(source, method_name, args, kwargs))
+            pending[task] = source
+        
+        launch_next()
+        if policy == "race":
+            while launched < len(sources):
+                launch_next()
+        
+        try:
+            while pending:
+                timeout = None
+                if policy == "hedged" and launched < len(sources):
+                    timeout = self._hedge_delay(sources[launched - 1])
+                
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    logger.debug(f"{method_name}: {sources[launched - 1]} slower than {timeout:.2f}s, hedging")
+                    launch_next()
+                    continue
+                
+                # Prefer the primary source when several finish together
+                for task in sorted(done, key=lambda t: sources.index(pending[t])):
+                    source = pending.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        logger.warning(f"{method_name}: {source} failed: {error}")
+                        last_error = error
+                    elif task.result():
+                        logger.debug(f"{method_name}: Using {source} data ({policy})")
+                        self._record_selection(method_name, source)
+                        return task.result()
+                    else:
+                        empty_result = (source, task.result())
+                
+                # Nothing usable yet: make sure the next source is running
+                if not pending and launched < len(sources):
+                    launch_next()
+        finally:
+            for task in pending:
+                task.cancel()
         
-        logger.error(f"{method_name}: No data source available")
-        raise OpenF1APIException(f"Failed to get data from {method_name}")
+        if empty_result is not None:
+            self._record_selection(method_name, empty_result[0])
+            return empty_result[1]
+        logger.error(f"{method_name}: all data sources failed")
+        raise last_error or OpenF1APIException(f"Failed to get data from {method_name}")
     
     async def get_drivers(self, session_key: Optional[int] = None) -> List[Dict[str, Any]]:
         """드라이버 정보 조회"""
@@ -142,12 +258,26 @@ class F1DataClient:
             await self.openf1_client.close()
     
     async def get_data_source_status(self) -> Dict[str, Any]:
-        """현재 데이터 소스 상태 반환"""
+        """현재 데이터 소스 상태 반환 (정책, 소스별 지연/서킷 상태, 메서드별 선택 결과 포함)"""
         status = {
             "use_livef1": self.use_livef1,
             "fallback_to_openf1": self.fallback_to_openf1,
             "livef1_available": False,
-            "openf1_available": False
+            "openf1_available": False,
+            "default_policy": self.default_policy,
+            "method_policies": self.method_policies,
+            "sources": {
+                name: {
+                    "circuit": self.breakers[name].snapshot(),
+                    "latency": self.latency[name].snapshot(),
+                    "hedge_delay": self._hedge_delay(name)
+                }
+                for name in self.breakers
+            },
+            "selection": self.selection,
+            "openf1_endpoints": self.openf1_client.get_circuit_status(),
+            "executors": executors.snapshot(),
+            "seasons": self.livef1_client.seasons.snapshot()
         }
         
         # LiveF1 상태 확인
@@ -9,38 +9,32 @@ from livef1.api import livetimingF1_request
 
 from app.config import settings
 from app.core.exceptions import OpenF1APIException
+from app.core.executors import executors
+from app.core.season_loader import SeasonLoader
 from app.services.cache_service import cache_service, cached
 
 logger = logging.getLogger(__name__)
 
 class LiveF1Client:
     def __init__(self):
-        self.current_season = None
         self.current_session = None
         self._cache = {}
+        # Seasons by year, loaded off the event loop with a session_key index
+        self.seasons = SeasonLoader(get_season)
     
     async def _get_current_season(self, year: Optional[int] = None) -> Any:
         if year is None:
             year = datetime.now().year
         
-        if self.current_season is None or getattr(self.current_season, 'year', None) != year:
-            try:
-                self.current_season = get_season(year)
-                logger.info(f"Loaded season {year} with {len(self.current_season.meetings)} meetings")
-            except Exception as e:
-                logger.error(f"Failed to load season {year}: {e}")
-                raise OpenF1APIException(f"Failed to load season {year}: {str(e)}")
-        
-        return self.current_season
+        try:
+            return await self.seasons.get(year)
+        except Exception as e:
+            logger.error(f"Failed to load season {year}: {e}")
+            raise OpenF1APIException(f"Failed to load season {year}: {str(e)}")
     
     async def _livef1_request(self, endpoint: str, **kwargs) -> Any:
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, 
-                lambda: livetimingF1_request(endpoint, **kwargs)
-            )
-            return result
+            return await executors.run("live", lambda: livetimingF1_request(endpoint, **kwargs))
         except Exception as e:
             logger.warning(f"LiveF1 API request failed for {endpoint}: {e}")
             return None
@@ -190,16 +184,10 @@ class LiveF1Client:
             if self.current_session and getattr(self.current_session, 'session_key', None) == session_key:
                 return self.current_session
             
-            season = await self._get_current_season()
-            if season and hasattr(season, 'meetings'):
-                for meeting in season.meetings:
-                    if hasattr(meeting, 'sessions'):
-                        for session in meeting.sessions:
-                            if getattr(session, 'session_key', None) == session_key:
-                                self.current_session = session
-                                return session
-            
-            return None
+            session = await self.seasons.get_session(session_key)
+            if session is not None:
+                self.current_session = session
+            return session
             
         except Exception as e:
             logger.error(f"Failed to get session by key {session_key}: {e}")
@@ -1,13 +1,30 @@
 import httpx
-from typing import Optional, Dict, Any, List
+import logging
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import asyncio
+from urllib.parse import quote, urlencode
 from asyncio_throttle import Throttler
 
 from app.config import settings
-from app.core.exceptions import OpenF1APIException
+from app.core.exceptions import CircuitOpenException, DeadlineExceededException, OpenF1APIException
+from app.core.http_cache import HttpCache
+from app.core.resilience import CircuitBreaker, RetryPolicy, remaining_time
 from app.services.cache_service import cache_service, cached
 
+logger = logging.getLogger(__name__)
+
+# Last good GET responses, kept much longer than the regular caches
+STALE_NAMESPACE = "openf1_stale"
+# Requests filtered by time ("date", "date>", "date<") are near one-offs: keeping a
+# stale copy of each would cost a cache write per call and grow without bound
+STALE_SKIP_PARAM_PREFIX = "date"
+# OpenF1 comparison filters are written key+operator+value with no "=" (date>2025-...),
+# the same form the live stack's LiveF1Service.get_weather_by_session sends
+FILTER_OPERATORS = (">=", "<=", ">", "<")
+# Don't start an attempt with less time than this left on the deadline
+MIN_ATTEMPT_TIME = 0.2
+
 class OpenF1Client:
     def __init__(self):
         self.base_url = settings.openf1_api_base_url
@@ -17,6 +34,14 @@ class OpenF1Client:
             period=60
         )
         self._client: Optional[httpx.AsyncClient] = None
+        self.timeout = settings.openf1_timeout
+        self.retry_policy = RetryPolicy(
+            attempts=max(1, settings.openf1_retry_attempts),
+            base_delay=settings.openf1_retry_base_delay,
+            max_delay=settings.openf1_retry_max_delay
+        )
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.http_cache = HttpCache()
     
     @property
     def client(self) -> httpx.AsyncClient:
@@ -31,7 +56,7 @@ class OpenF1Client:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers=headers,
-                timeout=30.0
+                timeout=self.timeout
             )
         return self._client
     
@@ -39,22 +64,75 @@ class OpenF1Client:
         if self._client:
             await self._client.aclose()
     
-    async def _make_request(
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                f"openf1{endpoint}",
+                failure_threshold=settings.circuit_failure_threshold,
+                recovery_timeout=settings.circuit_recovery_timeout
+            )
+            self.breakers[endpoint] = breaker
+        return breaker
+    
+    def get_circuit_status(self) -> Dict[str, Any]:
+        return {endpoint: breaker.snapshot() for endpoint, breaker in self.breakers.items()}
+    
+    @staticmethod
+    def _keeps_stale_copy(params: Optional[Dict[str, Any]]) -> bool:
+        return not any(key.startswith(STALE_SKIP_PARAM_PREFIX) for key in (params or {}))
+    
+    @staticmethod
+    def _request_url(endpoint: str, params: Optional[Dict[str, Any]]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """(url, params) for httpx: comparison filters go into the URL with the value quoted
+
+        httpx would send {"date>": value} as "date%3E=value", i.e. ">=" with the key mangled.
+        """
+        filters = {key: value for key, value in (params or {}).items() if key.endswith(FILTER_OPERATORS)}
+        if not filters:
+            return endpoint, params
+        plain = [(key, value) for key, value in params.items() if key not in filters]
+        query = "&".join(
+            ([urlencode(plain)] if plain else [])
+            + [f"{key}{quote(str(value), safe='')}" for key, value in filters.items()]
+        )
+        return f"{endpoint}?{query}", None
+
+    async def _stale_or_raise(self, endpoint: str, params: Optional[Dict[str, Any]], error: OpenF1APIException):
+        """Serve the last good response for this request, or re-raise"""
+        stale = None
+        if self._keeps_stale_copy(params):
+            stale = await cache_service.get(STALE_NAMESPACE, endpoint=endpoint, **(params or {}))
+        if stale is not None:
+            logger.warning(f"OpenF1 {endpoint} unavailable ({error.message}), serving stale data")
+            return stale
+        raise error
+    
+    async def _attempt(
         self,
         method: str,
         endpoint: str,
-        params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        timeout: float
     ) -> Dict[str, Any]:
+        cache_key = self.http_cache.key(endpoint, params) if method.upper() == "GET" else None
+        url, query_params = self._request_url(endpoint, params)
         async with self.throttler:
             try:
                 response = await self.client.request(
                     method=method,
-                    url=endpoint,
-                    params=params,
-                    json=data
+                    url=url,
+                    params=query_params,
+                    json=data,
+                    headers=self.http_cache.conditional_headers(cache_key) if cache_key else None,
+                    timeout=timeout
                 )
+                if cache_key and response.status_code == 304 and self.http_cache.lookup(cache_key):
+                    return self.http_cache.not_modified(cache_key, response.headers)
                 response.raise_for_status()
+                if cache_key:
+                    return self.http_cache.store(cache_key, response.headers, response.json())
                 return response.json()
             except httpx.HTTPStatusError as e:
                 raise OpenF1APIException(
@@ -66,6 +144,80 @@ class OpenF1Client:
             except Exception as e:
                 raise OpenF1APIException(f"Unexpected error: {str(e)}")
     
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Call OpenF1 through the endpoint's circuit breaker.
+        
+        GETs are retried on network errors, 429 and 5xx with jittered backoff,
+        and every attempt is cut to what is left of the request deadline. When
+        the circuit is open (or all attempts failed) a GET falls back to the
+        last good response for the same parameters. GETs are revalidated with
+        ETag/Last-Modified (see app.core.http_cache).
+        """
+        idempotent = method.upper() == "GET"
+        if idempotent:
+            # Still fresh per upstream Cache-Control: no request at all
+            fresh, body = self.http_cache.fresh_body(self.http_cache.key(endpoint, params))
+            if fresh:
+                return body
+        
+        breaker = self._breaker(endpoint)
+        attempts = self.retry_policy.attempts if idempotent else 1
+        error: Optional[OpenF1APIException] = None
+        
+        for attempt in range(attempts):
+            if attempt:
+                delay = self.retry_policy.backoff(attempt)
+                remaining = remaining_time()
+                if remaining is not None and remaining <= delay + MIN_ATTEMPT_TIME:
+                    break
+                await asyncio.sleep(delay)
+            
+            timeout = self.timeout
+            remaining = remaining_time()
+            if remaining is not None:
+                if remaining <= MIN_ATTEMPT_TIME:
+                    error = error or DeadlineExceededException(f"No time left to call OpenF1 {endpoint}")
+                    break
+                timeout = min(timeout, remaining)
+            
+            if not breaker.allow_request():
+                error = CircuitOpenException(f"OpenF1 {endpoint}", breaker.retry_after)
+                break
+            
+            try:
+                result = await self._attempt(method, endpoint, params, data, timeout)
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except OpenF1APIException as e:
+                error = e
+                retryable = e.status_code is None or e.status_code == 429 or e.status_code >= 500
+                if not retryable:
+                    # The upstream answered; the request itself is wrong
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                logger.warning(f"OpenF1 {endpoint} attempt {attempt + 1}/{attempts} failed: {e.message}")
+                continue
+            
+            breaker.record_success()
+            if idempotent and self._keeps_stale_copy(params):
+                await cache_service.set(
+                    STALE_NAMESPACE, result, settings.openf1_stale_ttl, endpoint=endpoint, **(params or {})
+                )
+            return result
+        
+        if idempotent:
+            return await self._stale_or_raise(endpoint, params, error)
+        raise error
+    
     @cached(namespace="drivers", ttl_seconds=600)  # Cache for 10 minutes
     async def get_drivers(self, session_key: Optional[int] = None) -> List[Dict[str, Any]]:
         params = {}
@@ -131,13 +283,23 @@ class OpenF1Client:
     async def get_weather(
         self,
         session_key: Optional[int] = None,
-        date: Optional[datetime] = None
+        date: Optional[datetime] = None,
+        since: Optional[str] = None
     ) -> List[Dict[str, Any]]:
+        """Weather samples; since (an OpenF1 date string) only returns samples after it.
+
+        If the incremental poll fails the whole session is fetched instead.
+        """
         params = {}
         if session_key:
             params["session_key"] = session_key
         if date:
             params["date"] = date.isoformat()
+        if since:
+            try:
+                return await self._make_request("GET", "/weather", params={**params, "date>": since})
+            except OpenF1APIException as e:
+                logger.warning(f"OpenF1 weather poll since {since} failed ({e.message}), fetching the full session")
         return await self._make_request("GET", "/weather", params=params)
     
     async def get_lap_times(
@@ -38,6 +38,7 @@ class RaceEventDetector:
         self.last_lap_times: Dict[int, Dict[int, float]] = {}  # session_key -> {driver_number: best_time}
         self.recent_pit_stops: Dict[int, Set[int]] = defaultdict(set)  # session_key -> {driver_numbers}
         self.position_history: Dict[int, List[Dict]] = defaultdict(list)  # session_key -> position_snapshots
+        self.last_weather: Dict[int, Dict] = {}  # session_key -> {"raining": bool, "trends": {field: trend_type}}
         
     def add_listener(self, event_type: EventType, callback: Callable[[RaceEvent], None]):
         """Add a listener for specific event types"""
@@ -285,6 +286,54 @@ class RaceEventDetector:
                 )
                 await self.emit_event(event)
     
+    async def process_weather(self, session_key: int, rainfall: List[float], trends: Dict):
+        """Detect rain starting/stopping and temperature trend changes.
+        
+        rainfall holds the new samples in order; trends maps a field name to
+        its current WeatherTrend (from the session's online statistics). The
+        first call for a session only records the baseline.
+        """
+        state = self.last_weather.get(session_key)
+        if state is None:
+            self.last_weather[session_key] = {
+                "raining": bool(rainfall) and rainfall[-1] > 0,
+                "trends": {name: trend.trend_type for name, trend in trends.items()}
+            }
+            return
+        
+        for value in rainfall:
+            raining = value > 0
+            if raining == state["raining"]:
+                continue
+            state["raining"] = raining
+            event = RaceEvent(
+                event_type=EventType.WEATHER_CHANGE,
+                timestamp=datetime.utcnow(),
+                session_key=session_key,
+                data={'change': 'rain_started' if raining else 'rain_stopped', 'rainfall': value},
+                message="🌧️ Rain has started!" if raining else "☀️ Rain has stopped"
+            )
+            await self.emit_event(event)
+        
+        for name, trend in trends.items():
+            previous = state["trends"].get(name)
+            state["trends"][name] = trend.trend_type
+            if trend.trend_type == previous or trend.trend_type == "stable":
+                continue
+            label = name.replace("_", " ").capitalize()
+            event = RaceEvent(
+                event_type=EventType.WEATHER_CHANGE,
+                timestamp=datetime.utcnow(),
+                session_key=session_key,
+                data={
+                    'change': f'{name}_{trend.trend_type}',
+                    'rate_per_30_min': round(trend.rate_of_change, 2),
+                    'previous_trend': previous
+                },
+                message=f"🌡️ {label} {trend.trend_type} ({trend.rate_of_change:+.1f}°C / 30 min)"
+            )
+            await self.emit_event(event)
+    
     def clear_session_data(self, session_key: int):
         """Clear stored data for a specific session"""
         if session_key in self.last_positions:
@@ -295,6 +344,8 @@ class RaceEventDetector:
             del self.recent_pit_stops[session_key]
         if session_key in self.position_history:
             del self.position_history[session_key]
+        if session_key in self.last_weather:
+            del self.last_weather[session_key]
         logger.info(f"Cleared data for session {session_key}")
 
 # Global instance
@@ -1,106 +1,35 @@
 import json
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Callable
 from pathlib import Path
 import os
 
 from app.services.openf1_client import openf1_client
 from app.core.exceptions import OpenF1APIException
+from app.core.points import RACE_POINTS, position_points
+from app.core.reference import reference
+from app.services.standings_store import StandingsStore
 
 class StandingsCalculator:
     def __init__(self):
         # Data storage path
         self.data_dir = Path("data/standings")
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.store = StandingsStore(self.data_dir)
         
-        # F1 2024 points system
-        self.points_system = {
-            1: 25, 2: 18, 3: 15, 4: 12, 5: 10,
-            6: 8, 7: 6, 8: 4, 9: 2, 10: 1
-        }
+        # Grand prix points by finishing position
+        self.points_system = position_points(RACE_POINTS)
         
-        # Updated F1 driver database - Accurate as of 2024/2025 seasons
-        # NOTE: OpenF1 API may contain test/simulation data - this affects accuracy
-        self.driver_database = {
-            # 2024 Actual F1 Grid
-            1: {"name": "Max Verstappen", "team": "Red Bull Racing", "color": "#0600ef", "active_2024": True, "active_2025": True},
-            11: {"name": "Sergio Perez", "team": "Red Bull Racing", "color": "#0600ef", "active_2024": True, "active_2025": False},  # Replaced mid-2024
-            
-            # Mercedes 2024/2025 - Hamilton to Ferrari in 2025
-            44: {"name": "Lewis Hamilton", "team": "Mercedes", "color": "#00d2be", "active_2024": True, "active_2025": False},  # To Ferrari 2025
-            63: {"name": "George Russell", "team": "Mercedes", "color": "#00d2be", "active_2024": True, "active_2025": True},
-            
-            # Ferrari 2024/2025 - Hamilton joins in 2025
-            16: {"name": "Charles Leclerc", "team": "Ferrari", "color": "#dc0000", "active_2024": True, "active_2025": True},
-            55: {"name": "Carlos Sainz Jr", "team": "Ferrari", "color": "#dc0000", "active_2024": True, "active_2025": False},  # To Williams 2025
-            
-            # McLaren - Stable lineup
-            4: {"name": "Lando Norris", "team": "McLaren", "color": "#ff8700", "active_2024": True, "active_2025": True},
-            81: {"name": "Oscar Piastri", "team": "McLaren", "color": "#ff8700", "active_2024": True, "active_2025": True},
-            
-            # Aston Martin - Stable lineup
-            14: {"name": "Fernando Alonso", "team": "Aston Martin", "color": "#006f62", "active_2024": True, "active_2025": True},
-            18: {"name": "Lance Stroll", "team": "Aston Martin", "color": "#006f62", "active_2024": True, "active_2025": True},
-            
-            # Alpine/Renault - Driver changes
-            10: {"name": "Pierre Gasly", "team": "Alpine", "color": "#0090ff", "active_2024": True, "active_2025": True},
-            31: {"name": "Esteban Ocon", "team": "Alpine", "color": "#0090ff", "active_2024": True, "active_2025": False},  # To Haas 2025
-            
-            # Williams - Multiple driver changes 2024
-            23: {"name": "Alexander Albon", "team": "Williams", "color": "#005aff", "active_2024": True, "active_2025": True},
-            2: {"name": "Logan Sargeant", "team": "Williams", "color": "#005aff", "active_2024": True, "active_2025": False},  # Dropped mid-2024
-            39: {"name": "Franco Colapinto", "team": "Williams", "color": "#005aff", "active_2024": True, "active_2025": False},  # Mid-2024 replacement
-            
-            # Kick Sauber/Stake - Team changes
-            77: {"name": "Valtteri Bottas", "team": "Kick Sauber", "color": "#52c41a", "active_2024": True, "active_2025": False},
-            24: {"name": "Zhou Guanyu", "team": "Kick Sauber", "color": "#52c41a", "active_2024": True, "active_2025": False},
-            
-            # RB/VCARB - Driver rotations
-            22: {"name": "Yuki Tsunoda", "team": "RB", "color": "#2b4562", "active_2024": True, "active_2025": True},
-            3: {"name": "Daniel Ricciardo", "team": "RB", "color": "#2b4562", "active_2024": True, "active_2025": False},  # Dropped 2024
-            40: {"name": "Liam Lawson", "team": "RB", "color": "#2b4562", "active_2024": True, "active_2025": True},  # Promoted 2024
-            
-            # Haas - Stable then changes
-            27: {"name": "Nico Hulkenberg", "team": "Haas", "color": "#b6babd", "active_2024": True, "active_2025": False},  # To Kick Sauber 2025
-            20: {"name": "Kevin Magnussen", "team": "Haas", "color": "#b6babd", "active_2024": True, "active_2025": True},
-            
-            # 2025 New Entries/Rookies
-            87: {"name": "Andrea Kimi Antonelli", "team": "Mercedes", "color": "#00d2be", "active_2024": False, "active_2025": True},  # 2025 rookie
-            43: {"name": "Gabriel Bortoleto", "team": "Kick Sauber", "color": "#52c41a", "active_2024": False, "active_2025": True},  # 2025 F2 graduate
-            50: {"name": "Jack Doohan", "team": "Alpine", "color": "#0090ff", "active_2024": False, "active_2025": True},  # 2025 Alpine
-            
-            # Test/Reserve drivers that appear in data
-            38: {"name": "Oliver Bearman", "team": "Ferrari", "color": "#dc0000", "active_2024": False, "active_2025": False},  # Reserve/F2
-            30: {"name": "Isack Hadjar", "team": "RB", "color": "#2b4562", "active_2024": False, "active_2025": False},  # Reserve
-            12: {"name": "Felipe Drugovich", "team": "Aston Martin", "color": "#006f62", "active_2024": False, "active_2025": False},  # Reserve
-            
-            # Historical/Former drivers (shouldn't be in current standings)
-            5: {"name": "Sebastian Vettel", "team": "Retired", "color": "#666666", "active_2024": False, "active_2025": False},
-            7: {"name": "Kimi Raikkonen", "team": "Retired", "color": "#666666", "active_2024": False, "active_2025": False},
-            9: {"name": "Nikita Mazepin", "team": "Former Haas", "color": "#666666", "active_2024": False, "active_2025": False},
-            6: {"name": "Nicholas Latifi", "team": "Former Williams", "color": "#666666", "active_2024": False, "active_2025": False},
-        }
-        
-        self.team_colors = {
-            "Red Bull Racing": "#0600ef",
-            "Mercedes": "#00d2be", 
-            "Ferrari": "#dc0000",
-            "McLaren": "#ff8700",
-            "Aston Martin": "#006f62",
-            "Kick Sauber": "#52c41a",
-            "RB": "#2b4562",
-            "Alpine": "#0090ff",
-            "Williams": "#005aff",
-            "Haas": "#ffffff",
-            # Legacy names for compatibility
-            "Alfa Romeo": "#900000",
-            "AlphaTauri": "#2b4562"
-        }
+        # Drivers, teams and colors come from the shared reference registry
+        self.reference = reference
+
+        # (year, last processed race date) -> remaining events
+        self._calendar_cache: Dict[tuple, List[Dict[str, Any]]] = {}
 
     def get_driver_info(self, driver_number: int, year: int = None) -> Dict[str, Any]:
         """Get driver info with fallback for unknown drivers and year validation"""
-        driver_info = self.driver_database.get(driver_number)
+        driver_info = self.reference.describe_number(driver_number, year)
         if not driver_info:
             print(f"Warning: Unknown driver #{driver_number} in OpenF1 data")
             return {
@@ -111,15 +40,19 @@ class StandingsCalculator:
             }
         
         # Check if driver was active in the specified year
-        if year:
-            active_key = f"active_{year}"
-            if active_key in driver_info and not driver_info[active_key]:
-                print(f"Warning: Driver {driver_info['name']} was not active in {year}")
-                driver_info = driver_info.copy()
-                driver_info["data_warning"] = f"Driver was not active in official F1 {year} season"
+        if year and not driver_info["active"] and year in self.reference.seasons:
+            print(f"Warning: Driver {driver_info['name']} was not active in {year}")
+            driver_info["data_warning"] = f"Driver was not active in official F1 {year} season"
         
         return driver_info
     
+    def is_active(self, driver_number: int, year: int) -> bool:
+        """False only for a known driver's number that wasn't on the grid that year
+        (unknown numbers and seasons without line-up data pass)"""
+        if year not in self.reference.seasons or self.reference.seat_for_number(year, driver_number):
+            return True
+        return self.reference.driver_by_number(driver_number) is None
+    
     def is_valid_race_session(self, session_info: Dict[str, Any]) -> bool:
         """Validate if session is likely a real F1 race (not test/practice)"""
         session_name = session_info.get("session_name", "").lower()
@@ -153,8 +86,7 @@ class StandingsCalculator:
             driver_info = self.get_driver_info(driver_num, year)
             
             # Check if driver was supposed to be active in this year
-            active_key = f"active_{year}"
-            if active_key in self.driver_database.get(driver_num, {}) and not self.driver_database[driver_num][active_key]:
+            if driver_num and not self.is_active(driver_num, year):
                 warnings.append(f"Excluded {driver_info['name']} - not active in {year}")
                 continue
             
@@ -190,12 +122,59 @@ class StandingsCalculator:
             print(f"Error getting sessions for {year}: {e}")
             return []
 
-    async def calculate_race_results(self, session_key: int, year: int = None) -> Optional[Dict[str, Any]]:
+    async def get_remaining_events(self, year: int, after: str = "") -> Optional[List[Dict[str, Any]]]:
+        """Grands prix and sprints of a year that start after the given ISO date, in calendar order.
+
+        Returns None when the calendar can't be fetched. Results are kept per
+        (year, after), i.e. per standings version.
+        """
+        key = (year, after)
+        if key in self._calendar_cache:
+            return self._calendar_cache[key]
+        try:
+            # OpenF1 lists sprints under session_type "Race" as well
+            sessions = await openf1_client.get_sessions(year=year, session_type="Race")
+        except Exception as e:
+            print(f"Error getting calendar for {year}: {e}")
+            return None
+        if not sessions:
+            return None
+
+        events = []
+        for session in sorted(sessions, key=lambda x: x.get("date_start", "")):
+            if session.get("date_start", "") <= after:
+                continue
+            session_name = session.get("session_name", "").lower()
+            if session_name == "sprint":
+                event_type = "sprint"
+            elif self.is_valid_race_session(session):
+                event_type = "race"
+            else:
+                continue
+            events.append({
+                "type": event_type,
+                "session_key": session.get("session_key"),
+                "location": session.get("location", "Unknown"),
+                "date": session.get("date_start", "")
+            })
+
+        self._calendar_cache[key] = events
+        while len(self._calendar_cache) > 32:
+            self._calendar_cache.pop(next(iter(self._calendar_cache)))
+        return events
+
+    async def calculate_race_results(
+        self,
+        session_key: int,
+        year: int = None,
+        session_info: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Calculate results for a single race session with improved validation"""
         try:
-            # Get session info
-            sessions = await openf1_client.get_sessions()
-            session_info = next((s for s in sessions if s.get("session_key") == session_key), None)
+            # Get session info (callers that already listed the sessions pass it in)
+            if session_info is None:
+                sessions = await openf1_client.get_sessions()
+                session_info = next((s for s in sessions if s.get("session_key") == session_key), None)
             
             if not session_info:
                 return None
@@ -273,8 +252,6 @@ class StandingsCalculator:
         
         # Calculate results for each race
         all_race_results = []
-        driver_stats = {}
-        sessions_processed = []
         
         for session in race_sessions[:15]:  # Limit to prevent timeout
             session_key = session.get("session_key")
@@ -282,13 +259,20 @@ class StandingsCalculator:
                 continue
                 
             print(f"Processing session {session_key} - {session.get('location', 'Unknown')}")
-            race_result = await self.calculate_race_results(session_key, year)
+            race_result = await self.calculate_race_results(session_key, year, session_info=session)
             
-            if not race_result:
-                continue
-                
-            all_race_results.append(race_result)
-            sessions_processed.append(session_key)
+            if race_result:
+                all_race_results.append(race_result)
+        
+        return self.build_year_standings(year, all_race_results)
+
+    def build_year_standings(self, year: int, all_race_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregate per-race results into driver/constructor standings for a year"""
+        driver_stats = {}
+        sessions_processed = []
+        
+        for race_result in all_race_results:
+            sessions_processed.append(race_result["session_key"])
             
             # Accumulate driver stats
             for result in race_result["results"]:
@@ -409,38 +393,24 @@ class StandingsCalculator:
         }
 
     def save_standings_data(self, year: int, data: Dict[str, Any]) -> None:
-        """Save standings data to JSON file"""
-        file_path = self.data_dir / f"standings_{year}.json"
+        """Save standings data to the binary standings store"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"Saved standings data for {year} to {file_path}")
+            self.store.save(year, data)
+            print(f"Saved standings data for {year} to {self.store.path_for(year)}")
         except Exception as e:
             print(f"Error saving data for {year}: {e}")
 
     def load_standings_data(self, year: int) -> Optional[Dict[str, Any]]:
-        """Load standings data from JSON file"""
-        file_path = self.data_dir / f"standings_{year}.json"
-        try:
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"Error loading data for {year}: {e}")
-        return None
+        """Load standings data from the binary standings store"""
+        return self.store.load(year)
+
+    def load_standings_section(self, year: int, section: str) -> Optional[Any]:
+        """Load a single section (e.g. driver_standings) without decoding the rest"""
+        return self.store.load_section(year, section)
 
     def is_data_stale(self, year: int, max_age_hours: int = 24) -> bool:
-        """Check if cached data is older than max_age_hours"""
-        data = self.load_standings_data(year)
-        if not data:
-            return True
-            
-        try:
-            last_updated = datetime.fromisoformat(data["last_updated"].replace("Z", "+00:00"))
-            age = datetime.utcnow() - last_updated.replace(tzinfo=None)
-            return age > timedelta(hours=max_age_hours)
-        except:
-            return True
+        """Check if cached data is older than max_age_hours (reads the file header only)"""
+        return self.store.is_stale(year, max_age_hours)
 
     async def update_year_if_needed(self, year: int, force: bool = False) -> Dict[str, Any]:
         """Update standings for a year if data is stale or force is True"""
@@ -453,11 +423,205 @@ class StandingsCalculator:
         self.save_standings_data(year, standings_data)
         return standings_data
 
-    async def batch_update_all_years(self, years: List[int] = None, force: bool = False) -> Dict[str, Any]:
-        """Update standings for multiple years"""
+    async def get_standings_section(self, year: int, section: str) -> Optional[Any]:
+        """Return one section of a year's standings, recalculating first if stale"""
+        if self.is_data_stale(year):
+            data = await self.update_year_if_needed(year)
+            return data.get(section) if data else None
+        return self.load_standings_section(year, section)
+
+    def _checkpoint_path(self, year: int) -> Path:
+        return self.data_dir / "checkpoints" / f"rebuild_{year}.jsonl"
+
+    def load_rebuild_checkpoint(self, year: int) -> Dict[str, Dict[str, Any]]:
+        """Load race results already finished by an interrupted rebuild (session_key -> result)
+
+        One JSON record per line; a line cut short by a crash is skipped.
+        """
+        file_path = self._checkpoint_path(year)
+        races: Dict[str, Dict[str, Any]] = {}
+        try:
+            if file_path.exists():
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue
+                        races[str(record["session_key"])] = record["result"]
+        except Exception as e:
+            print(f"Error loading rebuild checkpoint for {year}: {e}")
+        return races
+
+    def append_rebuild_checkpoint(self, year: int, session_key: Any, result: Dict[str, Any]) -> None:
+        """Append one finished race (O(1) per race instead of rewriting the whole checkpoint)"""
+        file_path = self._checkpoint_path(year)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"session_key": session_key, "result": result}, separators=(",", ":"), ensure_ascii=False)
+        try:
+            with open(file_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+        except Exception as e:
+            print(f"Error saving rebuild checkpoint for {year}: {e}")
+
+    def clear_rebuild_checkpoint(self, year: int) -> None:
+        file_path = self._checkpoint_path(year)
+        if file_path.exists():
+            file_path.unlink()
+
+    @staticmethod
+    def _session_has_run(session: Dict[str, Any], now: datetime) -> bool:
+        """True once the session's scheduled end (or start) is in the past"""
+        value = session.get("date_end") or session.get("date_start")
+        try:
+            ended = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return True
+        if ended.tzinfo is None:
+            ended = ended.replace(tzinfo=timezone.utc)
+        return ended <= now
+
+    async def rebuild_years_parallel(
+        self,
+        years: List[int],
+        workers: int = 8,
+        resume: bool = True,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """Rebuild several years at once from a shared pool of (year, race) work units.
+        
+        All workers go through openf1_client, so its Throttler keeps the whole
+        rebuild within the OpenF1 rate limit. Finished races are checkpointed
+        per year; with resume=True an interrupted rebuild only fetches the
+        races that are still missing. A year where a race that has already
+        been run could not be fetched is reported as failed and keeps its
+        checkpoint instead of being saved with races missing.
+        """
+        # List the race sessions of every year concurrently
+        session_lists = await asyncio.gather(
+            *(self.get_race_sessions_for_year(year) for year in years)
+        )
+        
+        finished: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        resumed = 0
+        
+        for year, sessions in zip(years, session_lists):
+            if not resume:
+                self.clear_rebuild_checkpoint(year)
+            finished[year] = self.load_rebuild_checkpoint(year)
+            for session in sessions:
+                session_key = session.get("session_key")
+                if not session_key:
+                    continue
+                if str(session_key) in finished[year]:
+                    resumed += 1
+                    continue
+                queue.put_nowait((year, session))
+        
+        total = queue.qsize() + resumed
+        counter = {"completed": resumed, "failed": 0}
+        missing: Dict[int, int] = {year: 0 for year in years}
+        now = datetime.now(timezone.utc)
+        print(f"Rebuilding {years}: {total} races ({resumed} restored from checkpoints), {workers} workers")
+        
+        def report(year: int, session: Dict[str, Any], ok: bool):
+            event = {
+                "year": year,
+                "session_key": session.get("session_key"),
+                "location": session.get("location", "Unknown"),
+                "success": ok,
+                "completed": counter["completed"],
+                "failed": counter["failed"],
+                "total": total
+            }
+            if progress:
+                progress(event)
+            else:
+                status = "done" if ok else "no result"
+                print(f"[{event['completed'] + event['failed']}/{total}] {year} {event['location']} ({event['session_key']}): {status}")
+        
+        async def worker():
+            while True:
+                try:
+                    year, session = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                session_key = session["session_key"]
+                race_result = await self.calculate_race_results(session_key, year, session_info=session)
+                if race_result:
+                    finished[year][str(session_key)] = race_result
+                    self.append_rebuild_checkpoint(year, session_key, race_result)
+                    counter["completed"] += 1
+                else:
+                    counter["failed"] += 1
+                    if self._session_has_run(session, now):
+                        # Races later in the season simply have no results yet
+                        missing[year] += 1
+                report(year, session, race_result is not None)
+        
+        await asyncio.gather(*(worker() for _ in range(max(1, workers))))
+        
+        results = {}
+        for year in years:
+            if missing[year]:
+                print(f"{year}: {missing[year]} finished races could not be fetched, keeping the checkpoint")
+                results[year] = {
+                    "success": False,
+                    "error": f"{missing[year]} finished races could not be fetched; rerun to resume from the checkpoint",
+                    "races_missing": missing[year],
+                    "races_checkpointed": len(finished[year])
+                }
+                continue
+            try:
+                race_results = sorted(finished[year].values(), key=lambda r: r.get("date", ""))
+                data = self.build_year_standings(year, race_results)
+                self.save_standings_data(year, data)
+                self.clear_rebuild_checkpoint(year)
+                results[year] = {
+                    "success": True,
+                    "races": data.get("total_races", 0),
+                    "last_updated": data.get("last_updated", ""),
+                    "drivers": len(data.get("driver_standings", [])),
+                    "teams": len(data.get("constructor_standings", []))
+                }
+            except Exception as e:
+                print(f"Error finalizing {year}: {e}")
+                results[year] = {
+                    "success": False,
+                    "error": str(e)
+                }
+        
+        return results
+
+    async def batch_update_all_years(
+        self,
+        years: List[int] = None,
+        force: bool = False,
+        parallel: bool = False,
+        workers: int = 8
+    ) -> Dict[str, Any]:
+        """Update standings for multiple years (parallel=True rebuilds all stale years at once)"""
         if years is None:
             years = [2021, 2022, 2023, 2024, 2025]
         
+        if parallel:
+            stale_years = [year for year in years if force or self.is_data_stale(year)]
+            results = {}
+            for year in years:
+                if year not in stale_years:
+                    manifest = self.store.manifest(year) or {}
+                    results[year] = {
+                        "success": True,
+                        "races": manifest.get("total_races", 0),
+                        "last_updated": manifest.get("last_updated", ""),
+                        "drivers": manifest.get("counts", {}).get("drivers", 0),
+                        "teams": manifest.get("counts", {}).get("teams", 0)
+                    }
+            if stale_years:
+                results.update(await self.rebuild_years_parallel(stale_years, workers=workers))
+            return results
+        
         results = {}
         for year in years:
             try:
@@ -6,6 +6,8 @@ import asyncio
 
 from app.services.openf1_client import openf1_client
 from app.core.exceptions import OpenF1APIException
+from app.core.points import RACE_POINTS, position_points
+from app.core.reference import reference
 
 @dataclass
 class DriverStanding:
@@ -39,94 +41,15 @@ class RaceResult:
 
 class StandingsService:
     def __init__(self):
-        # F1 2024 points system
-        self.points_system = {
-            1: 25, 2: 18, 3: 15, 4: 12, 5: 10,
-            6: 8, 7: 6, 8: 4, 9: 2, 10: 1
-        }
+        # Grand prix points by finishing position
+        self.points_system = position_points(RACE_POINTS)
         
-        # Driver and team info (Updated for 2024-2025 seasons)
-        self.driver_info = {
-            # Red Bull Racing
-            1: {"name": "Max Verstappen", "team": "Red Bull Racing", "color": "#0600ef"},
-            11: {"name": "Sergio Perez", "team": "Red Bull Racing", "color": "#0600ef"},
-            
-            # Mercedes
-            44: {"name": "Lewis Hamilton", "team": "Mercedes", "color": "#00d2be"},
-            63: {"name": "George Russell", "team": "Mercedes", "color": "#00d2be"},
-            
-            # Ferrari
-            16: {"name": "Charles Leclerc", "team": "Ferrari", "color": "#dc0000"},
-            55: {"name": "Carlos Sainz", "team": "Ferrari", "color": "#dc0000"},
-            
-            # McLaren
-            4: {"name": "Lando Norris", "team": "McLaren", "color": "#ff8700"},
-            81: {"name": "Oscar Piastri", "team": "McLaren", "color": "#ff8700"},
-            
-            # Aston Martin
-            14: {"name": "Fernando Alonso", "team": "Aston Martin", "color": "#006f62"},
-            18: {"name": "Lance Stroll", "team": "Aston Martin", "color": "#006f62"},
-            
-            # Alpine
-            10: {"name": "Pierre Gasly", "team": "Alpine", "color": "#0090ff"},
-            31: {"name": "Esteban Ocon", "team": "Alpine", "color": "#0090ff"},
-            
-            # Williams
-            23: {"name": "Alexander Albon", "team": "Williams", "color": "#005aff"},
-            2: {"name": "Logan Sargeant", "team": "Williams", "color": "#005aff"},
-            
-            # Alfa Romeo/Kick Sauber
-            77: {"name": "Valtteri Bottas", "team": "Kick Sauber", "color": "#52c41a"},
-            24: {"name": "Zhou Guanyu", "team": "Kick Sauber", "color": "#52c41a"},
-            
-            # AlphaTauri/RB
-            22: {"name": "Yuki Tsunoda", "team": "RB", "color": "#2b4562"},
-            3: {"name": "Daniel Ricciardo", "team": "RB", "color": "#2b4562"},
-            
-            # Haas
-            27: {"name": "Nico Hulkenberg", "team": "Haas", "color": "#ffffff"},
-            20: {"name": "Kevin Magnussen", "team": "Haas", "color": "#ffffff"},
-            
-            # Additional drivers that might appear
-            40: {"name": "Liam Lawson", "team": "RB", "color": "#2b4562"},
-            38: {"name": "Oliver Bearman", "team": "Ferrari", "color": "#dc0000"},
-            39: {"name": "Franco Colapinto", "team": "Williams", "color": "#005aff"},
-            50: {"name": "Nyck de Vries", "team": "AlphaTauri", "color": "#2b4562"},
-            21: {"name": "Nyck de Vries", "team": "AlphaTauri", "color": "#2b4562"},
-            
-            # 2025 season new drivers
-            30: {"name": "Isack Hadjar", "team": "RB", "color": "#2b4562"},
-            87: {"name": "Andrea Kimi Antonelli", "team": "Mercedes", "color": "#00d2be"},
-            5: {"name": "Sebastian Vettel", "team": "Aston Martin", "color": "#006f62"},
-            7: {"name": "Kimi Raikkonen", "team": "Kick Sauber", "color": "#52c41a"},
-            43: {"name": "Gabriel Bortoleto", "team": "Kick Sauber", "color": "#52c41a"},
-            
-            # Reserve/Test drivers
-            6: {"name": "Nicholas Latifi", "team": "Williams", "color": "#005aff"},
-            45: {"name": "Jack Doohan", "team": "Alpine", "color": "#0090ff"},
-            12: {"name": "Felipe Drugovich", "team": "Aston Martin", "color": "#006f62"},
-            
-            # Additional possible numbers
-            15: {"name": "Patricio O'Ward", "team": "McLaren", "color": "#ff8700"},
-            25: {"name": "Theo Pourchaire", "team": "Kick Sauber", "color": "#52c41a"}
-        }
-        
-        self.team_colors = {
-            "Red Bull Racing": "#0600ef",
-            "Mercedes": "#00d2be", 
-            "Ferrari": "#dc0000",
-            "McLaren": "#ff8700",
-            "Aston Martin": "#006f62",
-            "Kick Sauber": "#52c41a",
-            "RB": "#2b4562",
-            "AlphaTauri": "#2b4562",
-            "Haas": "#ffffff",
-            "Williams": "#005aff",
-            "Alpine": "#0090ff",
-            # Legacy team names that might still appear in data
-            "Alfa Romeo": "#900000",
-            "Alpha Tauri": "#2b4562"
-        }
+        # Drivers, teams and colors come from the shared reference registry
+        self.reference = reference
+
+    def get_driver_info(self, driver_number: int, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Name, team and color for a race number (season line-up first, then permanent numbers)"""
+        return self.reference.describe_number(driver_number, year)
 
     async def get_race_sessions(self, year: int = 2024) -> List[Dict[str, Any]]:
         """Get all race sessions for a given year"""
@@ -175,7 +98,7 @@ class StandingsService:
             # Convert to driver results
             driver_results = []
             for driver_num, pos_data in final_positions.items():
-                driver_info = self.driver_info.get(driver_num)
+                driver_info = self.get_driver_info(driver_num, session_info.get("year"))
                 if not driver_info:
                     # Log unknown driver for debugging
                     print(f"Warning: Unknown driver number {driver_num} found in race results")
@@ -253,7 +176,7 @@ class StandingsService:
             # Create standings
             standings = []
             for driver_num, stats in driver_stats.items():
-                driver_info = self.driver_info.get(driver_num)
+                driver_info = self.get_driver_info(driver_num, year)
                 if not driver_info:
                     # Log unknown driver for debugging
                     print(f"Warning: Unknown driver number {driver_num} found in standings data")
@@ -315,7 +238,7 @@ class StandingsService:
             # Create constructor standings
             standings = []
             for team_name, stats in team_stats.items():
-                team_color = self.team_colors.get(team_name, "#666666")
+                team_color = self.reference.team_color(team_name)
                 
                 standings.append(ConstructorStanding(
                     team_name=team_name,
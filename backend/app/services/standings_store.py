@@ -0,0 +1,216 @@
+import json
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+# File layout (all integers big-endian):
+#
+#   magic (8 bytes) | version (uint16) | manifest length (uint32)
+#   manifest (compact UTF-8 JSON)
+#   section blobs (zlib-compressed compact JSON), addressed by the manifest
+#
+# The manifest carries the scalar fields (year, last_updated, total_races ...)
+# and an index of {section name: [offset, length]} relative to the end of the
+# manifest, so freshness checks only ever read the first few hundred bytes.
+MAGIC = b"OTF1STD\x00"
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct(">8sHI")
+
+# Large values stored as separately compressed sections
+SECTION_KEYS = ("driver_standings", "constructor_standings", "race_results", "sessions_processed", "metadata")
+
+
+class StandingsStoreError(Exception):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+@dataclass
+class _CachedEntry:
+    """In-memory view of one standings file, keyed by its on-disk identity"""
+    mtime_ns: int
+    size: int
+    manifest: Dict[str, Any]
+    blob: bytes
+    sections: Dict[str, Any] = field(default_factory=dict)
+
+
+class StandingsStore:
+    """Compact, indexed on-disk store for yearly standings.
+
+    Files are written atomically (temp file + rename) and held in memory
+    between requests; a file is only re-read when its mtime/size change,
+    e.g. after another process (scheduler, CLI rebuild) rewrote it.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._entries: Dict[int, _CachedEntry] = {}
+
+    def path_for(self, year: int) -> Path:
+        return self.data_dir / f"standings_{year}.bin"
+
+    def legacy_path_for(self, year: int) -> Path:
+        return self.data_dir / f"standings_{year}.json"
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def save(self, year: int, data: Dict[str, Any]) -> None:
+        """Encode and atomically replace the standings file for a year"""
+        blobs = []
+        index = {}
+        offset = 0
+        for key in SECTION_KEYS:
+            if key not in data:
+                continue
+            encoded = zlib.compress(
+                json.dumps(data[key], separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            )
+            index[key] = [offset, len(encoded)]
+            blobs.append(encoded)
+            offset += len(encoded)
+
+        manifest = {key: value for key, value in data.items() if key not in SECTION_KEYS}
+        manifest["year"] = year
+        manifest["sections"] = index
+        manifest["counts"] = {
+            "drivers": len(data.get("driver_standings", [])),
+            "teams": len(data.get("constructor_standings", [])),
+            "sessions_processed": len(data.get("sessions_processed", [])),
+        }
+        manifest_bytes = json.dumps(manifest, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        blob = b"".join(blobs)
+
+        file_path = self.path_for(year)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".standings_{year}.", suffix=".tmp", dir=self.data_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(manifest_bytes)))
+                f.write(manifest_bytes)
+                f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        stat = file_path.stat()
+        self._entries[year] = _CachedEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            manifest=manifest,
+            blob=blob,
+            sections={key: data[key] for key in index},
+        )
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _read_file(self, file_path: Path, stat: os.stat_result) -> _CachedEntry:
+        with open(file_path, "rb") as f:
+            prefix = f.read(_PREFIX.size)
+            if len(prefix) != _PREFIX.size:
+                raise StandingsStoreError(f"Truncated standings file: {file_path}")
+            magic, version, manifest_len = _PREFIX.unpack(prefix)
+            if magic != MAGIC:
+                raise StandingsStoreError(f"Not a standings file: {file_path}")
+            if version != FORMAT_VERSION:
+                raise StandingsStoreError(f"Unsupported standings format v{version}: {file_path}")
+            manifest = json.loads(f.read(manifest_len).decode("utf-8"))
+            blob = f.read()
+        return _CachedEntry(mtime_ns=stat.st_mtime_ns, size=stat.st_size, manifest=manifest, blob=blob)
+
+    def _migrate_legacy(self, year: int) -> Optional[_CachedEntry]:
+        """Convert a pretty-printed standings_{year}.json into the binary format once"""
+        legacy_path = self.legacy_path_for(year)
+        if not legacy_path.exists():
+            return None
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.save(year, data)
+        print(f"Migrated legacy standings file {legacy_path} to {self.path_for(year)}")
+        return self._entries.get(year)
+
+    def _entry(self, year: int) -> Optional[_CachedEntry]:
+        file_path = self.path_for(year)
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            self._entries.pop(year, None)
+            return self._migrate_legacy(year)
+
+        entry = self._entries.get(year)
+        if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+
+        entry = self._read_file(file_path, stat)
+        self._entries[year] = entry
+        return entry
+
+    def manifest(self, year: int) -> Optional[Dict[str, Any]]:
+        """Return the header metadata for a year without decoding any section"""
+        try:
+            entry = self._entry(year)
+        except Exception as e:
+            print(f"Error reading standings manifest for {year}: {e}")
+            return None
+        return entry.manifest if entry else None
+
+    def load_section(self, year: int, key: str) -> Optional[Any]:
+        """Decode (once) and return a single section, e.g. driver_standings"""
+        try:
+            entry = self._entry(year)
+        except Exception as e:
+            print(f"Error reading standings data for {year}: {e}")
+            return None
+        if not entry:
+            return None
+        if key in entry.sections:
+            return entry.sections[key]
+
+        location = entry.manifest.get("sections", {}).get(key)
+        if not location:
+            return None
+        offset, length = location
+        value = json.loads(zlib.decompress(entry.blob[offset:offset + length]).decode("utf-8"))
+        entry.sections[key] = value
+        return value
+
+    def load(self, year: int) -> Optional[Dict[str, Any]]:
+        """Return the full standings document for a year"""
+        manifest = self.manifest(year)
+        if manifest is None:
+            return None
+        data = {key: value for key, value in manifest.items() if key not in ("sections", "counts")}
+        for key in manifest.get("sections", {}):
+            data[key] = self.load_section(year, key)
+        return data
+
+    def last_updated(self, year: int) -> Optional[datetime]:
+        manifest = self.manifest(year)
+        if not manifest or not manifest.get("last_updated"):
+            return None
+        try:
+            last_updated = datetime.fromisoformat(manifest["last_updated"].replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return last_updated.replace(tzinfo=None)
+
+    def is_stale(self, year: int, max_age_hours: int = 24) -> bool:
+        last_updated = self.last_updated(year)
+        if last_updated is None:
+            return True
+        return datetime.utcnow() - last_updated > timedelta(hours=max_age_hours)
+
+    def cached_years(self) -> List[int]:
+        return sorted(self._entries.keys())
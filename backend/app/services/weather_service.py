@@ -1,11 +1,22 @@
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
 import asyncio
 import statistics
+import time
 from dataclasses import dataclass
 
+import numpy as np
+
 from app.services.openf1_client import openf1_client
+from app.services.race_event_detector import race_event_detector
 from app.core.exceptions import OpenF1APIException
+from app.core.online_stats import StatsGroup
+
+# Trends are the least-squares slope over this many seconds of samples,
+# reported as change per TREND_UNIT seconds (the 30 minute prediction window)
+TREND_WINDOW = 1800
+TREND_UNIT = 1800
 
 @dataclass
 class WeatherCondition:
@@ -35,80 +46,155 @@ class TireRecommendation:
     optimal_temp_range: tuple
     expected_degradation: str
 
+class WeatherSeries:
+    """Weather samples of one session held as preallocated column arrays.
+
+    Samples are appended in timestamp order and only samples newer than the
+    last one are parsed, so polling a session costs the new samples only.
+    Capacity doubles when full. Every appended sample also updates the
+    session's online statistics (see app.core.online_stats).
+    """
+
+    FIELDS = (
+        "air_temperature", "track_temperature", "humidity", "pressure",
+        "wind_speed", "wind_direction", "rainfall"
+    )
+
+    def __init__(self, session_key: int, capacity: int = 256):
+        self.session_key = session_key
+        self.times = np.empty(capacity)  # epoch seconds
+        self.values = np.empty((capacity, len(self.FIELDS)))
+        self.size = 0
+        self.last_date = ""  # OpenF1 date string of the last sample, used as the poll cursor
+        self.polled_at = 0.0
+        self.lock = asyncio.Lock()
+        self.stats = StatsGroup(self.FIELDS, window=TREND_WINDOW)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self, needed: int):
+        capacity = self.times.shape[0]
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2)
+        times = np.empty(capacity)
+        times[:self.size] = self.times[:self.size]
+        values = np.empty((capacity, len(self.FIELDS)))
+        values[:self.size] = self.values[:self.size]
+        self.times, self.values = times, values
+
+    def extend(self, samples: List[Dict[str, Any]]) -> int:
+        """Append the samples newer than the last one; returns how many were added"""
+        new = sorted(
+            (sample for sample in samples if sample.get("date", "") > self.last_date),
+            key=lambda sample: sample["date"]
+        )
+        added = 0
+        self._grow(self.size + len(new))
+        for sample in new:
+            try:
+                timestamp = datetime.fromisoformat(sample["date"].replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                continue  # Skip invalid data points
+            row = self.size
+            self.times[row] = timestamp
+            for f, field_name in enumerate(self.FIELDS):
+                value = sample.get(field_name)
+                self.values[row, f] = np.nan if value is None else value
+            self.stats.push(timestamp, sample)
+            self.size += 1
+            self.last_date = sample["date"]
+            added += 1
+        return added
+
+    def column(self, field_name: str, start: int = 0) -> np.ndarray:
+        """View of one field from row start to the latest sample"""
+        return self.values[start:self.size, self.FIELDS.index(field_name)]
+
+    def window_start(self, seconds: float) -> int:
+        """First row within seconds of the latest sample"""
+        if not self.size:
+            return 0
+        return int(np.searchsorted(self.times[:self.size], self.times[self.size - 1] - seconds, side="left"))
+
+    def condition(self, row: int) -> WeatherCondition:
+        values = self.values[row]
+        wind_direction = values[self.FIELDS.index("wind_direction")]
+        return WeatherCondition(
+            air_temperature=float(values[0]),
+            track_temperature=float(values[1]),
+            humidity=float(values[2]),
+            pressure=float(values[3]),
+            wind_speed=float(values[4]),
+            wind_direction=None if np.isnan(wind_direction) else int(wind_direction),
+            rainfall=float(values[6]),
+            timestamp=datetime.fromtimestamp(float(self.times[row]), tz=timezone.utc),
+            session_key=self.session_key
+        )
+
+    def conditions(self, start: int = 0) -> List[WeatherCondition]:
+        return [self.condition(row) for row in range(start, self.size)]
+
+
 class WeatherService:
-    def __init__(self):
-        self.cache = {}
-        self.cache_duration = 60  # seconds
+    def __init__(self, max_sessions: int = 16):
+        # session_key -> WeatherSeries, least recently used first
+        self.cache: "OrderedDict[int, WeatherSeries]" = OrderedDict()
+        self.cache_duration = 60  # seconds between polls for new samples
+        self.max_sessions = max_sessions
+
+    async def get_series(self, session_key: int) -> WeatherSeries:
+        """The session's weather series, polled for new samples at most every cache_duration seconds"""
+        series = self.cache.get(session_key)
+        if series is None:
+            series = self.cache[session_key] = WeatherSeries(session_key)
+            while len(self.cache) > self.max_sessions:
+                self.cache.popitem(last=False)
+        self.cache.move_to_end(session_key)
+
+        if time.monotonic() - series.polled_at < self.cache_duration:
+            return series
+        async with series.lock:
+            # Another request may have polled while we waited for the lock
+            if time.monotonic() - series.polled_at >= self.cache_duration:
+                # Set before polling so an outage still waits cache_duration between attempts
+                series.polled_at = time.monotonic()
+                try:
+                    samples = await openf1_client.get_weather(
+                        session_key=session_key,
+                        since=series.last_date or None
+                    )
+                    added = series.extend(samples or [])
+                    if added:
+                        await race_event_detector.process_weather(
+                            session_key,
+                            series.column("rainfall", series.size - added).tolist(),
+                            self.series_trends(series)
+                        )
+                except Exception as e:
+                    if not series.size:
+                        raise
+                    print(f"Error polling weather for session {session_key}, serving cached samples: {e}")
+        return series
         
     async def get_current_weather(self, session_key: int) -> Optional[WeatherCondition]:
         """Get the most recent weather data for a session"""
         try:
-            weather_data = await openf1_client.get_weather(session_key=session_key)
-            
-            if not weather_data:
+            series = await self.get_series(session_key)
+            if not series.size:
                 return None
-                
-            # Get the most recent weather data
-            latest = max(weather_data, key=lambda x: x.get("date", ""))
-            
-            return WeatherCondition(
-                air_temperature=latest.get("air_temperature", 0),
-                track_temperature=latest.get("track_temperature", 0),
-                humidity=latest.get("humidity", 0),
-                pressure=latest.get("pressure", 0),
-                wind_speed=latest.get("wind_speed", 0),
-                wind_direction=latest.get("wind_direction"),
-                rainfall=latest.get("rainfall", 0),
-                timestamp=datetime.fromisoformat(latest.get("date", "").replace("Z", "+00:00")),
-                session_key=session_key
-            )
+            return series.condition(series.size - 1)
             
         except Exception as e:
             print(f"Error getting current weather: {e}")
             return None
     
     async def get_weather_history(self, session_key: int, hours: int = 3) -> List[WeatherCondition]:
-        """Get weather history for the specified time period"""
+        """Get weather history for the specified time period (up to the session's latest sample)"""
         try:
-            weather_data = await openf1_client.get_weather(
-                session_key=session_key
-            )
-            
-            # Filter data by time range locally
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(hours=hours)
-            
-            if not weather_data:
-                return []
-            
-            # Convert to WeatherCondition objects
-            conditions = []
-            for data in weather_data:
-                try:
-                    timestamp = datetime.fromisoformat(data.get("date", "").replace("Z", "+00:00"))
-                    # For historical data, just take the most recent data points instead of filtering by time
-                    conditions.append(WeatherCondition(
-                        air_temperature=data.get("air_temperature", 0),
-                        track_temperature=data.get("track_temperature", 0),
-                        humidity=data.get("humidity", 0),
-                        pressure=data.get("pressure", 0),
-                        wind_speed=data.get("wind_speed", 0),
-                        wind_direction=data.get("wind_direction"),
-                        rainfall=data.get("rainfall", 0),
-                        timestamp=timestamp,
-                        session_key=session_key
-                    ))
-                except Exception as e:
-                    continue  # Skip invalid data points
-            
-            # Sort by timestamp and take the most recent data points
-            sorted_conditions = sorted(conditions, key=lambda x: x.timestamp, reverse=True)
-            # Return the most recent data points (limit based on hours requested)
-            max_points = hours * 20  # Approximate 20 points per hour
-            return sorted_conditions[:max_points][::-1]  # Reverse to get chronological order
-            
-            # This line is now handled above
-            pass
+            series = await self.get_series(session_key)
+            return series.conditions(series.window_start(hours * 3600))
             
         except Exception as e:
             print(f"Error getting weather history: {e}")
@@ -116,58 +202,53 @@ class WeatherService:
     
     def analyze_temperature_trend(self, conditions: List[WeatherCondition]) -> Dict[str, WeatherTrend]:
         """Analyze temperature trends from weather history"""
-        if len(conditions) < 3:
-            return {}
-        
-        air_temps = [c.air_temperature for c in conditions]
-        track_temps = [c.track_temperature for c in conditions]
-        
+        stats = StatsGroup(("air_temperature", "track_temperature"), window=TREND_WINDOW)
+        for c in conditions:
+            stats.push(c.timestamp.timestamp(), {
+                "air_temperature": c.air_temperature,
+                "track_temperature": c.track_temperature
+            })
+        return self._temperature_trends(stats)
+    
+    def series_trends(self, series: WeatherSeries) -> Dict[str, WeatherTrend]:
+        """Temperature trends from a session's online statistics (no history scan)"""
+        return self._temperature_trends(series.stats)
+    
+    def _temperature_trends(self, stats: StatsGroup) -> Dict[str, WeatherTrend]:
         trends = {}
-        
-        # Analyze air temperature trend
-        if len(air_temps) >= 3:
-            recent_avg = statistics.mean(air_temps[-3:])
-            earlier_avg = statistics.mean(air_temps[:3])
-            rate = (recent_avg - earlier_avg) / len(air_temps)
-            
-            if abs(rate) < 0.5:
-                trend_type = "stable"
-            elif rate > 0:
-                trend_type = "rising"
-            else:
-                trend_type = "falling"
-            
-            trends["air_temperature"] = WeatherTrend(
-                trend_type=trend_type,
-                rate_of_change=rate,
-                confidence=min(0.9, len(air_temps) / 10),
-                prediction_window=30
-            )
-        
-        # Analyze track temperature trend
-        if len(track_temps) >= 3:
-            recent_avg = statistics.mean(track_temps[-3:])
-            earlier_avg = statistics.mean(track_temps[:3])
-            rate = (recent_avg - earlier_avg) / len(track_temps)
+        for field_name, threshold in (("air_temperature", 0.5), ("track_temperature", 1.0)):
+            window = stats[field_name].window
+            slope = window.slope
+            if len(window) < 3 or slope is None:
+                continue
+            rate = slope * TREND_UNIT
             
-            if abs(rate) < 1.0:
+            if abs(rate) < threshold:
                 trend_type = "stable"
             elif rate > 0:
                 trend_type = "rising"
             else:
                 trend_type = "falling"
             
-            trends["track_temperature"] = WeatherTrend(
+            trends[field_name] = WeatherTrend(
                 trend_type=trend_type,
                 rate_of_change=rate,
-                confidence=min(0.9, len(track_temps) / 10),
-                prediction_window=30
+                confidence=min(0.9, len(window) / 10),
+                prediction_window=TREND_UNIT // 60
             )
         
         return trends
     
-    def get_tire_recommendation(self, condition: WeatherCondition) -> TireRecommendation:
-        """Get tire compound recommendation based on weather conditions"""
+    def get_tire_recommendation(
+        self,
+        condition: WeatherCondition,
+        stats: Optional[StatsGroup] = None
+    ) -> TireRecommendation:
+        """Get tire compound recommendation based on weather conditions.
+        
+        With the session's statistics the compound follows the smoothed (EWMA)
+        track temperature, so single noisy samples don't flip it.
+        """
         reasoning = []
         risk_factors = []
         
@@ -194,6 +275,8 @@ class WeatherService:
         
         # Dry conditions analysis
         track_temp = condition.track_temperature
+        if stats is not None and stats["track_temperature"].ewma.value is not None:
+            track_temp = round(stats["track_temperature"].ewma.value, 1)
         air_temp = condition.air_temperature
         humidity = condition.humidity
         
@@ -226,6 +309,16 @@ class WeatherService:
             risk_factors.append("High humidity - rain risk")
             confidence *= 0.95
         
+        if stats is not None:
+            humidity_slope = stats["humidity"].window.slope
+            if humidity_slope is not None and humidity > 60 and humidity_slope * TREND_UNIT > 5:
+                risk_factors.append("Humidity rising quickly - rain risk")
+                confidence *= 0.95
+            track_slope = stats["track_temperature"].window.slope
+            if track_slope is not None and abs(track_slope * TREND_UNIT) > 3:
+                direction = "rising" if track_slope > 0 else "falling"
+                reasoning.append(f"Track temperature {direction} ({track_slope * TREND_UNIT:+.1f}°C / 30 min)")
+        
         # Temperature delta considerations
         temp_delta = track_temp - air_temp
         if temp_delta > 20:
@@ -285,23 +378,24 @@ class WeatherService:
         
         return impact
     
-    async def get_comprehensive_analysis(self, session_key: int) -> Dict[str, Any]:
+    async def get_comprehensive_analysis(self, session_key: int, hours: int = 3) -> Dict[str, Any]:
         """Get comprehensive weather analysis for race strategy"""
         try:
-            # Get current conditions
-            current = await self.get_current_weather(session_key)
-            if not current:
+            # One poll serves the current conditions, the history window and the trends
+            series = await self.get_series(session_key)
+            if not series.size:
                 # Return error if no data is available
                 return {"error": "No weather data available for this session"}
+            current = series.condition(series.size - 1)
             
-            # Get weather history
-            history = await self.get_weather_history(session_key, hours=3)
+            # Weather history window
+            start = series.window_start(hours * 3600)
             
             # Analyze trends
-            trends = self.analyze_temperature_trend(history)
+            trends = self.series_trends(series)
             
             # Get tire recommendation
-            tire_rec = self.get_tire_recommendation(current)
+            tire_rec = self.get_tire_recommendation(current, series.stats)
             
             # Calculate race impact
             race_impact = self.calculate_race_impact(current, trends)
@@ -334,8 +428,9 @@ class WeatherService:
                     "expected_degradation": tire_rec.expected_degradation
                 },
                 "race_impact": race_impact,
+                "session_statistics": series.stats.snapshot(slope_unit=TREND_UNIT),
                 "data_quality": {
-                    "history_points": len(history),
+                    "history_points": series.size - start,
                     "trend_confidence": round(statistics.mean([t.confidence for t in trends.values()]), 2) if trends else 0
                 }
             }
@@ -6,6 +6,7 @@ import json
 
 from app.services.openf1_client import openf1_client
 from app.services.race_event_detector import race_event_detector, RaceEvent
+from app.services.weather_service import weather_service
 from app.config import settings
 
 # Create Socket.IO server
@@ -105,9 +106,20 @@ async def stream_data(topic: str, session_key: int):
                 data = list(latest_positions.values())
             
             elif topic == "weather":
-                weather_data = await openf1_client.get_weather(session_key=session_key)
-                if weather_data:
-                    data = max(weather_data, key=lambda x: x.get("timestamp", 0))
+                # Polls only new samples and feeds WEATHER_CHANGE events to the race event detector
+                current = await weather_service.get_current_weather(session_key)
+                if current:
+                    data = {
+                        "air_temperature": current.air_temperature,
+                        "track_temperature": current.track_temperature,
+                        "humidity": current.humidity,
+                        "pressure": current.pressure,
+                        "wind_speed": current.wind_speed,
+                        "wind_direction": current.wind_direction,
+                        "rainfall": current.rainfall,
+                        "date": current.timestamp.isoformat(),
+                        "session_key": session_key
+                    }
             
             elif topic == "lap_times":
                 # Get latest lap times
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+챔피언십 몬테카를로 시뮬레이터 벤치마크
+
+가상의 시즌(20명, 10팀, 남은 그랑프리/스프린트)으로
+- 한 프로세스에서 simulate_chunk 를 직접 돌린 경우
+- ChampionshipSimulator 가 compute 프로세스 풀에 묶음을 나눠 보낸 경우 (워커 수별)
+의 초당 시뮬레이션 수를 비교합니다.
+
+사용 예:
+    python benchmarks/championship_simulation_benchmark.py --simulations 200000 --races 8 --sprints 2
+    python benchmarks/championship_simulation_benchmark.py --workers 1,2,4,8
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.core.points import points_rules
+from services.compute_service import ComputeService
+from services.championship_simulator import ChampionshipSimulator, form_distribution, simulate_chunk
+
+
+def build_season(races_left: int, sprints_left: int, completed: int = 16):
+    rng = random.Random(7)
+    drivers = [f"Driver {i + 1}" for i in range(20)]
+    teams = [f"Team {i + 1}" for i in range(10)]
+    driver_standings = [
+        {"name": name, "team": teams[i // 2], "points": max(0, 380 - i * 22)} for i, name in enumerate(drivers)
+    ]
+    team_points = {}
+    for standing in driver_standings:
+        team_points[standing["team"]] = team_points.get(standing["team"], 0) + standing["points"]
+    constructor_standings = [
+        {"team": team, "points": points} for team, points in sorted(team_points.items(), key=lambda item: -item[1])
+    ]
+    race_results = [
+        {
+            "round": r,
+            "results": [
+                {"driver_name": name, "position": position}
+                for position, name in enumerate(sorted(drivers, key=lambda n: drivers.index(n) + rng.random() * 8), 1)
+            ]
+        }
+        for r in range(1, completed + 1)
+    ]
+    calendar = [
+        {"round": r, "sprint": "sprint" if r - completed <= sprints_left else None}
+        for r in range(1, completed + races_left + 1)
+    ]
+    return driver_standings, constructor_standings, race_results, calendar
+
+
+def single_process(driver_standings, constructor_standings, race_results, events, simulations: int) -> float:
+    index = {standing["name"]: d for d, standing in enumerate(driver_standings)}
+    recent = [[] for _ in driver_standings]
+    for race in race_results[-6:]:
+        for result in race["results"]:
+            recent[index[result["driver_name"]]].append(result["position"])
+    teams = {standing["team"]: t for t, standing in enumerate(constructor_standings)}
+    args = (
+        form_distribution(recent, len(driver_standings)),
+        np.array([s["points"] for s in driver_standings], dtype=np.float64),
+        np.array([teams[s["team"]] for s in driver_standings], dtype=np.int32),
+        np.array([s["points"] for s in constructor_standings], dtype=np.float64),
+        events,
+        points_rules(2025)
+    )
+    start = time.perf_counter()
+    simulate_chunk(*args, simulations, 1)
+    return simulations / (time.perf_counter() - start)
+
+
+async def pooled(season, simulations: int, workers: int) -> float:
+    compute = ComputeService(max_workers=workers)
+    simulator = ChampionshipSimulator(compute=compute)
+    try:
+        # 워커 프로세스 시작 비용은 제외
+        await simulator.simulate(2025, *season, simulations=simulator.chunk_size * workers, seed=0)
+        start = time.perf_counter()
+        await simulator.simulate(2025, *season, simulations=simulations, seed=1)
+        return simulations / (time.perf_counter() - start)
+    finally:
+        compute.shutdown()
+
+
+async def main_async(args):
+    season = build_season(args.races, args.sprints)
+    events = ["sprint", "race"] * args.sprints + ["race"] * (args.races - args.sprints)
+    print(f"{args.simulations:,} simulations, {args.races} races + {args.sprints} sprints left, {os.cpu_count()} CPUs\n")
+
+    print(f"{'mode':<22}{'sims/s':>14}")
+    rate = single_process(season[0], season[1], season[2], events, args.simulations)
+    print(f"{'single process':<22}{rate:>14,.0f}")
+    for workers in [int(w) for w in args.workers.split(",")]:
+        rate = await pooled(season, args.simulations, workers)
+        print(f"{f'process pool x{workers}':<22}{rate:>14,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the championship Monte Carlo simulator")
+    parser.add_argument("--simulations", type=int, default=200000)
+    parser.add_argument("--races", type=int, default=8, help="Grands prix left")
+    parser.add_argument("--sprints", type=int, default=2, help="Sprints left (among those weekends)")
+    parser.add_argument("--workers", default=f"1,{os.cpu_count() or 1}", help="Comma separated pool sizes")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
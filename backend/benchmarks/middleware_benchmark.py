@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+미들웨어 스택 벤치마크: BaseHTTPMiddleware 방식 vs 순수 ASGI 방식
+
+캐시된 엔드포인트(메모리 캐시 적중)에 대해 동시 요청을 ASGI 레벨에서 발생시켜
+requests/sec 와 p99 지연 시간을 비교합니다. 두 스택 모두
+ErrorHandling -> RateLimit -> Logging 순서로 구성됩니다 (main_old.py 와 동일).
+
+사용 예:
+    python benchmarks/middleware_benchmark.py --seconds 5 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.middleware import ErrorHandlingMiddleware, RateLimitMiddleware, LoggingMiddleware
+from app.core.rate_limit import RateLimitRule, MemoryRateLimiter, rate_limit_headers
+
+logger = logging.getLogger("benchmark")
+
+# A standings-sized payload served from memory, like a warm @cached endpoint
+CACHED_PAYLOAD = [
+    {"position": i + 1, "driver_number": i + 1, "driver_name": f"Driver {i + 1}", "points": 400 - i * 15}
+    for i in range(20)
+]
+
+
+class BaseErrorHandlingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except HTTPException as e:
+            return JSONResponse(status_code=e.status_code, content={"error": "HTTP Exception", "message": e.detail})
+        except Exception:
+            return JSONResponse(status_code=500, content={"error": "Internal Server Error"})
+
+
+class BaseRateLimitMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, calls: int = 60, period: int = 60):
+        super().__init__(app)
+        self.rule = RateLimitRule(limit=calls, period=period)
+        self.limiter = MemoryRateLimiter()
+
+    async def dispatch(self, request: Request, call_next):
+        result = await self.limiter.check(f"{request.client.host}:*", self.rule)
+        headers = rate_limit_headers(result)
+        if not result.allowed:
+            return JSONResponse(status_code=429, content={"error": "Rate limit exceeded"}, headers=headers)
+        response = await call_next(request)
+        response.headers.update(headers)
+        return response
+
+
+class BaseLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url.path}")
+        response = await call_next(request)
+        duration = time.time() - start_time
+        logger.info(f"Response: {request.method} {request.url.path} - Status: {response.status_code}")
+        response.headers["X-Process-Time"] = str(duration)
+        return response
+
+
+def build_app(variant: str, calls: int) -> FastAPI:
+    app = FastAPI()
+    cache: Dict[str, list] = {"standings": CACHED_PAYLOAD}
+
+    @app.get("/api/v1/standings/drivers")
+    async def cached_drivers():
+        return cache["standings"]
+
+    if variant == "base":
+        app.add_middleware(BaseErrorHandlingMiddleware)
+        app.add_middleware(BaseRateLimitMiddleware, calls=calls, period=60)
+        app.add_middleware(BaseLoggingMiddleware)
+    else:
+        app.add_middleware(ErrorHandlingMiddleware)
+        app.add_middleware(RateLimitMiddleware, calls=calls, period=60)
+        app.add_middleware(LoggingMiddleware)
+    return app
+
+
+async def call(app, client_ip: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/standings/drivers",
+        "raw_path": b"/api/v1/standings/drivers",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": (client_ip, 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run_closed_loop(app, seconds: float, concurrency: int, clients: int):
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async def worker(worker_id: int):
+        nonlocal errors
+        i = worker_id
+        while time.perf_counter() < deadline:
+            t0 = time.perf_counter()
+            status = await call(app, f"10.1.{(i % clients) // 256}.{(i % clients) % 256}")
+            latencies.append(time.perf_counter() - t0)
+            if status != 200:
+                errors += 1
+            i += concurrency
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "requests": len(latencies),
+        "non_200": errors,
+    }
+
+
+async def main_async(args):
+    # Keep logging enabled (as in production) but don't let console I/O dominate the numbers
+    logging.basicConfig(level=logging.INFO, handlers=[logging.NullHandler()])
+
+    results = {}
+    for variant in ("base", "asgi"):
+        # High per-client limit so both stacks do the full rate-limit path without rejecting
+        app = build_app(variant, calls=10 ** 9)
+        await run_closed_loop(app, 0.5, args.concurrency, args.clients)  # warm-up
+        results[variant] = await run_closed_loop(app, args.seconds, args.concurrency, args.clients)
+
+    print(f"Cached endpoint, {args.concurrency} concurrent callers, {args.seconds}s per stack\n")
+    print(f"{'stack':<8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'requests':>10}{'non-200':>9}")
+    for variant, r in results.items():
+        print(f"{variant:<8}{r['rps']:>10.0f}{r['p50_ms']:>10.3f}{r['p99_ms']:>10.3f}{r['requests']:>10}{r['non_200']:>9}")
+
+    speedup = results["asgi"]["rps"] / results["base"]["rps"]
+    print(f"\nPure ASGI stack: {speedup:.2f}x requests/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare BaseHTTPMiddleware and pure ASGI middleware stacks")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per stack")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent in-flight requests")
+    parser.add_argument("--clients", type=int, default=1000, help="Distinct client IPs")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+RateLimitMiddleware 오버헤드 벤치마크
+
+5k req/s 부하를 ASGI 레벨에서 직접 발생시켜 (네트워크/uvicorn 비용 제외)
+- 미들웨어 없는 앱
+- 기존 sliding-window 리스트 방식
+- GCRA (memory / redis)
+의 요청당 지연 시간을 비교합니다.
+
+사용 예:
+    python benchmarks/rate_limit_benchmark.py --rate 5000 --seconds 5 --clients 1000
+    python benchmarks/rate_limit_benchmark.py --backend redis
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.middleware import RateLimitMiddleware
+from app.core.rate_limit import RateLimitRule, MemoryRateLimiter, RedisRateLimiter
+
+
+class LegacySlidingWindowMiddleware(BaseHTTPMiddleware):
+    """Previous implementation: a list of timestamps per client IP, rebuilt on every request"""
+
+    def __init__(self, app, calls: int = 60, period: int = 60):
+        super().__init__(app)
+        self.calls = calls
+        self.period = period
+        self.clients: Dict[str, list] = {}
+
+    async def dispatch(self, request: Request, call_next):
+        client_ip = request.client.host
+        now = time.time()
+        timestamps = [ts for ts in self.clients.get(client_ip, []) if now - ts < self.period]
+        self.clients[client_ip] = timestamps
+        if len(timestamps) >= self.calls:
+            return JSONResponse(status_code=429, content={"error": "Rate limit exceeded"})
+        timestamps.append(now)
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(self.calls)
+        response.headers["X-RateLimit-Remaining"] = str(self.calls - len(timestamps))
+        return response
+
+
+def build_app(variant: str, calls: int, backend: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping():
+        return {"ok": True}
+
+    if variant == "legacy":
+        app.add_middleware(LegacySlidingWindowMiddleware, calls=calls, period=60)
+    elif variant == "gcra":
+        app.add_middleware(RateLimitMiddleware, calls=calls, period=60, backend=backend)
+    return app
+
+
+async def call(app, client_ip: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/ping",
+        "raw_path": b"/api/v1/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": (client_ip, 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run_load(app, rate: int, seconds: float, clients: int):
+    """Open-loop load: request i is issued at start + i / rate"""
+    total = int(rate * seconds)
+    latencies = []
+    rejected = 0
+    late = 0
+    start = time.perf_counter()
+
+    for i in range(total):
+        target = start + i / rate
+        delay = target - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            late += 1
+        t0 = time.perf_counter()
+        status = await call(app, f"10.0.{(i % clients) // 256}.{(i % clients) % 256}")
+        latencies.append(time.perf_counter() - t0)
+        if status == 429:
+            rejected += 1
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "achieved_rps": total / elapsed,
+        "mean_us": statistics.mean(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "rejected": rejected,
+        "behind_schedule": late,
+    }
+
+
+async def limiter_throughput(limiter, n: int, clients: int) -> float:
+    rule = RateLimitRule(limit=60, period=60, burst=10)
+    start = time.perf_counter()
+    for i in range(n):
+        await limiter.check(f"10.0.0.{i % clients}:*", rule)
+    return n / (time.perf_counter() - start)
+
+
+async def main_async(args):
+    if args.backend == "redis":
+        from app.services.cache_service import cache_service
+        await cache_service.connect()
+
+    print(f"Load: {args.rate} req/s for {args.seconds}s across {args.clients} clients (limit {args.calls}/min)\n")
+
+    results = {}
+    for variant in ("none", "legacy", "gcra"):
+        app = build_app(variant, args.calls, args.backend)
+        await run_load(app, args.rate, 0.5, args.clients)  # warm-up
+        app = build_app(variant, args.calls, args.backend)
+        results[variant] = await run_load(app, args.rate, args.seconds, args.clients)
+
+    baseline = results["none"]["mean_us"]
+    print(f"{'variant':<10}{'rps':>10}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'overhead us':>13}{'429s':>8}")
+    for variant, r in results.items():
+        print(
+            f"{variant:<10}{r['achieved_rps']:>10.0f}{r['mean_us']:>10.1f}{r['p50_us']:>10.1f}"
+            f"{r['p99_us']:>10.1f}{r['mean_us'] - baseline:>13.1f}{r['rejected']:>8}"
+        )
+
+    limiter = RedisRateLimiter() if args.backend == "redis" else MemoryRateLimiter()
+    ops = await limiter_throughput(limiter, 200000 if args.backend == "memory" else 20000, args.clients)
+    print(f"\n{args.backend} limiter alone: {ops:,.0f} checks/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rate limit middleware overhead")
+    parser.add_argument("--rate", type=int, default=5000, help="Target requests per second")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per variant")
+    parser.add_argument("--clients", type=int, default=1000, help="Distinct client IPs")
+    parser.add_argument("--calls", type=int, default=60, help="Per-client limit per minute")
+    parser.add_argument("--backend", choices=["memory", "redis"], default="memory")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,25 @@
 import json
-import time
-from motorsport_selenium_scraper import MotorsportSeleniumScraper
+import sys
+from scraping_engine import ScrapingEngine
+from motorsport_http_scraper import submit_tiered
+from app.core.reference import reference
 from datetime import datetime
 import os
 
 class BulkDriverScraper:
-    def __init__(self):
-        self.scraper = MotorsportSeleniumScraper(headless=True)
+    def __init__(self, engine=None, workers=4, use_http=True):
+        # 공유 엔진이 주어지면 그 브라우저 풀을 사용, 아니면 자체 풀 생성
+        # (브라우저는 HTTP 경로로 부족한 페이지가 있을 때만 실제로 실행됨)
+        self.own_engine = engine is None
+        self.engine = engine or ScrapingEngine(workers=workers)
+        self.use_http = use_http
         self.output_file = "driver_career_stats.json"
         self.season_2025_file = "driver_2025_season_stats.json"
         
-        # F1 2025 드라이버 목록 (motorsportstats.com slug 형식)
+        # F1 2025 드라이버 목록 (motorsportstats.com slug 형식, 공용 참조 데이터에서)
         self.f1_drivers = {
-            "max-verstappen": {"number": 33, "name": "Max Verstappen"},
-            "lando-norris": {"number": 4, "name": "Lando Norris"},
-            "oscar-piastri": {"number": 81, "name": "Oscar Piastri"},
-            "charles-leclerc": {"number": 16, "name": "Charles Leclerc"},
-            "lewis-hamilton": {"number": 44, "name": "Lewis Hamilton"},
-            "george-russell": {"number": 63, "name": "George Russell"},
-            "andrea-kimi-antonelli": {"number": 12, "name": "Andrea Kimi Antonelli"},
-            "carlos-sainz": {"number": 55, "name": "Carlos Sainz"},
-            "alexander-albon": {"number": 23, "name": "Alexander Albon"},
-            "fernando-alonso": {"number": 14, "name": "Fernando Alonso"},
-            "lance-stroll": {"number": 18, "name": "Lance Stroll"},
-            "pierre-gasly": {"number": 10, "name": "Pierre Gasly"},
-            "esteban-ocon": {"number": 31, "name": "Esteban Ocon"},
-            "jack-doohan": {"number": 7, "name": "Jack Doohan"},
-            "franco-colapinto": {"number": 43, "name": "Franco Colapinto"},
-            "yuki-tsunoda": {"number": 22, "name": "Yuki Tsunoda"},
-            "liam-lawson": {"number": 30, "name": "Liam Lawson"},
-            "isack-hadjar": {"number": 6, "name": "Isack Hadjar"},
-            "nico-hulkenberg": {"number": 27, "name": "Nico Hulkenberg"},
-            "gabriel-bortoleto": {"number": 5, "name": "Gabriel Bortoleto"},
-            "oliver-bearman": {"number": 87, "name": "Oliver Bearman"}
+            driver.slug: {"number": driver.permanent_number, "name": driver.full_name}
+            for driver in reference.season_drivers(2025)
         }
     
     def scrape_all_drivers(self):
@@ -47,12 +34,15 @@ class BulkDriverScraper:
         
         print(f"Starting bulk scraping for {len(self.f1_drivers)} drivers...")
         
+        # HTTP 로 먼저 가져오고, 부족한 드라이버만 브라우저 풀에 제출
+        futures = submit_tiered(self.engine, "driver", self.f1_drivers, use_http=self.use_http)
+        
         for i, (driver_slug, driver_info) in enumerate(self.f1_drivers.items(), 1):
             print(f"\n[{i}/{len(self.f1_drivers)}] Processing {driver_info['name']} ({driver_slug})...")
             
             try:
-                # 스크래핑 실행
-                driver_stats = self.scraper.get_driver_career_stats(driver_slug)
+                # 스크래핑 결과 대기
+                driver_stats = futures[driver_slug].result()
                 
                 if driver_stats and driver_stats.get('extracted_stats'):
                     # 성공적으로 데이터를 가져온 경우
@@ -104,11 +94,6 @@ class BulkDriverScraper:
                 results["failed_scrapes"] += 1
                 
                 print(f"❌ Error: {driver_info['name']} - {str(e)}")
-            
-            # 요청 간 딜레이 (서버 부하 방지)
-            if i < len(self.f1_drivers):
-                print(f"   Waiting 3 seconds before next request...")
-                time.sleep(3)
         
         return results
     
@@ -125,12 +110,19 @@ class BulkDriverScraper:
         
         print(f"\nScraping 2025 season data for {len(self.f1_drivers)} drivers...")
         
+        futures = {
+            driver_slug: self.engine.submit(
+                lambda scraper, slug: scraper.get_driver_season_results(slug, 2025), driver_slug, label=driver_slug
+            )
+            for driver_slug in self.f1_drivers
+        }
+        
         for i, (driver_slug, driver_info) in enumerate(self.f1_drivers.items(), 1):
             print(f"\n[{i}/{len(self.f1_drivers)}] Getting 2025 season data for {driver_info['name']}...")
             
             try:
                 # 2025년 시즌 결과 페이지 스크래핑
-                season_data = self.scraper.get_driver_season_results(driver_slug, 2025)
+                season_data = futures[driver_slug].result()
                 
                 if season_data and season_data.get('race_results'):
                     # 2025년 시즌 통계 계산
@@ -224,10 +216,6 @@ class BulkDriverScraper:
                 results["failed_scrapes"] += 1
                 
                 print(f"❌ Error: {driver_info['name']} - {str(e)}")
-            
-            # 요청 간 딜레이
-            if i < len(self.f1_drivers):
-                time.sleep(2)
         
         return results
     
@@ -288,19 +276,22 @@ class BulkDriverScraper:
             print(f"❌ Error saving 2025 season results: {e}")
             return False
     
-    def run(self):
-        """전체 스크래핑 프로세스 실행"""
+    def run(self, interactive=None):
+        """전체 스크래핑 프로세스 실행 (성공 여부 반환)"""
+        if interactive is None:
+            # 스케줄러 등 비대화형 실행에서는 확인 프롬프트 생략
+            interactive = sys.stdin.isatty()
         try:
             print("Starting bulk driver statistics scraping...")
             
             # 기존 결과 확인
             existing_results = self.load_existing_results()
-            if existing_results:
+            if existing_results and interactive:
                 print(f"Found existing results from {existing_results.get('scraped_at', 'unknown time')}")
                 user_input = input("Do you want to continue with fresh scraping? (y/n): ").strip().lower()
                 if user_input != 'y':
                     print("Scraping cancelled.")
-                    return
+                    return False
             
             # 1. 커리어 통계 스크래핑
             print("\n🏆 PHASE 1: Career Statistics Scraping")
@@ -308,20 +299,25 @@ class BulkDriverScraper:
             career_results = self.scrape_all_drivers()
             
             # 커리어 통계 저장
-            if self.save_results(career_results):
+            saved = self.save_results(career_results)
+            if saved:
                 self.print_summary(career_results)
             
             # 2025년 시즌 데이터는 이제 career summary에서 함께 추출됨
             print("\n✅ 2025 season data is now extracted from career summary tables")
+            return saved
             
         except KeyboardInterrupt:
             print("\n⏹️  Scraping interrupted by user")
+            return False
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
+            return False
         finally:
-            # 브라우저 종료
-            self.scraper.close()
-            print("\n✅ Browser closed")
+            # 자체 브라우저 풀인 경우에만 종료
+            if self.own_engine:
+                self.engine.close()
+                print("\n✅ Browser closed")
     
     def print_season_summary(self, results):
         """2025년 시즌 스크래핑 결과 요약 출력"""
@@ -359,4 +355,4 @@ class BulkDriverScraper:
 
 if __name__ == "__main__":
     scraper = BulkDriverScraper()
-    scraper.run()
\ No newline at end of file
+    sys.exit(0 if scraper.run() else 1)
\ No newline at end of file
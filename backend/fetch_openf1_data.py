@@ -1,113 +1,299 @@
 #!/usr/bin/env python3
 """
 OpenF1 API에서 2025년 레이스 결과 데이터를 가져와서 JSON 파일로 저장하는 스크립트
+
+- 비동기(httpx)로 여러 세션 결과를 동시에 가져옵니다 (동시 요청 수 / 초당 요청 수 설정 가능)
+- 429 / 5xx 응답은 지터가 포함된 지수 백오프로 재시도합니다 (Retry-After 헤더 우선)
+- 이미 확정된(final) 세션은 기존 파일의 결과를 재사용하고 다시 요청하지 않습니다
+- 임시 파일에 쓴 뒤 rename 하므로 API 서버가 반쯤 쓰인 파일을 읽는 일이 없습니다
+
+사용 예:
+    python fetch_openf1_data.py --concurrency 4 --rate 3
+    python fetch_openf1_data.py --refresh-all
 """
 
-import requests
+import argparse
+import asyncio
 import json
-import time
 import logging
-from datetime import datetime
-from typing import Dict, List, Any
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional
+
+import httpx
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def fetch_2025_sessions() -> List[Dict[str, Any]]:
-    """2025년 모든 세션 정보 한 번에 가져오기"""
+OPENF1_BASE_URL = "https://api.openf1.org/v1"
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """초당 rate 개의 토큰이 채워지는 토큰 버킷 (최대 burst 개)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class OpenF1BulkFetcher:
+    """동시성 제한 + 토큰 버킷 + 재시도가 적용된 OpenF1 요청기"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        concurrency: int = 4,
+        rate: float = 3.0,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0
+    ):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.bucket = TokenBucket(rate, burst=concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """Retry-After 헤더가 있으면 따르고, 없으면 full-jitter 지수 백오프"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(self.backoff_max, float(retry_after))
+                except ValueError:
+                    pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def get_json(self, path: str, params: Dict[str, Any]) -> Any:
+        for attempt in range(self.max_retries + 1):
+            response = None
+            async with self.semaphore:
+                await self.bucket.acquire()
+                try:
+                    response = await self.client.get(path, params=params)
+                except httpx.TransportError as e:
+                    error = f"{type(e).__name__}: {e}"
+                else:
+                    if response.status_code == 200:
+                        return response.json()
+                    if response.status_code not in RETRY_STATUS_CODES:
+                        response.raise_for_status()
+                        return []
+                    error = f"HTTP {response.status_code}"
+
+            if attempt == self.max_retries:
+                raise RuntimeError(f"{path} {params} failed after {attempt + 1} attempts ({error})")
+
+            delay = self._retry_delay(attempt, response)
+            logger.warning(f"{path} {params}: {error}, retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+            await asyncio.sleep(delay)
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def is_session_final(session: Dict[str, Any], results: List[Dict[str, Any]], settle_hours: float) -> bool:
+    """결과가 있고 세션 종료 후 settle_hours 가 지났으면 확정(final)으로 간주 (페널티 반영 기간 고려)"""
+    if not results:
+        return False
+    ended_at = parse_datetime(session.get("date_end")) or parse_datetime(session.get("date_start"))
+    if not ended_at:
+        return False
+    return datetime.now(timezone.utc) - ended_at > timedelta(hours=settle_hours)
+
+
+def load_existing_data(output_file: str) -> Dict[str, Any]:
+    """기존 결과 파일 로드 (없거나 손상된 경우 빈 구조)"""
     try:
-        logger.info("Fetching 2025 sessions from OpenF1 API (all types)...")
-        url = "https://api.openf1.org/v1/sessions?year=2025"
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            sessions = response.json()
-            logger.info(f"Found {len(sessions)} sessions")
-            return sessions
-        else:
-            logger.error(f"Failed to fetch sessions: {response.status_code}")
-            return []
+        if os.path.exists(output_file):
+            with open(output_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
     except Exception as e:
-        logger.error(f"Failed to fetch 2025 sessions: {e}")
-        return []
+        logger.warning(f"Could not read existing {output_file}, fetching everything: {e}")
+    return {"sessions": {}}
+
+
+def write_json_atomic(output_file: str, data: Dict[str, Any]):
+    """같은 디렉토리의 임시 파일에 쓴 뒤 os.replace 로 교체"""
+    directory = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_path = tempfile.mkstemp(prefix=".openf1_", suffix=".json.tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, output_file)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+async def fetch_sessions(fetcher: OpenF1BulkFetcher, year: int) -> List[Dict[str, Any]]:
+    """해당 연도 모든 세션 정보 한 번에 가져오기"""
+    logger.info(f"Fetching {year} sessions from OpenF1 API (all types)...")
+    sessions = await fetcher.get_json("/sessions", {"year": year})
+    logger.info(f"Found {len(sessions)} sessions")
+    return sessions
+
 
-def fetch_session_results(session_key: int, session_type: str) -> List[Dict[str, Any]]:
+def build_session_entry(session: Dict[str, Any], results: List[Dict[str, Any]], final: bool) -> Dict[str, Any]:
+    """세션 정보 + 결과를 저장 형식으로 변환"""
+    return {
+        "session_key": session['session_key'],
+        "meeting_key": session.get('meeting_key'),
+        "session_type": session.get('session_type'),
+        "location": session.get('location'),
+        "date_start": session.get('date_start'),
+        "date_end": session.get('date_end'),
+        "country_name": session.get('country_name'),
+        "circuit_short_name": session.get('circuit_short_name'),
+        "results": results,
+        "final": final
+    }
+
+
+async def fetch_session_entry(
+    fetcher: OpenF1BulkFetcher,
+    session: Dict[str, Any],
+    settle_hours: float
+) -> Dict[str, Any]:
     """특정 세션의 결과 가져오기 (OpenF1 API 원본 응답 그대로 저장)"""
+    session_key = session['session_key']
     try:
-        logger.info(f"Fetching results for session {session_key} ({session_type})...")
-        
-        results_url = f"https://api.openf1.org/v1/session_result?session_key={session_key}"
-        response = requests.get(results_url, timeout=10)
-        
-        if response.status_code == 200:
-            results = response.json()
-            
-            if results:
-                logger.info(f"Found {len(results)} raw results for session {session_key}")
-                # OpenF1 API 응답을 그대로 반환
-                return results
-        
-        return []
-        
+        results = await fetcher.get_json("/session_result", {"session_key": session_key})
+        logger.info(f"Found {len(results)} raw results for session {session_key} ({session.get('session_type')})")
     except Exception as e:
         logger.error(f"Failed to fetch results for session {session_key}: {e}")
-        return []
+        results = []
+
+    return build_session_entry(session, results, is_session_final(session, results, settle_hours))
+
+
+async def run(args) -> Dict[str, Any]:
+    existing = {} if args.refresh_all else load_existing_data(args.output).get("sessions", {})
+
+    async with httpx.AsyncClient(base_url=OPENF1_BASE_URL, timeout=args.timeout) as client:
+        fetcher = OpenF1BulkFetcher(
+            client,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            max_retries=args.max_retries
+        )
+
+        sessions = await fetch_sessions(fetcher, args.year)
+        if not sessions:
+            raise RuntimeError("No sessions found")
+
+        now = datetime.now(timezone.utc)
+        entries: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+
+        for session in sessions:
+            session_key = session.get('session_key')
+            if not session_key:
+                continue
+
+            previous = existing.get(str(session_key))
+            if previous and previous.get("final"):
+                # 이미 확정된 세션은 다시 요청하지 않음
+                # (확정 전에 받은 결과는 settle_hours 가 지난 뒤 한 번 더 받아 페널티를 반영하고 그때 final 로 저장)
+                entries[str(session_key)] = build_session_entry(session, previous.get("results", []), final=True)
+                continue
+
+            starts_at = parse_datetime(session.get('date_start'))
+            if starts_at and starts_at > now:
+                # 아직 시작하지 않은 세션은 결과가 없으므로 요청 생략
+                entries[str(session_key)] = build_session_entry(session, [], final=False)
+                continue
+
+            to_fetch.append(session)
+
+        logger.info(
+            f"{len(to_fetch)} sessions to fetch, "
+            f"{sum(1 for e in entries.values() if e.get('final'))} final sessions reused"
+        )
+
+        fetched = await asyncio.gather(
+            *(fetch_session_entry(fetcher, session, args.settle_hours) for session in to_fetch)
+        )
+        for entry in fetched:
+            key = str(entry["session_key"])
+            previous = existing.get(key)
+            if not entry["results"] and previous and previous.get("results"):
+                # 요청 실패 시 이전 결과 유지
+                entry["results"] = previous["results"]
+            entries[key] = entry
+
+    # 세션 시작 시간 순으로 정렬
+    ordered = dict(sorted(entries.items(), key=lambda item: item[1].get("date_start") or ""))
+    return {
+        "year": args.year,
+        "fetched_at": datetime.now().isoformat(),
+        "sessions": ordered
+    }
+
+
+def parse_args(argv=None):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Fetch OpenF1 session results concurrently")
+    parser.add_argument("--year", type=int, default=2025)
+    parser.add_argument("--output", default=os.path.join(script_dir, "openf1_2025_results.json"))
+    parser.add_argument("--concurrency", type=int, default=4, help="Max in-flight requests")
+    parser.add_argument("--rate", type=float, default=3.0, help="Max requests per second")
+    parser.add_argument("--max-retries", type=int, default=5, help="Retries on 429/5xx/network errors")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument("--settle-hours", type=float, default=72.0,
+                        help="Hours after a session ends before its results are treated as final")
+    parser.add_argument("--refresh-all", action="store_true", help="Ignore existing results and refetch everything")
+    return parser.parse_args(argv)
+
 
 def main():
     """메인 함수"""
+    args = parse_args()
     logger.info("Starting OpenF1 data fetch...")
-    
-    # 세션 정보 가져오기
-    sessions = fetch_2025_sessions()
-    
-    if not sessions:
-        logger.error("No sessions found")
-        return
-    
-    # 결과 저장할 데이터 구조
-    openf1_data = {
-        "year": 2025,
-        "fetched_at": datetime.now().isoformat(),
-        "sessions": {}
-    }
-    
-    # 각 세션별로 결과 가져오기
-    for session in sessions:
-        session_key = session.get('session_key')
-        session_type = session.get('session_type')
-        location = session.get('location')
-        date_start = session.get('date_start')
-        
-        if not session_key:
-            continue
-        
-        logger.info(f"Processing session {session_key}: {session_type} at {location}")
-        
-        # 결과 가져오기
-        results = fetch_session_results(session_key, session_type)
-        
-        # 세션 정보 저장
-        openf1_data["sessions"][str(session_key)] = {
-            "session_key": session_key,
-            "meeting_key": session.get('meeting_key'),
-            "session_type": session_type,
-            "location": location,
-            "date_start": date_start,
-            "country_name": session.get('country_name'),
-            "circuit_short_name": session.get('circuit_short_name'),
-            "results": results
-        }
-        
-        # API 호출 제한을 위해 잠시 대기
-        time.sleep(0.5)
-    
-    # JSON 파일로 저장
-    output_file = "openf1_2025_results.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(openf1_data, f, indent=2, ensure_ascii=False)
-    
-    logger.info(f"OpenF1 data saved to {output_file}")
+
+    try:
+        openf1_data = asyncio.run(run(args))
+    except Exception as e:
+        logger.error(f"OpenF1 data fetch failed: {e}")
+        raise SystemExit(1)
+
+    # JSON 파일로 저장 (원자적 교체)
+    write_json_atomic(args.output, openf1_data)
+
+    logger.info(f"OpenF1 data saved to {args.output}")
     logger.info(f"Total sessions processed: {len(openf1_data['sessions'])}")
 
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
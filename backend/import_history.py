@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+지난 시즌 jolpi(Ergast) 데이터를 로컬 저장소(services/history_warehouse.py)로 가져오는 스크립트
+
+- 시즌마다 일정, 레이스 결과, 예선 결과, 최종 드라이버/컨스트럭터 순위를 받아 SQLite 에 저장
+- 이미 가져온 시즌은 건너뜀 (--force 로 다시 가져오기)
+- 진행 중인 시즌은 바뀔 수 있으므로 가져오지 않음 (API 가 계속 원격 호출)
+- jolpi 요청 제한(초당 4회, 시간당 500회)에 맞춰 요청 간격을 둠
+
+사용 예:
+    python import_history.py --from-year 2010
+    python import_history.py --seasons 2021,2022 --force
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from services.history_warehouse import ERGAST_PREFIX, HistoryWarehouse, DEFAULT_DB_PATH
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class ErgastFetcher:
+    """요청 간격 + 재시도가 적용된 jolpi 요청기"""
+
+    def __init__(self, interval: float = 0.5, max_retries: int = 4, timeout: float = 20.0):
+        self.interval = interval
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        self._last_request = 0.0
+        self.requests_made = 0
+
+    def get(self, path: str, offset: int = 0) -> Dict[str, Any]:
+        url = f"{ERGAST_PREFIX}{path}.json?limit={PAGE_SIZE}&offset={offset}"
+        for attempt in range(self.max_retries + 1):
+            wait = self._last_request + self.interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request = time.monotonic()
+            self.requests_made += 1
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f"{url} failed ({e}), retrying")
+                time.sleep(2 ** attempt)
+                continue
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                delay = float(response.headers.get("Retry-After") or 2 ** (attempt + 1))
+                logger.warning(f"{url}: HTTP {response.status_code}, retrying in {delay:.0f}s")
+                time.sleep(delay)
+                continue
+            response.raise_for_status()
+            return response.json()["MRData"]
+        raise RuntimeError(f"Giving up on {url}")
+
+    def races(self, path: str, key: str) -> List[Dict[str, Any]]:
+        """페이지를 넘기며 Races 를 모음 (한 레이스가 두 페이지에 걸치면 합침)"""
+        races: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        while True:
+            data = self.get(path, offset)
+            for race in data["RaceTable"]["Races"]:
+                merged = races.setdefault(race["round"], {**race, key: []})
+                merged[key].extend(race.get(key, []))
+            offset += PAGE_SIZE
+            # total 은 레이스 수가 아니라 결과 행 수
+            if offset >= int(data.get("total", 0)):
+                break
+        return sorted(races.values(), key=lambda race: int(race["round"]))
+
+    def standings(self, path: str, key: str) -> List[Dict[str, Any]]:
+        lists = self.get(path)["StandingsTable"]["StandingsLists"]
+        return lists[0][key] if lists else []
+
+
+def import_season(fetcher: ErgastFetcher, warehouse: HistoryWarehouse, season: int):
+    calendar = fetcher.get(str(season))["RaceTable"]["Races"]
+    if not calendar:
+        logger.warning(f"No races for {season}, skipping")
+        return
+    warehouse.import_season(
+        season,
+        calendar=calendar,
+        results=fetcher.races(f"{season}/results", "Results"),
+        qualifying=fetcher.races(f"{season}/qualifying", "QualifyingResults"),
+        driver_standings=fetcher.standings(f"{season}/driverStandings", "DriverStandings"),
+        constructor_standings=fetcher.standings(f"{season}/constructorStandings", "ConstructorStandings")
+    )
+
+
+def parse_seasons(args) -> List[int]:
+    last_complete = datetime.now().year - 1
+    if args.seasons:
+        seasons = sorted({int(season) for season in args.seasons.split(",") if season.strip()})
+    else:
+        seasons = list(range(args.from_year, (args.to_year or last_complete) + 1))
+    ongoing = [season for season in seasons if season > last_complete]
+    if ongoing:
+        logger.warning(f"Skipping seasons that are not finished yet: {ongoing}")
+    return [season for season in seasons if season <= last_complete]
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Import finished F1 seasons from jolpi into the local history warehouse")
+    parser.add_argument("--seasons", help="Comma separated seasons, e.g. 2021,2022")
+    parser.add_argument("--from-year", type=int, default=2000)
+    parser.add_argument("--to-year", type=int, default=None, help="Defaults to the last finished season")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between requests")
+    parser.add_argument("--force", action="store_true", help="Re-import seasons that are already stored")
+    return parser.parse_args(argv)
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    warehouse = HistoryWarehouse(args.db)
+    fetcher = ErgastFetcher(interval=args.interval)
+
+    imported = failed = 0
+    for season in parse_seasons(args):
+        if not args.force and warehouse.has_season(season):
+            logger.info(f"Season {season} already imported")
+            continue
+        try:
+            import_season(fetcher, warehouse, season)
+            imported += 1
+        except Exception as e:
+            failed += 1
+            logger.error(f"Failed to import season {season}: {e}")
+
+    warehouse.close()
+    logger.info(f"Imported {imported} seasons ({failed} failed, {fetcher.requests_made} requests) into {args.db}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
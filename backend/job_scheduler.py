@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+데이터 갱신 작업 스케줄러 (프로세스 내 asyncio DAG)
+
+작업 간 의존 관계를 따라 실행하고, 서로 독립적인 작업은 동시에 실행합니다.
+
+    openf1_fetch ──────────────► standings_rebuild
+    race_results ─┐
+    drivers ──────┼──► backup (openf1_fetch 포함, 내용이 바뀐 파일만)
+    teams ────────┘
+
+- 레이스 결과 / 드라이버 / 팀 스크래핑은 하나의 브라우저 풀(ScrapingEngine)을 공유
+- 실행 기록은 data/scheduler/run_history.json 에 저장
+- 데이터 파일을 만드는 작업이 성공하면 API 에 데이터셋 재로딩을 요청
+  (POST {OVERTAKE_API_URL}/admin/reload-datasets)
+- 수동 실행: `python job_scheduler.py run`, 실행 중인 스케줄러에는 `python job_scheduler.py trigger` (SIGUSR1)
+
+사용 예:
+    python job_scheduler.py serve                     # 매주 월요일 09:00 전체 실행
+    python job_scheduler.py run --jobs drivers,teams  # 지정 작업만 즉시 실행
+    python job_scheduler.py run --jobs standings_rebuild --with-deps
+    python job_scheduler.py history -n 5
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import os
+import signal
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+STATE_DIR = SCRIPT_DIR / "data" / "scheduler"
+HISTORY_FILE = STATE_DIR / "run_history.json"
+PID_FILE = STATE_DIR / "scheduler.pid"
+HISTORY_LIMIT = 200
+
+# refresh_planner 가 세션 전후에 실행할 때 쓰는 trigger (RefreshPlan.mode)
+CALENDAR_TRIGGERS = ("live", "post_session", "prewarm")
+
+API_URL = os.getenv("OVERTAKE_API_URL", "http://localhost:8000")
+RELOAD_TOKEN = os.getenv("RELOAD_TOKEN", "")
+
+# 백업 대상 (파일명, 백업 접두사)
+BACKUP_FILES = [
+    ("motorsportstats_2025_race_results.json", "motorsportstats_race_backup"),
+    ("driver_career_stats.json", "driver_career_stats_backup"),
+    ("team_2025_season_stats.json", "team_2025_season_backup"),
+    ("openf1_2025_results.json", "openf1_2025_results_backup")
+]
+
+
+@dataclass
+class Job:
+    name: str
+    fn: Callable[["RunContext"], Any]
+    deps: List[str] = field(default_factory=list)
+    timeout: float = 1800
+    # 성공 시 API 에 재로딩을 요청할 데이터 파일
+    datasets: List[str] = field(default_factory=list)
+
+
+class RunContext:
+    """한 번의 실행 동안 작업들이 공유하는 자원 (브라우저 풀은 처음 필요할 때 생성)"""
+
+    def __init__(self, workers: int = 4, trigger: str = "manual"):
+        self.workers = workers
+        self.trigger = trigger
+        self._engine = None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from scraping_engine import ScrapingEngine
+            self._engine = ScrapingEngine(workers=self.workers)
+        return self._engine
+
+    def close(self):
+        if self._engine is not None:
+            self._engine.close()
+            self._engine = None
+
+
+# ----------------------------------------------------------------------
+# 작업 정의
+# ----------------------------------------------------------------------
+async def openf1_fetch(ctx: RunContext) -> bool:
+    import fetch_openf1_data
+
+    args = fetch_openf1_data.parse_args([])
+    data = await fetch_openf1_data.run(args)
+    fetch_openf1_data.write_json_atomic(args.output, data)
+    logger.info(f"OpenF1: {len(data['sessions'])} sessions saved to {args.output}")
+    return True
+
+
+def race_results(ctx: RunContext) -> bool:
+    import motorsportstats_race_batch_scraper
+    return motorsportstats_race_batch_scraper.main(engine=ctx.engine)
+
+
+def driver_stats(ctx: RunContext) -> bool:
+    from bulk_driver_scraper import BulkDriverScraper
+    return BulkDriverScraper(engine=ctx.engine).run(interactive=False)
+
+
+def team_stats(ctx: RunContext) -> bool:
+    from team_season_scraper import TeamSeasonScraper
+    return TeamSeasonScraper(engine=ctx.engine).run()
+
+
+async def standings_rebuild(ctx: RunContext) -> bool:
+    import rebuild_standings
+
+    if ctx.trigger in CALENDAR_TRIGGERS:
+        # 방금 끝난 세션 반영: 24시간 안에 재계산했어도 올해만 다시 계산
+        years, force = [datetime.now().year], True
+    else:
+        years, force = rebuild_standings.DEFAULT_YEARS, False
+    results = await rebuild_standings.rebuild(years, workers=8, force=force, resume=True)
+    failed = [year for year, result in results.items() if not result.get("success")]
+    if failed:
+        raise RuntimeError(f"standings rebuild failed for {failed}")
+    return True
+
+
+def backup_changed_datasets(ctx: Optional[RunContext] = None) -> bool:
+    """내용이 바뀐 데이터 파일만 backups/ 에 복사 (scrape_manifest 해시 비교)"""
+    import shutil
+    from scrape_manifest import ScrapeManifest
+
+    manifest = ScrapeManifest()
+    backup_dir = SCRIPT_DIR / "backups"
+
+    for json_file, backup_prefix in BACKUP_FILES:
+        json_path = SCRIPT_DIR / json_file
+        if not json_path.exists():
+            # 생성 실패는 해당 작업의 실패로 이미 기록됨
+            logger.warning(f"{json_file} not found - nothing to back up")
+            continue
+
+        file_size = json_path.stat().st_size
+        if not manifest.dataset_changed(json_file, str(json_path)):
+            logger.info(f"📄 {json_file} unchanged (size: {file_size} bytes) - backup skipped")
+            continue
+
+        logger.info(f"📄 {json_file} updated (size: {file_size} bytes)")
+        backup_dir.mkdir(exist_ok=True)
+        backup_path = backup_dir / f"{backup_prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        shutil.copy2(json_path, backup_path)
+        manifest.mark_dataset(json_file, str(json_path))
+        logger.info(f"📁 Backup created: {backup_path}")
+
+    manifest.save()
+    cleanup_old_backups(backup_dir, days=30)
+    return True
+
+
+def cleanup_old_backups(backup_dir: Path, days: int = 30):
+    """오래된 백업 파일 정리 (종류별 최신 백업은 항상 유지 - 내용이 안 바뀌면 새 백업을 만들지 않으므로)"""
+    try:
+        cutoff = time.time() - days * 86400
+        for _, backup_prefix in BACKUP_FILES:
+            backups = sorted(backup_dir.glob(f"{backup_prefix}_*.json"), key=lambda f: f.stat().st_mtime)
+            for backup_file in backups[:-1]:
+                if backup_file.stat().st_mtime < cutoff:
+                    backup_file.unlink()
+                    logger.info(f"🗑️ Deleted old backup: {backup_file}")
+    except Exception as e:
+        logger.warning(f"Failed to cleanup old backups: {e}")
+
+
+JOBS: Dict[str, Job] = {
+    job.name: job for job in [
+        Job("openf1_fetch", openf1_fetch, timeout=600, datasets=["openf1_2025_results.json"]),
+        Job("race_results", race_results, datasets=["motorsportstats_2025_race_results.json"]),
+        Job("drivers", driver_stats, datasets=["driver_career_stats.json"]),
+        Job("teams", team_stats, datasets=["team_2025_season_stats.json"]),
+        Job("standings_rebuild", standings_rebuild, deps=["openf1_fetch"]),
+        Job("backup", backup_changed_datasets, deps=["openf1_fetch", "race_results", "drivers", "teams"], timeout=120),
+    ]
+}
+
+
+# ----------------------------------------------------------------------
+# 실행 기록
+# ----------------------------------------------------------------------
+def load_history() -> List[Dict[str, Any]]:
+    try:
+        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def append_history(run: Dict[str, Any]):
+    """최근 HISTORY_LIMIT 개만 유지, 임시 파일 + os.replace 로 저장"""
+    history = load_history()
+    history.append(run)
+    history = history[-HISTORY_LIMIT:]
+
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".history_", suffix=".json.tmp", dir=str(STATE_DIR))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, HISTORY_FILE)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+# ----------------------------------------------------------------------
+# API 재로딩 알림
+# ----------------------------------------------------------------------
+async def notify_reload(datasets: List[str]):
+    """API 서버에 데이터셋 재로딩 요청 (API 가 꺼져 있어도 작업은 실패로 보지 않음)"""
+    if not datasets:
+        return
+    try:
+        import httpx
+
+        headers = {"X-Reload-Token": RELOAD_TOKEN} if RELOAD_TOKEN else {}
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.post(
+                f"{API_URL}/admin/reload-datasets", json={"datasets": datasets}, headers=headers
+            )
+        if response.status_code == 200:
+            logger.info(f"🔄 API reloaded {datasets}")
+        else:
+            logger.warning(f"API reload request returned HTTP {response.status_code}")
+    except Exception as e:
+        logger.warning(f"Could not notify API to reload {datasets}: {e}")
+
+
+# ----------------------------------------------------------------------
+# 스케줄러
+# ----------------------------------------------------------------------
+def resolve_jobs(names: Optional[Iterable[str]] = None, with_deps: bool = False) -> List[str]:
+    """실행할 작업 목록 (with_deps=True 면 선행 작업 포함)"""
+    selected = list(names) if names else list(JOBS)
+    unknown = [name for name in selected if name not in JOBS]
+    if unknown:
+        raise ValueError(f"Unknown jobs: {unknown} (available: {list(JOBS)})")
+
+    if with_deps:
+        pending = list(selected)
+        while pending:
+            for dep in JOBS[pending.pop()].deps:
+                if dep not in selected:
+                    selected.append(dep)
+                    pending.append(dep)
+    return [name for name in JOBS if name in selected]
+
+
+class JobScheduler:
+    def __init__(self, jobs: Optional[List[str]] = None, workers: int = 4, notify: bool = True):
+        self.jobs = resolve_jobs(jobs)
+        self.workers = workers
+        self.notify = notify
+        self._lock = asyncio.Lock()
+        self._trigger: Optional[asyncio.Event] = None
+
+    async def _run_job(self, job: Job, ctx: RunContext) -> Any:
+        if inspect.iscoroutinefunction(job.fn):
+            return await asyncio.wait_for(job.fn(ctx), timeout=job.timeout)
+        # 동기 작업(Selenium 스크래퍼 등)은 스레드에서 실행
+        return await asyncio.wait_for(asyncio.to_thread(job.fn, ctx), timeout=job.timeout)
+
+    async def run(self, jobs: Optional[List[str]] = None, trigger: str = "manual") -> Dict[str, Any]:
+        """DAG 실행: 선행 작업이 모두 성공한 작업부터 동시에 시작, 선행 작업이 실패하면 건너뜀"""
+        names = resolve_jobs(jobs) if jobs else self.jobs
+        async with self._lock:
+            os.chdir(SCRIPT_DIR)
+            run = {
+                "run_id": uuid.uuid4().hex[:12],
+                "trigger": trigger,
+                "started_at": datetime.now().isoformat(),
+                "jobs": {name: {"status": "pending"} for name in names}
+            }
+            logger.info(f"=== Run {run['run_id']} started ({trigger}): {names} ===")
+
+            ctx = RunContext(workers=self.workers, trigger=trigger)
+            done: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in names}
+
+            async def execute(name: str):
+                job = JOBS[name]
+                record = run["jobs"][name]
+                try:
+                    # 이번 실행에 포함되지 않은 선행 작업은 이미 충족된 것으로 간주
+                    deps = [dep for dep in job.deps if dep in done]
+                    for dep in deps:
+                        await done[dep].wait()
+                    failed_deps = [dep for dep in deps if run["jobs"][dep]["status"] != "success"]
+                    if failed_deps:
+                        record.update(status="skipped", reason=f"dependency failed: {failed_deps}")
+                        logger.warning(f"⏭️ {name} skipped ({failed_deps} did not succeed)")
+                        return
+
+                    record.update(status="running", started_at=datetime.now().isoformat())
+                    logger.info(f"▶️ {name} started")
+                    started = time.monotonic()
+                    try:
+                        result = await self._run_job(job, ctx)
+                        success = result is not False
+                        record["status"] = "success" if success else "failed"
+                    except asyncio.TimeoutError:
+                        record.update(status="failed", error=f"timed out after {job.timeout:.0f}s")
+                    except Exception as e:
+                        record.update(status="failed", error=f"{type(e).__name__}: {e}")
+                    record["finished_at"] = datetime.now().isoformat()
+                    record["duration"] = round(time.monotonic() - started, 1)
+
+                    if record["status"] == "success":
+                        logger.info(f"✅ {name} finished in {record['duration']}s")
+                        if self.notify:
+                            await notify_reload(job.datasets)
+                    else:
+                        logger.error(f"❌ {name} failed: {record.get('error', 'returned False')}")
+                finally:
+                    done[name].set()
+
+            try:
+                await asyncio.gather(*(execute(name) for name in names))
+            finally:
+                await asyncio.to_thread(ctx.close)
+
+            run["finished_at"] = datetime.now().isoformat()
+            run["success"] = all(job["status"] == "success" for job in run["jobs"].values())
+            append_history(run)
+            logger.info(f"=== Run {run['run_id']} {'succeeded' if run['success'] else 'failed'} ===")
+            return run
+
+    def trigger(self):
+        """실행 중인 serve 루프에 즉시 실행 요청 (SIGUSR1 핸들러)"""
+        if self._trigger is not None:
+            self._trigger.set()
+
+    def _start_serving(self):
+        """SIGUSR1 핸들러 등록 + PID 파일 기록 (trigger 명령이 찾을 수 있도록)"""
+        self._trigger = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        if hasattr(signal, "SIGUSR1"):
+            loop.add_signal_handler(signal.SIGUSR1, self.trigger)
+
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        PID_FILE.write_text(str(os.getpid()))
+        logger.info(f"Job scheduler started (pid {os.getpid()}), jobs: {self.jobs}")
+
+    def _stop_serving(self):
+        if PID_FILE.exists():
+            PID_FILE.unlink()
+
+    async def wait_trigger(self, timeout: float) -> bool:
+        """timeout 초 동안 대기, 그 사이 trigger 가 오면 True"""
+        try:
+            await asyncio.wait_for(self._trigger.wait(), timeout=max(0.0, timeout))
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._trigger.clear()
+
+    async def serve(self, weekday: int = 0, at: str = "09:00"):
+        """매주 weekday(0=월요일) at 에 실행, SIGUSR1 을 받으면 즉시 실행"""
+        self._start_serving()
+        try:
+            while True:
+                next_run = next_run_after(datetime.now(), weekday, at)
+                logger.info(f"Next scheduled run: {next_run.strftime('%Y-%m-%d %H:%M')}")
+                triggered = await self.wait_trigger((next_run - datetime.now()).total_seconds())
+
+                try:
+                    await self.run(trigger="signal" if triggered else "schedule")
+                except Exception as e:
+                    logger.error(f"Scheduler run error: {e}")
+        finally:
+            self._stop_serving()
+
+
+def next_run_after(now: datetime, weekday: int, at: str) -> datetime:
+    hour, minute = (int(part) for part in at.split(":"))
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    candidate += timedelta(days=(weekday - now.weekday()) % 7)
+    if candidate <= now:
+        candidate += timedelta(days=7)
+    return candidate
+
+
+def run_jobs(jobs: Optional[List[str]] = None, with_deps: bool = False, trigger: str = "manual") -> bool:
+    """동기 진입점 (scheduler.py / weekly_scraper.py 에서 사용)"""
+    names = resolve_jobs(jobs, with_deps=with_deps)
+    run = asyncio.run(JobScheduler(names).run(trigger=trigger))
+    return run["success"]
+
+
+def send_trigger() -> bool:
+    """실행 중인 serve 프로세스에 SIGUSR1 전송"""
+    try:
+        pid = int(PID_FILE.read_text().strip())
+        os.kill(pid, signal.SIGUSR1)
+        logger.info(f"Triggered scheduler (pid {pid})")
+        return True
+    except (OSError, ValueError) as e:
+        logger.error(f"No running scheduler to trigger: {e}")
+        return False
+
+
+def main():
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Run the Overtake data jobs as a dependency graph")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run jobs now")
+    run_parser.add_argument("--jobs", help=f"Comma-separated subset of {list(JOBS)}")
+    run_parser.add_argument("--with-deps", action="store_true", help="Also run upstream jobs of the selected ones")
+
+    serve_parser = sub.add_parser("serve", help="Run jobs weekly and on SIGUSR1")
+    serve_parser.add_argument("--jobs", help=f"Comma-separated subset of {list(JOBS)}")
+    serve_parser.add_argument("--weekday", type=int, default=0, help="0=Monday ... 6=Sunday")
+    serve_parser.add_argument("--at", default="09:00", help="Local time HH:MM")
+
+    sub.add_parser("trigger", help="Ask a running scheduler to run now")
+
+    history_parser = sub.add_parser("history", help="Show recent runs")
+    history_parser.add_argument("-n", type=int, default=10)
+
+    args = parser.parse_args()
+    jobs = args.jobs.split(",") if getattr(args, "jobs", None) else None
+
+    if args.command == "run":
+        raise SystemExit(0 if run_jobs(jobs, with_deps=args.with_deps) else 1)
+    if args.command == "serve":
+        asyncio.run(JobScheduler(jobs).serve(weekday=args.weekday, at=args.at))
+    elif args.command == "trigger":
+        raise SystemExit(0 if send_trigger() else 1)
+    elif args.command == "history":
+        for run in load_history()[-args.n:]:
+            statuses = ", ".join(f"{name}={job['status']}" for name, job in run["jobs"].items())
+            print(f"{run['started_at']} [{run['trigger']}] {'OK ' if run.get('success') else 'FAIL'} {statuses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 """
 LiveF1 전용 F1 대시보드 백엔드 - 리팩토링된 버전
 """
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Body, Header, HTTPException, Request
+from typing import List, Optional
 from fastapi.middleware.cors import CORSMiddleware
+import hmac
 import json
 import logging
 import os
@@ -14,6 +16,8 @@ load_dotenv()
 
 # 서비스 및 라우터 import
 from services.livef1_service import LiveF1Service
+from app.core.executors import executors
+from services.compute_service import compute_service
 from routers import drivers, statistics, races, live_timing, teams, users
 
 # 로깅 설정
@@ -92,11 +96,48 @@ app.include_router(live_timing.router)
 app.include_router(teams.router)
 app.include_router(users.router)
 
+@app.on_event("shutdown")
+async def shutdown_pools():
+    """compute 프로세스 풀과 live/bulk/analytics 스레드 풀 정리"""
+    compute_service.shutdown()
+    executors.shutdown()
+
 # 기본 엔드포인트
 @app.get("/")
 async def read_root():
     return {"message": "F1 LiveTiming Dashboard API", "version": "2.0.0"}
 
+@app.post("/admin/reload-datasets")
+async def reload_datasets(
+    request: Request,
+    datasets: Optional[List[str]] = Body(None, embed=True),
+    x_reload_token: Optional[str] = Header(None)
+):
+    """스케줄러 작업 완료 후 JSON 데이터셋 재로딩
+
+    RELOAD_TOKEN 이 설정되어 있으면 X-Reload-Token 헤더로 확인,
+    설정되어 있지 않으면 같은 호스트(loopback)에서 온 요청만 허용
+    """
+    reload_token = os.getenv("RELOAD_TOKEN")
+    if reload_token:
+        if not x_reload_token or not hmac.compare_digest(x_reload_token, reload_token):
+            raise HTTPException(status_code=403, detail="Invalid reload token")
+    elif not request.client or request.client.host not in ("127.0.0.1", "::1", "localhost"):
+        raise HTTPException(status_code=403, detail="RELOAD_TOKEN is not set; reload is only allowed from localhost")
+    reloaded = livef1_service.reload_datasets(datasets)
+    return {"reloaded": reloaded}
+
+@app.get("/admin/executors")
+async def executor_status():
+    """livef1 실행기(live/bulk/analytics) 사용률, 시즌 캐시, compute 프로세스 풀 상태"""
+    return {
+        "executors": executors.snapshot(),
+        "seasons": livef1_service.seasons.snapshot(),
+        "compute": livef1_service.compute.snapshot(),
+        "progression": livef1_service.progression.snapshot(),
+        "simulator": livef1_service.simulator.snapshot()
+    }
+
 # Socket.IO 이벤트 핸들러들
 @sio.event
 async def connect(sid, environ):
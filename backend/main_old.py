@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 import socketio
 from contextlib import asynccontextmanager
 import uvicorn
@@ -8,7 +9,9 @@ import logging
 from app.config import settings
 from app.api import api_router
 from app.websocket import sio_app
-from app.core.middleware import ErrorHandlingMiddleware, RateLimitMiddleware, LoggingMiddleware
+from app.core.middleware import ErrorHandlingMiddleware, DeadlineMiddleware, RateLimitMiddleware, LoggingMiddleware, MetricsMiddleware
+from app.core.metrics import metrics_collector
+from app.core.executors import executors
 from app.services.openf1_client import openf1_client
 from app.core.database import init_database, close_database
 from app.services.cache_service import cache_service
@@ -23,19 +26,27 @@ logging.basicConfig(
 async def lifespan(app: FastAPI):
     print(f"Starting OpenF1 Dashboard API...")
     
+    # Size the livef1 thread pools
+    executors.configure(settings.executor_pools)
+    
     # Initialize database
     await init_database()
     
     # Initialize cache service
     await cache_service.connect()
     
+    # Start batched metrics flush
+    metrics_collector.start(interval=settings.metrics_flush_interval)
+    
     yield
     
     print("Shutting down...")
     # Close services
+    await metrics_collector.stop()
     await openf1_client.close()
     await cache_service.close()
     await close_database()
+    executors.shutdown()
 
 app = FastAPI(
     title="OpenF1 Dashboard API",
@@ -45,13 +56,18 @@ app = FastAPI(
 )
 
 # Add middleware in order (bottom to top execution)
+app.add_middleware(DeadlineMiddleware, default=settings.request_deadline)
 app.add_middleware(ErrorHandlingMiddleware)
 app.add_middleware(
     RateLimitMiddleware,
     calls=settings.rate_limit_per_minute,
-    period=60
+    period=60,
+    burst=settings.rate_limit_burst,
+    routes=settings.rate_limit_routes,
+    backend=settings.rate_limit_backend
 )
 app.add_middleware(LoggingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
@@ -71,6 +87,13 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(
+        metrics_collector.render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+motorsportstats.com HTTP 우선(tiered) 스크래퍼
+
+드라이버/팀 요약 페이지는 서버 렌더링된 테이블이나 __NEXT_DATA__ 임베디드 JSON 에
+필요한 데이터가 이미 들어있는 경우가 많습니다. Chrome 을 띄우기 전에:
+
+1. 비동기 HTTP(httpx)로 HTML 을 받아 BeautifulSoup 으로 파싱
+2. 필수 필드(드라이버: 커리어 통계 + 시즌 행, 팀: 시즌 행)가 없을 때만
+   ScrapingEngine 의 브라우저 워커로 넘김
+
+두 경로 모두 motorsport_parsing 의 같은 파싱 함수를 사용합니다.
+
+저장해 둔 HTML 로 오프라인 확인:
+    python motorsport_http_scraper.py --kind driver --from-file saved/esteban-ocon.html
+    python motorsport_http_scraper.py --kind team --slug mclaren
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+
+from motorsport_parsing import (
+    build_driver_result,
+    build_team_result,
+    driver_result_complete,
+    driver_summary_url,
+    page_from_html,
+    parse_driver_stats,
+    parse_team_stats,
+    team_result_complete,
+    team_summary_url,
+)
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+def parse_driver_html(html: str, driver_slug: str, url: Optional[str] = None) -> Dict[str, Any]:
+    """드라이버 요약 페이지 HTML -> get_driver_career_stats 와 같은 형식"""
+    page_text, tables = page_from_html(html)
+    extracted_stats, season_data = parse_driver_stats(page_text, tables, 2025)
+    result = build_driver_result(
+        driver_slug, url or driver_summary_url(driver_slug), page_text, tables, extracted_stats, season_data
+    )
+    result['source'] = 'http'
+    return result
+
+
+def parse_team_html(html: str, team_slug: str, year: int = 2025, url: Optional[str] = None) -> Dict[str, Any]:
+    """팀 요약 페이지 HTML -> get_team_season_stats 와 같은 형식"""
+    page_text, tables = page_from_html(html)
+    career_stats, season_data = parse_team_stats(page_text, tables, year)
+    result = build_team_result(
+        team_slug, url or team_summary_url(team_slug), year, page_text, career_stats, season_data
+    )
+    result['source'] = 'http'
+    return result
+
+
+class MotorsportHttpScraper:
+    """브라우저 없이 페이지 HTML 만 받아서 파싱 (동시 요청 수 제한)"""
+
+    def __init__(self, concurrency: int = 4, timeout: float = 15.0, min_request_interval: float = 0.5):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.min_request_interval = min_request_interval
+
+    async def _fetch(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str) -> Optional[str]:
+        async with semaphore:
+            try:
+                response = await client.get(url)
+                if response.status_code != 200:
+                    logger.warning(f"{url}: HTTP {response.status_code}")
+                    return None
+                return response.text
+            except httpx.HTTPError as e:
+                logger.warning(f"{url}: {type(e).__name__}: {e}")
+                return None
+            finally:
+                # 세마포어를 잡은 채로 쉬어서 서버 부하를 브라우저 경로 수준으로 유지
+                await asyncio.sleep(self.min_request_interval)
+
+    async def _fetch_all(self, kind: str, slugs: Iterable[str], year: int) -> Dict[str, Optional[Dict[str, Any]]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        headers = {"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"}
+
+        async with httpx.AsyncClient(timeout=self.timeout, headers=headers, follow_redirects=True) as client:
+            async def one(slug: str):
+                url = driver_summary_url(slug) if kind == "driver" else team_summary_url(slug)
+                html = await self._fetch(client, semaphore, url)
+                if html is None:
+                    return slug, None
+                try:
+                    if kind == "driver":
+                        return slug, parse_driver_html(html, slug, url)
+                    return slug, parse_team_html(html, slug, year, url)
+                except Exception as e:
+                    logger.warning(f"{slug}: could not parse HTML - {e}")
+                    return slug, None
+
+            return dict(await asyncio.gather(*(one(slug) for slug in slugs)))
+
+    def fetch_all(self, kind: str, slugs: Iterable[str], year: int = 2025) -> Dict[str, Optional[Dict[str, Any]]]:
+        """kind 는 "driver" 또는 "team". {slug: 결과 또는 None}"""
+        return asyncio.run(self._fetch_all(kind, list(slugs), year))
+
+
+def submit_tiered(engine, kind: str, slugs: Iterable[str], year: int = 2025, use_http: bool = True) -> Dict[str, Future]:
+    """
+    HTTP 로 먼저 가져오고, 필수 필드가 빠진 slug 만 브라우저 풀(engine)에 제출.
+    반환값은 {slug: Future} 로 engine.submit 결과와 같은 방식으로 기다리면 됩니다.
+    """
+    from motorsport_selenium_scraper import MotorsportSeleniumScraper
+
+    slugs = list(slugs)
+    http_results: Dict[str, Optional[Dict[str, Any]]] = {}
+    if use_http:
+        try:
+            http_results = MotorsportHttpScraper().fetch_all(kind, slugs, year)
+        except Exception as e:
+            logger.warning(f"HTTP fast path failed, using browser for all {kind}s: {e}")
+
+    is_complete = driver_result_complete if kind == "driver" else team_result_complete
+    futures = {}
+    escalated = []
+    for slug in slugs:
+        result = http_results.get(slug)
+        if is_complete(result):
+            future = Future()
+            future.set_result(result)
+            futures[slug] = future
+        elif kind == "driver":
+            escalated.append(slug)
+            futures[slug] = engine.submit(MotorsportSeleniumScraper.get_driver_career_stats, slug, label=slug)
+        else:
+            escalated.append(slug)
+            futures[slug] = engine.submit(MotorsportSeleniumScraper.get_team_season_stats, slug, year, label=slug)
+
+    logger.info(f"{kind}: {len(slugs) - len(escalated)} via HTTP, {len(escalated)} escalated to browser {escalated}")
+    return futures
+
+
+def main():
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Parse motorsportstats driver/team pages without a browser")
+    parser.add_argument("--kind", choices=["driver", "team"], required=True)
+    parser.add_argument("--slug", help="Page slug (e.g. esteban-ocon, mclaren)")
+    parser.add_argument("--from-file", help="Parse a saved HTML file instead of fetching")
+    parser.add_argument("--year", type=int, default=2025)
+    args = parser.parse_args()
+
+    if args.from_file:
+        with open(args.from_file, 'r', encoding='utf-8') as f:
+            html = f.read()
+        slug = args.slug or "fixture"
+        if args.kind == "driver":
+            result = parse_driver_html(html, slug)
+        else:
+            result = parse_team_html(html, slug, args.year)
+    elif args.slug:
+        result = MotorsportHttpScraper().fetch_all(args.kind, [args.slug], args.year).get(args.slug)
+    else:
+        parser.error("--slug or --from-file is required")
+
+    complete = driver_result_complete(result) if args.kind == "driver" else team_result_complete(result)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(f"\nRequired fields present: {complete} ({'HTTP is enough' if complete else 'would escalate to browser'})")
+    raise SystemExit(0 if complete else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+motorsportstats.com 페이지 파싱 공용 함수
+
+브라우저(Selenium)와 HTTP(BeautifulSoup) 경로가 같은 입력 형태를 넘기도록 해서
+파싱 결과가 가져온 방식과 무관하게 동일하도록 합니다.
+
+- page_text: 화면에 보이는 본문 텍스트 (줄 단위)
+- tables: 테이블 목록, 각 테이블은 행 목록이고 첫 행은 헤더 (셀은 문자열)
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+Table = List[List[str]]
+
+BASE_URL = "https://motorsportstats.com"
+SERIES_PATH = "summary/series/fia-formula-one-world-championship"
+
+DRIVER_CAREER_PATTERNS = {
+    'starts': r'Starts\s*(\d+)',
+    'wins': r'Wins\s*(\d+)',
+    'podiums': r'Podiums\s*(\d+)',
+    'poles': r'Poles\s*(\d+)',
+    'fastest_laps': r'Fastest Laps\s*(\d+)',
+    'points': r'Points\s*(\d+(?:\.\d+)?)',
+    'championships': r'Championships\s*(\d+)',
+    'best_finish': r'Best Finish\s*(\d+|DNF|DNS)',
+    'entries': r'Entries\s*(\d+)',
+    'dnf': r'DNF\s*(\d+)',
+    'retirements': r'Retirements\s*(\d+)',
+    'first_entry': r'First Entry\s*(\d{4})',
+    'last_entry': r'Last Entry\s*(\d{4})',
+    'years': r'Years\s*(\d+)',
+    'best_championship_position': r'Best Championship position\s*(\d+)',
+    'sprint_wins': r'Sprint Wins\s*(\d+)'
+}
+
+DRIVER_GENERAL_PATTERNS = {
+    'starts': r'[Ss]tarts[:\s]*(\d+)',
+    'wins': r'[Ww]ins[:\s]*(\d+)',
+    'podiums': r'[Pp]odiums[:\s]*(\d+)',
+    'poles': r'[Pp]oles?[:\s]*(\d+)',
+    'fastest_laps': r'[Ff]astest [Ll]aps?[:\s]*(\d+)',
+    'points': r'[Pp]oints[:\s]*(\d+(?:\.\d+)?)',
+    'championships': r'[Cc]hampionships[:\s]*(\d+)'
+}
+
+# "468 POINTS", "1 FASTEST LAPS", "3 / 120 WINS" 형태의 CAREER HIGHLIGHTS
+DRIVER_HIGHLIGHT_PATTERNS = {
+    'total_points': r'(\d+(?:\.\d+)?)\s*POINTS',
+    'fastest_laps_total': r'(\d+)\s*FASTEST LAPS',
+    'total_starts': r'(\d+)\s*STARTS',
+    'total_wins': r'(\d+)\s*/\s*\d+\s*WINS',
+    'total_podiums': r'(\d+)\s*/\s*\d+\s*PODIUMS',
+    'total_poles': r'(\d+)\s*/\s*\d+\s*POLES',
+    'total_championships': r'(\d+)\s*/\s*\d+\s*CHAMPIONSHIPS'
+}
+
+TEAM_CAREER_PATTERNS = {
+    'total_championships': r'(\d+)\s*/\s*\d+\s*CHAMPIONSHIPS',
+    'total_wins': r'(\d+)\s*/\s*\d+\s*WINS',
+    'total_podiums': r'(\d+)\s*/\s*\d+\s*PODIUMS',
+    'total_poles': r'(\d+)\s*/\s*\d+\s*POLES',
+    'total_starts': r'STARTS\s*(\d+)',
+    'total_points': r'POINTS\s*([\d.]+)'
+}
+
+
+def driver_summary_url(driver_slug: str) -> str:
+    return f"{BASE_URL}/driver/{driver_slug}/{SERIES_PATH}"
+
+
+def team_summary_url(team_slug: str) -> str:
+    return f"{BASE_URL}/team/{team_slug}/{SERIES_PATH}"
+
+
+def safe_int(value):
+    """Safely convert value to integer"""
+    if value is None or value == '':
+        return 0
+    try:
+        # Remove any non-digit characters except minus sign
+        cleaned = ''.join(c for c in str(value) if c.isdigit() or c == '-')
+        return int(cleaned) if cleaned else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def safe_float(value):
+    """Safely convert value to float"""
+    if value is None or value == '':
+        return 0.0
+    try:
+        # Remove any non-digit characters except minus sign and decimal point
+        cleaned = ''.join(c for c in str(value) if c.isdigit() or c in '.-')
+        return float(cleaned) if cleaned else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+# 시즌 요약 테이블로 인정하는 데 필요한 헤더 (승/포인트/출전 수)
+DRIVER_SEASON_HEADERS = ("W", "P", "RS")
+TEAM_SEASON_HEADERS = ("W", "PTS", "ST")
+
+
+def find_season_row(tables: List[Table], year: int, required_headers: Tuple[str, ...] = ()) -> Optional[Dict[str, str]]:
+    """required_headers 가 모두 있는 테이블에서 첫 열이 연도인 행을 찾아 {헤더: 값} 으로 반환
+
+    첫 열은 연도 자체("2025", "2025 Season" 등)여야 하며 "2025-03-16" 같은 날짜 셀은 제외
+    """
+    year_cell = re.compile(rf"{year}(?:\s|$)")
+    for table in tables:
+        if len(table) < 2:
+            continue
+        headers = [header.strip() for header in table[0]]
+        if not all(header in headers for header in required_headers):
+            continue
+        for row in table[1:]:
+            if row and year_cell.match(row[0].strip()):
+                return {headers[j]: value for j, value in enumerate(row) if j < len(headers)}
+    return None
+
+
+def _match_patterns(patterns: Dict[str, str], text: str) -> Dict[str, Any]:
+    stats = {}
+    for stat_name, pattern in patterns.items():
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            value = match.group(1)
+            stats[stat_name] = int(value) if value.isdigit() else value
+    return stats
+
+
+def parse_driver_stats(page_text: str, tables: List[Table], year: int = 2025) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """드라이버 요약 페이지 -> (커리어 통계, 해당 시즌 통계)"""
+    season_data = {}
+    row = find_season_row(tables, year, DRIVER_SEASON_HEADERS)
+    if row:
+        season_data = {
+            "season_wins": safe_int(row.get("W", 0)),
+            "season_podiums": safe_int(row.get("PD", 0)),
+            "season_poles": safe_int(row.get("PP", 0)),
+            "season_fastest_laps": safe_int(row.get("FL", 0)),
+            "season_points": safe_int(row.get("P", 0)),
+            "season_races": safe_int(row.get("RS", 0)),
+            "season_dnf": safe_int(row.get("DNF", 0)),
+            "season_best_finish": safe_int(row.get("BR", None)),
+            "season_best_grid": safe_int(row.get("BG", None)),
+            "season_avg_finish": safe_float(row.get("AF", None)),
+            "season_avg_grid": safe_float(row.get("AG", None)),
+            "season_championship_position": row.get("WC", None),
+            "season_entrant": row.get("Entrant", None)
+        }
+
+    # CAREER STATISTICS 섹션 (이후 ~50줄) 우선, 없으면 본문 전체에서 일반 패턴 검색
+    lines = page_text.split('\n')
+    career_stats_text = None
+    for i, line in enumerate(lines):
+        if 'CAREER STATISTICS' in line.upper():
+            career_stats_text = '\n'.join(lines[i:i + 50])
+            break
+
+    if career_stats_text is not None:
+        extracted_stats = _match_patterns(DRIVER_CAREER_PATTERNS, career_stats_text)
+    else:
+        extracted_stats = _match_patterns(DRIVER_GENERAL_PATTERNS, page_text)
+
+    # CAREER HIGHLIGHTS 는 아직 없는 항목만 채움
+    for stat_name, value in _match_patterns(DRIVER_HIGHLIGHT_PATTERNS, page_text).items():
+        base_name = stat_name.replace('total_', '').replace('_total', '')
+        if base_name not in extracted_stats:
+            extracted_stats[base_name] = int(value) if str(value).replace('.', '').isdigit() else value
+
+    return extracted_stats, season_data
+
+
+def parse_team_stats(page_text: str, tables: List[Table], year: int = 2025) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """팀 요약 페이지 -> (커리어 통계, 해당 시즌 통계)"""
+    season_data = {}
+    row = find_season_row(tables, year, TEAM_SEASON_HEADERS)
+    if row:
+        season_data = {
+            "season_wins": safe_int(row.get("W", 0)),
+            "season_podiums": safe_int(row.get("PD", 0)),
+            "season_poles": safe_int(row.get("PP", 0)),
+            "season_fastest_laps": safe_int(row.get("FL", 0)),
+            "season_points": safe_int(row.get("PTS", 0)),
+            "season_races": safe_int(row.get("ST", 0)),
+            "season_dnf": safe_int(row.get("DNF", 0)),
+            "season_championship_position": row.get("WC", None),
+            "season_drivers": row.get("Drivers", None)
+        }
+
+    team_stats = {}
+    lines = page_text.split('\n')
+    for i, line in enumerate(lines):
+        if 'CHAMPIONSHIPS' in line.upper() or 'CAREER HIGHLIGHTS' in line.upper():
+            career_stats_text = '\n'.join(lines[i:i + 30])
+            for stat_name, value in _match_patterns(TEAM_CAREER_PATTERNS, career_stats_text).items():
+                try:
+                    team_stats[stat_name] = int(value)
+                except ValueError:
+                    team_stats[stat_name] = value
+            break
+
+    return team_stats, season_data
+
+
+def _text_sample(page_text: str) -> str:
+    return page_text[:1000] + '...' if len(page_text) > 1000 else page_text
+
+
+def build_driver_result(driver_slug, url, page_text, tables, extracted_stats, season_data) -> Dict[str, Any]:
+    """get_driver_career_stats 반환 형식"""
+    return {
+        'driver_slug': driver_slug,
+        'url': url,
+        'extracted_stats': extracted_stats,
+        'season_2025_data': season_data,
+        'tables_found': len(tables),
+        'page_text_sample': _text_sample(page_text)
+    }
+
+
+def build_team_result(team_slug, url, year, page_text, career_stats, season_data) -> Dict[str, Any]:
+    """get_team_season_stats 반환 형식"""
+    return {
+        'team_slug': team_slug,
+        'url': url,
+        'career_stats': career_stats,
+        'season_data': season_data,
+        'year': year,
+        'page_text_sample': _text_sample(page_text)
+    }
+
+
+def driver_result_complete(result: Optional[Dict[str, Any]]) -> bool:
+    """HTTP 경로 결과로 충분한지 (아니면 브라우저로 재시도)
+
+    커리어 통계에 출전/포인트 값이 있고, 시즌 행에 실제 출전 기록이 있어야 함
+    (모두 0 인 행은 잘못 고른 테이블일 가능성이 높음)
+    """
+    if not result:
+        return False
+    career = result.get('extracted_stats') or {}
+    season = result.get('season_2025_data') or {}
+    has_career = any(key in career for key in ('starts', 'points', 'entries'))
+    return has_career and season.get('season_races', 0) > 0
+
+
+def team_result_complete(result: Optional[Dict[str, Any]]) -> bool:
+    if not result:
+        return False
+    season = result.get('season_data') or {}
+    return season.get('season_races', 0) > 0
+
+
+# ----------------------------------------------------------------------
+# HTML / embedded JSON (HTTP 경로)
+# ----------------------------------------------------------------------
+def tables_from_html(soup) -> List[Table]:
+    """BeautifulSoup 문서에서 테이블 추출 (헤더 행은 th 또는 td, 데이터 행은 td 만 - Selenium 경로와 동일)"""
+    tables = []
+    for table in soup.find_all("table"):
+        rows = table.find_all("tr")
+        if not rows:
+            continue
+        header_cells = rows[0].find_all("th") or rows[0].find_all("td")
+        parsed = [[cell.get_text(" ", strip=True) for cell in header_cells]]
+        for row in rows[1:]:
+            cells = row.find_all("td")
+            if cells:
+                parsed.append([cell.get_text(" ", strip=True) for cell in cells])
+        tables.append(parsed)
+    return tables
+
+
+def embedded_json(soup) -> Optional[Any]:
+    """Next.js 등이 심어두는 __NEXT_DATA__ 스크립트 JSON"""
+    script = soup.find("script", id="__NEXT_DATA__")
+    if not script or not script.string:
+        return None
+    try:
+        return json.loads(script.string)
+    except ValueError:
+        return None
+
+
+def tables_from_json(data: Any) -> List[Table]:
+    """임베디드 JSON 안의 '스칼라 값만 가진 dict 의 리스트' 를 테이블로 간주해 변환"""
+    tables = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            rows = [item for item in node if isinstance(item, dict)]
+            if rows and len(rows) == len(node) and all(
+                not isinstance(v, (dict, list)) for row in rows for v in row.values()
+            ):
+                headers = list(rows[0].keys())
+                tables.append([headers] + [["" if row.get(h) is None else str(row.get(h)) for h in headers] for row in rows])
+            else:
+                for item in node:
+                    walk(item)
+
+    walk(data)
+    return tables
+
+
+def page_from_html(html: str) -> Tuple[str, List[Table]]:
+    """HTML -> (본문 텍스트, 테이블 목록). 임베디드 JSON 테이블은 HTML 테이블 뒤에 추가"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    tables = tables_from_html(soup)
+    data = embedded_json(soup)
+    if data is not None:
+        tables.extend(tables_from_json(data))
+
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    body = soup.body or soup
+    page_text = body.get_text("\n", strip=True)
+    return page_text, tables
@@ -4,13 +4,30 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-import time
+from selenium.common.exceptions import TimeoutException
 import json
 from typing import Dict, Any, Optional
-import re
+
+from motorsport_parsing import (
+    build_driver_result,
+    build_team_result,
+    driver_summary_url,
+    parse_driver_stats,
+    parse_team_stats,
+    safe_float,
+    safe_int,
+    team_summary_url,
+)
+
+def wait_for_document(wait):
+    """Wait until document.readyState is 'complete'"""
+    wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+
 
 class MotorsportSeleniumScraper:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, wait_timeout=10, content_timeout=3):
+        self.wait_timeout = wait_timeout
+        self.content_timeout = content_timeout
         self.setup_driver(headless)
     
     def setup_driver(self, headless=True):
@@ -28,229 +45,70 @@ class MotorsportSeleniumScraper:
         
         try:
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 10)
+            self.wait = WebDriverWait(self.driver, self.wait_timeout)
+            self.content_wait = WebDriverWait(self.driver, self.content_timeout)
         except Exception as e:
             print(f"Error setting up driver: {e}")
             raise
     
+    def wait_for_content(self, locator=(By.TAG_NAME, "table")) -> bool:
+        """
+        Wait until the document has loaded and the rendered content (a table by default)
+        is present, instead of sleeping for a fixed time. Returns False on timeout.
+        Once the document is complete the content only gets the short content_timeout,
+        so pages without a table (e.g. races not yet run) fail fast.
+        """
+        try:
+            wait_for_document(self.wait)
+            self.content_wait.until(EC.presence_of_element_located(locator))
+            return True
+        except TimeoutException:
+            return False
+    
+    def read_page(self):
+        """
+        Return (page_text, tables) for the current page in the same shape the
+        HTTP path produces, so both go through motorsport_parsing.
+        """
+        page_text = self.driver.find_element(By.TAG_NAME, "body").text
+        tables = []
+        for table in self.driver.find_elements(By.TAG_NAME, "table"):
+            try:
+                rows = table.find_elements(By.TAG_NAME, "tr")
+                if not rows:
+                    continue
+                header_cells = rows[0].find_elements(By.TAG_NAME, "th")
+                if not header_cells:
+                    header_cells = rows[0].find_elements(By.TAG_NAME, "td")
+                parsed = [[cell.text.strip() for cell in header_cells]]
+                for row in rows[1:]:
+                    cells = row.find_elements(By.TAG_NAME, "td")
+                    if cells:
+                        parsed.append([cell.text.strip() for cell in cells])
+                tables.append(parsed)
+            except Exception:
+                continue
+        return page_text, tables
+    
     def get_driver_career_stats(self, driver_slug: str) -> Optional[Dict[str, Any]]:
         """
         Get driver career statistics using Selenium
         """
         try:
-            url = f"https://motorsportstats.com/driver/{driver_slug}/summary/series/fia-formula-one-world-championship"
+            url = driver_summary_url(driver_slug)
             print(f"Loading page: {url}")
             
             self.driver.get(url)
             
-            # Wait for page to load
-            time.sleep(3)
-            
-            # Wait for content to load
-            try:
-                self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            except:
+            # Wait for the statistics tables to render
+            if not self.wait_for_content():
                 print("Timeout waiting for page to load")
             
-            # Get page source after JavaScript execution
-            page_source = self.driver.page_source
-            
-            # Get text content
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
-            
-            print(f"Page loaded, text length: {len(page_text)}")
-            print(f"Page text sample: {page_text[:500]}...")
-            
-            # Look for statistics in the page
-            extracted_stats = {}
+            page_text, tables = self.read_page()
+            print(f"Page loaded, text length: {len(page_text)}, {len(tables)} tables")
             
-            # Try to find specific stat elements
-            try:
-                # Look for stat containers
-                stat_elements = self.driver.find_elements(By.CSS_SELECTOR, "[class*='stat'], [class*='number'], [class*='value']")
-                print(f"Found {len(stat_elements)} potential stat elements")
-                
-                for element in stat_elements:
-                    try:
-                        text = element.text.strip()
-                        if text and text.isdigit():
-                            parent_text = element.find_element(By.XPATH, "..").text
-                            print(f"Stat element: {text} (parent: {parent_text[:50]}...)")
-                    except:
-                        continue
-                
-                # Look for tables and extract 2025 season data
-                tables = self.driver.find_elements(By.TAG_NAME, "table")
-                print(f"Found {len(tables)} tables")
-                
-                season_2025_data = {}
-                
-                for i, table in enumerate(tables):
-                    try:
-                        table_text = table.text
-                        print(f"Table {i+1}: {table_text[:200]}...")
-                        
-                        # Parse table for 2025 season data
-                        rows = table.find_elements(By.TAG_NAME, "tr")
-                        
-                        if len(rows) > 1:  # Has header and data rows
-                            # Get header row
-                            header_cells = rows[0].find_elements(By.TAG_NAME, "th")
-                            if not header_cells:
-                                header_cells = rows[0].find_elements(By.TAG_NAME, "td")
-                            
-                            headers = [cell.text.strip() for cell in header_cells]
-                            
-                            # Look for 2025 data in subsequent rows
-                            for row in rows[1:]:
-                                cells = row.find_elements(By.TAG_NAME, "td")
-                                if cells:
-                                    row_data = [cell.text.strip() for cell in cells]
-                                    
-                                    # Check if this row contains 2025 data
-                                    if row_data and "2025" in row_data[0]:
-                                        print(f"Found 2025 row: {row_data}")
-                                        
-                                        # Map headers to values
-                                        row_dict = {}
-                                        for j, value in enumerate(row_data):
-                                            if j < len(headers):
-                                                row_dict[headers[j]] = value
-                                        
-                                        # Extract relevant 2025 season stats
-                                        season_2025_data = {
-                                            "season_wins": self._safe_int(row_dict.get("W", 0)),
-                                            "season_podiums": self._safe_int(row_dict.get("PD", 0)),
-                                            "season_poles": self._safe_int(row_dict.get("PP", 0)),
-                                            "season_fastest_laps": self._safe_int(row_dict.get("FL", 0)),
-                                            "season_points": self._safe_int(row_dict.get("P", 0)),
-                                            "season_races": self._safe_int(row_dict.get("RS", 0)),
-                                            "season_dnf": self._safe_int(row_dict.get("DNF", 0)),
-                                            "season_best_finish": self._safe_int(row_dict.get("BR", None)),
-                                            "season_best_grid": self._safe_int(row_dict.get("BG", None)),
-                                            "season_avg_finish": self._safe_float(row_dict.get("AF", None)),
-                                            "season_avg_grid": self._safe_float(row_dict.get("AG", None)),
-                                            "season_championship_position": row_dict.get("WC", None),
-                                            "season_entrant": row_dict.get("Entrant", None)
-                                        }
-                                        
-                                        print(f"Extracted 2025 season data: {season_2025_data}")
-                                        break
-                    except:
-                        continue
-                
-                # Look for CAREER STATISTICS section specifically
-                career_stats_found = False
-                career_stats_text = ""
-                
-                # Split text into lines and find CAREER STATISTICS section
-                lines = page_text.split('\n')
-                for i, line in enumerate(lines):
-                    if 'CAREER STATISTICS' in line.upper():
-                        career_stats_found = True
-                        # Get the next ~50 lines after CAREER STATISTICS
-                        career_stats_lines = lines[i:i+50]
-                        career_stats_text = '\n'.join(career_stats_lines)
-                        print(f"Found CAREER STATISTICS at line {i}")
-                        print(f"Career Statistics text: {career_stats_text}")
-                        break
-                
-                if career_stats_found:
-                    # Extract specific stats from CAREER SUMMARY
-                    # Pattern for "STAT VALUE" format
-                    career_patterns = {
-                        'starts': r'Starts\s*(\d+)',
-                        'wins': r'Wins\s*(\d+)',
-                        'podiums': r'Podiums\s*(\d+)', 
-                        'poles': r'Poles\s*(\d+)',
-                        'fastest_laps': r'Fastest Laps\s*(\d+)',
-                        'points': r'Points\s*(\d+(?:\.\d+)?)',
-                        'championships': r'Championships\s*(\d+)',
-                        'best_finish': r'Best Finish\s*(\d+|DNF|DNS)',
-                        'entries': r'Entries\s*(\d+)',
-                        'dnf': r'DNF\s*(\d+)',
-                        'retirements': r'Retirements\s*(\d+)',
-                        'first_entry': r'First Entry\s*(\d{4})',
-                        'last_entry': r'Last Entry\s*(\d{4})',
-                        'years': r'Years\s*(\d+)',
-                        'best_championship_position': r'Best Championship position\s*(\d+)',
-                        'sprint_wins': r'Sprint Wins\s*(\d+)'
-                    }
-                    
-                    for stat_name, pattern in career_patterns.items():
-                        match = re.search(pattern, career_stats_text, re.IGNORECASE)
-                        if match:
-                            value = match.group(1)
-                            try:
-                                extracted_stats[stat_name] = int(value) if value.isdigit() else value
-                                print(f"Extracted {stat_name}: {value}")
-                            except ValueError:
-                                extracted_stats[stat_name] = value
-                else:
-                    print("CAREER STATISTICS section not found, trying general patterns")
-                    # Fallback to general patterns
-                    general_patterns = {
-                        'starts': r'[Ss]tarts[:\s]*(\d+)',
-                        'wins': r'[Ww]ins[:\s]*(\d+)', 
-                        'podiums': r'[Pp]odiums[:\s]*(\d+)',
-                        'poles': r'[Pp]oles?[:\s]*(\d+)',
-                        'fastest_laps': r'[Ff]astest [Ll]aps?[:\s]*(\d+)',
-                        'points': r'[Pp]oints[:\s]*(\d+(?:\.\d+)?)',
-                        'championships': r'[Cc]hampionships[:\s]*(\d+)'
-                    }
-                    
-                    for stat_name, pattern in general_patterns.items():
-                        match = re.search(pattern, page_text, re.IGNORECASE)
-                        if match:
-                            value = match.group(1)
-                            try:
-                                extracted_stats[stat_name] = int(value) if value.isdigit() else value
-                            except ValueError:
-                                extracted_stats[stat_name] = value
-                
-                # Extract from CAREER HIGHLIGHTS section (top of page)
-                # Look for patterns like "468 POINTS" or "1 FASTEST LAPS"
-                highlights_patterns = {
-                    'total_points': r'(\d+(?:\.\d+)?)\s*POINTS',
-                    'fastest_laps_total': r'(\d+)\s*FASTEST LAPS',
-                    'total_starts': r'(\d+)\s*STARTS',
-                    'total_wins': r'(\d+)\s*/\s*\d+\s*WINS',
-                    'total_podiums': r'(\d+)\s*/\s*\d+\s*PODIUMS',
-                    'total_poles': r'(\d+)\s*/\s*\d+\s*POLES',
-                    'total_championships': r'(\d+)\s*/\s*\d+\s*CHAMPIONSHIPS'
-                }
-                
-                for stat_name, pattern in highlights_patterns.items():
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        value = match.group(1)
-                        try:
-                            # Only use if we don't already have this stat
-                            base_name = stat_name.replace('total_', '').replace('_total', '')
-                            if base_name not in extracted_stats:
-                                extracted_stats[base_name] = int(value) if value.replace('.', '').isdigit() else value
-                                print(f"Extracted from highlights {base_name}: {value}")
-                        except ValueError:
-                            pass
-                
-                # Try to find specific data by looking for numbers in context
-                lines = page_text.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if any(keyword in line.lower() for keyword in ['start', 'win', 'podium', 'pole', 'point', 'championship']):
-                        print(f"Relevant line: {line}")
-                
-            except Exception as e:
-                print(f"Error extracting stats: {e}")
-            
-            return {
-                'driver_slug': driver_slug,
-                'url': url,
-                'extracted_stats': extracted_stats,
-                'season_2025_data': season_2025_data if 'season_2025_data' in locals() else {},
-                'tables_found': len(tables) if 'tables' in locals() else 0,
-                'page_text_sample': page_text[:1000] + '...' if len(page_text) > 1000 else page_text
-            }
+            extracted_stats, season_2025_data = parse_driver_stats(page_text, tables, 2025)
+            return build_driver_result(driver_slug, url, page_text, tables, extracted_stats, season_2025_data)
             
         except Exception as e:
             print(f"Error scraping driver stats: {e}")
@@ -258,162 +116,44 @@ class MotorsportSeleniumScraper:
     
     def _safe_int(self, value):
         """Safely convert value to integer"""
-        if value is None or value == '':
-            return 0
-        try:
-            # Remove any non-digit characters except minus sign
-            cleaned = ''.join(c for c in str(value) if c.isdigit() or c == '-')
-            return int(cleaned) if cleaned else 0
-        except (ValueError, TypeError):
-            return 0
+        return safe_int(value)
     
     def _safe_float(self, value):
         """Safely convert value to float"""
-        if value is None or value == '':
-            return 0.0
-        try:
-            # Remove any non-digit characters except minus sign and decimal point
-            cleaned = ''.join(c for c in str(value) if c.isdigit() or c in '.-')
-            return float(cleaned) if cleaned else 0.0
-        except (ValueError, TypeError):
-            return 0.0
+        return safe_float(value)
     
     def get_team_season_stats(self, team_slug: str, year: int = 2025) -> Optional[Dict[str, Any]]:
         """
         Get team season statistics from motorsportstats.com
         """
         try:
-            url = f"https://motorsportstats.com/team/{team_slug}/summary/series/fia-formula-one-world-championship"
+            url = team_summary_url(team_slug)
             print(f"Loading team page: {url}")
             
             self.driver.get(url)
             
-            # Wait for page to load
-            time.sleep(3)
-            
-            # Wait for content to load
-            try:
-                self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            except:
+            # Wait for the statistics tables to render
+            if not self.wait_for_content():
                 print("Timeout waiting for page to load")
             
-            # Get page text
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
-            print(f"Page loaded, text length: {len(page_text)}")
-            
-            # Extract team statistics
-            team_stats = {}
-            
-            # Look for tables and extract current season data
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
-            print(f"Found {len(tables)} tables")
+            page_text, tables = self.read_page()
+            print(f"Page loaded, text length: {len(page_text)}, {len(tables)} tables")
             
-            season_data = {}
-            
-            for i, table in enumerate(tables):
-                try:
-                    table_text = table.text
-                    print(f"Table {i+1}: {table_text[:200]}...")
-                    
-                    # Parse table for current season data
-                    rows = table.find_elements(By.TAG_NAME, "tr")
-                    
-                    if len(rows) > 1:  # Has header and data rows
-                        # Get header row
-                        header_cells = rows[0].find_elements(By.TAG_NAME, "th")
-                        if not header_cells:
-                            header_cells = rows[0].find_elements(By.TAG_NAME, "td")
-                        
-                        headers = [cell.text.strip() for cell in header_cells]
-                        
-                        # Look for current year data in subsequent rows
-                        for row in rows[1:]:
-                            cells = row.find_elements(By.TAG_NAME, "td")
-                            if cells:
-                                row_data = [cell.text.strip() for cell in cells]
-                                
-                                # Check if this row contains current year data
-                                if row_data and str(year) in row_data[0]:
-                                    print(f"Found {year} row: {row_data}")
-                                    
-                                    # Map headers to values
-                                    row_dict = {}
-                                    for j, value in enumerate(row_data):
-                                        if j < len(headers):
-                                            row_dict[headers[j]] = value
-                                    
-                                    # Extract relevant season stats
-                                    season_data = {
-                                        "season_wins": self._safe_int(row_dict.get("W", 0)),
-                                        "season_podiums": self._safe_int(row_dict.get("PD", 0)),
-                                        "season_poles": self._safe_int(row_dict.get("PP", 0)),
-                                        "season_fastest_laps": self._safe_int(row_dict.get("FL", 0)),
-                                        "season_points": self._safe_int(row_dict.get("PTS", 0)),
-                                        "season_races": self._safe_int(row_dict.get("ST", 0)),
-                                        "season_dnf": self._safe_int(row_dict.get("DNF", 0)),
-                                        "season_championship_position": row_dict.get("WC", None),
-                                        "season_drivers": row_dict.get("Drivers", None)
-                                    }
-                                    
-                                    print(f"Extracted {year} season data: {season_data}")
-                                    break
-                except:
-                    continue
-            
-            # Look for CAREER STATISTICS section for team info
-            career_stats_found = False
-            career_stats_text = ""
-            
-            # Split text into lines and find team statistics
-            lines = page_text.split('\n')
-            for i, line in enumerate(lines):
-                if 'CHAMPIONSHIPS' in line.upper() or 'CAREER HIGHLIGHTS' in line.upper():
-                    career_stats_found = True
-                    # Get the next ~30 lines after career highlights
-                    career_stats_lines = lines[i:i+30]
-                    career_stats_text = '\n'.join(career_stats_lines)
-                    print(f"Found team career highlights at line {i}")
-                    print(f"Career highlights text: {career_stats_text}")
-                    break
-            
-            if career_stats_found:
-                # Extract team career stats
-                career_patterns = {
-                    'total_championships': r'(\\d+)\\s*/\\s*\\d+\\s*CHAMPIONSHIPS',
-                    'total_wins': r'(\\d+)\\s*/\\s*\\d+\\s*WINS',
-                    'total_podiums': r'(\\d+)\\s*/\\s*\\d+\\s*PODIUMS',
-                    'total_poles': r'(\\d+)\\s*/\\s*\\d+\\s*POLES',
-                    'total_starts': r'STARTS\\s*(\\d+)',
-                    'total_points': r'POINTS\\s*([\\d.]+)'
-                }
-                
-                for stat_name, pattern in career_patterns.items():
-                    match = re.search(pattern, career_stats_text, re.IGNORECASE)
-                    if match:
-                        value = match.group(1)
-                        try:
-                            team_stats[stat_name] = int(value)
-                            print(f"Extracted {stat_name}: {value}")
-                        except ValueError:
-                            team_stats[stat_name] = value
-            
-            return {
-                'team_slug': team_slug,
-                'url': url,
-                'career_stats': team_stats,
-                'season_data': season_data,
-                'year': year,
-                'page_text_sample': page_text[:1000] + '...' if len(page_text) > 1000 else page_text
-            }
+            team_stats, season_data = parse_team_stats(page_text, tables, year)
+            return build_team_result(team_slug, url, year, page_text, team_stats, season_data)
             
         except Exception as e:
             print(f"Error scraping team stats: {e}")
             return None
 
     def close(self):
-        """Close the driver"""
+        """Close the driver (safe to call more than once)"""
         if hasattr(self, 'driver'):
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
+            del self.driver
     
     def __del__(self):
         """Cleanup when object is destroyed"""
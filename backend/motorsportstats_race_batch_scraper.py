@@ -1,12 +1,10 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-import time
+from selenium.common.exceptions import TimeoutException
 import json
 
+from motorsport_selenium_scraper import wait_for_document
+
 GP_SLUGS = [
     'australian-grand-prix', 'chinese-grand-prix', 'japanese-grand-prix', 'bahrain-grand-prix',
     'saudi-arabian-grand-prix', 'miami-grand-prix', 'emilia-romagna-grand-prix', 'monaco-grand-prix',
@@ -20,14 +18,15 @@ YEAR = 2025
 OUTPUT_JSON = 'motorsportstats_2025_race_results.json'
 
 
-def get_race_results_table(driver, wait, year, grand_prix_slug):
+def get_race_results_table(driver, wait, year, grand_prix_slug, content_wait=None):
     url = f"https://motorsportstats.com/results/fia-formula-one-world-championship/{year}/{grand_prix_slug}/classification"
     print(f"Loading page: {url}")
     driver.get(url)
-    time.sleep(3)
     try:
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
-    except:
+        # 문서 로드가 끝난 뒤에는 짧은 대기만: 아직 열리지 않은 GP 는 표가 없으므로 빨리 포기
+        wait_for_document(wait)
+        (content_wait or wait).until(EC.presence_of_element_located((By.TAG_NAME, "table")))
+    except TimeoutException:
         print(f"Timeout waiting for table: {grand_prix_slug}")
         return None
     tables = driver.find_elements(By.TAG_NAME, "table")
@@ -72,30 +71,64 @@ def get_race_results_table(driver, wait, year, grand_prix_slug):
     return results
 
 
-def main():
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    service = Service()
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    wait = WebDriverWait(driver, 10)
-    all_results = {}
+def scrape_race(scraper, grand_prix_slug):
+    """ScrapingEngine 작업 단위: 워커 전용 브라우저로 GP 하나 스크래핑"""
+    return get_race_results_table(scraper.driver, scraper.wait, YEAR, grand_prix_slug, scraper.content_wait)
+
+
+def load_existing_results():
+    """이전 실행 결과 (없거나 손상되었으면 빈 dict)"""
+    try:
+        with open(OUTPUT_JSON, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main(engine=None, workers=4, force=False):
+    from scraping_engine import ScrapingEngine
+    from scrape_manifest import ScrapeManifest
+
+    manifest = ScrapeManifest()
+    all_results = load_existing_results()
+
+    # 확정(final)된 레이스 결과는 다시 가져오지 않음 (force=True 면 전체 재수집)
+    to_scrape = [
+        slug for slug in GP_SLUGS
+        if force or slug not in all_results or not manifest.is_final(f"race:{YEAR}:{slug}")
+    ]
+    print(f"{len(GP_SLUGS) - len(to_scrape)}개 GP 확정됨 (건너뜀), {len(to_scrape)}개 GP 스크래핑")
+    if not to_scrape:
+        return True
+
+    own_engine = engine is None
+    if own_engine:
+        engine = ScrapingEngine(workers=workers)
     try:
-        for slug in GP_SLUGS:
-            results = get_race_results_table(driver, wait, YEAR, slug)
+        # 아직 열리지 않은 GP 는 빈 결과가 정상이므로 None 이어도 재시도하지 않음
+        scraped = engine.map(scrape_race, to_scrape, retry_on_none=False)
+        for slug in to_scrape:
+            results = scraped.get(slug)
             if results:
+                if manifest.record_page(f"race:{YEAR}:{slug}", results):
+                    print(f"{slug}: 새 결과 또는 변경됨")
                 all_results[slug] = results
+            elif slug in all_results:
+                print(f"{slug}: 가져오기 실패, 이전 결과 유지")
             else:
                 print(f"{slug}: 진행되지 않았거나 데이터 없음.")
+
+        # GP_SLUGS 순서 유지
+        ordered = {slug: all_results[slug] for slug in GP_SLUGS if slug in all_results}
         with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
-            json.dump(all_results, f, ensure_ascii=False, indent=2)
+            json.dump(ordered, f, ensure_ascii=False, indent=2)
+        manifest.save()
         print(f"\n모든 결과가 {OUTPUT_JSON} 파일에 저장되었습니다.")
+        return True
     finally:
-        driver.quit()
+        if own_engine:
+            engine.close()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import sys
+    main(force="--force" in sys.argv)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+여러 시즌의 순위표(standings)를 병렬로 재계산하는 스크립트
+(year, race) 단위 작업을 공유 워커 풀에서 처리하며, 중단된 경우 체크포인트부터 이어서 진행합니다.
+
+사용 예:
+    python rebuild_standings.py --years 2023,2024,2025 --workers 8
+    python rebuild_standings.py --force --no-resume
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_YEARS = [2021, 2022, 2023, 2024, 2025]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rebuild cached standings for several seasons in parallel")
+    parser.add_argument("--years", type=str, default=None, help="Comma-separated years (default: 2021-2025)")
+    parser.add_argument("--workers", type=int, default=8, help="Number of concurrent race workers")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if cached data is fresh")
+    parser.add_argument("--no-resume", action="store_true", help="Ignore existing checkpoints and start over")
+    return parser.parse_args()
+
+
+def log_progress(event):
+    """워커 진행 상황 로그"""
+    done = event["completed"] + event["failed"]
+    status = "ok" if event["success"] else "no result"
+    logger.info(f"[{done}/{event['total']}] {event['year']} {event['location']} ({event['session_key']}): {status}")
+
+
+async def rebuild(years, workers, force, resume):
+    # 스크립트 디렉토리 기준으로 data/standings 경로를 사용
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    from app.services.cache_service import cache_service
+    from app.services.openf1_client import openf1_client
+    from app.services.standings_calculator import standings_calculator
+
+    await cache_service.connect()
+    try:
+        stale_years = [year for year in years if force or standings_calculator.is_data_stale(year)]
+        if not stale_years:
+            logger.info("All requested years are fresh, nothing to rebuild")
+            return {}
+
+        logger.info(f"Rebuilding standings for {stale_years} with {workers} workers")
+        return await standings_calculator.rebuild_years_parallel(
+            stale_years,
+            workers=workers,
+            resume=resume,
+            progress=log_progress
+        )
+    finally:
+        await openf1_client.close()
+        await cache_service.close()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    years = [int(y.strip()) for y in args.years.split(",")] if args.years else DEFAULT_YEARS
+
+    results = asyncio.run(rebuild(years, args.workers, args.force, not args.no_resume))
+
+    failed = [year for year, result in results.items() if not result.get("success")]
+    for year, result in sorted(results.items()):
+        if result.get("success"):
+            logger.info(f"{year}: {result['races']} races, {result['drivers']} drivers, {result['teams']} teams")
+        else:
+            logger.error(f"{year}: failed - {result.get('error')}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+레이스 캘린더 기반 갱신 스케줄러
+
+매주 고정 시각 대신 jolpi(Ergast) 캘린더의 세션 시각을 보고 모드를 정합니다.
+(스케줄러 컨테이너에는 services/ 가 없으므로 캘린더는 여기서 httpx 로 직접 받음)
+
+- live: 세션 진행 중 -> 5분마다 OpenF1 증분 수집 (확정 세션은 재요청하지 않음)
+- post_session: 세션 종료 후 -> 15분마다 수집 + 순위표 재계산,
+  레이스 종료 2시간 뒤 한 번 전체 스크래핑 + 백업
+- prewarm: 세션 시작 90분 전 -> 한 번 수집하고 API 데이터셋/주요 엔드포인트 미리 로딩
+- idle: 주말 사이 -> 아무 작업 없이 다음 prewarm 시각까지 대기 (최대 12시간마다 캘린더 재확인)
+
+캘린더를 가져올 수 없으면 기존처럼 매주 월요일 09:00 전체 실행으로 동작합니다.
+
+사용 예:
+    python refresh_planner.py serve
+    python refresh_planner.py plan              # 지금 시점의 계획만 출력
+"""
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from job_scheduler import API_URL, JOBS, JobScheduler, next_run_after
+
+logger = logging.getLogger(__name__)
+
+# 세션 예상 길이 (지연/적기 중단 여유 포함)
+SESSION_DURATION = {
+    "practice": timedelta(minutes=75),
+    "qualifying": timedelta(minutes=75),
+    "sprint": timedelta(minutes=60),
+    "race": timedelta(minutes=150),
+}
+# 세션 종료 후 자주 갱신하는 기간
+POST_SESSION_WINDOW = {
+    "practice": timedelta(hours=1),
+    "qualifying": timedelta(hours=2),
+    "sprint": timedelta(hours=3),
+    "race": timedelta(hours=6),
+}
+PREWARM_BEFORE = timedelta(minutes=90)
+# 레이스 종료 후 motorsportstats 등에 결과가 올라올 때까지 기다리는 시간
+RESULTS_DELAY = timedelta(hours=2)
+
+LIVE_INTERVAL = 300
+POST_SESSION_INTERVAL = 900
+MAX_IDLE = timedelta(hours=12)
+CALENDAR_TTL = timedelta(hours=6)
+
+LIVE_JOBS = ["openf1_fetch"]
+POST_SESSION_JOBS = ["openf1_fetch", "standings_rebuild"]
+POST_RACE_JOBS = list(JOBS)
+PREWARM_JOBS = ["openf1_fetch"]
+
+CALENDAR_URL = "https://api.jolpi.ca/ergast/f1/{season}.json"
+# Ergast 레이스 항목의 세션 필드 -> (이름, 종류), LiveF1Service._calendar_sessions 와 같은 규칙
+CALENDAR_SESSION_FIELDS = [
+    ("FirstPractice", "Practice 1", "practice"),
+    ("SecondPractice", "Practice 2", "practice"),
+    ("ThirdPractice", "Practice 3", "practice"),
+    ("SprintQualifying", "Sprint Qualifying", "qualifying"),
+    ("SprintShootout", "Sprint Qualifying", "qualifying"),
+    ("Sprint", "Sprint", "sprint"),
+    ("Qualifying", "Qualifying", "qualifying"),
+]
+
+# prewarm 때 미리 호출할 API 경로 (데이터셋 캐시 로딩)
+PREWARM_PATHS = [
+    "/api/v1/calendar/next",
+    "/api/v1/calendar/current",
+    "/api/v1/driver-standings",
+    "/api/v1/constructor-standings",
+    "/api/v1/all-drivers/season-stats",
+    "/api/v1/all-teams/season-stats",
+    "/api/v1/race-results/latest",
+]
+
+
+@dataclass
+class RefreshPlan:
+    mode: str
+    # 지금 실행할 작업
+    jobs: List[str] = field(default_factory=list)
+    # 다음 계획 평가까지 대기 시간(초)
+    interval: float = 0
+    session: Optional[Dict[str, Any]] = None
+    # 같은 key 로는 한 번만 실행할 작업 (레이스 후 전체 스크래핑, prewarm)
+    once_key: Optional[str] = None
+    once_jobs: List[str] = field(default_factory=list)
+    reason: str = ""
+
+
+def parse_start(value: str) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def calendar_from_ergast(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """jolpi 응답 -> [{season, round, race_name, sessions: [{name, type, start}]}]"""
+    calendar = []
+    for race in data["MRData"]["RaceTable"]["Races"]:
+        sessions = [
+            {"name": name, "type": session_type, "start": f"{race[key]['date']}T{race[key].get('time') or '00:00:00Z'}"}
+            for key, name, session_type in CALENDAR_SESSION_FIELDS
+            if race.get(key, {}).get("date")
+        ]
+        sessions.append({"name": "Race", "type": "race", "start": f"{race['date']}T{race.get('time') or '00:00:00Z'}"})
+        calendar.append({
+            "season": race["season"],
+            "round": int(race["round"]),
+            "race_name": race["raceName"],
+            "sessions": sorted(sessions, key=lambda session: session["start"]),
+        })
+    return calendar
+
+
+async def fetch_calendar(year: Optional[int] = None) -> List[Dict[str, Any]]:
+    import httpx
+
+    season = year or "current"
+    async with httpx.AsyncClient(timeout=15.0) as client:
+        response = await client.get(CALENDAR_URL.format(season=season))
+        response.raise_for_status()
+    return calendar_from_ergast(response.json())
+
+
+def flatten_sessions(calendar: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """캘린더 -> 시작 시각 순 세션 목록 (start/end 는 aware datetime)"""
+    sessions = []
+    for race in calendar:
+        for session in race.get("sessions", []):
+            start = parse_start(session.get("start"))
+            if start is None:
+                continue
+            session_type = session.get("type", "race")
+            sessions.append({
+                "id": f"{race.get('season')}-{race.get('round')}-{session.get('name')}",
+                "race_name": race.get("race_name"),
+                "round": race.get("round"),
+                "name": session.get("name"),
+                "type": session_type,
+                "start": start,
+                "end": start + SESSION_DURATION.get(session_type, SESSION_DURATION["race"]),
+            })
+    sessions.sort(key=lambda s: s["start"])
+    return sessions
+
+
+def plan_refresh(calendar: List[Dict[str, Any]], now: Optional[datetime] = None) -> RefreshPlan:
+    """현재 시각과 캘린더로 갱신 모드/작업/대기 시간 결정"""
+    now = now or datetime.now(timezone.utc)
+    sessions = flatten_sessions(calendar)
+    if not sessions:
+        return RefreshPlan(mode="unknown", reason="no sessions in calendar")
+
+    upcoming = next((s for s in sessions if s["start"] > now), None)
+
+    # 1. 세션 진행 중
+    for session in sessions:
+        if session["start"] <= now < session["end"]:
+            return RefreshPlan(
+                mode="live",
+                jobs=LIVE_JOBS,
+                interval=LIVE_INTERVAL,
+                session=session,
+                reason=f"{session['race_name']} {session['name']} in progress"
+            )
+
+    # 2. 세션 종료 직후 (가장 최근에 끝난 세션 기준)
+    finished = [s for s in sessions if s["end"] <= now]
+    if finished:
+        last = finished[-1]
+        window_end = last["end"] + POST_SESSION_WINDOW.get(last["type"], timedelta(hours=1))
+        if now < window_end:
+            plan = RefreshPlan(
+                mode="post_session",
+                jobs=POST_SESSION_JOBS,
+                interval=POST_SESSION_INTERVAL,
+                session=last,
+                reason=f"{last['race_name']} {last['name']} finished at {last['end']:%H:%M} UTC"
+            )
+            if last["type"] == "race":
+                ready_at = last["end"] + RESULTS_DELAY
+                if now >= ready_at:
+                    plan.once_key = f"post-race-{last['id']}"
+                    plan.once_jobs = POST_RACE_JOBS
+                else:
+                    plan.interval = min(plan.interval, (ready_at - now).total_seconds())
+            if upcoming:
+                plan.interval = min(plan.interval, max(60.0, (upcoming["start"] - PREWARM_BEFORE - now).total_seconds()))
+            return plan
+
+    if upcoming is None:
+        return RefreshPlan(mode="idle", interval=MAX_IDLE.total_seconds(), reason="season finished")
+
+    # 3. 다음 세션 직전
+    prewarm_at = upcoming["start"] - PREWARM_BEFORE
+    if now >= prewarm_at:
+        return RefreshPlan(
+            mode="prewarm",
+            interval=max(60.0, (upcoming["start"] - now).total_seconds()),
+            session=upcoming,
+            once_key=f"prewarm-{upcoming['id']}",
+            once_jobs=PREWARM_JOBS,
+            reason=f"{upcoming['race_name']} {upcoming['name']} starts at {upcoming['start']:%H:%M} UTC"
+        )
+
+    # 4. 주말 사이
+    return RefreshPlan(
+        mode="idle",
+        interval=min(MAX_IDLE, prewarm_at - now).total_seconds(),
+        session=upcoming,
+        reason=f"next session {upcoming['race_name']} {upcoming['name']} at {upcoming['start']:%Y-%m-%d %H:%M} UTC"
+    )
+
+
+async def prewarm_api(paths: List[str] = PREWARM_PATHS):
+    """API 데이터셋 재로딩 + 주요 엔드포인트 호출로 세션 시작 전 캐시 채우기"""
+    import httpx
+    from job_scheduler import notify_reload
+
+    await notify_reload([name for job in JOBS.values() for name in job.datasets])
+    async with httpx.AsyncClient(base_url=API_URL, timeout=30.0) as client:
+        for path in paths:
+            try:
+                response = await client.get(path)
+                logger.info(f"prewarm {path}: HTTP {response.status_code}")
+            except Exception as e:
+                logger.warning(f"prewarm {path} failed: {e}")
+
+
+class CalendarRefreshScheduler(JobScheduler):
+    """RefreshPlan 에 따라 작업 실행, 캘린더를 못 가져오면 매주 월요일 09:00 전체 실행"""
+
+    def __init__(self, year: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.year = year
+        self._calendar: List[Dict[str, Any]] = []
+        self._calendar_loaded_at: Optional[datetime] = None
+        self._done_once: set = set()
+
+    async def load_calendar(self) -> List[Dict[str, Any]]:
+        now = datetime.now(timezone.utc)
+        if self._calendar_loaded_at and now - self._calendar_loaded_at < CALENDAR_TTL:
+            return self._calendar
+        try:
+            calendar = await fetch_calendar(self.year)
+            if calendar:
+                self._calendar, self._calendar_loaded_at = calendar, now
+        except Exception as e:
+            logger.warning(f"Could not load race calendar: {e}")
+        return self._calendar
+
+    async def tick(self) -> RefreshPlan:
+        """계획을 세우고 해당 작업 실행, 계획을 반환"""
+        plan = plan_refresh(await self.load_calendar())
+        logger.info(f"Refresh mode: {plan.mode} ({plan.reason})")
+
+        if plan.mode == "unknown":
+            # 캘린더 없음: 주간 실행으로 대체
+            next_run = next_run_after(datetime.now(), 0, "09:00")
+            plan.interval = (next_run - datetime.now()).total_seconds()
+            return plan
+
+        # 이 스케줄러에 허용된 작업만 (예: Selenium 이 없는 컨테이너에서는 스크래핑 제외)
+        jobs = [job for job in plan.jobs if job in self.jobs]
+        run_once = bool(plan.once_key) and plan.once_key not in self._done_once
+        once_jobs = [job for job in plan.once_jobs if job in self.jobs]
+        if run_once:
+            jobs += [job for job in once_jobs if job not in jobs]
+        run = await self.run(jobs, trigger=plan.mode) if jobs else None
+        if run_once:
+            # 허용된 작업을 한 번 돌렸으면 기록 (실패한 작업 때문에 창이 닫힐 때까지
+            # 15분마다 전체를 다시 돌리지 않음 - 다음 세션/정기 갱신에서 다시 수집)
+            self._done_once.add(plan.once_key)
+            failed = [job for job in once_jobs if run and run["jobs"][job]["status"] != "success"]
+            if failed:
+                logger.warning(f"{plan.once_key}: {failed} did not succeed, not retrying")
+            if plan.mode == "prewarm":
+                await prewarm_api()
+        return plan
+
+    async def serve(self, weekday: int = 0, at: str = "09:00"):
+        """캘린더 모드 상주 실행 (SIGUSR1 을 받으면 전체 작업 즉시 실행)"""
+        self._start_serving()
+        try:
+            while True:
+                try:
+                    plan = await self.tick()
+                except Exception as e:
+                    logger.error(f"Refresh tick error: {e}")
+                    plan = RefreshPlan(mode="error", interval=POST_SESSION_INTERVAL)
+
+                wake_at = datetime.now() + timedelta(seconds=plan.interval)
+                logger.info(f"Next refresh check: {wake_at.strftime('%Y-%m-%d %H:%M')}")
+                triggered = await self.wait_trigger(plan.interval)
+                if triggered or plan.mode == "unknown":
+                    try:
+                        await self.run(trigger="signal" if triggered else "schedule")
+                    except Exception as e:
+                        logger.error(f"Scheduler run error: {e}")
+        finally:
+            self._stop_serving()
+
+
+def main():
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Race-weekend-aware refresh scheduler")
+    parser.add_argument("command", choices=["serve", "plan"])
+    parser.add_argument("--year", type=int, default=None)
+    args = parser.parse_args()
+
+    scheduler = CalendarRefreshScheduler(year=args.year)
+    if args.command == "serve":
+        asyncio.run(scheduler.serve())
+    else:
+        plan = plan_refresh(asyncio.run(scheduler.load_calendar()))
+        print(f"mode={plan.mode} jobs={plan.jobs} once={plan.once_key}:{plan.once_jobs} "
+              f"next check in {plan.interval / 60:.0f} min - {plan.reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,6 @@
 """
 from fastapi import APIRouter, HTTPException
 from typing import Optional
-import json
-import os
 import logging
 from datetime import datetime
 
@@ -32,11 +30,11 @@ async def get_drivers():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{driver_number}")
-async def get_driver_detail(driver_number: int):
+async def get_driver_detail(driver_number: int, year: Optional[int] = None):
     """특정 드라이버 상세 정보 (통합 - 기본 정보 + 시즌 통계 + 경력 통계)"""
     try:
         # 기본 드라이버 정보
-        driver = await livef1_service.get_driver_detail(driver_number)
+        driver = await livef1_service.get_driver_detail(driver_number, year)
         if not driver:
             raise HTTPException(status_code=404, detail="Driver not found")
         
@@ -45,12 +43,9 @@ async def get_driver_detail(driver_number: int):
         career_stats = {}
         
         try:
-            career_json_file = os.path.join(os.path.dirname(__file__), "..", "driver_career_stats.json")
+            scraped_data = livef1_service.load_dataset("driver_career_stats.json")
             
-            if os.path.exists(career_json_file):
-                with open(career_json_file, 'r', encoding='utf-8') as f:
-                    scraped_data = json.load(f)
-                
+            if scraped_data:
                 # 드라이버 번호로 매핑 찾기
                 drivers = scraped_data.get('drivers', {})
                 for slug, driver_info in drivers.items():
@@ -115,12 +110,9 @@ async def get_driver_season_stats(driver_number: int, year: Optional[int] = None
         if year == 2025:
             try:
                 # 커리어 통계 JSON 파일에서 2025 시즌 데이터 가져오기
-                career_json_file = os.path.join(os.path.dirname(__file__), "..", "driver_career_stats.json")
+                career_data = livef1_service.load_dataset("driver_career_stats.json")
                 
-                if os.path.exists(career_json_file):
-                    with open(career_json_file, 'r', encoding='utf-8') as f:
-                        career_data = json.load(f)
-                    
+                if career_data:
                     # 드라이버 번호로 매핑 찾기
                     drivers = career_data.get('drivers', {})
                     for slug, driver_info in drivers.items():
@@ -193,12 +185,9 @@ async def get_driver_career_stats(driver_number: int):
     try:
         # JSON 파일에서 커리어 통계 로드 시도
         try:
-            json_file_path = os.path.join(os.path.dirname(__file__), "..", "driver_career_stats.json")
+            scraped_data = livef1_service.load_dataset("driver_career_stats.json")
             
-            if os.path.exists(json_file_path):
-                with open(json_file_path, 'r', encoding='utf-8') as f:
-                    scraped_data = json.load(f)
-                
+            if scraped_data:
                 # 드라이버 번호로 매핑 찾기
                 drivers = scraped_data.get('drivers', {})
                 for slug, driver_info in drivers.items():
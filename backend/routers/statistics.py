@@ -117,6 +117,32 @@ async def get_all_teams_season_stats(year: Optional[int] = None):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/championship/probabilities")
+async def get_championship_probabilities(year: Optional[int] = None, simulations: int = 200000):
+    """남은 시즌 몬테카를로 시뮬레이션으로 계산한 챔피언 확률"""
+    try:
+        if year is None:
+            year = datetime.now().year
+        
+        return await livef1_service.get_championship_probabilities(year, simulations)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/season-stats/rounds")
+async def get_season_round_results(year: Optional[int] = None, round_number: Optional[int] = None):
+    """라운드별 결과와 팀 포인트 (2025년, motorsportstats 기반)"""
+    try:
+        if year is None:
+            year = datetime.now().year
+        
+        if year != 2025:
+            raise HTTPException(status_code=404, detail="Round tables are only available for 2025")
+        return await livef1_service.get_season_round_results_2025(round_number)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/driver-standings")
 async def get_driver_standings(year: Optional[int] = None):
     """드라이버 순위 가져오기"""
@@ -0,0 +1,132 @@
+"""
+스크래핑 매니페스트 (증분 스크래핑용)
+
+페이지별 내용 해시와 확정(final) 여부, 출력 파일(데이터셋)별 해시를 기록합니다.
+
+- 페이지: 같은 해시가 연속 두 번 관측되고, 마지막 변경 후 settle_days 가 지나면 final.
+  final 페이지(완료된 레이스 결과 등)는 다시 가져오지 않습니다.
+- 데이터셋: scraped_at 같은 실행 시각 필드를 제외하고 해시를 계산해서,
+  실제 내용이 바뀌었을 때만 백업하도록 합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 실행 위치(CWD)와 상관없이 모든 스크래퍼/스케줄러가 같은 파일을 쓰도록 절대 경로로 고정
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scrape_manifest.json")
+
+# 실행할 때마다 바뀌는 필드 (내용 비교에서 제외)
+VOLATILE_KEYS = {"scraped_at", "fetched_at"}
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_volatile(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+def content_hash(value: Any) -> str:
+    """정렬된 JSON 직렬화 기준 sha256 (실행 시각 필드 제외)"""
+    canonical = json.dumps(_strip_volatile(value), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: str) -> Optional[str]:
+    """JSON 파일 내용 해시 (JSON 이 아니면 바이트 해시, 파일이 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return content_hash(json.load(f))
+    except ValueError:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+
+class ScrapeManifest:
+    def __init__(self, path: str = DEFAULT_MANIFEST_PATH, settle_days: float = 3.0):
+        self.path = path
+        self.settle_days = settle_days
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.datasets: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.pages = data.get("pages", {})
+                self.datasets = data.get("datasets", {})
+        except Exception as e:
+            logger.warning(f"Could not read {self.path}, starting a fresh manifest: {e}")
+            self.pages, self.datasets = {}, {}
+
+    def save(self):
+        """임시 파일에 쓴 뒤 os.replace 로 교체"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".manifest_", suffix=".json.tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"pages": self.pages, "datasets": self.datasets}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    # ------------------------------------------------------------------
+    # 페이지
+    # ------------------------------------------------------------------
+    def is_final(self, key: str) -> bool:
+        return bool(self.pages.get(key, {}).get("final"))
+
+    def record_page(self, key: str, content: Any) -> bool:
+        """페이지 내용 기록. 내용이 바뀌었으면 True"""
+        now = datetime.now()
+        digest = content_hash(content)
+        entry = self.pages.get(key)
+
+        if entry is None or entry.get("hash") != digest:
+            self.pages[key] = {
+                "hash": digest,
+                "first_seen": entry.get("first_seen", now.isoformat()) if entry else now.isoformat(),
+                "last_changed": now.isoformat(),
+                "last_checked": now.isoformat(),
+                "unchanged_checks": 0,
+                "final": False
+            }
+            return True
+
+        entry["last_checked"] = now.isoformat()
+        entry["unchanged_checks"] = entry.get("unchanged_checks", 0) + 1
+        last_changed = datetime.fromisoformat(entry["last_changed"])
+        if now - last_changed >= timedelta(days=self.settle_days):
+            entry["final"] = True
+        return False
+
+    def reset_page(self, key: str):
+        """final 표시 해제 (정정 공지 등으로 다시 가져와야 할 때)"""
+        self.pages.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # 데이터셋 (출력 파일)
+    # ------------------------------------------------------------------
+    def dataset_changed(self, name: str, path: str) -> bool:
+        """마지막 기록 이후 파일 내용이 바뀌었는지 (기록은 mark_dataset 에서)"""
+        digest = file_hash(path)
+        return digest is not None and self.datasets.get(name, {}).get("hash") != digest
+
+    def mark_dataset(self, name: str, path: str):
+        digest = file_hash(path)
+        if digest is not None:
+            self.datasets[name] = {"hash": digest, "recorded_at": datetime.now().isoformat()}
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+motorsportstats.com 스크래퍼 공용 브라우저 풀 엔진
+
+- N 개의 워커 스레드가 각자 Chrome(MotorsportSeleniumScraper) 인스턴스를 하나씩 보유
+- 레이스 결과 / 드라이버 / 팀 스크래퍼가 모두 같은 작업 큐에 작업을 제출
+- 고정 sleep 대신 명시적 대기(explicit wait), 페이지 로드 타임아웃, 지수 백오프(+지터) 재시도
+- 브라우저가 죽으면(WebDriverException) 해당 워커의 브라우저만 재생성
+
+사용 예 (주간 스크래핑 전체를 하나의 풀로 실행):
+    python scraping_engine.py --workers 4
+"""
+
+import argparse
+import logging
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+
+from motorsport_selenium_scraper import MotorsportSeleniumScraper
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScrapeJob:
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    label: str
+    retry_on_none: bool
+    future: Future = field(default_factory=Future)
+    attempts: int = 0
+
+
+class ScrapingEngine:
+    """공유 작업 큐 + 브라우저 워커 풀
+
+    fn 은 fn(scraper, *args) 형태로 호출되며, scraper 는 워커 전용
+    MotorsportSeleniumScraper 입니다 (예: MotorsportSeleniumScraper.get_team_season_stats).
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        headless: bool = True,
+        page_timeout: int = 20,
+        wait_timeout: int = 10,
+        content_timeout: int = 3,
+        retries: int = 2,
+        min_request_interval: float = 0.5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0
+    ):
+        self.workers = max(1, workers)
+        self.headless = headless
+        self.page_timeout = page_timeout
+        self.wait_timeout = wait_timeout
+        self.content_timeout = content_timeout
+        self.retries = retries
+        self.min_request_interval = min_request_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._queue: "queue.Queue[Optional[ScrapeJob]]" = queue.Queue()
+        self._threads = []
+        self._started = False
+        self._pace_lock = threading.Lock()
+        self._last_request_at = 0.0
+
+    # ------------------------------------------------------------------
+    # 작업 제출
+    # ------------------------------------------------------------------
+    def submit(self, fn: Callable[..., Any], *args, label: str = "", retry_on_none: bool = True) -> Future:
+        """작업 제출. retry_on_none=True 이면 None 결과도 실패로 보고 재시도"""
+        self._ensure_started()
+        job = ScrapeJob(fn=fn, args=args, label=label or f"{getattr(fn, '__name__', 'job')}{args}", retry_on_none=retry_on_none)
+        self._queue.put(job)
+        return job.future
+
+    def map(self, fn: Callable[..., Any], items: Iterable[Any], retry_on_none: bool = True) -> Dict[Any, Any]:
+        """items 각각에 대해 fn(scraper, item) 실행, {item: 결과} 반환 (실패 시 None)"""
+        futures = {item: self.submit(fn, item, label=str(item), retry_on_none=retry_on_none) for item in items}
+        results = {}
+        for item, future in futures.items():
+            try:
+                results[item] = future.result()
+            except Exception as e:
+                logger.error(f"{item}: failed after retries - {e}")
+                results[item] = None
+        return results
+
+    # ------------------------------------------------------------------
+    # 워커
+    # ------------------------------------------------------------------
+    def _ensure_started(self):
+        if self._started:
+            return
+        self._started = True
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"scrape-worker-{i + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Scraping engine started with {self.workers} browser workers")
+
+    def _new_scraper(self) -> MotorsportSeleniumScraper:
+        scraper = MotorsportSeleniumScraper(
+            headless=self.headless, wait_timeout=self.wait_timeout, content_timeout=self.content_timeout
+        )
+        scraper.driver.set_page_load_timeout(self.page_timeout)
+        return scraper
+
+    def _pace(self):
+        """풀 전체 기준 최소 요청 간격 유지 (서버 부하 방지)"""
+        with self._pace_lock:
+            delay = self._last_request_at + self.min_request_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._last_request_at = time.monotonic()
+
+    def _backoff(self, attempts: int) -> float:
+        """재시도 전 대기 시간: 지수 백오프, 절반은 고정 + 절반은 무작위 지터 (워커들이 동시에 재시도하지 않도록)"""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _worker(self):
+        scraper: Optional[MotorsportSeleniumScraper] = None
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    return
+
+                while True:
+                    job.attempts += 1
+                    try:
+                        if scraper is None:
+                            scraper = self._new_scraper()
+                        self._pace()
+                        result = job.fn(scraper, *job.args)
+                        if result is None and job.retry_on_none and job.attempts <= self.retries:
+                            logger.warning(f"{job.label}: empty result, retrying ({job.attempts}/{self.retries})")
+                            time.sleep(self._backoff(job.attempts))
+                            continue
+                        job.future.set_result(result)
+                        break
+                    except Exception as e:
+                        if isinstance(e, WebDriverException) and scraper is not None:
+                            # 브라우저 세션이 망가졌을 수 있으므로 새로 띄움
+                            scraper.close()
+                            scraper = None
+                        if job.attempts > self.retries:
+                            job.future.set_exception(e)
+                            break
+                        logger.warning(f"{job.label}: {type(e).__name__}: {e} - retrying ({job.attempts}/{self.retries})")
+                        time.sleep(self._backoff(job.attempts))
+        finally:
+            if scraper is not None:
+                scraper.close()
+
+    def close(self):
+        """대기 중인 작업을 모두 처리한 뒤 워커와 브라우저 종료"""
+        if not self._started:
+            return
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def run_weekly_scrape(workers: int = 4) -> bool:
+    """레이스 결과 / 드라이버 / 팀 스크래핑을 하나의 브라우저 풀에서 동시에 실행"""
+    import motorsportstats_race_batch_scraper
+    from bulk_driver_scraper import BulkDriverScraper
+    from team_season_scraper import TeamSeasonScraper
+
+    started_at = time.time()
+    results = {}
+
+    with ScrapingEngine(workers=workers) as engine:
+        def race_job():
+            results["races"] = motorsportstats_race_batch_scraper.main(engine=engine)
+
+        def driver_job():
+            results["drivers"] = BulkDriverScraper(engine=engine).run(interactive=False)
+
+        def team_job():
+            results["teams"] = TeamSeasonScraper(engine=engine).run()
+
+        # 세 스크래퍼가 동시에 같은 큐로 작업을 제출
+        threads = [threading.Thread(target=job) for job in (race_job, driver_job, team_job)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    logger.info(f"Weekly scrape finished in {time.time() - started_at:.0f}s: {results}")
+    return all(results.get(name) for name in ("races", "drivers", "teams"))
+
+
+def main():
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Run all motorsportstats scrapers on a shared browser pool")
+    parser.add_argument("--workers", type=int, default=4, help="Number of concurrent browser workers")
+    args = parser.parse_args()
+
+    raise SystemExit(0 if run_weekly_scrape(args.workers) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
 """
 Services 패키지
 각종 서비스 클래스들을 포함합니다.
+
+LiveF1Service 는 처음 접근할 때 import 합니다. compute 워커 프로세스(spawn)가
+services.compute_service 등의 커널을 불러올 때 fastapi/livef1 까지 읽지 않도록.
 """
 
-from .livef1_service import LiveF1Service
+__all__ = ['LiveF1Service']
+
 
-__all__ = ['LiveF1Service']
\ No newline at end of file
+def __getattr__(name):
+    if name == 'LiveF1Service':
+        from .livef1_service import LiveF1Service
+        return LiveF1Service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
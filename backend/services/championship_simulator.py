@@ -0,0 +1,269 @@
+"""
+챔피언십 결과 몬테카를로 시뮬레이터 (NumPy)
+
+현재 순위 포인트에서 출발해 남은 그랑프리/스프린트를 수십만 번 시뮬레이션하고
+드라이버/컨스트럭터 챔피언 확률, 예상 최종 포인트, 최종 순위 분포를 계산합니다.
+
+- 포인트 규칙은 시즌별 (app.core.points.points_rules: 2021 스프린트 3-2-1, 2019~2024 패스티스트 랩 1점)
+- 드라이버별 최근 레이스 피니시 순위로 순위 분포(최근 레이스일수록 가중치 큼)를 만들고,
+  각 이벤트마다 드라이버별로 분포에서 순위를 뽑은 뒤 그 값으로 줄을 세워 피니시 순서를 만듦
+- 시뮬레이션 대상은 마지막으로 끝난 레이스에 출전한 드라이버 (교체/대타로 빠진 드라이버는 제외)
+- 시뮬레이션은 묶음(chunk) 단위로 compute 프로세스 풀에 나눠 여러 코어에서 실행
+  (동시에 보내는 묶음은 워커 수까지만 - 나머지는 여기서 기다려 analytics 스레드로 넘치지 않음)
+- 결과는 (시즌, 끝난 라운드, 현재 포인트, 시뮬레이션 수) 별로 캐시
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.points import points_rules
+from services.compute_service import compute_service
+
+logger = logging.getLogger(__name__)
+
+FORM_RACES = 6  # 최근 몇 레이스로 폼을 볼지
+FORM_DECAY = 0.75  # 한 레이스 전 결과의 가중치
+FORM_PRIOR = 0.5  # 순위마다 더하는 사전 가중치 (결과가 적은 드라이버도 모든 순위가 가능하도록)
+FASTEST_LAP_TOP = 10  # 패스티스트 랩 포인트는 이 순위 안에서 완주한 드라이버만
+CHUNK_SIZE = 25_000
+MAX_SIMULATIONS = 1_000_000
+
+
+def points_table(points: Sequence[int], n_drivers: int) -> np.ndarray:
+    """0부터 시작하는 피니시 순위 -> 포인트 (그리드보다 짧으면 0 으로 채움)"""
+    table = np.zeros(n_drivers, dtype=np.float64)
+    size = min(len(points), n_drivers)
+    table[:size] = points[:size]
+    return table
+
+
+def form_distribution(recent_positions: List[List[int]], n_drivers: int) -> np.ndarray:
+    """드라이버별 최근 피니시 순위 목록(오래된 것부터) -> 순위 누적분포 (n_drivers × n_drivers)"""
+    weights = np.full((n_drivers, n_drivers), FORM_PRIOR)
+    for d, positions in enumerate(recent_positions):
+        for age, position in enumerate(reversed(positions[-FORM_RACES:])):
+            weights[d, min(max(position, 1), n_drivers) - 1] += FORM_DECAY ** age
+    cdf = np.cumsum(weights, axis=1)
+    cdf /= cdf[:, -1:]
+    return cdf
+
+
+def simulate_chunk(
+    cdf: np.ndarray,
+    base_points: np.ndarray,
+    team_of: np.ndarray,
+    base_team_points: np.ndarray,
+    events: Sequence[str],
+    rules: Dict[str, Any],
+    simulations: int,
+    seed: int
+) -> Dict[str, np.ndarray]:
+    """simulations 번의 남은 시즌 (워커 프로세스에서 실행)
+
+    events 는 "race" / "sprint" 목록, rules 는 points_rules(year).
+    포인트는 float64 (순위표의 절반 포인트 유지). 반환은 합계/횟수 배열이라 묶음끼리 더하면 됨.
+    """
+    rng = np.random.default_rng(seed)
+    n_drivers = cdf.shape[0]
+    n_teams = base_team_points.shape[0]
+    tables = {
+        "race": points_table(rules["race"], n_drivers),
+        "sprint": points_table(rules["sprint"], n_drivers)
+    }
+    fastest_lap = rules.get("fastest_lap", 0)
+    rows = np.arange(simulations)
+
+    totals = np.repeat(base_points[np.newaxis, :].astype(np.float64), simulations, axis=0)
+    event_points = np.empty((simulations, n_drivers), dtype=np.float64)
+    for event in events:
+        u = rng.random((simulations, n_drivers))
+        # 드라이버별 분포에서 순위를 뽑고(역누적분포), 같은 값은 무작위로 갈리도록 작은 잡음을 더해 줄 세움
+        draws = np.empty((simulations, n_drivers))
+        for d in range(n_drivers):
+            draws[:, d] = np.searchsorted(cdf[d], u[:, d], side="right")
+        draws += rng.random((simulations, n_drivers))
+        order = np.argsort(draws, axis=1)  # order[:, 0] = 우승한 드라이버
+        np.put_along_axis(event_points, order, tables[event][np.newaxis, :], axis=1)
+        if event == "race" and fastest_lap:
+            # 패스티스트 랩: 상위 FASTEST_LAP_TOP 완주자 중 한 명 (균등)
+            setter = order[rows, rng.integers(0, min(FASTEST_LAP_TOP, n_drivers), simulations)]
+            event_points[rows, setter] += fastest_lap
+        totals += event_points
+
+    team_totals = np.zeros((simulations, n_teams), dtype=np.float64)
+    team_totals += base_team_points[np.newaxis, :].astype(np.float64)
+    for d in range(n_drivers):
+        if team_of[d] >= 0:
+            team_totals[:, team_of[d]] += totals[:, d] - base_points[d]
+
+    # 최종 순위: 동점은 무작위 (countback 까지 시뮬레이션하지 않음)
+    final_rank = np.argsort(np.argsort(-(totals + rng.random(totals.shape) * 0.5), axis=1), axis=1)
+    team_rank = np.argsort(np.argsort(-(team_totals + rng.random(team_totals.shape) * 0.5), axis=1), axis=1)
+    rank_counts = np.stack([(final_rank == rank).sum(axis=0) for rank in range(n_drivers)], axis=1)
+
+    return {
+        "champion": (final_rank == 0).sum(axis=0),
+        "team_champion": (team_rank == 0).sum(axis=0),
+        "points_sum": totals.sum(axis=0),
+        "team_points_sum": team_totals.sum(axis=0),
+        "rank_counts": rank_counts,
+        "simulations": simulations
+    }
+
+
+class ChampionshipSimulator:
+    """남은 시즌 시뮬레이션 + 결과 캐시"""
+
+    def __init__(self, compute=compute_service, chunk_size: int = CHUNK_SIZE, cache_size: int = 16):
+        self.compute = compute
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        # 모든 요청을 합쳐 풀에 동시에 올리는 묶음 수 (compute 의 max_pending 보다 작게)
+        self._slots = asyncio.Semaphore(max(1, min(compute.max_workers, compute.max_pending)))
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"runs": 0, "cache_hits": 0, "simulations": 0, "seconds": 0.0}
+
+    async def simulate(
+        self,
+        year: int,
+        driver_standings: List[Dict[str, Any]],
+        constructor_standings: List[Dict[str, Any]],
+        race_results: List[Dict[str, Any]],
+        calendar: List[Dict[str, Any]],
+        simulations: int = 200_000,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        simulations = max(1, min(int(simulations), MAX_SIMULATIONS))
+        completed = [race for race in race_results if race.get("results")]
+        last_round = max((race["round"] for race in completed), default=0)
+        remaining = [race for race in calendar if race["round"] > last_round]
+        events = [event for race in remaining for event in (("sprint", "race") if race.get("sprint") else ("race",))]
+
+        driver_standings = self._current_field(driver_standings, completed)
+        drivers = [standing["name"] for standing in driver_standings]
+        teams = [standing["team"] for standing in constructor_standings]
+        key = hashlib.blake2b(
+            repr((year, last_round, simulations, seed, events,
+                  [(s["name"], s["points"]) for s in driver_standings],
+                  [(s["team"], s["points"]) for s in constructor_standings])).encode(),
+            digest_size=16
+        ).hexdigest()
+        if key in self._cache:
+            self.stats["cache_hits"] += 1
+            return self._cache[key]
+
+        n_drivers = len(drivers)
+        if not n_drivers:
+            return {"drivers": [], "constructors": [], "remaining_events": 0, "simulations": 0, "year": year}
+
+        index = {name: d for d, name in enumerate(drivers)}
+        recent: List[List[int]] = [[] for _ in drivers]
+        for race in sorted(completed, key=lambda race: race["round"])[-FORM_RACES:]:
+            for result in race["results"]:
+                d = index.get(result["driver_name"])
+                if d is not None and result.get("position"):
+                    recent[d].append(result["position"])
+
+        team_index = {team: t for t, team in enumerate(teams)}
+        team_of = np.array([team_index.get(standing["team"], -1) for standing in driver_standings], dtype=np.int32)
+        cdf = form_distribution(recent, n_drivers)
+        base_points = np.array([standing["points"] for standing in driver_standings], dtype=np.float64)
+        base_team_points = np.array([standing["points"] for standing in constructor_standings], dtype=np.float64)
+        rules = points_rules(year)
+
+        started = time.monotonic()
+        base_seed = seed if seed is not None else int.from_bytes(bytes.fromhex(key[:8]), "big")
+        chunks = [
+            min(self.chunk_size, simulations - offset) for offset in range(0, simulations, self.chunk_size)
+        ]
+
+        async def run_chunk(i: int, size: int) -> Dict[str, Any]:
+            async with self._slots:
+                return await self.compute.run(
+                    simulate_chunk, cdf, base_points, team_of, base_team_points, events, rules, size, base_seed + i
+                )
+
+        parts = await asyncio.gather(*[run_chunk(i, size) for i, size in enumerate(chunks)])
+        elapsed = time.monotonic() - started
+
+        champion = sum(part["champion"] for part in parts)
+        team_champion = sum(part["team_champion"] for part in parts)
+        points_sum = sum(part["points_sum"] for part in parts)
+        team_points_sum = sum(part["team_points_sum"] for part in parts)
+        rank_counts = sum(part["rank_counts"] for part in parts)
+
+        driver_rows = [
+            {
+                "name": drivers[d],
+                "team": driver_standings[d]["team"],
+                "current_points": float(base_points[d]),
+                "champion_probability": float(champion[d]) / simulations,
+                "expected_points": float(points_sum[d]) / simulations,
+                "top3_probability": float(rank_counts[d, :3].sum()) / simulations,
+                "final_position_distribution": (rank_counts[d, :10] / simulations).round(4).tolist()
+            }
+            for d in range(n_drivers)
+        ]
+        driver_rows.sort(key=lambda row: (-row["champion_probability"], -row["expected_points"]))
+        constructor_rows = [
+            {
+                "team": teams[t],
+                "current_points": float(base_team_points[t]),
+                "champion_probability": float(team_champion[t]) / simulations,
+                "expected_points": float(team_points_sum[t]) / simulations
+            }
+            for t in range(len(teams))
+        ]
+        constructor_rows.sort(key=lambda row: (-row["champion_probability"], -row["expected_points"]))
+
+        result = {
+            "drivers": driver_rows,
+            "constructors": constructor_rows,
+            "completed_rounds": last_round,
+            "remaining_races": len(remaining),
+            "remaining_sprints": events.count("sprint"),
+            "remaining_events": len(events),
+            "simulations": simulations,
+            "simulations_per_second": round(simulations / elapsed) if elapsed > 0 else None,
+            "model": {
+                "form_races": FORM_RACES,
+                "form_decay": FORM_DECAY,
+                "race_points": list(rules["race"]),
+                "sprint_points": list(rules["sprint"]),
+                "fastest_lap_point": rules["fastest_lap"]
+            },
+            "year": year
+        }
+
+        self.stats["runs"] += 1
+        self.stats["simulations"] += simulations
+        self.stats["seconds"] += elapsed
+        self._cache[key] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.pop(next(iter(self._cache)))
+        logger.info(f"Simulated {simulations} seasons for {year} ({len(events)} events left) in {elapsed:.2f}s")
+        return result
+
+    @staticmethod
+    def _current_field(driver_standings: List[Dict[str, Any]], completed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """마지막으로 끝난 레이스의 출전자만 (시즌 중 교체되거나 한두 번 대타로 나온 드라이버 제외)
+
+        끝난 레이스가 없거나 출전자가 순위표와 하나도 맞지 않으면 순위표 그대로
+        """
+        if not completed:
+            return driver_standings
+        latest = max(completed, key=lambda race: race["round"])
+        entrants = {result["driver_name"] for result in latest["results"]}
+        field = [standing for standing in driver_standings if standing["name"] in entrants]
+        return field or driver_standings
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"cached": len(self._cache), **self.stats}
+
+
+championship_simulator = ChampionshipSimulator()
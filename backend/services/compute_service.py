@@ -0,0 +1,250 @@
+"""
+CPU 집계 전용 프로세스 풀 서비스
+
+시즌 통계처럼 순수 파이썬으로 도는 집계를 이벤트 루프(웹소켓 스트림)와
+같은 GIL 에서 돌리지 않도록 ProcessPoolExecutor 로 넘깁니다.
+
+- 입력은 dict 트리가 아니라 array 열(column) 로 만들어 넘김 (피클/전송 비용이 작음)
+- 결과는 (커널 이름 + 입력 내용) 해시로 메모이즈, 같은 입력이 동시에 오면 계산 한 번만 수행
+- 풀이 가득 차거나 깨지면 analytics 스레드 실행기에서 계산 (요청은 실패시키지 않음)
+- 워커는 spawn 으로 시작 (uvicorn 프로세스는 live/bulk/analytics 스레드가 돌고 있어
+  fork 하면 다른 스레드가 잡고 있던 락 때문에 자식이 멈출 수 있음)
+
+커널 함수는 워커 프로세스에서 실행되므로 모듈 수준 함수여야 하고 표준 라이브러리만 사용합니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.core.executors import executors
+from app.core.points import RACE_POINTS
+from app.core.resilience import LatencyStats
+
+logger = logging.getLogger(__name__)
+
+# ---- 커널 (워커 프로세스에서 실행) ----
+
+def season_result_stats_kernel(
+    n_drivers: int,
+    n_teams: int,
+    n_rounds: int,
+    entry_round: Sequence[int],
+    entry_driver: Sequence[int],
+    entry_team: Sequence[int],
+    entry_position: Sequence[int]
+) -> Dict[str, Any]:
+    """피니시 순위 열 한 번 순회로 드라이버/팀 시즌 합계와 라운드별 표 (포인트는 RACE_POINTS 로 계산)
+
+    반환 order 는 (-포인트, -승, -포디움) 순, 동점은 먼저 등장한 쪽이 앞.
+    rounds 는 라운드별 {"entries": 순위순 entry 번호, "team_points": [(팀, 포인트)] 포인트순}.
+    """
+    driver = {key: [0] * n_drivers for key in ("points", "wins", "podiums", "races", "position_sum")}
+    driver["best"] = [0] * n_drivers
+    driver["positions"] = [[] for _ in range(n_drivers)]
+    team = {key: [0] * n_teams for key in ("points", "wins", "podiums", "races")}
+    team_drivers = [set() for _ in range(n_teams)]
+    entry_points = [0] * len(entry_position)
+    round_entries: List[List[int]] = [[] for _ in range(n_rounds)]
+    round_team_points: List[Dict[int, int]] = [{} for _ in range(n_rounds)]
+
+    for i, (r, d, t, position) in enumerate(zip(entry_round, entry_driver, entry_team, entry_position)):
+        points = RACE_POINTS[position - 1] if 1 <= position <= len(RACE_POINTS) else 0
+        win = 1 if position == 1 else 0
+        podium = 1 if position <= 3 else 0
+        for table, k in ((driver, d), (team, t)):
+            table["points"][k] += points
+            table["wins"][k] += win
+            table["podiums"][k] += podium
+            table["races"][k] += 1
+        driver["position_sum"][d] += position
+        driver["positions"][d].append(position)
+        if not driver["best"][d] or position < driver["best"][d]:
+            driver["best"][d] = position
+        team_drivers[t].add(d)
+        entry_points[i] = points
+        round_entries[r].append(i)
+        round_team_points[r][t] = round_team_points[r].get(t, 0) + points
+
+    def order(table: Dict[str, List[int]], n: int) -> List[int]:
+        return sorted(range(n), key=lambda k: (-table["points"][k], -table["wins"][k], -table["podiums"][k]))
+
+    team["drivers"] = [len(drivers) for drivers in team_drivers]
+    rounds = [
+        {
+            "entries": sorted(entries, key=lambda i: entry_position[i]),
+            "team_points": sorted(team_points.items(), key=lambda item: -item[1])
+        }
+        for entries, team_points in zip(round_entries, round_team_points)
+    ]
+    return {
+        "drivers": {**driver, "order": order(driver, n_drivers)},
+        "teams": {**team, "order": order(team, n_teams)},
+        "entry_points": entry_points,
+        "rounds": rounds
+    }
+
+
+def team_race_stats_kernel(
+    n_teams: int,
+    entry_race: Sequence[int],
+    entry_team: Sequence[int],
+    entry_position: Sequence[int],
+    entry_dnf: Sequence[int],
+    entry_fastest: Sequence[int]
+) -> Dict[str, List[int]]:
+    """팀별 승/포디움/DNF/패스티스트랩/원투 (entry_team 이 -1 이면 집계 제외)"""
+    stats = {key: [0] * n_teams for key in ("wins", "podiums", "dnfs", "fastest_laps", "one_twos")}
+    # (레이스, 팀) 별 1위/2위 여부: bit 1 = 1위, bit 2 = 2위
+    finishes: Dict[tuple, int] = {}
+    for race, t, position, dnf, fastest in zip(entry_race, entry_team, entry_position, entry_dnf, entry_fastest):
+        if t < 0:
+            continue
+        if position == 1:
+            stats["wins"][t] += 1
+        if position <= 3:
+            stats["podiums"][t] += 1
+        stats["dnfs"][t] += dnf
+        stats["fastest_laps"][t] += fastest
+        if position in (1, 2):
+            finishes[(race, t)] = finishes.get((race, t), 0) | position
+    for (_, t), bits in finishes.items():
+        if bits == 3:
+            stats["one_twos"][t] += 1
+    return stats
+
+
+# ---- 서비스 ----
+
+def _content_hash(name: str, args: tuple) -> str:
+    return hashlib.blake2b(pickle.dumps((name, args), protocol=pickle.HIGHEST_PROTOCOL), digest_size=16).hexdigest()
+
+
+class ComputeService:
+    """프로세스 풀 + 내용 해시 메모이즈 (결과는 공유되므로 호출자가 수정하면 안 됨)"""
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = 32, memo_size: int = 256):
+        self.max_workers = max_workers or int(os.getenv("COMPUTE_WORKERS") or 0) or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.memo_size = memo_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._memo: "OrderedDict[str, Any]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.pending = 0
+        self.latency: Dict[str, LatencyStats] = {}
+        self.stats = {"submitted": 0, "memo_hits": 0, "joined": 0, "fallbacks": 0, "failed": 0, "max_pending": 0}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    async def run(self, kernel: Callable[..., Any], *args) -> Any:
+        """kernel(*args) 를 워커 프로세스에서 실행 (같은 입력이면 메모이즈된 결과)"""
+        key = _content_hash(kernel.__name__, args)
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            self.stats["memo_hits"] += 1
+            return self._memo[key]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["joined"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._compute(key, kernel, args))
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _compute(self, key: str, kernel: Callable[..., Any], args: tuple) -> Any:
+        started = time.monotonic()
+        self.stats["submitted"] += 1
+        ok = False
+        try:
+            result = await self._dispatch(kernel, args)
+            ok = True
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        finally:
+            self.latency.setdefault(kernel.__name__, LatencyStats()).record(time.monotonic() - started, ok)
+
+        self._memo[key] = result
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return result
+
+    async def _dispatch(self, kernel: Callable[..., Any], args: tuple) -> Any:
+        if self.pending >= self.max_pending:
+            # 풀이 밀려 있으면 기다리지 않고 스레드에서 계산
+            self.stats["fallbacks"] += 1
+            return await executors.run("analytics", kernel, *args)
+
+        self.pending += 1
+        self.stats["max_pending"] = max(self.stats["max_pending"], self.pending)
+        try:
+            return await asyncio.wrap_future(self._get_pool().submit(kernel, *args))
+        except BrokenProcessPool:
+            logger.warning("Compute process pool broke, recreating it and computing in a thread")
+            self._pool = None
+            self.stats["fallbacks"] += 1
+            return await executors.run("analytics", kernel, *args)
+        finally:
+            self.pending -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "pending": self.pending,
+            "inflight": len(self._inflight),
+            "memo_entries": len(self._memo),
+            **self.stats,
+            "kernels": {name: stats.snapshot() for name, stats in self.latency.items()}
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+class Interner:
+    """이름 -> 0부터 매겨지는 번호 (처음 등장한 순서)"""
+
+    def __init__(self):
+        self.index: Dict[Any, int] = {}
+        self.names: List[Any] = []
+
+    def __call__(self, name: Any) -> int:
+        idx = self.index.get(name)
+        if idx is None:
+            idx = self.index[name] = len(self.names)
+            self.names.append(name)
+        return idx
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def int_column(values=()) -> array:
+    return array("i", values)
+
+
+def float_column(values=()) -> array:
+    return array("d", values)
+
+
+compute_service = ComputeService()
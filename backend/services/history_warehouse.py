@@ -0,0 +1,623 @@
+"""
+지난 시즌 F1 기록 로컬 저장소 (SQLite)
+
+끝난 시즌은 바뀌지 않으므로 import_history.py 로 jolpi(Ergast) 데이터를 한 번 받아
+정규화된 테이블(races, results, qualifying, drivers, constructors, circuits, standings)에 저장하고,
+LiveF1Service 는 보관된 시즌에 대해 원격 호출 대신 여기서 Ergast 와 같은 형태의 응답을 만들어 씁니다.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv(
+    "HISTORY_DB_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "data", "history.sqlite3")
+)
+ERGAST_PREFIX = "https://api.jolpi.ca/ergast/f1/"
+
+# Ergast 레이스 항목의 세션 일정 필드
+SESSION_FIELDS = ["FirstPractice", "SecondPractice", "ThirdPractice", "SprintQualifying", "SprintShootout", "Sprint", "Qualifying"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    season INTEGER PRIMARY KEY,
+    imported_at TEXT NOT NULL,
+    races INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS circuits (
+    circuit_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    locality TEXT,
+    country TEXT,
+    lat TEXT,
+    lng TEXT,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS drivers (
+    driver_id TEXT PRIMARY KEY,
+    permanent_number TEXT,
+    code TEXT,
+    given_name TEXT,
+    family_name TEXT,
+    date_of_birth TEXT,
+    nationality TEXT,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS constructors (
+    constructor_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    nationality TEXT,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS races (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    race_name TEXT NOT NULL,
+    circuit_id TEXT NOT NULL REFERENCES circuits(circuit_id),
+    date TEXT,
+    time TEXT,
+    url TEXT,
+    PRIMARY KEY (season, round)
+);
+CREATE TABLE IF NOT EXISTS race_sessions (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    session TEXT NOT NULL,
+    date TEXT,
+    time TEXT,
+    PRIMARY KEY (season, round, session)
+);
+CREATE TABLE IF NOT EXISTS results (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    driver_id TEXT NOT NULL REFERENCES drivers(driver_id),
+    constructor_id TEXT NOT NULL REFERENCES constructors(constructor_id),
+    number TEXT,
+    position INTEGER,
+    position_text TEXT,
+    points REAL,
+    grid INTEGER,
+    laps INTEGER,
+    status TEXT,
+    time_millis TEXT,
+    time_text TEXT,
+    fastest_lap_rank TEXT,
+    fastest_lap_lap TEXT,
+    fastest_lap_time TEXT,
+    fastest_lap_speed TEXT,
+    PRIMARY KEY (season, round, driver_id)
+);
+CREATE TABLE IF NOT EXISTS qualifying (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    driver_id TEXT NOT NULL REFERENCES drivers(driver_id),
+    constructor_id TEXT NOT NULL REFERENCES constructors(constructor_id),
+    number TEXT,
+    position INTEGER,
+    q1 TEXT,
+    q2 TEXT,
+    q3 TEXT,
+    PRIMARY KEY (season, round, driver_id)
+);
+CREATE TABLE IF NOT EXISTS driver_standings (
+    season INTEGER NOT NULL,
+    driver_id TEXT NOT NULL REFERENCES drivers(driver_id),
+    constructor_ids TEXT NOT NULL,
+    position INTEGER,
+    position_text TEXT,
+    points REAL,
+    wins INTEGER,
+    PRIMARY KEY (season, driver_id)
+);
+CREATE TABLE IF NOT EXISTS constructor_standings (
+    season INTEGER NOT NULL,
+    constructor_id TEXT NOT NULL REFERENCES constructors(constructor_id),
+    position INTEGER,
+    position_text TEXT,
+    points REAL,
+    wins INTEGER,
+    PRIMARY KEY (season, constructor_id)
+);
+CREATE INDEX IF NOT EXISTS idx_races_circuit ON races (circuit_id, season);
+CREATE INDEX IF NOT EXISTS idx_results_driver ON results (driver_id, season, round);
+CREATE INDEX IF NOT EXISTS idx_results_constructor ON results (constructor_id, season, round);
+CREATE INDEX IF NOT EXISTS idx_qualifying_driver ON qualifying (driver_id, season, round);
+"""
+
+
+def _number_text(value: Optional[float]) -> str:
+    """25.0 -> "25", 12.5 -> "12.5" (Ergast 문자열 형식)"""
+    if value is None:
+        return "0"
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class HistoryWarehouse:
+    """SQLite 기반 지난 시즌 저장소 (읽기는 연결 하나를 잠금으로 공유)"""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    # ---- 연결 / 스키마 ----
+
+    def _connect(self, create: bool = False) -> Optional[sqlite3.Connection]:
+        if self._conn is None:
+            if not create and not os.path.exists(self.path):
+                # 아직 import 하지 않음: 파일을 만들지 않고 원격 API 사용
+                return None
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return []
+            return conn.execute(sql, tuple(params)).fetchall()
+
+    def seasons(self) -> List[int]:
+        return [row["season"] for row in self._query("SELECT season FROM seasons ORDER BY season")]
+
+    def has_season(self, season: int) -> bool:
+        return bool(self._query("SELECT 1 FROM seasons WHERE season = ?", (season,)))
+
+    # ---- 적재 ----
+
+    def import_season(
+        self,
+        season: int,
+        calendar: List[Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        qualifying: List[Dict[str, Any]],
+        driver_standings: List[Dict[str, Any]],
+        constructor_standings: List[Dict[str, Any]]
+    ):
+        """Ergast 응답의 Races / StandingsLists 항목으로 한 시즌을 (다시) 저장"""
+        with self._lock:
+            conn = self._connect(create=True)
+            with conn:
+                for table in ("races", "race_sessions", "results", "qualifying", "driver_standings", "constructor_standings"):
+                    conn.execute(f"DELETE FROM {table} WHERE season = ?", (season,))
+
+                for race in calendar:
+                    self._upsert_circuit(conn, race["Circuit"])
+                    race_round = int(race["round"])
+                    conn.execute(
+                        "INSERT INTO races VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (season, race_round, race["raceName"], race["Circuit"]["circuitId"],
+                         race.get("date"), race.get("time"), race.get("url"))
+                    )
+                    for session in SESSION_FIELDS:
+                        info = race.get(session)
+                        if info:
+                            conn.execute(
+                                "INSERT INTO race_sessions VALUES (?, ?, ?, ?, ?)",
+                                (season, race_round, session, info.get("date"), info.get("time"))
+                            )
+
+                for race in results:
+                    for result in race.get("Results", []):
+                        self._upsert_driver(conn, result["Driver"])
+                        self._upsert_constructor(conn, result["Constructor"])
+                        fastest = result.get("FastestLap", {})
+                        conn.execute(
+                            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (season, int(race["round"]), result["Driver"]["driverId"],
+                             result["Constructor"]["constructorId"], result.get("number"),
+                             _int_or_none(result.get("position")), result.get("positionText"),
+                             _float_or_none(result.get("points")), _int_or_none(result.get("grid")),
+                             _int_or_none(result.get("laps")), result.get("status"),
+                             result.get("Time", {}).get("millis"), result.get("Time", {}).get("time"),
+                             fastest.get("rank"), fastest.get("lap"), fastest.get("Time", {}).get("time"),
+                             fastest.get("AverageSpeed", {}).get("speed"))
+                        )
+
+                for race in qualifying:
+                    for result in race.get("QualifyingResults", []):
+                        self._upsert_driver(conn, result["Driver"])
+                        self._upsert_constructor(conn, result["Constructor"])
+                        conn.execute(
+                            "INSERT OR REPLACE INTO qualifying VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (season, int(race["round"]), result["Driver"]["driverId"],
+                             result["Constructor"]["constructorId"], result.get("number"),
+                             _int_or_none(result.get("position")),
+                             result.get("Q1"), result.get("Q2"), result.get("Q3"))
+                        )
+
+                for standing in driver_standings:
+                    self._upsert_driver(conn, standing["Driver"])
+                    for constructor in standing.get("Constructors", []):
+                        self._upsert_constructor(conn, constructor)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO driver_standings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (season, standing["Driver"]["driverId"],
+                         ",".join(c["constructorId"] for c in standing.get("Constructors", [])),
+                         _int_or_none(standing.get("position")), standing.get("positionText"),
+                         _float_or_none(standing.get("points")), _int_or_none(standing.get("wins")))
+                    )
+
+                for standing in constructor_standings:
+                    self._upsert_constructor(conn, standing["Constructor"])
+                    conn.execute(
+                        "INSERT OR REPLACE INTO constructor_standings VALUES (?, ?, ?, ?, ?, ?)",
+                        (season, standing["Constructor"]["constructorId"],
+                         _int_or_none(standing.get("position")), standing.get("positionText"),
+                         _float_or_none(standing.get("points")), _int_or_none(standing.get("wins")))
+                    )
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?)",
+                    (season, datetime.now().isoformat(), len(calendar))
+                )
+        logger.info(f"Imported season {season}: {len(calendar)} races")
+
+    @staticmethod
+    def _upsert_circuit(conn: sqlite3.Connection, circuit: Dict[str, Any]):
+        location = circuit.get("Location", {})
+        conn.execute(
+            "INSERT OR REPLACE INTO circuits VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (circuit["circuitId"], circuit["circuitName"], location.get("locality"), location.get("country"),
+             location.get("lat"), location.get("long"), circuit.get("url"))
+        )
+
+    @staticmethod
+    def _upsert_driver(conn: sqlite3.Connection, driver: Dict[str, Any]):
+        conn.execute(
+            "INSERT OR REPLACE INTO drivers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (driver["driverId"], driver.get("permanentNumber"), driver.get("code"), driver.get("givenName"),
+             driver.get("familyName"), driver.get("dateOfBirth"), driver.get("nationality"), driver.get("url"))
+        )
+
+    @staticmethod
+    def _upsert_constructor(conn: sqlite3.Connection, constructor: Dict[str, Any]):
+        conn.execute(
+            "INSERT OR REPLACE INTO constructors VALUES (?, ?, ?, ?)",
+            (constructor["constructorId"], constructor["name"], constructor.get("nationality"), constructor.get("url"))
+        )
+
+    # ---- Ergast 형태로 조회 ----
+
+    def ergast(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        jolpi URL 에 대한 응답을 로컬에서 생성. 보관된 시즌이 아니거나 지원하지 않는 경로면 None.
+        (limit/offset 은 무시하고 전부 반환)
+        """
+        if not url.startswith(ERGAST_PREFIX):
+            return None
+        path = re.sub(r"\.json$", "", url[len(ERGAST_PREFIX):].split("?", 1)[0])
+        parts = [part for part in path.split("/") if part]
+        if not parts or not parts[0].isdigit():
+            return None
+        season = int(parts[0])
+        if not self.has_season(season):
+            return None
+        rest = parts[1:]
+
+        if not rest:
+            return self._race_table(season, self.races(season))
+        if rest == ["results"]:
+            return self._race_table(season, self.races(season, results=True))
+        if len(rest) == 2 and rest[0].isdigit() and rest[1] == "results":
+            return self._race_table(season, self.races(season, round_number=int(rest[0]), results=True))
+        if rest == ["qualifying"]:
+            return self._race_table(season, self.races(season, qualifying=True))
+        if len(rest) == 2 and rest[0].isdigit() and rest[1] == "qualifying":
+            return self._race_table(season, self.races(season, round_number=int(rest[0]), qualifying=True))
+        if len(rest) == 3 and rest[0] == "drivers" and rest[2] == "results":
+            return self._race_table(season, self.races(season, driver_id=rest[1], results=True))
+        if len(rest) == 3 and rest[0] == "constructors" and rest[2] == "results":
+            return self._race_table(season, self.races(season, constructor_id=rest[1], results=True))
+        if rest == ["circuits"]:
+            return self._circuit_table(self.circuits(season))
+        if len(rest) == 2 and rest[0] == "circuits":
+            return self._circuit_table(self.circuits(season, circuit_id=rest[1]))
+        if len(rest) == 3 and rest[0] == "circuits" and rest[2] == "results":
+            return self._race_table(season, self.races(season, circuit_id=rest[1], results=True))
+        if rest == ["driverStandings"]:
+            return self._standings_table(season, "DriverStandings", self.driver_standings(season))
+        if rest == ["constructorStandings"]:
+            return self._standings_table(season, "ConstructorStandings", self.constructor_standings(season))
+        return None
+
+    @staticmethod
+    def _mrdata(total: int, **table) -> Dict[str, Any]:
+        return {"MRData": {"series": "f1", "limit": str(total), "offset": "0", "total": str(total), **table}}
+
+    def _race_table(self, season: int, races: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self._mrdata(len(races), RaceTable={"season": str(season), "Races": races})
+
+    def _circuit_table(self, circuits: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self._mrdata(len(circuits), CircuitTable={"Circuits": circuits})
+
+    def _standings_table(self, season: int, key: str, standings: List[Dict[str, Any]]) -> Dict[str, Any]:
+        rounds = self._query("SELECT races FROM seasons WHERE season = ?", (season,))
+        standings_lists = []
+        if standings:
+            standings_lists.append({"season": str(season), "round": str(rounds[0]["races"]) if rounds else "", key: standings})
+        return self._mrdata(1, StandingsTable={"season": str(season), "StandingsLists": standings_lists})
+
+    @staticmethod
+    def _circuit(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "circuitId": row["circuit_id"],
+            "url": _text(row["circuit_url"]),
+            "circuitName": row["circuit_name"],
+            "Location": {
+                "lat": _text(row["lat"]),
+                "long": _text(row["lng"]),
+                "locality": _text(row["locality"]),
+                "country": _text(row["country"])
+            }
+        }
+
+    @staticmethod
+    def _driver(row: sqlite3.Row) -> Dict[str, Any]:
+        driver = {
+            "driverId": row["driver_id"],
+            "url": _text(row["driver_url"]),
+            "givenName": _text(row["given_name"]),
+            "familyName": _text(row["family_name"]),
+            "dateOfBirth": _text(row["date_of_birth"]),
+            "nationality": _text(row["driver_nationality"])
+        }
+        # 예전 시즌 드라이버에는 번호/코드가 없음
+        if row["permanent_number"]:
+            driver["permanentNumber"] = row["permanent_number"]
+        if row["code"]:
+            driver["code"] = row["code"]
+        return driver
+
+    @staticmethod
+    def _constructor(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "constructorId": row["constructor_id"],
+            "url": _text(row["constructor_url"]),
+            "name": row["constructor_name"],
+            "nationality": _text(row["constructor_nationality"])
+        }
+
+    def circuits(self, season: int, circuit_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql = """
+            SELECT DISTINCT c.circuit_id, c.name AS circuit_name, c.locality, c.country, c.lat, c.lng, c.url AS circuit_url
+            FROM races r JOIN circuits c ON c.circuit_id = r.circuit_id
+            WHERE r.season = ?
+        """
+        params: List[Any] = [season]
+        if circuit_id:
+            sql += " AND c.circuit_id = ?"
+            params.append(circuit_id)
+        return [self._circuit(row) for row in self._query(sql + " ORDER BY c.circuit_id", params)]
+
+    def races(
+        self,
+        season: int,
+        round_number: Optional[int] = None,
+        circuit_id: Optional[str] = None,
+        driver_id: Optional[str] = None,
+        constructor_id: Optional[str] = None,
+        results: bool = False,
+        qualifying: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Ergast Races 항목 목록 (results/qualifying 을 요청하면 결과가 있는 레이스만)"""
+        sql = """
+            SELECT r.season, r.round, r.race_name, r.date, r.time, r.url,
+                   c.circuit_id, c.name AS circuit_name, c.locality, c.country, c.lat, c.lng, c.url AS circuit_url
+            FROM races r JOIN circuits c ON c.circuit_id = r.circuit_id
+            WHERE r.season = ?
+        """
+        params: List[Any] = [season]
+        if round_number is not None:
+            sql += " AND r.round = ?"
+            params.append(round_number)
+        if circuit_id:
+            sql += " AND r.circuit_id = ?"
+            params.append(circuit_id)
+        race_rows = self._query(sql + " ORDER BY r.round", params)
+
+        sessions: Dict[int, Dict[str, Dict[str, str]]] = {}
+        for row in self._query("SELECT round, session, date, time FROM race_sessions WHERE season = ?", (season,)):
+            info = {"date": row["date"]}
+            if row["time"]:
+                info["time"] = row["time"]
+            sessions.setdefault(row["round"], {})[row["session"]] = info
+
+        race_results = self._results(season, round_number, driver_id, constructor_id) if results else {}
+        race_qualifying = self._qualifying(season, round_number, driver_id, constructor_id) if qualifying else {}
+
+        races = []
+        for row in race_rows:
+            race_round = row["round"]
+            if results and race_round not in race_results:
+                continue
+            if qualifying and race_round not in race_qualifying:
+                continue
+            race = {
+                "season": str(row["season"]),
+                "round": str(race_round),
+                "url": _text(row["url"]),
+                "raceName": row["race_name"],
+                "Circuit": self._circuit(row),
+                "date": row["date"]
+            }
+            if row["time"]:
+                race["time"] = row["time"]
+            race.update(sessions.get(race_round, {}))
+            if results:
+                race["Results"] = race_results[race_round]
+            if qualifying:
+                race["QualifyingResults"] = race_qualifying[race_round]
+            races.append(race)
+        return races
+
+    _ENTRY_COLUMNS = """
+        d.driver_id, d.permanent_number, d.code, d.given_name, d.family_name, d.date_of_birth,
+        d.nationality AS driver_nationality, d.url AS driver_url,
+        k.constructor_id, k.name AS constructor_name, k.nationality AS constructor_nationality, k.url AS constructor_url
+    """
+
+    def _entry_filter(self, alias: str, season: int, round_number, driver_id, constructor_id):
+        sql = f" WHERE {alias}.season = ?"
+        params: List[Any] = [season]
+        if round_number is not None:
+            sql += f" AND {alias}.round = ?"
+            params.append(round_number)
+        if driver_id:
+            sql += f" AND {alias}.driver_id = ?"
+            params.append(driver_id)
+        if constructor_id:
+            sql += f" AND {alias}.constructor_id = ?"
+            params.append(constructor_id)
+        return sql, params
+
+    def _results(self, season, round_number=None, driver_id=None, constructor_id=None) -> Dict[int, List[Dict[str, Any]]]:
+        where, params = self._entry_filter("x", season, round_number, driver_id, constructor_id)
+        rows = self._query(
+            f"""SELECT x.*, {self._ENTRY_COLUMNS}
+                FROM results x
+                JOIN drivers d ON d.driver_id = x.driver_id
+                JOIN constructors k ON k.constructor_id = x.constructor_id
+                {where}
+                ORDER BY x.round, x.position IS NULL, x.position""",
+            params
+        )
+        by_round: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            result = {
+                "number": _text(row["number"]),
+                "position": _text(row["position"]),
+                "positionText": _text(row["position_text"]),
+                "points": _number_text(row["points"]),
+                "Driver": self._driver(row),
+                "Constructor": self._constructor(row),
+                "grid": _text(row["grid"]),
+                "laps": _text(row["laps"]),
+                "status": _text(row["status"])
+            }
+            if row["time_text"]:
+                result["Time"] = {"millis": _text(row["time_millis"]), "time": row["time_text"]}
+            if row["fastest_lap_time"]:
+                result["FastestLap"] = {
+                    "rank": _text(row["fastest_lap_rank"]),
+                    "lap": _text(row["fastest_lap_lap"]),
+                    "Time": {"time": row["fastest_lap_time"]}
+                }
+                if row["fastest_lap_speed"]:
+                    result["FastestLap"]["AverageSpeed"] = {"units": "kph", "speed": row["fastest_lap_speed"]}
+            by_round.setdefault(row["round"], []).append(result)
+        return by_round
+
+    def _qualifying(self, season, round_number=None, driver_id=None, constructor_id=None) -> Dict[int, List[Dict[str, Any]]]:
+        where, params = self._entry_filter("x", season, round_number, driver_id, constructor_id)
+        rows = self._query(
+            f"""SELECT x.*, {self._ENTRY_COLUMNS}
+                FROM qualifying x
+                JOIN drivers d ON d.driver_id = x.driver_id
+                JOIN constructors k ON k.constructor_id = x.constructor_id
+                {where}
+                ORDER BY x.round, x.position IS NULL, x.position""",
+            params
+        )
+        by_round: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            result = {
+                "number": _text(row["number"]),
+                "position": _text(row["position"]),
+                "Driver": self._driver(row),
+                "Constructor": self._constructor(row)
+            }
+            for session in ("q1", "q2", "q3"):
+                if row[session]:
+                    result[session.upper()] = row[session]
+            by_round.setdefault(row["round"], []).append(result)
+        return by_round
+
+    def driver_standings(self, season: int) -> List[Dict[str, Any]]:
+        rows = self._query(
+            """SELECT s.*, d.driver_id, d.permanent_number, d.code, d.given_name, d.family_name, d.date_of_birth,
+                      d.nationality AS driver_nationality, d.url AS driver_url
+               FROM driver_standings s JOIN drivers d ON d.driver_id = s.driver_id
+               WHERE s.season = ? ORDER BY s.position IS NULL, s.position""",
+            (season,)
+        )
+        constructors = {
+            row["constructor_id"]: row
+            for row in self._query(
+                """SELECT constructor_id, name AS constructor_name, nationality AS constructor_nationality,
+                          url AS constructor_url FROM constructors"""
+            )
+        }
+        standings = []
+        for row in rows:
+            standings.append({
+                "position": _text(row["position"]),
+                "positionText": _text(row["position_text"]),
+                "points": _number_text(row["points"]),
+                "wins": _text(row["wins"]),
+                "Driver": self._driver(row),
+                "Constructors": [
+                    self._constructor(constructors[constructor_id])
+                    for constructor_id in row["constructor_ids"].split(",")
+                    if constructor_id in constructors
+                ]
+            })
+        return standings
+
+    def constructor_standings(self, season: int) -> List[Dict[str, Any]]:
+        rows = self._query(
+            """SELECT s.*, k.name AS constructor_name, k.nationality AS constructor_nationality, k.url AS constructor_url
+               FROM constructor_standings s JOIN constructors k ON k.constructor_id = s.constructor_id
+               WHERE s.season = ? ORDER BY s.position IS NULL, s.position""",
+            (season,)
+        )
+        return [
+            {
+                "position": _text(row["position"]),
+                "positionText": _text(row["position_text"]),
+                "points": _number_text(row["points"]),
+                "wins": _text(row["wins"]),
+                "Constructor": self._constructor(row)
+            }
+            for row in rows
+        ]
+
+
+# 프로세스 공용 인스턴스
+history_warehouse = HistoryWarehouse()
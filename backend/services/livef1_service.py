@@ -6,7 +6,9 @@ from typing import List, Optional, Dict, Any
 import asyncio
 import json
 import logging
+import os
 from datetime import datetime
+from urllib.parse import quote
 import requests
 from fastapi import WebSocket
 
@@ -14,35 +16,107 @@ import livef1
 from livef1 import get_season, get_session, get_meeting
 from livef1.api import livetimingF1_request
 
+from app.core.http_cache import HttpCache
+from app.core.reference import reference
+from app.core.executors import executors
+from app.core.season_loader import SeasonLoader
+from app.core.online_stats import StatsGroup
+from services.history_warehouse import history_warehouse
+from services.compute_service import (
+    compute_service, Interner, int_column, season_result_stats_kernel, team_race_stats_kernel
+)
+from services.progression_engine import progression_engine
+from services.championship_simulator import championship_simulator
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 날씨 분석 온라인 통계를 유지하는 필드
+WEATHER_FIELDS = ("air_temperature", "track_temperature", "humidity", "pressure", "wind_speed")
+
 
 class LiveF1Service:
     def __init__(self):
-        self.current_season = None
         self.current_session = None
+        # 시즌 객체: bulk 실행기에서 로드, 연도별 캐시 + 현재 시즌 백그라운드 갱신
+        self.seasons = SeasonLoader(get_season)
         self.websocket_connections: List[WebSocket] = []
+        # 스크래핑/수집 결과 JSON 캐시: 파일명 -> (mtime_ns, 데이터)
+        self._datasets: Dict[str, Any] = {}
+        self.data_dir = os.path.join(os.path.dirname(__file__), "..")
+        # jolpi(Ergast) 응답 캐시: ETag/Last-Modified 재검증, 304 면 파싱된 결과 재사용
+        self.http_cache = HttpCache()
+        self._http = requests.Session()
+        # 끝난 시즌 로컬 저장소 (import_history.py 로 채움)
+        self.history = history_warehouse
+        # CPU 집계는 프로세스 풀로 (이벤트 루프/웹소켓과 GIL 을 다투지 않도록)
+        self.compute = compute_service
+        self.progression = progression_engine
+        self.simulator = championship_simulator
+        # motorsportstats 결과 표: (데이터셋 객체, 표), 데이터셋이 바뀌면 다시 계산
+        self._result_tables: Optional[tuple] = None
+        self._result_tables_lock = asyncio.Lock()
+        # 세션별 날씨 온라인 통계: session_key -> {"cursor": 마지막 샘플 date, "stats": StatsGroup, "rainfall": bool}
+        self._weather_stats: Dict[int, Dict[str, Any]] = {}
+        # 백그라운드 작업 참조 (이벤트 루프는 약한 참조만 가지므로 끝날 때까지 여기서 보관)
+        self._background_tasks: set = set()
+    
+    def load_dataset(self, filename: str) -> Optional[Any]:
+        """data_dir 의 JSON 데이터셋 (요청마다 파일을 다시 파싱하지 않도록 mtime 기준 캐시, 없으면 None)"""
+        path = os.path.join(self.data_dir, filename)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._datasets.pop(filename, None)
+            return None
+        
+        cached = self._datasets.get(filename)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self._datasets[filename] = (mtime, data)
+        return data
+    
+    def reload_datasets(self, filenames: Optional[List[str]] = None) -> List[str]:
+        """캐시된 데이터셋을 버리고 다시 읽음 (스케줄러 작업 완료 알림 시 호출)"""
+        names = filenames or list(self._datasets.keys())
+        reloaded = []
+        for filename in names:
+            self._datasets.pop(filename, None)
+            try:
+                if self.load_dataset(filename) is not None:
+                    reloaded.append(filename)
+            except Exception as e:
+                logger.error(f"Failed to reload dataset {filename}: {e}")
+        logger.info(f"Reloaded datasets: {reloaded}")
+        if "motorsportstats_2025_race_results.json" in reloaded:
+            # 다음 요청을 기다리지 않고 바로 표를 다시 계산
+            try:
+                task = asyncio.get_running_loop().create_task(self.get_season_result_tables())
+            except RuntimeError:
+                pass
+            else:
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_task_done)
+        return reloaded
+    
+    def _background_task_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task failed: {task.exception()}")
+    
+    def _ergast_json(self, url: str) -> Optional[Any]:
+        """jolpi(Ergast) JSON: 로컬 저장소에 있는 지난 시즌은 거기서, 나머지는 HTTP 캐시 경유 (실패 시 None)"""
+        data = self.history.ergast(url)
+        if data is not None:
+            return data
+        return self.http_cache.fetch_json(self._http, url, timeout=10)
     
     def _get_nationality_from_country_code(self, country_code: str) -> str:
         """국가 코드를 국적으로 변환"""
-        country_map = {
-            "NED": "Dutch",
-            "GBR": "British", 
-            "ESP": "Spanish",
-            "MON": "Monégasque",
-            "AUS": "Australian",
-            "FRA": "French",
-            "GER": "German",
-            "MEX": "Mexican",
-            "FIN": "Finnish",
-            "CAN": "Canadian",
-            "JPN": "Japanese",
-            "THA": "Thai",
-            "DEN": "Danish",
-            "CHN": "Chinese"
-        }
-        return country_map.get(country_code, "Unknown")
+        return reference.nationality(country_code)
     
     async def _get_meeting_key_for_round(self, round_number: int, year: int = 2025) -> Optional[int]:
         """공식 캘린더에서 round_number에 해당하는 meeting_key를 추출"""
@@ -68,13 +142,10 @@ class LiveF1Service:
     async def _get_openf1_session_results_from_json(self, round_number: int, session_type: str, year: int = 2025) -> List[Dict[str, Any]]:
         """meeting_key + session_type 기반으로 OpenF1 JSON에서 세션 결과를 추출"""
         try:
-            import os
-            json_file_path = os.path.join(os.path.dirname(__file__), "..", "openf1_2025_results.json")
-            if not os.path.exists(json_file_path):
-                logger.warning(f"OpenF1 JSON file not found: {json_file_path}")
+            openf1_data = self.load_dataset("openf1_2025_results.json")
+            if openf1_data is None:
+                logger.warning("OpenF1 JSON file not found: openf1_2025_results.json")
                 return []
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                openf1_data = json.load(f)
             sessions = openf1_data.get('sessions', {})
             # 1. round_number → meeting_key
             meeting_key = await self._get_meeting_key_for_round(round_number, year)
@@ -118,56 +189,21 @@ class LiveF1Service:
                 # OpenF1 원본 데이터를 Ergast 형식으로 변환
                 formatted_results = []
                 
-                # 드라이버 이름 매핑
-                driver_name_map = {
-                    1: {"givenName": "Max", "familyName": "Verstappen", "code": "VER"},
-                    4: {"givenName": "Lando", "familyName": "Norris", "code": "NOR"},
-                    5: {"givenName": "Gabriel", "familyName": "Bortoleto", "code": "BOR"},
-                    6: {"givenName": "Isack", "familyName": "Hadjar", "code": "HAD"},
-                    7: {"givenName": "Jack", "familyName": "Doohan", "code": "DOO"},
-                    10: {"givenName": "Pierre", "familyName": "Gasly", "code": "GAS"},
-                    12: {"givenName": "Andrea Kimi", "familyName": "Antonelli", "code": "ANT"},
-                    14: {"givenName": "Fernando", "familyName": "Alonso", "code": "ALO"},
-                    16: {"givenName": "Charles", "familyName": "Leclerc", "code": "LEC"},
-                    18: {"givenName": "Lance", "familyName": "Stroll", "code": "STR"},
-                    22: {"givenName": "Yuki", "familyName": "Tsunoda", "code": "TSU"},
-                    23: {"givenName": "Alexander", "familyName": "Albon", "code": "ALB"},
-                    27: {"givenName": "Nico", "familyName": "Hülkenberg", "code": "HUL"},
-                    30: {"givenName": "Liam", "familyName": "Lawson", "code": "LAW"},
-                    31: {"givenName": "Esteban", "familyName": "Ocon", "code": "OCO"},
-                    44: {"givenName": "Lewis", "familyName": "Hamilton", "code": "HAM"},
-                    55: {"givenName": "Carlos", "familyName": "Sainz", "code": "SAI"},
-                    63: {"givenName": "George", "familyName": "Russell", "code": "RUS"},
-                    81: {"givenName": "Oscar", "familyName": "Piastri", "code": "PIA"},
-                    87: {"givenName": "Oliver", "familyName": "Bearman", "code": "BEA"},
-                }
-                
-                # 팀 매핑
-                team_map = {
-                    1: "Red Bull Racing", 4: "McLaren", 5: "Sauber", 6: "RB F1 Team", 7: "Alpine F1 Team",
-                    10: "Alpine F1 Team", 12: "Mercedes", 14: "Aston Martin", 16: "Ferrari", 18: "Aston Martin",
-                    22: "RB F1 Team", 23: "Williams", 27: "Sauber", 30: "Red Bull Racing", 31: "Haas F1 Team",
-                    44: "Ferrari", 55: "Williams", 63: "Mercedes", 81: "McLaren", 87: "Haas F1 Team",
-                }
-                
                 for result in sorted_results:
                     driver_number = result.get('driver_number', 0)
-                    driver_info = driver_name_map.get(driver_number, {
-                        "givenName": "Driver",
-                        "familyName": f"#{driver_number}",
-                        "code": f"D{driver_number:02d}"
-                    })
+                    seat = reference.seat_for_number(year, driver_number, round_number)
+                    driver = seat.driver if seat else reference.driver_by_number(driver_number)
                     
                     formatted_result = {
                         'position': str(result.get('position')),
                         'Driver': {
-                            'givenName': driver_info["givenName"],
-                            'familyName': driver_info["familyName"],
+                            'givenName': driver.given_name if driver else "Driver",
+                            'familyName': driver.family_name if driver else f"#{driver_number}",
                             'permanentNumber': str(driver_number),
-                            'code': driver_info["code"]
+                            'code': driver.code if driver else f"D{driver_number:02d}"
                         },
                         'Constructor': {
-                            'name': team_map.get(driver_number, 'Unknown Team')
+                            'name': seat.team.name if seat else 'Unknown Team'
                         },
                         'points': str(result.get('points', 0)),
                         'laps': str(result.get('number_of_laps', 0))
@@ -197,14 +233,9 @@ class LiveF1Service:
 
     async def _get_openf1_race_weekend_details(self, round_number: Optional[int] = None) -> Dict[str, Any]:
         """2025년: motorsportstats_2025_race_results.json만 사용, 없으면 빈 데이터 반환"""
-        import os
-        import json
-        base_dir = os.path.dirname(__file__)
-        msstats_path = os.path.join(base_dir, "..", "motorsportstats_2025_race_results.json")
         # motorsportstats만 사용
-        if os.path.exists(msstats_path):
-            with open(msstats_path, 'r', encoding='utf-8') as f:
-                msstats_data = json.load(f)
+        msstats_data = self.load_dataset("motorsportstats_2025_race_results.json")
+        if msstats_data is not None:
             weekends = []
             for idx, (slug, results) in enumerate(msstats_data.items(), 1):
                 if round_number and idx != round_number:
@@ -227,120 +258,11 @@ class LiveF1Service:
         # 파일 없으면 빈 데이터 반환
         return {'race_weekends': [], 'total_weekends': 0, 'year': 2025}
 
-    def _convert_openf1_results_to_ergast(self, openf1_results: List[Dict], session_type: str) -> List[Dict]:
-        """OpenF1 결과를 Ergast 형식으로 변환"""
-        try:
-            if not openf1_results:
-                return []
-            
-            # 드라이버 정보 매핑
-            driver_name_map = {
-                1: {"givenName": "Max", "familyName": "Verstappen", "code": "VER", "permanentNumber": "1"},
-                4: {"givenName": "Lando", "familyName": "Norris", "code": "NOR", "permanentNumber": "4"},
-                5: {"givenName": "Gabriel", "familyName": "Bortoleto", "code": "BOR", "permanentNumber": "5"},
-                6: {"givenName": "Isack", "familyName": "Hadjar", "code": "HAD", "permanentNumber": "6"},
-                7: {"givenName": "Jack", "familyName": "Doohan", "code": "DOO", "permanentNumber": "7"},
-                10: {"givenName": "Pierre", "familyName": "Gasly", "code": "GAS", "permanentNumber": "10"},
-                12: {"givenName": "Andrea Kimi", "familyName": "Antonelli", "code": "ANT", "permanentNumber": "12"},
-                14: {"givenName": "Fernando", "familyName": "Alonso", "code": "ALO", "permanentNumber": "14"},
-                16: {"givenName": "Charles", "familyName": "Leclerc", "code": "LEC", "permanentNumber": "16"},
-                18: {"givenName": "Lance", "familyName": "Stroll", "code": "STR", "permanentNumber": "18"},
-                22: {"givenName": "Yuki", "familyName": "Tsunoda", "code": "TSU", "permanentNumber": "22"},
-                23: {"givenName": "Alexander", "familyName": "Albon", "code": "ALB", "permanentNumber": "23"},
-                27: {"givenName": "Nico", "familyName": "Hülkenberg", "code": "HUL", "permanentNumber": "27"},
-                30: {"givenName": "Liam", "familyName": "Lawson", "code": "LAW", "permanentNumber": "30"},
-                31: {"givenName": "Esteban", "familyName": "Ocon", "code": "OCO", "permanentNumber": "31"},
-                43: {"givenName": "Franco", "familyName": "Colapinto", "code": "COL", "permanentNumber": "43"},
-                44: {"givenName": "Lewis", "familyName": "Hamilton", "code": "HAM", "permanentNumber": "44"},
-                55: {"givenName": "Carlos", "familyName": "Sainz", "code": "SAI", "permanentNumber": "55"},
-                63: {"givenName": "George", "familyName": "Russell", "code": "RUS", "permanentNumber": "63"},
-                81: {"givenName": "Oscar", "familyName": "Piastri", "code": "PIA", "permanentNumber": "81"},
-                87: {"givenName": "Oliver", "familyName": "Bearman", "code": "BEA", "permanentNumber": "87"}
-            }
-            
-            # 팀 정보 매핑
-            team_map = {
-                1: {"name": "Red Bull Racing", "constructorId": "red_bull"},
-                4: {"name": "McLaren", "constructorId": "mclaren"},
-                5: {"name": "Sauber", "constructorId": "sauber"},
-                6: {"name": "Red Bull Racing", "constructorId": "red_bull"},
-                7: {"name": "Alpine", "constructorId": "alpine"},
-                10: {"name": "Alpine", "constructorId": "alpine"},
-                12: {"name": "Mercedes", "constructorId": "mercedes"},
-                14: {"name": "Aston Martin", "constructorId": "aston_martin"},
-                16: {"name": "Ferrari", "constructorId": "ferrari"},
-                18: {"name": "Aston Martin", "constructorId": "aston_martin"},
-                22: {"name": "RB", "constructorId": "alphatauri"},
-                23: {"name": "Williams", "constructorId": "williams"},
-                27: {"name": "Haas F1 Team", "constructorId": "haas"},
-                30: {"name": "RB", "constructorId": "alphatauri"},
-                31: {"name": "Haas F1 Team", "constructorId": "haas"},
-                43: {"name": "Williams", "constructorId": "williams"},
-                44: {"name": "Ferrari", "constructorId": "ferrari"},
-                55: {"name": "Williams", "constructorId": "williams"},
-                63: {"name": "Mercedes", "constructorId": "mercedes"},
-                81: {"name": "McLaren", "constructorId": "mclaren"},
-                87: {"name": "Sauber", "constructorId": "sauber"}
-            }
-            
-            ergast_results = []
-            
-            for result in openf1_results:
-                driver_number = result.get('driver_number')
-                if not driver_number or driver_number not in driver_name_map:
-                    continue
-                
-                driver_info = driver_name_map[driver_number]
-                team_info = team_map.get(driver_number, {"name": "Unknown", "constructorId": "unknown"})
-                
-                ergast_result = {
-                    "position": str(result.get('position', 0)),
-                    "Driver": {
-                        "driverId": driver_info['code'].lower(),
-                        "permanentNumber": driver_info['permanentNumber'],
-                        "code": driver_info['code'],
-                        "givenName": driver_info['givenName'],
-                        "familyName": driver_info['familyName']
-                    },
-                    "Constructor": {
-                        "constructorId": team_info['constructorId'],
-                        "name": team_info['name']
-                    },
-                    "points": str(result.get('points', 0))
-                }
-                
-                # 세션 타입에 따라 추가 정보
-                if session_type.lower() == 'race':
-                    ergast_result.update({
-                        "grid": str(result.get('grid', 0)),
-                        "laps": str(result.get('number_of_laps', 0)),
-                        "status": "Finished" if not result.get('dnf') else "DNF"
-                    })
-                    
-                    # 시간 정보 추가
-                    if result.get('duration'):
-                        duration = result.get('duration')
-                        minutes = int(duration // 60)
-                        seconds = duration % 60
-                        ergast_result["Time"] = {"time": f"{minutes}:{seconds:.3f}"}
-                        
-                elif session_type.lower() == 'qualifying':
-                    # 퀄리파잉 시간 (임시로 Q1 시간만 설정)
-                    ergast_result["Q1"] = "1:20.000"  # 실제 데이터 있으면 사용
-                
-                ergast_results.append(ergast_result)
-            
-            return ergast_results
-            
-        except Exception as e:
-            logger.error(f"Failed to convert OpenF1 results to Ergast format: {e}")
-            return []
-
-    async def _get_current_season_stats(self, driver_number: int) -> dict:
-        """2025 시즌 실제 통계 가져오기"""
+    async def _get_current_season_stats(self, driver_number: int, year: int = 2025) -> dict:
+        """해당 시즌(기본 2025) 실제 통계 가져오기"""
         try:
-            # 2025년 모든 레이스 세션 가져오기
-            sessions_url = "https://api.openf1.org/v1/sessions?year=2025&session_type=Race"
+            # 시즌의 모든 레이스 세션 가져오기
+            sessions_url = f"https://api.openf1.org/v1/sessions?year={year}&session_type=Race"
             sessions_response = requests.get(sessions_url, timeout=10)
             
             season_stats = {
@@ -389,15 +311,11 @@ class LiveF1Service:
         if year is None:
             year = datetime.now().year
         
-        if self.current_season is None or getattr(self.current_season, 'year', None) != year:
-            try:
-                self.current_season = get_season(year)
-                logger.info(f"Loaded season {year}")
-            except Exception as e:
-                logger.error(f"Failed to load season {year}: {e}")
-                raise
-        
-        return self.current_season
+        try:
+            return await self.seasons.get(year)
+        except Exception as e:
+            logger.error(f"Failed to load season {year}: {e}")
+            raise
     
     async def get_drivers(self, session_key: Optional[str] = None) -> List[Dict[str, Any]]:
         try:
@@ -470,7 +388,9 @@ class LiveF1Service:
             logger.error(f"Failed to get drivers: {e}")
             return []
     
-    async def get_driver_detail(self, driver_number: int) -> Optional[Dict[str, Any]]:
+    async def get_driver_detail(self, driver_number: int, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """드라이버 기본 정보 + 커리어/시즌 통계 (year 가 없으면 스크래핑 데이터 기준 시즌인 2025)"""
+        season = year if year is not None else 2025
         try:
             # 먼저 드라이버 목록에서 기본 정보 찾기
             drivers = await self.get_drivers()
@@ -497,120 +417,19 @@ class LiveF1Service:
                             "place_of_birth": ""  # OpenF1에서는 제공하지 않음
                         }
                 
-                # 2025 시즌 실제 결과 가져오기
-                current_season_stats = await self._get_current_season_stats(driver_number)
+                # 요청한 시즌 실제 결과 가져오기
+                current_season_stats = await self._get_current_season_stats(driver_number, season)
                 logger.info(f"Current season stats for driver {driver_number}: {current_season_stats}")
                 
-                # 드라이버별 상세 정보 (하드코딩)
-                driver_stats = {
-                    1: {  # Max Verstappen
-                        "nationality": "Dutch",
-                        "date_of_birth": "1997-09-30",
-                        "place_of_birth": "Hasselt, Belgium",
-                        "race_wins": 62,
-                        "podiums": 107,
-                        "pole_positions": 40,
-                        "fastest_laps": 33,
-                        "career_points": 2586,
-                        "first_entry": 2015,
-                        "world_championships": 3
-                    },
-                    4: {  # Lando Norris
-                        "nationality": "British",
-                        "date_of_birth": "1999-11-13",
-                        "place_of_birth": "Bristol, England",
-                        "race_wins": 4,
-                        "podiums": 22,
-                        "pole_positions": 8,
-                        "fastest_laps": 7,
-                        "career_points": 650,
-                        "first_entry": 2019,
-                        "world_championships": 0
-                    },
-                    81: {  # Oscar Piastri
-                        "nationality": "Australian",
-                        "date_of_birth": "2001-04-06",
-                        "place_of_birth": "Melbourne, Australia",
-                        "race_wins": 2,
-                        "podiums": 12,
-                        "pole_positions": 1,
-                        "fastest_laps": 1,
-                        "career_points": 292,
-                        "first_entry": 2023,
-                        "world_championships": 0
-                    },
-                    16: {  # Charles Leclerc
-                        "nationality": "Monégasque",
-                        "date_of_birth": "1997-10-16",
-                        "place_of_birth": "Monte Carlo, Monaco",
-                        "race_wins": 7,
-                        "podiums": 39,
-                        "pole_positions": 26,
-                        "fastest_laps": 9,
-                        "career_points": 1196,
-                        "first_entry": 2018,
-                        "world_championships": 0
-                    },
-                    55: {  # Carlos Sainz
-                        "nationality": "Spanish",
-                        "date_of_birth": "1994-09-01",
-                        "place_of_birth": "Madrid, Spain",
-                        "race_wins": 3,
-                        "podiums": 25,
-                        "pole_positions": 6,
-                        "fastest_laps": 3,
-                        "career_points": 1013,
-                        "first_entry": 2015,
-                        "world_championships": 0
-                    },
-                    44: {  # Lewis Hamilton
-                        "nationality": "British",
-                        "date_of_birth": "1985-01-07",
-                        "place_of_birth": "Stevenage, England",
-                        "race_wins": 103,
-                        "podiums": 197,
-                        "pole_positions": 104,
-                        "fastest_laps": 67,
-                        "career_points": 4526,
-                        "first_entry": 2007,
-                        "world_championships": 7,
-                        # 2025 시즌 데이터
-                        "season_wins": 0,
-                        "season_podiums": 0,
-                        "season_points": 0
-                    },
-                    63: {  # George Russell
-                        "nationality": "British",
-                        "date_of_birth": "1998-02-15",
-                        "place_of_birth": "King's Lynn, England",
-                        "race_wins": 1,
-                        "podiums": 13,
-                        "pole_positions": 3,
-                        "fastest_laps": 7,
-                        "career_points": 376,
-                        "first_entry": 2019,
-                        "world_championships": 0
-                    },
-                    33: {  # Max Verstappen (if using number 33 instead of 1)
-                        "nationality": "Dutch",
-                        "date_of_birth": "1997-09-30",
-                        "place_of_birth": "Hasselt, Belgium",
-                        "race_wins": 62,
-                        "podiums": 107,
-                        "pole_positions": 40,
-                        "fastest_laps": 33,
-                        "career_points": 2586,
-                        "first_entry": 2015,
-                        "world_championships": 3
-                    }
-                }
+                # 드라이버별 상세 정보 (참조 데이터의 커리어 기록)
+                profile = reference.driver_by_number(driver_number, season)
                 
-                if driver_number in driver_stats:
-                    stats = driver_stats[driver_number]
+                if profile and profile.career:
+                    stats = profile.career
                     ergast_data.update({
-                        "nationality": stats["nationality"],
-                        "date_of_birth": stats["date_of_birth"],
-                        "place_of_birth": stats["place_of_birth"]
+                        "nationality": profile.nationality,
+                        "date_of_birth": profile.date_of_birth,
+                        "place_of_birth": profile.place_of_birth
                     })
                     career_stats = {
                         "race_wins": stats["race_wins"],
@@ -644,7 +463,7 @@ class LiveF1Service:
             except Exception as e:
                 logger.warning(f"Failed to fetch additional driver data for {driver_number}: {e}")
                 # 실패 시에도 현재 시즌 데이터는 시도해보기
-                current_season_stats = await self._get_current_season_stats(driver_number)
+                current_season_stats = await self._get_current_season_stats(driver_number, season)
                 
                 ergast_data = {
                     "nationality": "Unknown",
@@ -772,9 +591,8 @@ class LiveF1Service:
                 # 특정 년도
                 url = f"https://api.jolpi.ca/ergast/f1/{year}/driverStandings"
             
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            data = self._ergast_json(url)
+            if data is not None:
                 standings_list = data['MRData']['StandingsTable']['StandingsLists']
                 
                 if standings_list:
@@ -786,13 +604,9 @@ class LiveF1Service:
                         driver_name = f"{driver_data['Driver']['givenName']} {driver_data['Driver']['familyName']}"
                         original_team = driver_data['Constructors'][0]['name'] if driver_data['Constructors'] else 'Unknown'
                         
-                        # 팀 소속 수정
-                        if driver_name == "Yuki Tsunoda":
-                            team_name = "Red Bull"
-                        elif driver_name == "Liam Lawson":
-                            team_name = "RB F1 Team"
-                        else:
-                            team_name = original_team
+                        # 시즌 중 이적 반영 (순위표에는 첫 소속 팀이 먼저 나옴)
+                        seat = reference.seat_for_driver(year, driver_data['Driver'].get('driverId', ''))
+                        team_name = seat.team.name if seat else original_team
                         
                         # 이미지 URL 추가 (파일이 있으면 자동 매핑)
                         headshot_url = f"/images/drivers/{driver_name}.webp"
@@ -832,9 +646,8 @@ class LiveF1Service:
                 # 특정 년도
                 url = f"https://api.jolpi.ca/ergast/f1/{year}/constructorStandings"
             
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            data = self._ergast_json(url)
+            if data is not None:
                 standings_list = data['MRData']['StandingsTable']['StandingsLists']
                 
                 if standings_list:
@@ -884,9 +697,8 @@ class LiveF1Service:
             else:
                 url = f"https://api.jolpi.ca/ergast/f1/{year}.json"
             
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            data = self._ergast_json(url)
+            if data is not None:
                 races = data['MRData']['RaceTable']['Races']
                 
                 # 데이터 포맷 변환
@@ -909,6 +721,7 @@ class LiveF1Service:
                         "third_practice": race.get('ThirdPractice', {}).get('date'),
                         "qualifying": race.get('Qualifying', {}).get('date'),
                         "sprint": race.get('Sprint', {}).get('date'),
+                        "sessions": self._calendar_sessions(race),
                     }
                     formatted_races.append(race_info)
                 
@@ -921,6 +734,34 @@ class LiveF1Service:
             logger.error(f"Failed to get race calendar: {e}")
             return []
     
+    def _calendar_sessions(self, race: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Ergast 레이스 항목 -> 세션 시작 시각(UTC ISO) 목록, 시작 시각 순"""
+        session_fields = [
+            ("FirstPractice", "Practice 1", "practice"),
+            ("SecondPractice", "Practice 2", "practice"),
+            ("ThirdPractice", "Practice 3", "practice"),
+            ("SprintQualifying", "Sprint Qualifying", "qualifying"),
+            ("SprintShootout", "Sprint Qualifying", "qualifying"),
+            ("Sprint", "Sprint", "sprint"),
+            ("Qualifying", "Qualifying", "qualifying"),
+        ]
+        sessions = []
+        for field, name, session_type in session_fields:
+            info = race.get(field)
+            if info and info.get('date'):
+                sessions.append({
+                    "name": name,
+                    "type": session_type,
+                    "start": f"{info['date']}T{info.get('time') or '00:00:00Z'}"
+                })
+        sessions.append({
+            "name": "Race",
+            "type": "race",
+            "start": f"{race['date']}T{race.get('time') or '00:00:00Z'}"
+        })
+        sessions.sort(key=lambda session: session["start"])
+        return sessions
+    
     async def get_next_race(self) -> Optional[Dict[str, Any]]:
         """다음 레이스 정보 가져오기"""
         try:
@@ -982,85 +823,33 @@ class LiveF1Service:
             if not race_results:
                 return {"driver_progression": [], "constructor_progression": [], "race_labels": []}
             
-            # 드라이버별 레이스별 순위 및 포인트 추적
-            driver_progression = {}
-            constructor_progression = {}
-            race_labels = []
-            
-            # 각 레이스별로 순위 계산
-            current_driver_points = {}
-            current_constructor_points = {}
+            # 시즌별 포인트 행렬 엔진 (새 라운드만 추가 계산)
+            return await executors.run("analytics", self.progression.progression, year, race_results)
             
-            for race in race_results:
-                if not race.get('results'):
-                    continue
-                    
-                race_label = f"R{race['round']}"
-                race_labels.append(race_label)
-                
-                # 레이스 결과에서 포인트 누적
-                for result in race['results']:
-                    driver_name = result['driver_name']
-                    team_name = result['team']
-                    points = result['points']
-                    
-                    # 드라이버 포인트 누적
-                    if driver_name not in current_driver_points:
-                        current_driver_points[driver_name] = 0
-                        driver_progression[driver_name] = []
-                    current_driver_points[driver_name] += points
-                    
-                    # 컨스트럭터 포인트 누적
-                    if team_name not in current_constructor_points:
-                        current_constructor_points[team_name] = 0
-                        constructor_progression[team_name] = []
-                    current_constructor_points[team_name] += points
-                
-                # 현재 레이스 후 순위 계산
-                sorted_drivers = sorted(current_driver_points.items(), key=lambda x: x[1], reverse=True)
-                sorted_constructors = sorted(current_constructor_points.items(), key=lambda x: x[1], reverse=True)
-                
-                # 드라이버별 현재 순위 기록
-                for position, (driver_name, points) in enumerate(sorted_drivers, 1):
-                    if driver_name not in driver_progression:
-                        driver_progression[driver_name] = []
-                    driver_progression[driver_name].append({
-                        "race": race_label,
-                        "position": position,
-                        "points": points,
-                        "round": race['round']
-                    })
-                
-                # 컨스트럭터별 현재 순위 기록
-                for position, (team_name, points) in enumerate(sorted_constructors, 1):
-                    if team_name not in constructor_progression:
-                        constructor_progression[team_name] = []
-                    constructor_progression[team_name].append({
-                        "race": race_label,
-                        "position": position,
-                        "points": points,
-                        "round": race['round']
-                    })
-            
-            # 모든 드라이버와 컨스트럭터를 포함하되, 포인트 순으로 정렬
-            sorted_drivers = sorted(current_driver_points.items(), key=lambda x: x[1], reverse=True)
-            sorted_constructors = sorted(current_constructor_points.items(), key=lambda x: x[1], reverse=True)
+        except Exception as e:
+            logger.error(f"Failed to get standings progression: {e}")
+            return {"driver_progression": [], "constructor_progression": [], "race_labels": []}
+
+    async def get_championship_probabilities(self, year: Optional[int] = None, simulations: int = 200000) -> Dict[str, Any]:
+        """남은 레이스를 몬테카를로로 시뮬레이션한 드라이버/컨스트럭터 챔피언 확률"""
+        try:
+            if year is None:
+                year = datetime.now().year
             
-            # 모든 드라이버/컨스트럭터 포함 (순서만 정렬)
-            filtered_driver_progression = {name: driver_progression[name] for name, _ in sorted_drivers if name in driver_progression}
-            filtered_constructor_progression = {name: constructor_progression[name] for name, _ in sorted_constructors if name in constructor_progression}
+            driver_standings = await self.get_driver_standings(year)
+            if not driver_standings:
+                return {"drivers": [], "constructors": [], "remaining_events": 0, "simulations": 0, "year": year}
+            constructor_standings = await self.get_constructor_standings(year)
+            race_results = await self.get_race_results(year)
+            calendar = await self.get_race_calendar(year)
             
-            return {
-                "driver_progression": filtered_driver_progression,
-                "constructor_progression": filtered_constructor_progression,
-                "race_labels": race_labels,
-                "total_races": len(race_labels),
-                "year": year
-            }
+            return await self.simulator.simulate(
+                year, driver_standings, constructor_standings, race_results, calendar, simulations=simulations
+            )
             
         except Exception as e:
-            logger.error(f"Failed to get standings progression: {e}")
-            return {"driver_progression": [], "constructor_progression": [], "race_labels": []}
+            logger.error(f"Failed to simulate championship for {year}: {e}")
+            return {"drivers": [], "constructors": [], "remaining_events": 0, "simulations": 0, "year": year}
 
     async def get_race_weekend_details(self, year: Optional[int] = None, round_number: Optional[int] = None) -> Dict[str, Any]:
         """특정 레이스 주말의 상세 정보 (일정, 결과 등)"""
@@ -1075,7 +864,7 @@ class LiveF1Service:
             # ... (기존 코드 유지) ...
             # 레이스 캘린더 정보
             calendar_url = f"https://api.jolpi.ca/ergast/f1/{year}.json?limit=1000"
-            calendar_response = requests.get(calendar_url, timeout=10)
+            calendar_data = self._ergast_json(calendar_url)
             
             # 레이스 결과 정보
             if round_number:
@@ -1088,8 +877,7 @@ class LiveF1Service:
             
             race_weekends = []
             
-            if calendar_response.status_code == 200:
-                calendar_data = calendar_response.json()
+            if calendar_data is not None:
                 races = calendar_data['MRData']['RaceTable']['Races']
                 
                 # 결과 데이터 가져오기
@@ -1098,9 +886,8 @@ class LiveF1Service:
                 
                 try:
                     logger.info(f"Fetching race results from: {results_url}")
-                    results_response = requests.get(results_url, timeout=10)
-                    if results_response.status_code == 200:
-                        results_json = results_response.json()
+                    results_json = self._ergast_json(results_url)
+                    if results_json is not None:
                         races_with_results = results_json['MRData']['RaceTable']['Races']
                         logger.info(f"Found {len(races_with_results)} races with results")
                         for race in races_with_results:
@@ -1109,15 +896,14 @@ class LiveF1Service:
                             results_data[race_round] = race_results
                             logger.info(f"Race {race_round}: {len(race_results)} results")
                     else:
-                        logger.warning(f"Failed to fetch results: {results_response.status_code}")
+                        logger.warning(f"Failed to fetch results from {results_url}")
                 except Exception as e:
                     logger.error(f"Error fetching race results: {e}")
                 
                 try:
                     logger.info(f"Fetching qualifying results from: {qualifying_url}")
-                    qualifying_response = requests.get(qualifying_url, timeout=10)
-                    if qualifying_response.status_code == 200:
-                        qualifying_json = qualifying_response.json()
+                    qualifying_json = self._ergast_json(qualifying_url)
+                    if qualifying_json is not None:
                         races_with_qualifying = qualifying_json['MRData']['RaceTable']['Races']
                         logger.info(f"Found {len(races_with_qualifying)} races with qualifying")
                         for race in races_with_qualifying:
@@ -1126,7 +912,7 @@ class LiveF1Service:
                             qualifying_data[race_round] = qualifying_results
                             logger.info(f"Qualifying {race_round}: {len(qualifying_results)} results")
                     else:
-                        logger.warning(f"Failed to fetch qualifying: {qualifying_response.status_code}")
+                        logger.warning(f"Failed to fetch qualifying from {qualifying_url}")
                 except Exception as e:
                     logger.error(f"Error fetching qualifying results: {e}")
                 
@@ -1279,9 +1065,8 @@ class LiveF1Service:
                     else:
                         url = f"https://api.jolpi.ca/ergast/f1/{year}/results.json?limit={limit}&offset={offset}"
                 
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
+                data = self._ergast_json(url)
+                if data is not None:
                     races = data['MRData']['RaceTable']['Races']
                     
                     if not races:  # 더 이상 데이터가 없으면 중단
@@ -1378,11 +1163,10 @@ class LiveF1Service:
                     url = f"https://api.jolpi.ca/ergast/f1/{year}/drivers/{driver_id}/results.json"
                 
                 logger.info(f"DEBUG: Requesting URL: {url}")
-                response = requests.get(url, timeout=10)
-                logger.info(f"DEBUG: Response status: {response.status_code}")
+                data = self._ergast_json(url)
+                logger.info(f"DEBUG: Response received: {data is not None}")
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if data is not None:
                     races = data['MRData']['RaceTable']['Races']
                     
                     logger.info(f"DEBUG: Found {len(races)} races for {driver_id} in {year}")
@@ -1619,9 +1403,8 @@ class LiveF1Service:
                 else:
                     url = f"https://api.jolpi.ca/ergast/f1/{year}/circuits/{circuit_id}.json"
                 
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
+                data = self._ergast_json(url)
+                if data is not None:
                     circuits = data['MRData']['CircuitTable']['Circuits']
                     
                     if circuits:
@@ -1635,9 +1418,8 @@ class LiveF1Service:
                         
                         circuit_races = []
                         try:
-                            races_response = requests.get(races_url, timeout=10)
-                            if races_response.status_code == 200:
-                                races_data = races_response.json()
+                            races_data = self._ergast_json(races_url)
+                            if races_data is not None:
                                 circuit_races = races_data['MRData']['RaceTable']['Races']
                         except:
                             pass
@@ -1702,9 +1484,8 @@ class LiveF1Service:
                 else:
                     url = f"https://api.jolpi.ca/ergast/f1/{year}/circuits.json"
                 
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
+                data = self._ergast_json(url)
+                if data is not None:
                     circuits = data['MRData']['CircuitTable']['Circuits']
                     
                     circuit_list = []
@@ -1744,9 +1525,8 @@ class LiveF1Service:
                 else:
                     url = f"https://api.jolpi.ca/ergast/f1/{year}/constructors/{team_id}/results.json"
                 
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
+                data = self._ergast_json(url)
+                if data is not None:
                     races = data['MRData']['RaceTable']['Races']
                     
                     # 팀 통계 계산
@@ -1834,47 +1614,35 @@ class LiveF1Service:
                 standings = await self.get_constructor_standings(year)
                 race_results = await self.get_race_results(year)
                 
+                # 레이스 결과를 열로 펼쳐 팀별 집계는 compute 프로세스에서
+                team_index = {standing['team']: k for k, standing in enumerate(standings)}
+                entry_race, entry_team, entry_position = int_column(), int_column(), int_column()
+                entry_dnf, entry_fastest = int_column(), int_column()
+                for r, race in enumerate(race_results):
+                    for result in race.get('results', []):
+                        status = result['status']
+                        entry_race.append(r)
+                        entry_team.append(team_index.get(result['team'], -1))
+                        entry_position.append(result['position'])
+                        entry_dnf.append(1 if ('DNF' in status or 'Accident' in status or 'Retired' in status) else 0)
+                        entry_fastest.append(1 if result.get('fastest_lap') else 0)
+                
+                counts = await self.compute.run(
+                    team_race_stats_kernel, len(standings), entry_race, entry_team, entry_position, entry_dnf, entry_fastest
+                )
+                
                 team_stats = []
-                for standing in standings:
-                    team_name = standing['team']
-                    
-                    # 각 팀의 레이스 결과 분석
-                    wins = podiums = dnfs = 0
-                    fastest_laps = 0
-                    one_twos = 0
-                    
-                    for race in race_results:
-                        race_positions = []
-                        for result in race.get('results', []):
-                            if result['team'] == team_name:
-                                position = result['position']
-                                status = result['status']
-                                
-                                race_positions.append(position)
-                                
-                                if position == 1:
-                                    wins += 1
-                                if position <= 3:
-                                    podiums += 1
-                                if 'DNF' in status or 'Accident' in status or 'Retired' in status:
-                                    dnfs += 1
-                                if result.get('fastest_lap'):
-                                    fastest_laps += 1
-                        
-                        # 1-2 피니시 체크
-                        if len(race_positions) >= 2 and 1 in race_positions and 2 in race_positions:
-                            one_twos += 1
-                    
+                for k, standing in enumerate(standings):
                     team_stats.append({
                         'position': standing['position'],
-                        'team_name': team_name,
+                        'team_name': standing['team'],
                         'nationality': standing.get('nationality', ''),
                         'points': standing['points'],
-                        'wins': wins,
-                        'podiums': podiums,
-                        'dnfs': dnfs,
-                        'fastest_laps': fastest_laps,
-                        'one_twos': one_twos
+                        'wins': counts['wins'][k],
+                        'podiums': counts['podiums'][k],
+                        'dnfs': counts['dnfs'][k],
+                        'fastest_laps': counts['fastest_laps'][k],
+                        'one_twos': counts['one_twos'][k]
                     })
                 
                 return {
@@ -1889,12 +1657,8 @@ class LiveF1Service:
 
     async def _livef1_request(self, endpoint: str) -> Any:
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, 
-                lambda: livetimingF1_request(endpoint)
-            )
-            return result
+            # 라이브 타이밍 전용 실행기 (시즌/과거 데이터 로드와 분리)
+            return await executors.run("live", livetimingF1_request, endpoint)
         except Exception as e:
             # 403 Forbidden은 정상적인 상황 (활성 세션이 없을 때)
             if "403" in str(e) or "Forbidden" in str(e):
@@ -1986,11 +1750,20 @@ class LiveF1Service:
                 "session_key": session_key
             }
 
-    async def get_weather_by_session(self, session_key: int) -> List[Dict[str, Any]]:
-        """세션별 날씨 데이터 가져오기"""
+    async def get_weather_by_session(self, session_key: int, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """세션별 날씨 데이터 가져오기 (since 가 있으면 그 이후 샘플만, 실패하면 전체를 다시 받음)"""
         try:
             # OpenF1 API를 사용하여 날씨 데이터 가져오기
             url = f"https://api.openf1.org/v1/weather?session_key={session_key}"
+            if since:
+                # 커서는 "+00:00" 같은 시간대를 포함하므로 인코딩 ('+' 가 공백으로 읽히지 않도록)
+                try:
+                    response = requests.get(f"{url}&date>{quote(since, safe='')}", timeout=10)
+                    if response.status_code == 200:
+                        return response.json()
+                    logger.warning(f"Weather poll since {since} failed: HTTP {response.status_code}, fetching the full session")
+                except Exception as e:
+                    logger.warning(f"Weather poll since {since} failed ({e}), fetching the full session")
             response = requests.get(url, timeout=10)
             
             if response.status_code == 200:
@@ -2004,55 +1777,81 @@ class LiveF1Service:
             return []
 
     async def get_weather_analysis(self, session_key: int) -> Dict[str, Any]:
-        """날씨 분석 데이터 가져오기"""
+        """날씨 분석 데이터 가져오기
+
+        세션별 온라인 통계(평균/최소/최대/EWMA/30분 기울기)에 마지막 샘플 이후 데이터만 더함
+        (요청마다 세션 전체 날씨를 다시 훑지 않음)
+        """
+        empty = {
+            "average_temperature": None,
+            "temperature_range": {"min": None, "max": None},
+            "average_humidity": None,
+            "humidity_range": {"min": None, "max": None},
+            "pressure_range": {"min": None, "max": None},
+            "wind_speed_range": {"min": None, "max": None},
+            "rainfall": False,
+            "track_temperature_range": {"min": None, "max": None},
+            "session_key": session_key
+        }
         try:
-            weather_data = await self.get_weather_by_session(session_key)
-            
-            if not weather_data:
+            entry = self._weather_stats.get(session_key)
+            if entry is None:
+                entry = self._weather_stats[session_key] = {
+                    "cursor": "",
+                    "stats": StatsGroup(WEATHER_FIELDS, window=1800),
+                    "rainfall": False
+                }
+                while len(self._weather_stats) > 16:
+                    self._weather_stats.pop(next(iter(self._weather_stats)))
+
+            weather_data = await self.get_weather_by_session(session_key, since=entry["cursor"] or None)
+            for w in sorted(weather_data, key=lambda w: w.get("date", "")):
+                date = w.get("date", "")
+                if date <= entry["cursor"]:
+                    continue  # since 필터가 무시돼도 이미 더한 샘플은 건너뜀
+                try:
+                    t = datetime.fromisoformat(date.replace("Z", "+00:00")).timestamp()
+                except ValueError:
+                    continue
+                entry["stats"].push(t, w)
+                entry["rainfall"] = entry["rainfall"] or bool(w.get("rainfall"))
+                entry["cursor"] = date
+
+            stats = entry["stats"]
+            if not stats["air_temperature"].running.count and not stats["track_temperature"].running.count:
+                return empty
+
+            def value_range(name: str) -> Dict[str, Any]:
+                running = stats[name].running
+                return {"min": running.min, "max": running.max}
+
+            def average(name: str) -> Optional[float]:
+                running = stats[name].running
+                return running.mean if running.count else None
+
+            def trend(name: str) -> Dict[str, Any]:
+                slope = stats[name].window.slope
                 return {
-                    "average_temperature": None,
-                    "temperature_range": {"min": None, "max": None},
-                    "average_humidity": None,
-                    "humidity_range": {"min": None, "max": None},
-                    "pressure_range": {"min": None, "max": None},
-                    "wind_speed_range": {"min": None, "max": None},
-                    "rainfall": False,
-                    "track_temperature_range": {"min": None, "max": None},
-                    "session_key": session_key
+                    "ewma": stats[name].ewma.value,
+                    "change_per_30_min": slope * 1800 if slope is not None else None
                 }
-            
-            # 날씨 분석 계산
-            temperatures = [w.get("air_temperature") for w in weather_data if w.get("air_temperature") is not None]
-            humidity = [w.get("humidity") for w in weather_data if w.get("humidity") is not None]
-            pressure = [w.get("pressure") for w in weather_data if w.get("pressure") is not None]
-            wind_speed = [w.get("wind_speed") for w in weather_data if w.get("wind_speed") is not None]
-            track_temp = [w.get("track_temperature") for w in weather_data if w.get("track_temperature") is not None]
-            rainfall = any(w.get("rainfall", False) for w in weather_data)
-            
+
             return {
-                "average_temperature": sum(temperatures) / len(temperatures) if temperatures else None,
-                "temperature_range": {"min": min(temperatures), "max": max(temperatures)} if temperatures else {"min": None, "max": None},
-                "average_humidity": sum(humidity) / len(humidity) if humidity else None,
-                "humidity_range": {"min": min(humidity), "max": max(humidity)} if humidity else {"min": None, "max": None},
-                "pressure_range": {"min": min(pressure), "max": max(pressure)} if pressure else {"min": None, "max": None},
-                "wind_speed_range": {"min": min(wind_speed), "max": max(wind_speed)} if wind_speed else {"min": None, "max": None},
-                "rainfall": rainfall,
-                "track_temperature_range": {"min": min(track_temp), "max": max(track_temp)} if track_temp else {"min": None, "max": None},
+                "average_temperature": average("air_temperature"),
+                "temperature_range": value_range("air_temperature"),
+                "average_humidity": average("humidity"),
+                "humidity_range": value_range("humidity"),
+                "pressure_range": value_range("pressure"),
+                "wind_speed_range": value_range("wind_speed"),
+                "rainfall": entry["rainfall"],
+                "track_temperature_range": value_range("track_temperature"),
+                "trends": {name: trend(name) for name in ("air_temperature", "track_temperature", "humidity")},
+                "samples": stats["air_temperature"].running.count,
                 "session_key": session_key
             }
         except Exception as e:
             logger.error(f"Failed to get weather analysis: {e}")
-            return {
-                "average_temperature": None,
-                "temperature_range": {"min": None, "max": None},
-                "average_humidity": None,
-                "humidity_range": {"min": None, "max": None},
-                "pressure_range": {"min": None, "max": None},
-                "wind_speed_range": {"min": None, "max": None},
-                "rainfall": False,
-                "track_temperature_range": {"min": None, "max": None},
-                "session_key": session_key
-            }
+            return empty
 
     async def get_tire_strategy(self, session_key: int) -> Dict[str, Any]:
         """타이어 전략 분석 가져오기"""
@@ -2140,189 +1939,159 @@ class LiveF1Service:
         for ws in disconnected:
             self.websocket_connections.remove(ws)
 
+    async def get_season_result_tables(self) -> Optional[Dict[str, Any]]:
+        """motorsportstats 결과로 만든 드라이버/팀/라운드별 표 (데이터셋이 바뀔 때만 다시 계산, 없으면 None)
+
+        반환된 표는 공유되므로 호출자가 수정하면 안 됨.
+        """
+        msstats_data = self.load_dataset("motorsportstats_2025_race_results.json")
+        if msstats_data is None:
+            return None
+        # load_dataset 은 파일이 바뀌기 전까지 같은 객체를 돌려줌
+        if self._result_tables and self._result_tables[0] is msstats_data:
+            return self._result_tables[1]
+        async with self._result_tables_lock:
+            if self._result_tables and self._result_tables[0] is msstats_data:
+                return self._result_tables[1]
+            tables = await self._build_season_result_tables(msstats_data)
+            self._result_tables = (msstats_data, tables)
+            logger.info(
+                f"Materialized season result tables: {len(tables['drivers'])} drivers, "
+                f"{len(tables['teams'])} teams, {len(tables['rounds'])} rounds"
+            )
+            return tables
+
+    async def _build_season_result_tables(self, msstats_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """결과를 열로 펼쳐 한 번의 집계(compute 프로세스)로 세 표를 만듦"""
+        drivers, teams = Interner(), Interner()
+        driver_teams = []  # 드라이버가 처음 기록된 팀
+        entry_round, entry_driver, entry_team, entry_position = int_column(), int_column(), int_column(), int_column()
+        gp_slugs = list(msstats_data.keys())
+        for r, gp_slug in enumerate(gp_slugs):
+            for result in msstats_data[gp_slug]:
+                # 포지션을 숫자로 변환 (유효하지 않은 포지션은 건너뛰기)
+                try:
+                    position = int(result.get('POS', '0'))
+                except (ValueError, TypeError):
+                    continue
+                team_name = result.get('TEAM', '')
+                d = drivers(result.get('DRIVER', ''))
+                if d == len(driver_teams):
+                    driver_teams.append(team_name)
+                entry_round.append(r)
+                entry_driver.append(d)
+                entry_team.append(teams(team_name))
+                entry_position.append(position)
+        
+        stats = await self.compute.run(
+            season_result_stats_kernel,
+            len(drivers), len(teams), len(gp_slugs), entry_round, entry_driver, entry_team, entry_position
+        )
+        
+        table = stats['drivers']
+        driver_list = []
+        for position, k in enumerate(table['order'], 1):
+            driver_name = drivers.names[k]
+            races_entered = table['races'][k]
+            driver_list.append({
+                'name': driver_name,
+                'team': driver_teams[k],
+                'season_points': table['points'][k],
+                'season_wins': table['wins'][k],
+                'season_podiums': table['podiums'][k],
+                'races_entered': races_entered,
+                'best_finish': table['best'][k] or None,
+                'finish_positions': list(table['positions'][k]),
+                'poles': 0,  # 폴포지션 데이터가 없으므로 0으로 설정
+                'fastest_laps': 0,  # 최고속도랩 데이터가 없으므로 0으로 설정
+                'dnf': 0,  # DNF는 결과에 없으면 0
+                'championship_position': str(position),
+                'average_finish': round(table['position_sum'][k] / races_entered, 1) if races_entered else 0.0,
+                'driver_number': hash(driver_name) % 100,  # 임시 드라이버 번호
+                'slug': driver_name.lower().replace(' ', '-'),
+                'data_source': 'motorsportstats'
+            })
+        
+        table = stats['teams']
+        team_list = []
+        for position, k in enumerate(table['order'], 1):
+            team_name = teams.names[k]
+            team_list.append({
+                'name': team_name,
+                'full_name': team_name,
+                'season_points': table['points'][k],
+                'season_wins': table['wins'][k],
+                'season_podiums': table['podiums'][k],
+                'season_races': table['races'][k],
+                'season_poles': 0,
+                'season_fastest_laps': 0,
+                'season_dnf': 0,
+                'drivers_count': f"{table['drivers'][k]} drivers",
+                'championship_position': str(position),
+                'team_slug': team_name.lower().replace(' ', '-').replace('formula', 'f1'),
+                'data_source': 'motorsportstats'
+            })
+        
+        round_list = []
+        for r, (gp_slug, round_stats) in enumerate(zip(gp_slugs, stats['rounds']), 1):
+            round_list.append({
+                'round': r,
+                'gp_slug': gp_slug,
+                'race_name': gp_slug.replace('-', ' ').title(),
+                'results': [
+                    {
+                        'position': entry_position[i],
+                        'driver': drivers.names[entry_driver[i]],
+                        'team': teams.names[entry_team[i]],
+                        'points': stats['entry_points'][i]
+                    }
+                    for i in round_stats['entries']
+                ],
+                'team_points': [
+                    {'team': teams.names[t], 'points': points} for t, points in round_stats['team_points']
+                ]
+            })
+        
+        return {'drivers': driver_list, 'teams': team_list, 'rounds': round_list}
+
     async def calculate_season_driver_stats(self, year: int = 2025) -> List[Dict[str, Any]]:
-        """motorsportstats_2025_race_results.json을 기반으로 드라이버별 시즌 통계 계산"""
+        """motorsportstats_2025_race_results.json 기반 드라이버별 시즌 통계 (미리 계산된 표)"""
         try:
-            import os
-            base_dir = os.path.dirname(__file__)
-            msstats_path = os.path.join(base_dir, "..", "motorsportstats_2025_race_results.json")
-            
-            if not os.path.exists(msstats_path):
+            tables = await self.get_season_result_tables()
+            if tables is None:
                 logger.warning("motorsportstats_2025_race_results.json not found")
                 return []
-            
-            with open(msstats_path, 'r', encoding='utf-8') as f:
-                msstats_data = json.load(f)
-            
-            # 드라이버별 통계 초기화
-            driver_stats = {}
-            
-            # F1 포인트 시스템 (1위부터 10위까지)
-            points_system = {1: 25, 2: 18, 3: 15, 4: 12, 5: 10, 6: 8, 7: 6, 8: 4, 9: 2, 10: 1}
-            
-            for gp_slug, results in msstats_data.items():
-                for result in results:
-                    driver_name = result.get('DRIVER', '')
-                    team_name = result.get('TEAM', '')
-                    position_str = result.get('POS', '0')
-                    
-                    # 포지션을 숫자로 변환
-                    try:
-                        position = int(position_str)
-                    except (ValueError, TypeError):
-                        continue  # 유효하지 않은 포지션은 건너뛰기
-                    
-                    if driver_name not in driver_stats:
-                        driver_stats[driver_name] = {
-                            'name': driver_name,
-                            'team': team_name,
-                            'season_points': 0,
-                            'season_wins': 0,
-                            'season_podiums': 0,
-                            'races_entered': 0,
-                            'best_finish': float('inf'),
-                            'finish_positions': [],
-                            'poles': 0,  # 폴포지션 데이터가 없으므로 0으로 설정
-                            'fastest_laps': 0,  # 최고속도랩 데이터가 없으므로 0으로 설정
-                            'dnf': 0,  # DNF는 결과에 없으면 0
-                            'championship_position': None
-                        }
-                    
-                    # 통계 업데이트
-                    driver_stats[driver_name]['races_entered'] += 1
-                    driver_stats[driver_name]['finish_positions'].append(position)
-                    
-                    # 최고 피니시 업데이트
-                    if position < driver_stats[driver_name]['best_finish']:
-                        driver_stats[driver_name]['best_finish'] = position
-                    
-                    # 포인트 계산
-                    if position in points_system:
-                        driver_stats[driver_name]['season_points'] += points_system[position]
-                    
-                    # 승수 계산
-                    if position == 1:
-                        driver_stats[driver_name]['season_wins'] += 1
-                    
-                    # 포디움 계산
-                    if position <= 3:
-                        driver_stats[driver_name]['season_podiums'] += 1
-            
-            # 평균 피니시 계산 및 챔피언십 포지션 결정
-            driver_list = []
-            for driver_name, stats in driver_stats.items():
-                if stats['finish_positions']:
-                    stats['average_finish'] = round(sum(stats['finish_positions']) / len(stats['finish_positions']), 1)
-                else:
-                    stats['average_finish'] = 0.0
-                
-                if stats['best_finish'] == float('inf'):
-                    stats['best_finish'] = None
-                
-                # driver_number 추출 (가능한 경우)
-                stats['driver_number'] = hash(driver_name) % 100  # 임시 드라이버 번호
-                stats['slug'] = driver_name.lower().replace(' ', '-')
-                stats['data_source'] = 'motorsportstats'
-                
-                driver_list.append(stats)
-            
-            # 포인트순으로 정렬하여 챔피언십 포지션 결정
-            driver_list.sort(key=lambda x: (-x['season_points'], -x['season_wins'], -x['season_podiums']))
-            
-            for i, driver in enumerate(driver_list, 1):
-                driver['championship_position'] = str(i)
-            
-            return driver_list
+            return list(tables['drivers'])
             
         except Exception as e:
             logger.error(f"Failed to calculate driver season stats: {e}")
             return []
 
     async def calculate_season_team_stats(self, year: int = 2025) -> List[Dict[str, Any]]:
-        """motorsportstats_2025_race_results.json을 기반으로 팀별 시즌 통계 계산"""
+        """motorsportstats_2025_race_results.json 기반 팀별 시즌 통계 (미리 계산된 표)"""
         try:
-            import os
-            base_dir = os.path.dirname(__file__)
-            msstats_path = os.path.join(base_dir, "..", "motorsportstats_2025_race_results.json")
-            
-            if not os.path.exists(msstats_path):
+            tables = await self.get_season_result_tables()
+            if tables is None:
                 logger.warning("motorsportstats_2025_race_results.json not found")
                 return []
-            
-            with open(msstats_path, 'r', encoding='utf-8') as f:
-                msstats_data = json.load(f)
-            
-            # 팀별 통계 초기화
-            team_stats = {}
-            
-            # F1 포인트 시스템
-            points_system = {1: 25, 2: 18, 3: 15, 4: 12, 5: 10, 6: 8, 7: 6, 8: 4, 9: 2, 10: 1}
-            
-            for gp_slug, results in msstats_data.items():
-                for result in results:
-                    driver_name = result.get('DRIVER', '')
-                    team_name = result.get('TEAM', '')
-                    position_str = result.get('POS', '0')
-                    
-                    # 포지션을 숫자로 변환
-                    try:
-                        position = int(position_str)
-                    except (ValueError, TypeError):
-                        continue
-                    
-                    if team_name not in team_stats:
-                        team_stats[team_name] = {
-                            'name': team_name,
-                            'full_name': team_name,
-                            'season_points': 0,
-                            'season_wins': 0,
-                            'season_podiums': 0,
-                            'season_races': 0,
-                            'season_poles': 0,
-                            'season_fastest_laps': 0,
-                            'season_dnf': 0,
-                            'drivers_count': set(),  # 드라이버 이름들을 저장할 set
-                            'championship_position': None
-                        }
-                    
-                    # 드라이버 추가
-                    team_stats[team_name]['drivers_count'].add(driver_name)
-                    team_stats[team_name]['season_races'] += 1
-                    
-                    # 포인트 계산
-                    if position in points_system:
-                        team_stats[team_name]['season_points'] += points_system[position]
-                    
-                    # 승수 계산
-                    if position == 1:
-                        team_stats[team_name]['season_wins'] += 1
-                    
-                    # 포디움 계산
-                    if position <= 3:
-                        team_stats[team_name]['season_podiums'] += 1
-            
-            # 팀 리스트 생성 및 정렬
-            team_list = []
-            for team_name, stats in team_stats.items():
-                # drivers_count를 문자열로 변환
-                stats['drivers_count'] = f"{len(stats['drivers_count'])} drivers"
-                stats['team_slug'] = team_name.lower().replace(' ', '-').replace('formula', 'f1')
-                stats['data_source'] = 'motorsportstats'
-                
-                team_list.append(stats)
-            
-            # 포인트순으로 정렬하여 챔피언십 포지션 결정
-            team_list.sort(key=lambda x: (-x['season_points'], -x['season_wins'], -x['season_podiums']))
-            
-            for i, team in enumerate(team_list, 1):
-                team['championship_position'] = str(i)
-            
-            return team_list
+            return list(tables['teams'])
             
         except Exception as e:
             logger.error(f"Failed to calculate team season stats: {e}")
             return []
 
+    async def get_season_round_results_2025(self, round_number: Optional[int] = None) -> Dict[str, Any]:
+        """2025년 라운드별 결과/팀 포인트 표 (round_number 를 주면 해당 라운드만)"""
+        try:
+            tables = await self.get_season_result_tables()
+            rounds = tables['rounds'] if tables else []
+            if round_number is not None:
+                rounds = [entry for entry in rounds if entry['round'] == round_number]
+            return {'rounds': rounds, 'total_rounds': len(rounds), 'year': 2025, 'data_source': 'motorsportstats'}
+        except Exception as e:
+            logger.error(f"Failed to get 2025 round results: {e}")
+            return {'rounds': [], 'total_rounds': 0, 'year': 2025, 'data_source': 'motorsportstats'}
+
     async def get_season_driver_stats_2025(self) -> Dict[str, Any]:
         """2025년 드라이버 시즌 통계 반환"""
         try:
@@ -0,0 +1,211 @@
+"""
+시즌 순위 변화(progression) 계산 엔진 (NumPy)
+
+한 시즌을 (드라이버 × 라운드) 포인트 행렬로 두고 누적 포인트, 라운드별 순위,
+선두와의 포인트 차, 컨스트럭터 합계를 벡터 연산으로 계산합니다.
+
+- 순위 동점 처리: 포인트 → 우승 수 → 2위 수 → 3위 수 ... (countback) → 먼저 등장한 순
+- 라운드 r 의 순위에는 r 까지 한 번이라도 결과가 있는 드라이버/팀만 포함
+- 시즌별로 결과를 캐시하고, 새 라운드가 추가되면 그 라운드 열만 계산해 붙임
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# countback 에 쓰는 최대 순위 (그보다 뒤는 모두 같은 것으로 취급)
+MAX_COUNTBACK_POSITION = 30
+
+
+class _Standings:
+    """한 종류(드라이버 또는 컨스트럭터)의 라운드별 행렬"""
+
+    def __init__(self, capacity_rows: int = 32, capacity_rounds: int = 32):
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.first_round = np.full(capacity_rows, -1, dtype=np.int32)  # 처음 등장한 라운드 번째(0부터)
+        self.points = np.zeros((capacity_rows, capacity_rounds))  # 라운드별 획득 포인트
+        self.cumulative = np.zeros((capacity_rows, capacity_rounds))
+        self.positions = np.zeros((capacity_rows, capacity_rounds), dtype=np.int32)  # 순위 (0 = 미등장)
+        self.counts = np.zeros((capacity_rows, MAX_COUNTBACK_POSITION), dtype=np.int32)  # 지금까지 순위별 횟수
+        self.rounds = 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _grow(self, rows: int, rounds: int):
+        """행/열이 모자라면 두 배로 늘림 (라운드를 추가할 때마다 복사하지 않도록)"""
+        cap_rows, cap_rounds = self.points.shape
+        if rows <= cap_rows and rounds <= cap_rounds:
+            return
+        new_rows = cap_rows if rows <= cap_rows else max(rows, cap_rows * 2)
+        new_rounds = cap_rounds if rounds <= cap_rounds else max(rounds, cap_rounds * 2)
+        for name in ("points", "cumulative", "positions"):
+            old = getattr(self, name)
+            grown = np.zeros((new_rows, new_rounds), dtype=old.dtype)
+            grown[:cap_rows, :cap_rounds] = old
+            setattr(self, name, grown)
+        first_round = np.full(new_rows, -1, dtype=np.int32)
+        first_round[:cap_rows] = self.first_round
+        self.first_round = first_round
+        counts = np.zeros((new_rows, MAX_COUNTBACK_POSITION), dtype=np.int32)
+        counts[:cap_rows] = self.counts
+        self.counts = counts
+
+    def ids(self, names: List[str]) -> np.ndarray:
+        ids = np.empty(len(names), dtype=np.int64)
+        for i, name in enumerate(names):
+            idx = self.index.get(name)
+            if idx is None:
+                idx = self.index[name] = len(self.names)
+                self.names.append(name)
+            ids[i] = idx
+        return ids
+
+    def add_round(self, ids: np.ndarray, points: np.ndarray, finish: np.ndarray):
+        """한 라운드의 결과 (ids 는 같은 항목이 여러 번 나올 수 있음: 컨스트럭터)"""
+        r = self.rounds
+        n = len(self.names)
+        self._grow(n, r + 1)
+
+        np.add.at(self.points[:, r], ids, points)
+        self.cumulative[:n, r] = self.points[:n, r] + (self.cumulative[:n, r - 1] if r else 0.0)
+        appeared = np.zeros(n, dtype=bool)
+        appeared[ids] = True
+        self.first_round[:n][appeared & (self.first_round[:n] < 0)] = r
+
+        finished = (finish >= 1) & (finish <= MAX_COUNTBACK_POSITION)
+        np.add.at(self.counts, (ids[finished], finish[finished] - 1), 1)
+
+        # 등장한 항목만 순위: lexsort 는 마지막 키가 1순위
+        active = np.flatnonzero(self.first_round[:n] >= 0)
+        keys = [active]  # 동점이면 먼저 등장한 순
+        counts = self.counts[active]
+        keys.extend(-counts[:, p] for p in range(MAX_COUNTBACK_POSITION - 1, -1, -1))
+        keys.append(-self.cumulative[active, r])
+        order = active[np.lexsort(keys)]
+        self.positions[order, r] = np.arange(1, len(order) + 1, dtype=np.int32)
+        self.rounds += 1
+
+    def final_order(self) -> np.ndarray:
+        if not self.rounds:
+            return np.arange(0)
+        r = self.rounds - 1
+        active = np.flatnonzero(self.positions[:len(self.names), r] > 0)
+        return active[np.argsort(self.positions[active, r], kind="stable")]
+
+    def gaps(self) -> np.ndarray:
+        """라운드별 선두와의 포인트 차 (n × rounds)"""
+        n, r = len(self.names), self.rounds
+        cumulative = self.cumulative[:n, :r]
+        leader = cumulative.max(axis=0) if n else np.zeros(r)
+        return leader[np.newaxis, :] - cumulative
+
+    def series(self, labels: List[str], rounds: List[Any]) -> Dict[str, List[Dict[str, Any]]]:
+        gaps = self.gaps()
+        result = {}
+        for k in self.final_order().tolist():
+            first = int(self.first_round[k])
+            positions = self.positions[k, first:self.rounds].tolist()
+            cumulative = self.cumulative[k, first:self.rounds].tolist()
+            gap = gaps[k, first:].tolist()
+            result[self.names[k]] = [
+                {
+                    "race": labels[first + i],
+                    "position": positions[i],
+                    "points": cumulative[i],
+                    "round": rounds[first + i],
+                    "gap_to_leader": gap[i]
+                }
+                for i in range(len(positions))
+            ]
+        return result
+
+
+def round_signature(race: Dict[str, Any]) -> str:
+    """라운드 결과 내용 해시 (결과가 정정되면 달라짐)"""
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(str(race.get("round")).encode())
+    for result in race.get("results", []):
+        digest.update(f"|{result['driver_name']}|{result['team']}|{result['points']}|{result.get('position')}".encode())
+    return digest.hexdigest()
+
+
+class SeasonProgression:
+    """한 시즌의 드라이버/컨스트럭터 순위 변화 (라운드를 순서대로 추가)"""
+
+    def __init__(self, year: int):
+        self.year = year
+        self.drivers = _Standings()
+        self.constructors = _Standings()
+        self.labels: List[str] = []
+        self.rounds: List[Any] = []
+        self.signatures: List[str] = []
+        self._result: Optional[Dict[str, Any]] = None
+
+    def append_round(self, race: Dict[str, Any]):
+        results = race["results"]
+        points = np.fromiter((result["points"] for result in results), dtype=np.float64, count=len(results))
+        finish = np.fromiter((result.get("position") or 0 for result in results), dtype=np.int64, count=len(results))
+        self.drivers.add_round(self.drivers.ids([result["driver_name"] for result in results]), points, finish)
+        self.constructors.add_round(self.constructors.ids([result["team"] for result in results]), points, finish)
+        self.labels.append(f"R{race['round']}")
+        self.rounds.append(race["round"])
+        self.signatures.append(round_signature(race))
+        self._result = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self._result is None:
+            self._result = {
+                "driver_progression": self.drivers.series(self.labels, self.rounds),
+                "constructor_progression": self.constructors.series(self.labels, self.rounds),
+                "race_labels": list(self.labels),
+                "total_races": len(self.labels),
+                "year": self.year
+            }
+        return self._result
+
+
+class ProgressionEngine:
+    """시즌별 SeasonProgression 캐시 (앞 라운드가 그대로면 새 라운드만 추가, 바뀌었으면 다시 계산)"""
+
+    def __init__(self):
+        self._seasons: Dict[int, SeasonProgression] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "appended_rounds": 0, "rebuilds": 0}
+
+    def progression(self, year: int, race_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        races = [race for race in race_results if race.get("results")]
+        signatures = [round_signature(race) for race in races]
+        with self._lock:
+            season = self._seasons.get(year)
+            if season is None or season.signatures != signatures[:len(season.signatures)]:
+                if season is not None:
+                    logger.info(f"Results for {year} changed, rebuilding standings progression")
+                season = self._seasons[year] = SeasonProgression(year)
+                self.stats["rebuilds"] += 1
+            new_races = races[len(season.signatures):]
+            if not new_races:
+                self.stats["hits"] += 1
+            for race in new_races:
+                season.append_round(race)
+            self.stats["appended_rounds"] += len(new_races)
+            return season.to_dict()
+
+    def invalidate(self, year: Optional[int] = None):
+        with self._lock:
+            if year is None:
+                self._seasons.clear()
+            else:
+                self._seasons.pop(year, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"seasons": {year: len(season.rounds) for year, season in self._seasons.items()}, **self.stats}
+
+
+progression_engine = ProgressionEngine()
@@ -1,12 +1,17 @@
 import json
-import time
-from motorsport_selenium_scraper import MotorsportSeleniumScraper
+import sys
+from scraping_engine import ScrapingEngine
+from motorsport_http_scraper import submit_tiered
 from datetime import datetime
 import os
 
 class TeamSeasonScraper:
-    def __init__(self):
-        self.scraper = MotorsportSeleniumScraper(headless=True)
+    def __init__(self, engine=None, workers=4, use_http=True):
+        # 공유 엔진이 주어지면 그 브라우저 풀을 사용, 아니면 자체 풀 생성
+        # (브라우저는 HTTP 경로로 부족한 페이지가 있을 때만 실제로 실행됨)
+        self.own_engine = engine is None
+        self.engine = engine or ScrapingEngine(workers=workers)
+        self.use_http = use_http
         self.output_file = "team_2025_season_stats.json"
         
         # F1 2025 팀 목록 (motorsportstats.com slug 형식)
@@ -36,12 +41,15 @@ class TeamSeasonScraper:
         
         print(f"Starting team scraping for {len(self.f1_teams)} teams...")
         
+        # HTTP 로 먼저 가져오고, 부족한 팀만 브라우저 풀에 제출
+        futures = submit_tiered(self.engine, "team", self.f1_teams, 2025, use_http=self.use_http)
+        
         for i, (team_slug, team_info) in enumerate(self.f1_teams.items(), 1):
             print(f"\n[{i}/{len(self.f1_teams)}] Processing {team_info['name']} ({team_slug})...")
             
             try:
-                # 스크래핑 실행
-                team_stats = self.scraper.get_team_season_stats(team_slug, 2025)
+                # 스크래핑 결과 대기
+                team_stats = futures[team_slug].result()
                 
                 if team_stats and team_stats.get('season_data'):
                     # 성공적으로 데이터를 가져온 경우
@@ -96,11 +104,6 @@ class TeamSeasonScraper:
                 results["failed_scrapes"] += 1
                 
                 print(f"❌ Error: {team_info['name']} - {str(e)}")
-            
-            # 요청 간 딜레이 (서버 부하 방지)
-            if i < len(self.f1_teams):
-                print(f"   Waiting 3 seconds before next request...")
-                time.sleep(3)
         
         return results
     
@@ -142,7 +145,7 @@ class TeamSeasonScraper:
                     print(f"  {data['name']}: {data.get('error', 'Unknown error')}")
     
     def run(self):
-        """전체 스크래핑 프로세스 실행"""
+        """전체 스크래핑 프로세스 실행 (성공 여부 반환)"""
         try:
             print("Starting team season statistics scraping...")
             
@@ -150,18 +153,23 @@ class TeamSeasonScraper:
             team_results = self.scrape_all_teams()
             
             # 결과 저장
-            if self.save_results(team_results):
+            saved = self.save_results(team_results)
+            if saved:
                 self.print_summary(team_results)
+            return saved
             
         except KeyboardInterrupt:
             print("\n⏹️  Scraping interrupted by user")
+            return False
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
+            return False
         finally:
-            # 브라우저 종료
-            self.scraper.close()
-            print("\n✅ Browser closed")
+            # 자체 브라우저 풀인 경우에만 종료
+            if self.own_engine:
+                self.engine.close()
+                print("\n✅ Browser closed")
 
 if __name__ == "__main__":
     scraper = TeamSeasonScraper()
-    scraper.run()
\ No newline at end of file
+    sys.exit(0 if scraper.run() else 1)
\ No newline at end of file
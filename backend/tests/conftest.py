@@ -0,0 +1,5 @@
+import os
+import sys
+
+# backend/ 의 최상위 모듈(motorsport_parsing 등)을 테스트에서 바로 import
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -0,0 +1,88 @@
+"""
+챔피언십 몬테카를로 시뮬레이터 테스트 (simulate_chunk / form_distribution / 출전 드라이버 필터)
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.core.points import points_rules
+from services.championship_simulator import ChampionshipSimulator, form_distribution, simulate_chunk
+
+
+def run_chunk(cdf, base_points, team_of, base_team_points, events, year=2025, simulations=2000, seed=7):
+    return simulate_chunk(
+        cdf,
+        np.asarray(base_points, dtype=np.float64),
+        np.asarray(team_of, dtype=np.int32),
+        np.asarray(base_team_points, dtype=np.float64),
+        events,
+        points_rules(year),
+        simulations,
+        seed
+    )
+
+
+def test_form_distribution_is_a_cdf():
+    cdf = form_distribution([[1, 1, 2], [], [3]], 3)
+
+    assert cdf.shape == (3, 3)
+    assert np.all(np.diff(cdf, axis=1) >= 0)
+    assert np.allclose(cdf[:, -1], 1.0)
+    # 결과가 없는 드라이버는 사전 가중치만 (균등)
+    assert np.allclose(cdf[1], [1 / 3, 2 / 3, 1.0])
+    # 최근 결과일수록 가중치가 큼: 1위를 두 번 한 드라이버가 1위 확률이 가장 높음
+    assert cdf[0, 0] > cdf[2, 0]
+
+
+def test_single_driver_scores_every_point():
+    cdf = form_distribution([[1]], 1)
+    result = run_chunk(cdf, [10.5], [0], [10.5], ["sprint", "race", "race"], year=2025, simulations=50)
+
+    # 2025: 스프린트 8 + 레이스 25 x 2, 패스티스트 랩 포인트 없음
+    assert result["simulations"] == 50
+    assert result["champion"].tolist() == [50]
+    assert result["points_sum"][0] == pytest.approx(50 * (10.5 + 8 + 25 + 25))
+    assert result["team_points_sum"][0] == pytest.approx(50 * (10.5 + 8 + 25 + 25))
+
+
+def test_season_rules_change_the_points():
+    cdf = form_distribution([[1]], 1)
+    result = run_chunk(cdf, [0], [0], [0], ["sprint", "race"], year=2021, simulations=10)
+
+    # 2021: 스프린트 3점, 레이스 25점 + 패스티스트 랩 1점 (완주자가 한 명뿐)
+    assert result["points_sum"][0] == pytest.approx(10 * (3 + 25 + 1))
+
+
+def test_points_are_conserved_and_seeded():
+    n = 6
+    cdf = form_distribution([[d + 1] * 3 for d in range(n)], n)
+    base = [30, 25, 20, 10, 5, 0]
+    team_of = [0, 0, 1, 1, 2, -1]
+    events = ["race", "sprint", "race"]
+    first = run_chunk(cdf, base, team_of, [55, 30, 5], events, year=2023, simulations=500)
+    again = run_chunk(cdf, base, team_of, [55, 30, 5], events, year=2023, simulations=500)
+
+    # 레이스마다 25+18+15+12+10+8 (+ 패스티스트 랩 1), 스프린트 8+7+6+5+4+3
+    per_season = 2 * (25 + 18 + 15 + 12 + 10 + 8 + 1) + (8 + 7 + 6 + 5 + 4 + 3)
+    assert first["points_sum"].sum() == pytest.approx(500 * (sum(base) + per_season))
+    assert first["champion"].sum() == 500
+    assert first["rank_counts"].sum(axis=0).tolist() == [500] * n
+    assert first["champion"].tolist() == again["champion"].tolist()
+    assert np.array_equal(first["points_sum"], again["points_sum"])
+
+
+def test_current_field_keeps_latest_race_entrants():
+    standings = [{"name": name, "team": "T", "points": 0} for name in ("A", "B", "C", "D")]
+    completed = [
+        {"round": 1, "results": [{"driver_name": "A"}, {"driver_name": "B"}, {"driver_name": "C"}]},
+        {"round": 2, "results": [{"driver_name": "A"}, {"driver_name": "B"}, {"driver_name": "D"}]},
+    ]
+
+    field = ChampionshipSimulator._current_field(standings, completed)
+
+    assert [standing["name"] for standing in field] == ["A", "B", "D"]
+    assert ChampionshipSimulator._current_field(standings, []) == standings
+    # 출전자가 순위표와 하나도 맞지 않으면 순위표 그대로
+    unknown = [{"round": 3, "results": [{"driver_name": "X"}]}]
+    assert ChampionshipSimulator._current_field(standings, unknown) == standings
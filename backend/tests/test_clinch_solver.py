@@ -0,0 +1,110 @@
+"""
+챔피언십 확정/탈락 계산 테스트 (solve 경계값 / 필요한 최소 순위 / ClinchSolver 메모이제이션)
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.core.points import points_rules
+from app.services.clinch_solver import ClinchSolver, event_tables, solve
+
+RULES_2025 = points_rules(2025)  # 패스티스트 랩 포인트 없음
+RULES_2024 = points_rules(2024)
+
+
+def test_event_tables_use_the_season_rules():
+    tables, bonus = event_tables(["race", "sprint"], RULES_2024)
+
+    assert tables[0, :3].tolist() == [25, 18, 15]
+    assert tables[0, 10:].sum() == 0
+    assert tables[1, :8].tolist() == [8, 7, 6, 5, 4, 3, 2, 1]
+    assert bonus.tolist() == [1, 0]
+
+
+def test_points_available_per_event():
+    assert solve([0], ["race", "sprint"], RULES_2025)["per_event_max"] == [25, 8]
+    assert solve([0], ["race", "sprint"], RULES_2024)["per_event_max"] == [26, 8]
+    # 컨스트럭터는 1-2 피니시
+    assert solve([0], ["race", "sprint"], RULES_2025, cars=2)["available"] == 43 + 15
+
+
+def test_clinch_and_elimination_bounds():
+    solved = solve([100, 80, 74, 75], ["race"], RULES_2025)
+
+    # 75 + 25 = 100: 동점이면 countback 이 결정하므로 아직 탈락 아님
+    assert solved["eliminated"] == [False, False, True, False]
+    assert solved["clinched"] == [False, False, False, False]
+    assert solved["best_position"] == [1, 1, 2, 1]
+    assert solved["worst_position"] == [3, 4, 4, 4]
+    assert solved["max_points"] == [125, 105, 99, 100]
+
+    # 26점 차는 남은 25점으로 따라잡을 수 없음
+    clinched = solve([100, 74], ["race"], RULES_2025)
+    assert clinched["clinched"] == [True, False]
+    assert clinched["eliminated"] == [False, True]
+
+
+def test_required_finishes_for_one_race():
+    solved = solve([100, 80], ["race"], RULES_2025)
+
+    # 선두: 2위 경쟁자가 남은 최고 순위를 가져가도 앞서려면 T[f] > 5 → 7위(6점)까지
+    assert solved["finish_to_clinch"] == [7, None]
+    assert solved["finish_to_clinch_next_event"] == [7, None]
+    # 2위: 선두가 0점이어도 100점에 닿으려면 20점 이상 → 우승만
+    assert solved["finish_to_stay_in_contention"] == [20, 1]
+
+
+def test_next_event_accounts_for_later_events():
+    solved = solve([100, 60], ["race", "race"], RULES_2025)
+
+    # 두 경기 모두 f 위: 100 + 2T[f] > 60 + 2 * 25 → 7위(6점)까지
+    assert solved["finish_to_clinch"] == [7, None]
+    # 다음 경기만: 100 + T[f] > 60 + 25 + 25(마지막 경기) → 4위(12점)까지
+    assert solved["finish_to_clinch_next_event"] == [4, None]
+
+
+def test_no_events_left_decides_the_title():
+    solved = solve([90, 90, 50], [], RULES_2025)
+
+    assert solved["available"] == 0
+    assert solved["clinched"] == [False, False, False]
+    assert solved["eliminated"] == [False, False, True]
+    assert solved["finish_to_clinch"] == [None, None, None]
+
+
+def standings(last_updated="2025-11-01T00:00:00"):
+    return {
+        "last_updated": last_updated,
+        "total_races": 22,
+        "driver_standings": [
+            {"driver_name": "A", "points": 100, "position": 1},
+            {"driver_name": "B", "points": 80, "position": 2},
+            {"driver_name": "C", "points": 40, "position": 3},
+        ],
+        "constructor_standings": [
+            {"team_name": "X", "points": 180, "position": 1},
+            {"team_name": "Y", "points": 90, "position": 2},
+        ],
+    }
+
+
+def test_analyze_statuses_and_memoization():
+    solver = ClinchSolver(max_entries=2)
+    events = [{"type": "race", "session_key": 1, "location": "Yas Marina", "date": "2025-12-07"}]
+
+    result = solver.analyze(2025, standings(), events)
+    assert [row["status"] for row in result["drivers"]] == ["contender", "contender", "eliminated"]
+    assert [row["status"] for row in result["constructors"]] == ["clinched", "eliminated"]
+    assert result["driver_points_available"] == 25
+    assert result["constructor_points_available"] == 43
+    assert result["remaining_races"] == 1
+    assert result["drivers"][1]["points_behind_leader"] == 20
+
+    assert solver.analyze(2025, standings(), events) is result
+    assert solver.stats == {"hits": 1, "solves": 1}
+
+    # 순위표가 갱신되면 다시 계산
+    solver.analyze(2025, standings("2025-12-08T00:00:00"), [])
+    assert solver.stats["solves"] == 2
+    assert solver.analyze(2025, standings("2025-12-08T00:00:00"), [])["drivers"][0]["status"] == "champion"
@@ -0,0 +1,127 @@
+"""
+HttpCache 테스트 (Cache-Control 신선도 / ETag 재검증 / LRU 제한, 네트워크 없음)
+"""
+
+import pytest
+
+from app.core import http_cache
+from app.core.http_cache import HttpCache, parse_cache_control
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Response:
+    def __init__(self, status_code, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class ScriptedSession:
+    """미리 정해 둔 응답을 차례로 돌려주고, 받은 요청 헤더를 기록"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(http_cache.time, "monotonic", clock)
+    return clock
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('public, max-age=60, no-cache="set-cookie"') == {
+        "public": None,
+        "max-age": "60",
+        "no-cache": "set-cookie",
+    }
+    assert parse_cache_control(None) == {}
+
+
+def test_key_ignores_none_params_and_order():
+    assert HttpCache.key("u", {"b": 2, "a": 1, "c": None}) == "u?a=1&b=2"
+    assert HttpCache.key("u", {"c": None}) == "u"
+
+
+def test_fresh_response_is_served_without_a_request(clock):
+    cache = HttpCache()
+    session = ScriptedSession(Response(200, {"cache-control": "max-age=60", "age": "10"}, {"v": 1}))
+
+    assert cache.fetch_json(session, "u") == {"v": 1}
+    clock.now += 49
+    assert cache.fetch_json(session, "u") == {"v": 1}
+
+    assert len(session.requests) == 1
+    assert cache.stats == {"fresh_hits": 1, "revalidated": 0, "downloads": 1}
+
+
+def test_stale_response_is_revalidated_with_etag(clock):
+    cache = HttpCache()
+    body = {"v": 1}
+    session = ScriptedSession(
+        Response(200, {"cache-control": "max-age=5", "etag": '"a"'}, body),
+        Response(304, {"cache-control": "max-age=5"}),
+    )
+
+    cache.fetch_json(session, "u")
+    clock.now += 6
+    # 304 는 저장해 둔(이미 파싱된) 본문을 그대로 돌려줌
+    assert cache.fetch_json(session, "u") is body
+
+    assert session.requests[0] == {}
+    assert session.requests[1] == {"If-None-Match": '"a"'}
+    assert cache.stats["revalidated"] == 1
+
+    # 재검증으로 신선도가 연장됨
+    clock.now += 4
+    assert cache.fetch_json(session, "u") is body
+    assert len(session.requests) == 2
+
+
+def test_uncacheable_responses_are_not_stored(clock):
+    cache = HttpCache()
+    session = ScriptedSession(
+        Response(200, {"cache-control": "max-age=60, no-store", "etag": '"a"'}, 1),
+        Response(200, {}, 2),
+        Response(200, {}, 3),
+    )
+
+    assert cache.fetch_json(session, "u") == 1
+    assert cache.fetch_json(session, "u") == 2
+    assert cache.fetch_json(session, "u") == 3
+    assert cache.snapshot()["entries"] == 0
+    assert all(headers == {} for headers in session.requests)
+
+
+def test_non_200_returns_none(clock):
+    cache = HttpCache()
+    assert cache.fetch_json(ScriptedSession(Response(500)), "u") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = HttpCache(max_entries=2)
+    headers = {"cache-control": "max-age=60"}
+    cache.store("a", headers, 1)
+    cache.store("b", headers, 2)
+    cache.lookup("a")
+    cache.store("c", headers, 3)
+
+    assert cache.lookup("b") is None
+    assert cache.fresh_body("a") == (True, 1)
+    assert cache.fresh_body("c") == (True, 3)
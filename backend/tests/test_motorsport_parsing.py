@@ -0,0 +1,108 @@
+"""
+motorsportstats.com 요약 페이지 파서 테스트 (저장해 둔 HTML 픽스처, 네트워크 없음)
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("httpx")
+
+from motorsport_http_scraper import parse_driver_html, parse_team_html
+from motorsport_parsing import (
+    DRIVER_SEASON_HEADERS,
+    driver_result_complete,
+    find_season_row,
+    team_result_complete,
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "motorsportstats")
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_driver_summary_season_row():
+    result = parse_driver_html(load_fixture("driver_summary.html"), "esteban-ocon")
+
+    season = result["season_2025_data"]
+    assert season["season_races"] == 12
+    assert season["season_points"] == 23
+    assert season["season_wins"] == 0
+    assert season["season_dnf"] == 1
+    assert season["season_best_finish"] == 5
+    assert season["season_avg_finish"] == pytest.approx(11.4)
+    assert season["season_championship_position"] == "14th"
+    assert season["season_entrant"] == "MoneyGram Haas F1 Team"
+    assert result["source"] == "http"
+    assert driver_result_complete(result)
+
+
+def test_driver_summary_career_statistics():
+    stats = parse_driver_html(load_fixture("driver_summary.html"), "esteban-ocon")["extracted_stats"]
+
+    assert stats["entries"] == 180
+    assert stats["starts"] == 178
+    assert stats["wins"] == 1
+    assert stats["podiums"] == 4
+    assert stats["points"] == 468
+    assert stats["first_entry"] == 2016
+
+
+def test_driver_page_without_season_table_is_incomplete():
+    # 날짜 셀("2025-07-06")만 있는 결과 테이블을 시즌 행으로 잡으면 안 됨
+    result = parse_driver_html(load_fixture("driver_without_season_table.html"), "esteban-ocon")
+
+    assert result["season_2025_data"] == {}
+    assert result["extracted_stats"]["starts"] == 178
+    assert not driver_result_complete(result)
+
+
+def test_team_summary_season_row():
+    result = parse_team_html(load_fixture("team_summary.html"), "mclaren")
+
+    season = result["season_data"]
+    assert season["season_races"] == 24
+    assert season["season_points"] == 460
+    assert season["season_wins"] == 9
+    assert season["season_podiums"] == 20
+    assert season["season_drivers"] == "Lando Norris, Oscar Piastri"
+    assert result["career_stats"]["total_championships"] == 9
+    assert result["career_stats"]["total_wins"] == 195
+    assert team_result_complete(result)
+
+
+def test_team_summary_other_year():
+    result = parse_team_html(load_fixture("team_summary.html"), "mclaren", year=2024)
+
+    assert result["season_data"]["season_points"] == 666
+    assert result["year"] == 2024
+
+
+def test_team_parser_rejects_driver_page():
+    # 드라이버 시즌 테이블에는 PTS/ST 열이 없음
+    result = parse_team_html(load_fixture("driver_summary.html"), "haas")
+
+    assert result["season_data"] == {}
+    assert not team_result_complete(result)
+
+
+def test_find_season_row_requires_headers():
+    results = [["Date", "W", "P", "RS"], ["2025-03-16", "1", "25", "1"]]
+    other = [["Year", "Wins"], ["2025", "3"]]
+    seasons = [[" Season ", "W", "P", "RS"], ["2025 Season", "2", "120", "12"]]
+
+    assert find_season_row([results], 2025, DRIVER_SEASON_HEADERS) is None
+    assert find_season_row([other], 2025, DRIVER_SEASON_HEADERS) is None
+    row = find_season_row([results, other, seasons], 2025, DRIVER_SEASON_HEADERS)
+    assert row == {"Season": "2025 Season", "W": "2", "P": "120", "RS": "12"}
+
+
+def test_incomplete_results():
+    assert not driver_result_complete(None)
+    assert not driver_result_complete({"extracted_stats": {"wins": 1}, "season_2025_data": {"season_races": 10}})
+    assert not driver_result_complete({"extracted_stats": {"starts": 10}, "season_2025_data": {"season_races": 0}})
+    assert not team_result_complete({"season_data": {"season_wins": 0}})
@@ -0,0 +1,118 @@
+"""
+온라인 통계 테스트 (Welford / EWMA / SlidingWindow 기울기·최소·최대를 전체 재계산 결과와 비교)
+"""
+
+import math
+import random
+import statistics
+
+import pytest
+
+from app.core.online_stats import Ewma, RunningStats, SlidingWindow, StatsGroup, StreamStats
+
+
+def least_squares_slope(samples):
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_x = sum(x for _, x in samples) / n
+    sxx = sum((t - mean_t) ** 2 for t, _ in samples)
+    if sxx == 0:
+        return None
+    return sum((t - mean_t) * (x - mean_x) for t, x in samples) / sxx
+
+
+def test_running_stats_match_statistics_module():
+    values = [3.5, -1.0, 7.25, 7.25, 0.0, 12.0]
+    stats = RunningStats()
+    for value in values:
+        stats.push(value)
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    assert (stats.min, stats.max) == (-1.0, 12.0)
+
+    single = RunningStats()
+    single.push(4.0)
+    assert single.variance is None and single.std is None
+
+
+def test_ewma():
+    ewma = Ewma(alpha=0.5)
+    for value in (10.0, 20.0, 20.0):
+        ewma.push(value)
+    assert ewma.value == 17.5
+
+    with pytest.raises(ValueError):
+        Ewma(alpha=0)
+
+
+def test_sliding_window_matches_full_recomputation():
+    rng = random.Random(20250)
+    window = SlidingWindow(span=30.0)
+    kept = []
+    t = 1_700_000_000.0  # 실제 타임스탬프 크기에서도 합계가 정확한지
+
+    for _ in range(500):
+        t += rng.choice([0.0, 0.5, 1.0, 4.0, 12.0])
+        x = float(rng.randint(-5, 5))  # 같은 값이 자주 나와야 단조 덱의 동점 처리가 검증됨
+        window.push(t, x)
+        kept = [(st, sx) for st, sx in kept + [(t, x)] if st >= t - 30.0]
+
+        values = [sx for _, sx in kept]
+        assert len(window) == len(kept)
+        assert window.min == min(values)
+        assert window.max == max(values)
+        assert window.mean == pytest.approx(statistics.mean(values))
+        expected = least_squares_slope(kept)
+        if expected is None:
+            assert window.slope is None
+        else:
+            assert window.slope == pytest.approx(expected, rel=1e-6, abs=1e-9)
+
+
+def test_sliding_window_eviction_boundary():
+    window = SlidingWindow(span=10.0)
+    window.push(0.0, 5.0)
+    window.push(10.0, 1.0)
+    # t - span 과 같은 시각의 샘플은 남김
+    assert len(window) == 2
+    assert window.max == 5.0
+
+    window.push(10.5, 2.0)
+    assert len(window) == 2
+    assert (window.min, window.max) == (1.0, 2.0)
+
+
+def test_slope_needs_two_distinct_times():
+    window = SlidingWindow(span=60.0)
+    window.push(5.0, 1.0)
+    window.push(5.0, 3.0)
+    assert window.slope is None
+
+    window.push(7.0, 7.0)
+    assert window.slope == pytest.approx(least_squares_slope([(5.0, 1.0), (5.0, 3.0), (7.0, 7.0)]))
+
+
+def test_stream_stats_skip_missing_values_and_scale_slope():
+    stream = StreamStats(window=3600.0)
+    for t, x in [(0, 20.0), (60, None), (120, float("nan")), (1800, 21.0)]:
+        stream.push(t, x)
+
+    snapshot = stream.snapshot(slope_unit=1800)
+    assert snapshot["count"] == 2
+    assert snapshot["current"] == 21.0
+    assert snapshot["window_samples"] == 2
+    assert snapshot["slope"] == pytest.approx(1.0)
+    assert not math.isnan(snapshot["mean"])
+
+
+def test_stats_group_tracks_each_field():
+    group = StatsGroup(["air", "track"], window=600.0)
+    group.push(0.0, {"air": 18.0, "track": 30.0})
+    group.push(60.0, {"air": 19.0})
+
+    snapshot = group.snapshot()
+    assert snapshot["air"]["count"] == 2
+    assert snapshot["track"]["count"] == 1
+    assert group["track"].last == 30.0
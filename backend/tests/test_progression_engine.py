@@ -0,0 +1,108 @@
+"""
+시즌 순위 변화 엔진 테스트 (countback 동점 처리 / 늦게 등장한 드라이버 / 증분 계산과 재계산)
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from services.progression_engine import ProgressionEngine, SeasonProgression
+
+
+def race(round_number, *finishers):
+    """finishers: (driver, team, points, position)"""
+    return {
+        "round": round_number,
+        "results": [
+            {"driver_name": driver, "team": team, "points": points, "position": position}
+            for driver, team, points, position in finishers
+        ],
+    }
+
+
+SEASON = [
+    race(1, ("VER", "Red Bull", 25, 1), ("NOR", "McLaren", 18, 2), ("PIA", "McLaren", 15, 3)),
+    race(2, ("NOR", "McLaren", 25, 1), ("VER", "Red Bull", 18, 2), ("PIA", "McLaren", 15, 3)),
+    race(3, ("PIA", "McLaren", 25, 1), ("HAM", "Ferrari", 18, 2), ("VER", "Red Bull", 0, 20)),
+]
+
+
+def progression_of(races, year=2025):
+    season = SeasonProgression(year)
+    for r in races:
+        season.append_round(r)
+    return season.to_dict()
+
+
+def test_countback_breaks_points_ties():
+    # R2 후 VER 과 NOR 은 43점 동점, 우승 수도 1 대 1 → 2위 횟수도 같음 → 3위 이하도 같음 → 먼저 등장한 VER
+    result = progression_of(SEASON[:2])["driver_progression"]
+    assert [entry["position"] for entry in result["VER"]] == [1, 1]
+    assert [entry["position"] for entry in result["NOR"]] == [2, 2]
+
+    # 같은 포인트라도 우승이 있는 쪽이 앞
+    tied = progression_of([
+        race(1, ("A", "T1", 18, 2), ("B", "T2", 18, 1)),
+    ])["driver_progression"]
+    assert list(tied) == ["B", "A"]
+
+
+def test_cumulative_points_and_gap_to_leader():
+    result = progression_of(SEASON)
+    drivers = result["driver_progression"]
+
+    assert [entry["points"] for entry in drivers["PIA"]] == [15, 30, 55]
+    assert [entry["gap_to_leader"] for entry in drivers["PIA"]] == [10, 13, 0]
+    # VER/NOR 43점 동점: 우승·2위 횟수가 같고 VER 만 20위 기록이 있어 앞섬
+    assert list(drivers) == ["PIA", "VER", "NOR", "HAM"]
+    assert result["race_labels"] == ["R1", "R2", "R3"]
+    assert result["total_races"] == 3
+
+
+def test_late_entry_starts_at_first_round():
+    ham = progression_of(SEASON)["driver_progression"]["HAM"]
+
+    assert [entry["race"] for entry in ham] == ["R3"]
+    assert ham[0]["position"] == 4
+    assert ham[0]["points"] == 18
+
+
+def test_constructors_sum_both_cars():
+    constructors = progression_of(SEASON)["constructor_progression"]
+
+    assert [entry["points"] for entry in constructors["McLaren"]] == [33, 73, 98]
+    assert [entry["position"] for entry in constructors["McLaren"]] == [1, 1, 1]
+    assert [entry["race"] for entry in constructors["Ferrari"]] == ["R3"]
+
+
+def test_matrices_grow_past_initial_capacity():
+    drivers = [f"D{i}" for i in range(40)]
+    races = [
+        race(r, *[(name, f"T{i // 2}", float(i % 3), i + 1) for i, name in enumerate(drivers)])
+        for r in range(1, 41)
+    ]
+    result = progression_of(races)["driver_progression"]
+
+    assert len(result) == 40
+    assert result["D2"][-1]["points"] == 80.0
+    assert len(result["D0"]) == 40
+    # 포인트가 같으면 countback (D2 가 D5 보다 앞선 순위를 더 많이 가짐)
+    assert result["D2"][-1]["position"] < result["D5"][-1]["position"]
+
+
+def test_engine_appends_new_rounds_and_rebuilds_on_correction():
+    engine = ProgressionEngine()
+
+    engine.progression(2025, SEASON[:2])
+    incremental = engine.progression(2025, SEASON)
+    assert incremental == progression_of(SEASON)
+    assert engine.stats == {"hits": 0, "appended_rounds": 3, "rebuilds": 1}
+
+    engine.progression(2025, SEASON + [race(4)])  # 결과 없는 라운드는 무시
+    assert engine.stats["hits"] == 1
+
+    corrected = [race(1, ("VER", "Red Bull", 0, 20), ("NOR", "McLaren", 25, 1))] + SEASON[1:]
+    rebuilt = engine.progression(2025, corrected)
+    assert engine.stats["rebuilds"] == 2
+    assert rebuilt == progression_of(corrected)
+    assert engine.snapshot()["seasons"] == {2025: 3}
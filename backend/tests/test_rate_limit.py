@@ -0,0 +1,141 @@
+"""
+GCRA 레이트 리미터 테스트 (_gcra 계산 / MemoryRateLimiter / 경로별 규칙 / 헤더)
+"""
+
+import asyncio
+
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import (
+    MemoryRateLimiter,
+    RateLimitRule,
+    RedisRateLimiter,
+    RouteRateLimits,
+    _gcra,
+    rate_limit_headers,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+def test_rule_parse():
+    assert RateLimitRule.parse("120/60:20") == RateLimitRule(limit=120, period=60.0, burst=20)
+    assert RateLimitRule.parse("30") == RateLimitRule(limit=30, period=60.0, burst=None)
+
+    rule = RateLimitRule.parse("10/10")
+    assert rule.emission_interval == 1.0
+    assert rule.capacity == 10
+    assert rule.burst_offset == 10.0
+
+
+def test_gcra_burst_then_spacing():
+    # 초당 1회, 버스트 3
+    rule = RateLimitRule(limit=10, period=10, burst=3)
+    tat = 0.0
+
+    remaining = []
+    for _ in range(3):
+        tat, result = _gcra(tat, 0.0, rule)
+        assert result.allowed
+        remaining.append(result.remaining)
+    assert remaining == [2, 1, 0]
+
+    denied_tat, denied = _gcra(tat, 0.0, rule)
+    assert denied_tat is None
+    assert not denied.allowed
+    assert denied.retry_after == pytest.approx(1.0)
+    assert denied.reset_after == pytest.approx(3.0)
+
+    # 거부된 요청은 상태를 바꾸지 않으므로 1초 뒤에는 정확히 한 번 허용
+    tat, result = _gcra(tat, 1.0, rule)
+    assert result.allowed and result.remaining == 0
+    assert _gcra(tat, 1.0, rule)[0] is None
+
+
+def test_gcra_idle_bucket_refills_to_capacity():
+    rule = RateLimitRule(limit=10, period=10, burst=3)
+    tat, _ = _gcra(0.0, 0.0, rule)
+
+    # 오래된 TAT 는 현재 시각으로 당겨지므로 버스트가 다시 가득 참
+    _, result = _gcra(tat, 100.0, rule)
+    assert result.allowed
+    assert result.remaining == 2
+
+
+def test_memory_limiter_keys_are_independent(clock):
+    limiter = MemoryRateLimiter()
+    rule = RateLimitRule(limit=2, period=10)
+
+    async def run():
+        a = [(await limiter.check("a", rule)).allowed for _ in range(3)]
+        b = (await limiter.check("b", rule)).allowed
+        return a, b
+
+    a, b = asyncio.run(run())
+    assert a == [True, True, False]
+    assert b
+
+
+def test_memory_limiter_prunes_expired_keys(clock):
+    limiter = MemoryRateLimiter(prune_batch=8)
+    rule = RateLimitRule(limit=1, period=1)
+
+    async def run():
+        for key in ("a", "b", "c"):
+            await limiter.check(key, rule)
+        assert len(limiter) == 3
+        clock.now += 5
+        await limiter.check("d", rule)
+
+    asyncio.run(run())
+    assert len(limiter) == 1
+
+
+def test_redis_limiter_falls_back_to_memory_on_error(clock):
+    class BrokenRedis:
+        def register_script(self, script):
+            async def call(keys, args):
+                raise ConnectionError("redis down")
+            return call
+
+    limiter = RedisRateLimiter(redis_client=BrokenRedis())
+    rule = RateLimitRule(limit=1, period=60)
+
+    async def run():
+        return [(await limiter.check("client", rule)).allowed for _ in range(2)]
+
+    assert asyncio.run(run()) == [True, False]
+
+
+def test_route_limits_longest_prefix_wins():
+    default = RateLimitRule(limit=100, period=60)
+    api = RateLimitRule(limit=50, period=60)
+    sim = RateLimitRule(limit=5, period=60)
+    routes = RouteRateLimits(default, {"/api": api, "/api/v1/simulation": sim})
+
+    assert routes.resolve("/api/v1/simulation/run") == ("/api/v1/simulation", sim)
+    assert routes.resolve("/api/v1/drivers") == ("/api", api)
+    assert routes.resolve("/health") == ("*", default)
+
+
+def test_headers_include_retry_after_only_when_denied():
+    allowed = rate_limit.RateLimitResult(allowed=True, limit=10, remaining=3, reset_after=2.0, retry_after=0.0)
+    denied = rate_limit.RateLimitResult(allowed=False, limit=10, remaining=0, reset_after=2.0, retry_after=0.2)
+
+    assert "Retry-After" not in rate_limit_headers(allowed)
+    assert rate_limit_headers(allowed)["X-RateLimit-Remaining"] == "3"
+    assert rate_limit_headers(denied)["Retry-After"] == "1"
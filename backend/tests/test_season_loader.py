@@ -0,0 +1,182 @@
+"""
+BoundedExecutor / ExecutorRegistry / SeasonLoader 테스트 (스레드 풀 대기열 제한, 단일 로드, LRU)
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import season_loader
+from app.core.executors import BoundedExecutor, ExecutorBusyError, ExecutorRegistry, parse_pool_spec
+from app.core.season_loader import SeasonLoader, index_sessions
+
+
+def make_season(year, *session_keys):
+    sessions = [SimpleNamespace(session_key=key, year=year) for key in session_keys]
+    return SimpleNamespace(year=year, meetings=[SimpleNamespace(sessions=sessions)])
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # 모듈 전역 풀 대신 테스트 전용 풀 사용
+    registry = ExecutorRegistry({"bulk": (2, 8)})
+    monkeypatch.setattr(season_loader, "executors", registry)
+    yield registry
+    registry.shutdown()
+
+
+def test_parse_pool_spec():
+    assert parse_pool_spec("4/8") == (4, 8)
+    assert parse_pool_spec("3") == (3, 0)
+    assert parse_pool_spec("0/-1") == (1, 0)
+    with pytest.raises(ValueError):
+        parse_pool_spec("many")
+
+
+def test_bounded_executor_rejects_when_full():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def run():
+        running = asyncio.ensure_future(executor.run(release.wait, 5))
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorBusyError):
+            await executor.run(lambda: "rejected")
+        release.set()
+        return await running, await queued
+
+    try:
+        assert asyncio.run(run()) == (True, "queued")
+    finally:
+        executor.shutdown(wait=True)
+
+    snapshot = executor.snapshot()
+    assert snapshot["submitted"] == 2
+    assert snapshot["rejected"] == 1
+    assert snapshot["completed"] == 2
+    assert snapshot["max_pending"] == 2
+    assert executor.pending == 0
+
+
+def test_bounded_executor_counts_failures():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+
+    async def run():
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(lambda: 1 / 0)
+        return await executor.run(lambda: "ok")
+
+    try:
+        assert asyncio.run(run()) == "ok"
+    finally:
+        executor.shutdown(wait=True)
+    assert (executor.stats["failed"], executor.stats["completed"]) == (1, 1)
+    assert executor.pending == 0
+
+
+def test_registry_configure_replaces_pools():
+    registry = ExecutorRegistry({"bulk": (2, 4)})
+    try:
+        first = registry["bulk"]
+        registry.configure({"bulk": "3/6", "live": "oops"})
+        second = registry["bulk"]
+
+        assert second is not first
+        assert (second.max_workers, second.max_queue) == (3, 6)
+        with pytest.raises(KeyError):
+            registry.get("live")
+    finally:
+        registry.shutdown()
+
+
+def test_index_sessions_skips_missing_keys():
+    season = make_season(2024, 1, 2)
+    season.meetings.append(SimpleNamespace(sessions=[SimpleNamespace(session_key=None)]))
+    season.meetings.append(SimpleNamespace(sessions=None))
+
+    assert sorted(index_sessions(season)) == [1, 2]
+
+
+def test_concurrent_requests_share_one_load(registry):
+    calls = []
+    release = threading.Event()
+
+    def load(year):
+        calls.append(year)
+        release.wait(5)
+        return make_season(year, 9158)
+
+    loader = SeasonLoader(load)
+
+    async def run():
+        waiters = [asyncio.ensure_future(loader.get(2023)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*waiters)
+
+    seasons = asyncio.run(run())
+    assert calls == [2023]
+    assert seasons[0] is seasons[1] is seasons[2]
+    assert loader.stats["loads"] == 1
+    assert loader.stats["joined"] == 2
+    assert loader.cached_session(9158).year == 2023
+
+
+def test_failed_load_is_not_cached(registry):
+    attempts = []
+
+    def load(year):
+        attempts.append(year)
+        if len(attempts) == 1:
+            raise ConnectionError("upstream down")
+        return make_season(year)
+
+    loader = SeasonLoader(load)
+
+    async def run():
+        with pytest.raises(ConnectionError):
+            await loader.get(2022)
+        return await loader.get(2022)
+
+    assert asyncio.run(run()).year == 2022
+    assert attempts == [2022, 2022]
+    assert loader.stats["failures"] == 1
+
+
+def test_least_recently_used_season_is_evicted(registry):
+    loader = SeasonLoader(make_season, max_seasons=2)
+
+    async def run():
+        for year in (2021, 2022, 2021, 2023):
+            await loader.get(year)
+
+    asyncio.run(run())
+    assert sorted(loader.snapshot()["seasons"]) == [2021, 2023]
+    assert loader.stats["loads"] == 3
+    assert loader.stats["hits"] == 1
+
+
+def test_stale_current_season_is_served_while_refreshing(registry):
+    year = datetime.now().year
+    versions = []
+
+    def load(year):
+        versions.append(len(versions) + 1)
+        return SimpleNamespace(version=versions[-1], meetings=[])
+
+    loader = SeasonLoader(load, refresh_after=0.0)
+
+    async def run():
+        first = await loader.get(year)
+        cached = await loader.get(year)
+        await asyncio.gather(*loader._inflight.values())
+        return first, cached, await loader.get(year)
+
+    first, cached, refreshed = asyncio.run(run())
+    assert cached is first
+    assert refreshed.version > first.version
+    assert loader.stats["refreshes"] >= 1